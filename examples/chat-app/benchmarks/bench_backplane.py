@@ -0,0 +1,144 @@
+"""워커 간 백플레인 처리량 벤치마크
+
+여러 워커 프로세스가 각자 가짜 WebSocket을 채팅방에 연결하고, 모든 워커가
+동시에 브로드캐스트한 메시지가 다른 워커의 소켓까지 전달되는 데 걸린
+시간을 측정한다.
+
+실행:
+    python -m benchmarks.bench_backplane --workers 4 --messages 5000
+    python -m benchmarks.bench_backplane --workers 4 --messages 5000 --unbatched
+    python -m benchmarks.bench_backplane --backplane redis --url redis://localhost:6379/0
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing as mp
+import os
+import tempfile
+import time
+
+from src.websocket.backplane import create_backplane
+from src.websocket.manager import ConnectionManager
+
+
+class CountingSocket:
+    """전송 횟수만 세는 가짜 WebSocket"""
+
+    def __init__(self):
+        self.received = 0
+
+    async def send_text(self, text: str):
+        self.received += 1
+
+
+async def run_worker(index: int, args, barrier, results) -> None:
+    manager = ConnectionManager(queue_size=args.messages * args.workers)
+    await manager.attach_backplane(
+        create_backplane(
+            args.backplane,
+            args.url,
+            batch_size=args.batch_size,
+            flush_interval=args.flush_interval_ms / 1000,
+        )
+    )
+
+    rooms = [f"room-{r}" for r in range(args.rooms)]
+    sockets = []
+    for s in range(args.sockets):
+        socket = CountingSocket()
+        manager.connect(f"user-{index}-{s}", socket, rooms)
+        sockets.append(socket)
+
+    # 모든 워커가 백플레인에 연결된 뒤 시작
+    await asyncio.to_thread(barrier.wait)
+    await asyncio.sleep(0.2)
+
+    expected = args.workers * args.messages * len(sockets)
+    start = time.perf_counter()
+    for n in range(args.messages):
+        await manager.broadcast_to_room(rooms[n % len(rooms)], {"type": "message", "n": n})
+        if args.unbatched:
+            await manager.backplane.flush()  # 메시지마다 프레임 하나
+        elif n % 100 == 0:
+            await asyncio.sleep(0)  # 수신 루프에 실행 기회
+
+    deadline = start + args.timeout
+    while sum(s.received for s in sockets) < expected and time.perf_counter() < deadline:
+        await asyncio.sleep(0.005)
+    elapsed = time.perf_counter() - start
+
+    results.put(
+        {
+            "worker": index,
+            "delivered": sum(s.received for s in sockets),
+            "expected": expected,
+            "elapsed_s": elapsed,
+            "frames_sent": manager.backplane.frames_sent,
+        }
+    )
+    await asyncio.to_thread(barrier.wait)
+    await manager.detach_backplane()
+
+
+def worker_main(index: int, args, barrier, results) -> None:
+    asyncio.run(run_worker(index, args, barrier, results))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backplane", choices=["local", "redis"], default="local")
+    parser.add_argument("--url", default="")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rooms", type=int, default=10)
+    parser.add_argument("--sockets", type=int, default=5, help="워커당 소켓 수")
+    parser.add_argument("--messages", type=int, default=5000, help="워커당 전송 메시지 수")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--flush-interval-ms", type=float, default=1.0)
+    parser.add_argument("--unbatched", action="store_true", help="배치 없이 메시지마다 전송")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    tmp = None
+    if args.backplane == "local" and not args.url:
+        tmp = tempfile.mkdtemp(prefix="bp-")
+        args.url = os.path.join(tmp, "bp.sock")
+
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(args.workers)
+    results = ctx.Queue()
+    processes = [
+        ctx.Process(target=worker_main, args=(i, args, barrier, results))
+        for i in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    delivered = sum(r["delivered"] for r in reports)
+    expected = sum(r["expected"] for r in reports)
+    elapsed = max(r["elapsed_s"] for r in reports)
+    published = args.workers * args.messages
+    print(
+        json.dumps(
+            {
+                "backplane": args.backplane,
+                "workers": args.workers,
+                "batch_size": 1 if args.unbatched else args.batch_size,
+                "published": published,
+                "delivered": delivered,
+                "expected": expected,
+                "elapsed_s": round(elapsed, 3),
+                "published_per_s": round(published / elapsed),
+                "deliveries_per_s": round(delivered / elapsed),
+                "frames_sent": sum(r["frames_sent"] for r in reports),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""DB 프로필 벤치마크 (default vs production)
+
+파일 SQLite DB에서 쓰기 태스크(메시지 INSERT + 커밋)와 읽기 태스크(최근
+메시지 페이지 조회)를 정해진 시간 동안 동시에 실행하고, 프로필별 처리량과
+지연, 'database is locked' 오류 수를 비교한다.
+
+실행:
+    python -m benchmarks.bench_db_profile --seconds 5 --writers 8 --readers 32
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
+
+from src.database import create_engines, create_session_factory
+from src.models import Base, ChatRoom, Message
+from src.models.base import utcnow
+from src.repositories.message import message_page_query, next_seq
+
+
+def summarize(latencies: list[float], seconds: float) -> dict:
+    if not latencies:
+        return {"ops_per_sec": 0.0}
+    ordered = sorted(latencies)
+    return {
+        "ops_per_sec": round(len(ordered) / seconds, 1),
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p99_ms": round(ordered[max(0, int(len(ordered) * 0.99) - 1)], 2),
+    }
+
+
+async def run_profile(profile: str, args) -> dict:
+    tmpdir = tempfile.mkdtemp(prefix="bench-db-profile-")
+    url = f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'chat.db')}"
+    write_engine, read_engine = create_engines(url, profile=profile)
+    factory = create_session_factory(write_engine, read_engine)
+    try:
+        async with write_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(insert(ChatRoom), {"id": "room", "created_at": utcnow()})
+
+        writes: list[float] = []
+        reads: list[float] = []
+        errors = {"write": 0, "read": 0}
+        deadline = time.perf_counter() + args.seconds
+
+        async def writer() -> None:
+            n = 0
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    async with factory() as session:
+                        await session.execute(
+                            insert(Message).values(
+                                room_id="room", content=f"message {n}", seq=next_seq("room")
+                            )
+                        )
+                        await session.commit()
+                    writes.append((time.perf_counter() - start) * 1000)
+                except OperationalError:
+                    errors["write"] += 1
+                n += 1
+
+        async def reader() -> None:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    async with factory() as session:
+                        (await session.scalars(message_page_query("room", 50))).all()
+                    reads.append((time.perf_counter() - start) * 1000)
+                except OperationalError:
+                    errors["read"] += 1
+
+        await asyncio.gather(
+            *(writer() for _ in range(args.writers)),
+            *(reader() for _ in range(args.readers)),
+        )
+    finally:
+        await write_engine.dispose()
+        if read_engine is not write_engine:
+            await read_engine.dispose()
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    return {
+        "profile": profile,
+        "writes": summarize(writes, args.seconds),
+        "reads": summarize(reads, args.seconds),
+        "locked_errors": errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=32)
+    args = parser.parse_args()
+
+    async def run_all():
+        return [await run_profile(profile, args) for profile in ("default", "production")]
+
+    report = {"writers": args.writers, "readers": args.readers, "results": asyncio.run(run_all())}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
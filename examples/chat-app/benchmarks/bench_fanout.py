@@ -0,0 +1,98 @@
+"""브로드캐스트 팬아웃 인코딩 벤치마크
+
+한 채팅방에 N개의 가짜 WebSocket을 연결하고 메시지를 브로드캐스트해 모든
+송신 큐가 비워질 때까지의 시간을 잰다. 기본은 메시지당 한 번 인코딩한
+프레임을 공유하고, --per-socket은 이전 방식(소켓마다 표준 json 인코딩)이다.
+
+실행:
+    python -m benchmarks.bench_fanout --sockets 1000 --messages 200
+    python -m benchmarks.bench_fanout --sockets 1000 --messages 200 --per-socket
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime
+
+from src.core import serialization
+from src.websocket import manager as manager_module
+from src.websocket.manager import ConnectionManager
+from src.websocket.outbox import Frame
+
+
+class PerSocketFrame(Frame):
+    """소켓마다 다시 인코딩하는 프레임 (이전 send_json 동작)"""
+
+    __slots__ = ()
+
+    @property
+    def text(self) -> str:
+        return json.dumps(self.message, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class CountingSocket:
+    """전송 바이트만 세는 가짜 WebSocket"""
+
+    def __init__(self):
+        self.received = 0
+
+    async def send_text(self, text: str):
+        self.received += len(text)
+
+
+def sample_message(room_id: str, n: int) -> dict:
+    return {
+        "type": "message",
+        "room_id": room_id,
+        "message": {
+            "id": str(uuid.uuid4()),
+            "room_id": room_id,
+            "sender_id": str(uuid.uuid4()),
+            "content": f"안녕하세요, 메시지 {n}번입니다. " * 4,
+            "created_at": datetime.now(),
+        },
+    }
+
+
+async def run(args) -> dict:
+    if args.per_socket:
+        manager_module.Frame = PerSocketFrame
+
+    manager = ConnectionManager(queue_size=args.messages)
+    sockets = [CountingSocket() for _ in range(args.sockets)]
+    room_id = str(uuid.uuid4())
+    for n, websocket in enumerate(sockets):
+        manager.connect(f"user{n}", websocket, [room_id])
+
+    messages = [sample_message(room_id, n) for n in range(args.messages)]
+    start = time.perf_counter()
+    for message in messages:
+        await manager.broadcast_to_room(room_id, message)
+    await manager.flush()
+    elapsed = time.perf_counter() - start
+
+    frames = args.sockets * args.messages
+    return {
+        "mode": "per_socket" if args.per_socket else "shared_frame",
+        "encoder": "json" if args.per_socket or serialization.orjson is None else "orjson",
+        "sockets": args.sockets,
+        "messages": args.messages,
+        "elapsed_s": round(elapsed, 3),
+        "frames_per_s": round(frames / elapsed),
+        "bytes_sent": sum(websocket.received for websocket in sockets),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sockets", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--per-socket", action="store_true")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
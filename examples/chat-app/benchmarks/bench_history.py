@@ -0,0 +1,121 @@
+"""메시지 히스토리 페이지네이션 벤치마크 (OFFSET vs 키셋)
+
+한 채팅방에 N개 메시지를 넣고, 여러 깊이에서 한 페이지를 읽는 시간을
+비교한다. OFFSET은 깊이에 비례해 느려지고, 키셋은 깊이와 무관하다.
+
+실행:
+    python -m benchmarks.bench_history --messages 1000000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from src.models import Base, ChatRoom, Message
+from src.repositories.message import encode_cursor, message_page_query
+
+
+def seed(engine, room_id: str, count: int) -> None:
+    """메시지 대량 삽입 (같은 초에 여러 메시지가 있도록 타임스탬프를 묶음)"""
+    start = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(ChatRoom.__table__.insert(), {"id": room_id, "created_at": start})
+        chunk = 50_000
+        for offset in range(0, count, chunk):
+            rows = [
+                {
+                    "id": str(uuid.uuid4()),
+                    "room_id": room_id,
+                    "sender_id": None,
+                    "content": f"message {n}",
+                    "created_at": start + timedelta(milliseconds=n // 3 * 10),
+                    "seq": n + 1,
+                }
+                for n in range(offset, min(offset + chunk, count))
+            ]
+            conn.execute(Message.__table__.insert(), rows)
+
+
+def timed(session: Session, query, repeat: int) -> float:
+    """쿼리 실행 시간 중앙값 (ms)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        session.scalars(query).all()
+        session.expunge_all()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-history-")
+    path = os.path.join(workdir, "history.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+
+    room_id = str(uuid.uuid4())
+    start = time.perf_counter()
+    seed(engine, room_id, args.messages)
+    seed_s = time.perf_counter() - start
+
+    depths = sorted({0, 1_000, 10_000, 100_000, args.messages // 2, args.messages - args.limit})
+    depths = [d for d in depths if 0 <= d < args.messages]
+    rows = []
+    with Session(engine) as session:
+        for depth in depths:
+            offset_query = (
+                select(Message)
+                .where(Message.room_id == room_id)
+                .order_by(Message.created_at.asc(), Message.id.asc())
+                .offset(depth)
+                .limit(args.limit)
+            )
+            # 해당 깊이 직전 메시지의 커서 (측정 대상 아님)
+            if depth:
+                anchor = session.scalars(offset_query.offset(depth - 1).limit(1)).one()
+                after = encode_cursor(anchor)
+            else:
+                after = None
+            keyset_query = message_page_query(room_id, args.limit, after=after)
+
+            rows.append(
+                {
+                    "depth": depth,
+                    "offset_ms": round(timed(session, offset_query, args.repeat), 3),
+                    "keyset_ms": round(timed(session, keyset_query, args.repeat), 3),
+                }
+            )
+
+    engine.dispose()
+    shutil.rmtree(workdir, ignore_errors=True)
+
+    print(
+        json.dumps(
+            {
+                "messages": args.messages,
+                "limit": args.limit,
+                "seed_s": round(seed_s, 1),
+                "pages": rows,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""메시지 저장 처리량 벤치마크 (메시지별 커밋 vs 그룹 커밋)
+
+동시 생산자 C개가 총 N개 메시지를 파일 SQLite DB에 저장한다. 메시지별
+커밋은 메시지마다 트랜잭션(= fsync)을 하나씩 쓰고, 그룹 커밋은
+MessageIngestQueue로 모아 배치마다 한 번 커밋한다. 두 방식 모두 커밋된
+뒤에 확인 응답을 받는다.
+
+실행:
+    python -m benchmarks.bench_ingest --messages 5000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.models import Base, ChatRoom, Message
+from src.models.base import utcnow
+from src.repositories.ingest import MessageIngestQueue
+from src.repositories.message import next_seq
+
+
+async def run_mode(mode: str, args) -> dict:
+    tmpdir = tempfile.mkdtemp(prefix="bench-ingest-")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'chat.db')}")
+    queue = MessageIngestQueue(batch_size=args.batch_size, max_delay=args.max_delay_ms / 1000)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(insert(ChatRoom), {"id": "room", "created_at": utcnow()})
+
+        if mode == "group":
+            await queue.start(engine)
+        lock = asyncio.Lock()
+
+        async def save(n: int) -> None:
+            if mode == "group":
+                await queue.submit("room", None, f"message {n}")
+                return
+            row = {
+                "id": str(uuid.uuid4()),
+                "room_id": "room",
+                "sender_id": None,
+                "content": f"message {n}",
+                "created_at": utcnow(),
+            }
+            # SQLite는 쓰기 트랜잭션이 하나뿐이므로 직렬화 (busy 재시도 방지)
+            async with lock:
+                async with engine.begin() as conn:
+                    await conn.execute(insert(Message).values(seq=next_seq("room")), row)
+
+        latencies: list[float] = []
+        counter = iter(range(args.messages))
+
+        async def producer() -> None:
+            for n in counter:
+                start = time.perf_counter()
+                await save(n)
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(producer() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await queue.stop()
+        await engine.dispose()
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    ordered = sorted(latencies)
+    result = {
+        "mode": mode,
+        "messages_per_sec": round(args.messages / elapsed, 1),
+        "ack_ms": {
+            "p50": round(statistics.median(ordered), 2),
+            "p99": round(ordered[int(len(ordered) * 0.99) - 1], 2),
+        },
+    }
+    if mode == "group":
+        metrics = queue.metrics()
+        result["batches"] = metrics["batches"]
+        result["avg_batch"] = metrics["avg_batch"]
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--max-delay-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    async def run_all():
+        return [await run_mode(mode, args) for mode in ("per_message", "group")]
+
+    report = {
+        "messages": args.messages,
+        "concurrency": args.concurrency,
+        "results": asyncio.run(run_all()),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""로그인 폭주 중 이벤트 루프 지연 측정
+
+동시 로그인 요청을 몰아넣는 동안 5ms 간격의 프로브 태스크가 얼마나 늦게
+깨어나는지 기록한다. --inline은 bcrypt를 이벤트 루프에서 직접 실행하던
+이전 동작을 재현한다. 풀을 쓰면 지연은 로그인 수와 무관하게 평평하고,
+인라인이면 bcrypt 한 번(수백 ms) 단위로 커진다.
+
+실행:
+    python -m benchmarks.bench_login --logins 200 --concurrency 50
+    python -m benchmarks.bench_login --logins 200 --concurrency 50 --inline
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import uuid
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.security import hash_password, password_hasher, verify_password
+from src.database import get_db
+from src.main import app
+from src.models import Base, User
+
+PASSWORD = "password123"
+
+
+async def probe(stop: asyncio.Event, lags: list[float], interval: float = 0.005) -> None:
+    """interval마다 깨어나 예정보다 늦은 시간(ms)을 기록"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected) * 1000)
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def run(args) -> dict:
+    tmpdir = tempfile.mkdtemp(prefix="bench-login-")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'chat.db')}")
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db():
+        async with factory() as session:
+            yield session
+
+    password_hasher.rounds = args.rounds
+    password_hasher.workers = args.workers
+    password_hasher.max_queue = args.queue_size
+    if args.inline:
+        # 이전 동작: 이벤트 루프에서 bcrypt 직접 호출
+        async def verify_inline(password, hashed):
+            return verify_password(password, hashed)
+
+        password_hasher.verify = verify_inline
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        password_hash = hash_password(PASSWORD, args.rounds)
+        async with factory() as session:
+            session.add_all(
+                User(
+                    id=str(uuid.uuid4()),
+                    username=f"user{n}",
+                    email=f"user{n}@example.com",
+                    password_hash=password_hash,
+                )
+                for n in range(args.logins)
+            )
+            await session.commit()
+
+        app.dependency_overrides[get_db] = override_get_db
+        statuses: dict[int, int] = {}
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+
+            async def login(n: int) -> None:
+                async with semaphore:
+                    response = await client.post(
+                        "/api/auth/login", json={"username": f"user{n}", "password": PASSWORD}
+                    )
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+            # 유휴 상태 기준선
+            stop = asyncio.Event()
+            idle_lags: list[float] = []
+            task = asyncio.create_task(probe(stop, idle_lags))
+            await asyncio.sleep(0.5)
+            stop.set()
+            await task
+
+            stop = asyncio.Event()
+            lags: list[float] = []
+            task = asyncio.create_task(probe(stop, lags))
+            start = time.perf_counter()
+            await asyncio.gather(*(login(n) for n in range(args.logins)))
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await task
+    finally:
+        app.dependency_overrides.clear()
+        password_hasher.shutdown()
+        await engine.dispose()
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    return {
+        "mode": "inline" if args.inline else "pool",
+        "logins": args.logins,
+        "concurrency": args.concurrency,
+        "rounds": args.rounds,
+        "workers": args.workers,
+        "statuses": statuses,
+        "logins_per_sec": round(args.logins / elapsed, 1),
+        "idle_lag_ms": {"p50": round(statistics.median(idle_lags), 2)},
+        "burst_lag_ms": {
+            "p50": round(statistics.median(lags), 2),
+            "p99": round(percentile(lags, 0.99), 2),
+            "max": round(max(lags), 2),
+            "samples": len(lags),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--queue-size", type=int, default=1000)
+    parser.add_argument("--inline", action="store_true", help="bcrypt를 이벤트 루프에서 실행")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
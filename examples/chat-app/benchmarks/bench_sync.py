@@ -0,0 +1,134 @@
+"""재연결 동기화 벤치마크 (채팅방별 재조회 vs 동기화 쿼리)
+
+한 사용자가 R개 채팅방에 속해 있고 채팅방마다 M개 메시지가 있을 때,
+재연결 한 번에 드는 쿼리 시간을 비교한다.
+
+- repage: 채팅방마다 최근 메시지 한 페이지를 다시 조회 (이전 방식)
+- sync_idle: 놓친 메시지가 없을 때 (채팅방 위치 조회 한 번)
+- sync_behind: 채팅방마다 놓친(안 읽은) 메시지가 --missed개 있을 때
+
+실행:
+    python -m benchmarks.bench_sync --rooms 200 --messages 5000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.models import Base, ChatRoom, ChatRoomMember, Message, User
+from src.repositories.message import message_page_query
+from src.repositories.sync import messages_since_query, room_heads_query, unread_counts_query
+
+
+def seed(engine, user_id: str, rooms: int, messages: int, unread: int) -> list[str]:
+    """사용자 하나와 채팅방 R개, 채팅방마다 메시지 M개 삽입 (마지막 unread개는 안 읽음)"""
+    start = datetime(2025, 1, 1)
+    room_ids = [str(uuid.uuid4()) for _ in range(rooms)]
+    read_up_to = messages - unread - 1
+    with engine.begin() as conn:
+        conn.execute(
+            User.__table__.insert(),
+            {
+                "id": user_id,
+                "username": "bench",
+                "email": "bench@example.com",
+                "password_hash": "x",
+                "is_active": True,
+                "created_at": start,
+            },
+        )
+        conn.execute(
+            ChatRoom.__table__.insert(), [{"id": r, "created_at": start} for r in room_ids]
+        )
+        members = []
+        for room_id in room_ids:
+            rows = [
+                {
+                    "id": str(uuid.uuid4()),
+                    "room_id": room_id,
+                    "sender_id": None,
+                    "content": f"message {n}",
+                    "created_at": start + timedelta(seconds=n),
+                    "seq": n + 1,
+                }
+                for n in range(messages)
+            ]
+            conn.execute(Message.__table__.insert(), rows)
+            members.append(
+                {
+                    "room_id": room_id,
+                    "user_id": user_id,
+                    "joined_at": start,
+                    "last_read_at": rows[read_up_to]["created_at"],
+                    "last_read_message_id": rows[read_up_to]["id"],
+                }
+            )
+        conn.execute(ChatRoomMember.__table__.insert(), members)
+    return room_ids
+
+
+def timed(fn, repeat: int) -> float:
+    """실행 시간 중앙값 (ms)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--missed", type=int, default=5)
+    parser.add_argument("--page", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-sync-")
+    engine = create_engine(f"sqlite:///{os.path.join(workdir, 'sync.db')}")
+    Base.metadata.create_all(engine)
+    user_id = str(uuid.uuid4())
+    room_ids = seed(engine, user_id, args.rooms, args.messages, args.missed)
+
+    with Session(engine) as session:
+
+        def repage():
+            for room_id in room_ids:
+                session.scalars(message_page_query(room_id, args.page)).all()
+            session.expunge_all()
+
+        def sync(missed: int):
+            heads = dict(session.execute(room_heads_query(user_id)).all())
+            behind = {r: seq - missed for r, seq in heads.items() if missed}
+            if behind:
+                session.scalars(messages_since_query(behind, args.page + 1)).all()
+                session.execute(unread_counts_query(user_id, list(behind))).all()
+            session.expunge_all()
+
+        result = {
+            "rooms": args.rooms,
+            "messages_per_room": args.messages,
+            "missed_per_room": args.missed,
+            "repage_ms": round(timed(repage, args.repeat), 3),
+            "sync_idle_ms": round(timed(lambda: sync(0), args.repeat), 3),
+            "sync_behind_ms": round(timed(lambda: sync(args.missed), args.repeat), 3),
+        }
+
+    engine.dispose()
+    shutil.rmtree(workdir, ignore_errors=True)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
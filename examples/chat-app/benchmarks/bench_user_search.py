@@ -0,0 +1,114 @@
+"""사용자 검색 벤치마크 (LIKE '%q%' 전체 스캔 vs 인덱스 검색)
+
+N명의 사용자를 넣고 검색어별 첫 페이지 조회 시간을 비교한다. LIKE는
+일치하는 행이 적을수록(끝까지 스캔해야 할수록) 느려지고, 인덱스 검색은
+일치하는 행 수와 무관하다.
+
+실행:
+    python -m benchmarks.bench_user_search --users 1000000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from src.migrations.user_search_index import upgrade
+from src.models import Base, User
+from src.repositories.user import user_search_stages
+
+QUERIES = ["user1", "user123456", "er12345", "99999", "zz", "nomatchatall"]
+
+
+def seed(engine, count: int) -> None:
+    with engine.begin() as conn:
+        chunk = 50_000
+        for offset in range(0, count, chunk):
+            conn.execute(
+                User.__table__.insert(),
+                [
+                    {
+                        "id": f"{n:036d}",
+                        "username": f"user{n}",
+                        "email": f"user{n}@example.com",
+                        "password_hash": "x",
+                        "is_active": True,
+                        "token_version": 0,
+                    }
+                    for n in range(offset, min(offset + chunk, count))
+                ],
+            )
+
+
+def timed(session: Session, queries, limit: int, repeat: int) -> float:
+    """limit개가 찰 때까지 쿼리를 차례로 실행한 시간 중앙값 (ms)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = 0
+        for query in queries:
+            found += len(session.execute(query.limit(limit - found)).all())
+            if found == limit:
+                break
+        session.expunge_all()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="bench-user-search-")
+    engine = create_engine(f"sqlite:///{os.path.join(tmpdir, 'chat.db')}")
+    try:
+        Base.metadata.create_all(engine)
+        start = time.perf_counter()
+        seed(engine, args.users)
+        seed_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            upgrade(conn)
+        index_seconds = time.perf_counter() - start
+
+        results = []
+        with Session(engine) as session:
+            for q in QUERIES:
+                like = [select(User).where(User.is_active.is_(True), User.username.contains(q))]
+                stages = [query for _, query in user_search_stages("sqlite", q)]
+                results.append(
+                    {
+                        "q": q,
+                        "like_ms": round(timed(session, like, args.limit, args.repeat), 3),
+                        "index_ms": round(timed(session, stages, args.limit, args.repeat), 3),
+                    }
+                )
+    finally:
+        engine.dispose()
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    print(
+        json.dumps(
+            {
+                "users": args.users,
+                "seed_seconds": round(seed_seconds, 1),
+                "index_build_seconds": round(index_seconds, 1),
+                "queries": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
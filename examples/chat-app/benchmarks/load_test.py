@@ -0,0 +1,506 @@
+"""부하 테스트 (HTTP 요청 혼합 + WebSocket 수신)
+
+가상 사용자 --users명이 1:1 채팅방 --rooms개에 고르게 나뉘어, 각자 --mix
+비율대로 요청(send: 메시지 전송, history: 메시지 조회, rooms: 채팅방 목록,
+sync: 재연결 동기화)을 --duration초 동안 연달아 보낸다. 앞의 --receivers명은
+WebSocket으로 메시지를 받으며, 전송 요청 시작부터 수신까지를 팬아웃 지연으로
+기록한다. 요청 종류별 처리량, p50/p95/p99 지연, 상태 코드를 JSON으로 출력한다.
+
+- 기본: 앱을 같은 프로세스에서 ASGI로 호출한다 (임시 SQLite 파일 DB, 속도 제한
+  해제, bcrypt cost --rounds). 수신자는 연결 관리자에 직접 붙인 소켓이다.
+- --url: 실행 중인 서버(uvicorn)에 HTTP/WebSocket으로 접속한다. 사용자 생성이
+  빠르도록 서버를 BCRYPT_ROUNDS=4 RATE_LIMIT_ENABLED=false로 띄우는 것을 권장한다.
+
+같은 --seed와 설정이면 요청 순서가 같으므로 실행 결과끼리 비교할 수 있다.
+--output으로 결과를 저장하고 --baseline으로 이전 결과를 주면, 처리량이 줄거나
+p95 지연이 --tolerance 비율 이상 늘어난 항목을 regressions에 표시한다.
+
+실행:
+    python -m benchmarks.load_test --users 50 --rooms 100 --duration 10 --receivers 20
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --output base.json
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --baseline base.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+
+import httpx
+
+OPERATIONS = ("send", "history", "rooms", "sync")
+PASSWORD = "password123"
+
+
+@dataclass
+class VirtualUser:
+    index: int
+    id: str
+    token: str
+    rooms: list[str] = field(default_factory=list)
+
+    @property
+    def headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+class Recorder:
+    """요청 종류별 지연과 상태 코드"""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {op: [] for op in OPERATIONS}
+        self.statuses: dict[str, Counter] = {op: Counter() for op in OPERATIONS}
+
+    def add(self, op: str, status: int | str, seconds: float) -> None:
+        self.latencies[op].append(seconds * 1000)
+        self.statuses[op][str(status)] += 1
+
+
+class Fanout:
+    """전송한 메시지의 수신 지연"""
+
+    def __init__(self):
+        self.sent: dict[str, float] = {}
+        self.expected = 0
+        self.lags: list[float] = []
+        self.delivered = asyncio.Event()
+
+    def on_frame(self, frame: dict) -> None:
+        if frame.get("type") != "message":
+            return
+        started = self.sent.get(frame["message"]["content"])
+        if started is not None:
+            self.lags.append((time.perf_counter() - started) * 1000)
+            if len(self.lags) >= self.expected:
+                self.delivered.set()
+
+
+class RecordingSocket:
+    """연결 관리자에 직접 붙이는 수신 소켓 (같은 프로세스 모드)"""
+
+    def __init__(self, fanout: Fanout):
+        self.fanout = fanout
+
+    async def send_text(self, text: str) -> None:
+        self.fanout.on_frame(json.loads(text))
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+def latency_summary(values: list[float]) -> dict:
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "max": None, "mean": None}
+    ordered = sorted(values)
+
+    def at(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * q))], 2)
+
+    return {
+        "p50": at(0.50),
+        "p95": at(0.95),
+        "p99": at(0.99),
+        "max": round(ordered[-1], 2),
+        "mean": round(statistics.fmean(ordered), 2),
+    }
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """"send=1,history=3" → {"send": 1.0, "history": 3.0}"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in OPERATIONS:
+            choices = ", ".join(OPERATIONS)
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r} ({choices})")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def room_pairs(users: int, rooms: int) -> list[tuple[int, int]]:
+    """서로 다른 사용자 쌍 rooms개 (사용자마다 채팅방 수가 고르게)"""
+    if rooms > users * (users - 1) // 2:
+        raise SystemExit(f"{users} users can have at most {users * (users - 1) // 2} rooms")
+    pairs: list[tuple[int, int]] = []
+    seen: set[tuple[int, int]] = set()
+    for step in range(1, users // 2 + 1):
+        for a in range(users):
+            pair = tuple(sorted((a, (a + step) % users)))
+            if pair not in seen:
+                seen.add(pair)
+                pairs.append(pair)
+                if len(pairs) == rooms:
+                    return pairs
+    return pairs
+
+
+async def request(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+    """429/503이면 Retry-After만큼 기다렸다가 재시도 (준비 단계용)"""
+    while True:
+        response = await client.request(method, url, **kwargs)
+        if response.status_code not in (429, 503):
+            return response
+        await asyncio.sleep(float(response.headers.get("Retry-After", "1")))
+
+
+async def create_users(client: httpx.AsyncClient, count: int, concurrency: int) -> list:
+    run_id = uuid.uuid4().hex[:8]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(n: int) -> VirtualUser:
+        username = f"lt{run_id}_{n}"
+        async with semaphore:
+            response = await request(
+                client,
+                "POST",
+                "/api/auth/register",
+                json={
+                    "username": username,
+                    "email": f"{username}@example.com",
+                    "password": PASSWORD,
+                },
+            )
+            response.raise_for_status()
+            user_id = response.json()["id"]
+            response = await request(
+                client, "POST", "/api/auth/login", json={"username": username, "password": PASSWORD}
+            )
+            response.raise_for_status()
+        return VirtualUser(n, user_id, response.json()["access_token"])
+
+    return list(await asyncio.gather(*(create(n) for n in range(count))))
+
+
+async def create_rooms(
+    client: httpx.AsyncClient, users: list[VirtualUser], rooms: int, concurrency: int
+) -> dict[str, tuple[int, int]]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(a: int, b: int) -> tuple[str, tuple[int, int]]:
+        async with semaphore:
+            response = await request(
+                client,
+                "POST",
+                "/api/rooms",
+                json={"other_user_id": users[b].id},
+                headers=users[a].headers,
+            )
+            response.raise_for_status()
+        return response.json()["id"], (a, b)
+
+    created = dict(await asyncio.gather(*(create(a, b) for a, b in room_pairs(len(users), rooms))))
+    for room_id, pair in created.items():
+        for n in pair:
+            users[n].rooms.append(room_id)
+    return created
+
+
+async def virtual_user(
+    client: httpx.AsyncClient,
+    user: VirtualUser,
+    mix: dict[str, float],
+    deadline: float,
+    think: float,
+    seed: int,
+    recorder: Recorder,
+    fanout: Fanout,
+    receivers_per_room: dict[str, int],
+) -> None:
+    rng = random.Random(seed * 1_000_003 + user.index)
+    ops, weights = list(mix), list(mix.values())
+    cursor: str | None = None
+    sent = 0
+    while time.perf_counter() < deadline:
+        op = rng.choices(ops, weights)[0]
+        if op in ("send", "history") and not user.rooms:
+            op = "rooms"
+        room_id = rng.choice(user.rooms) if user.rooms else None
+        started = time.perf_counter()
+        try:
+            if op == "send":
+                content = f"load {user.index}:{sent}"
+                sent += 1
+                fanout.sent[content] = started
+                fanout.expected += receivers_per_room.get(room_id, 0)
+                response = await client.post(
+                    f"/api/rooms/{room_id}/messages",
+                    json={"content": content},
+                    headers=user.headers,
+                )
+            elif op == "history":
+                response = await client.get(
+                    f"/api/rooms/{room_id}/messages", params={"limit": 50}, headers=user.headers
+                )
+            elif op == "rooms":
+                response = await client.get("/api/rooms", headers=user.headers)
+            else:
+                response = await client.post(
+                    "/api/sync", json={"since": cursor}, headers=user.headers
+                )
+                if response.status_code == 200:
+                    cursor = response.json()["cursor"]
+            status: int | str = response.status_code
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        recorder.add(op, status, time.perf_counter() - started)
+        if think:
+            await asyncio.sleep(rng.expovariate(1 / think))
+
+
+async def ws_receiver(base_url: str, user: VirtualUser, fanout: Fanout, ready: asyncio.Event):
+    """서버에 WebSocket으로 연결해 메시지 수신 (--url 모드)"""
+    import websockets
+
+    url = base_url.replace("http", "ws", 1) + f"/ws?token={user.token}"
+    async with websockets.connect(url) as websocket:
+        ready.set()
+        while True:
+            try:
+                frame = await asyncio.wait_for(websocket.recv(), timeout=20)
+            except asyncio.TimeoutError:
+                # 서버의 presence TTL 안에 하트비트 프레임 전송
+                await websocket.send("ping")
+                continue
+            fanout.on_frame(json.loads(frame))
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline: dict, result: dict, tolerance: float) -> list[str]:
+    """이전 결과보다 처리량이 줄었거나 p95 지연이 늘어난 항목"""
+    regressions = []
+
+    def check(name: str, before, after, higher_is_better: bool) -> None:
+        if not before or after is None:
+            return
+        change = (after - before) / before
+        if (-change if higher_is_better else change) > tolerance:
+            regressions.append(f"{name}: {before} -> {after} ({change:+.0%})")
+
+    for op, current in result["operations"].items():
+        previous = baseline.get("operations", {}).get(op)
+        if previous is None:
+            continue
+        check(f"{op}.rps", previous["rps"], current["rps"], higher_is_better=True)
+        check(f"{op}.p95_ms", previous["latency_ms"]["p95"], current["latency_ms"]["p95"], False)
+    check(
+        "fanout.p95_ms",
+        baseline.get("fanout", {}).get("lag_ms", {}).get("p95"),
+        result["fanout"]["lag_ms"]["p95"],
+        higher_is_better=False,
+    )
+    return regressions
+
+
+async def run_in_process(args, body) -> dict:
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from src.core.rate_limit import rate_limiter
+    from src.core.security import password_hasher
+    from src.database import get_db
+    from src.main import app
+    from src.migrations import upgrade_all
+    from src.models import Base
+    from src.websocket.manager import manager
+
+    tmpdir = tempfile.mkdtemp(prefix="load-test-")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'chat.db')}")
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db():
+        async with factory() as session:
+            yield session
+
+    password_hasher.rounds = args.rounds
+    rate_limiter.enabled = args.rate_limit
+    attached: list[tuple[str, RecordingSocket]] = []
+
+    async def attach(users: list[VirtualUser], fanout: Fanout) -> None:
+        for user in users:
+            socket = RecordingSocket(fanout)
+            manager.connect(user.id, socket, user.rooms)
+            attached.append((user.id, socket))
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(upgrade_all)
+        app.dependency_overrides[get_db] = override_get_db
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+            return await body(client, attach)
+    finally:
+        for user_id, socket in attached:
+            manager.disconnect(user_id, socket)
+        app.dependency_overrides.clear()
+        password_hasher.shutdown()
+        await engine.dispose()
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+async def run_against_server(args, body) -> dict:
+    tasks: list[asyncio.Task] = []
+
+    async def attach(users: list[VirtualUser], fanout: Fanout) -> None:
+        for user in users:
+            ready = asyncio.Event()
+            tasks.append(asyncio.create_task(ws_receiver(args.url, user, fanout, ready)))
+            await ready.wait()
+
+    limits = httpx.Limits(max_connections=args.users + 10)
+    try:
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+            return await body(client, attach)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def run(args) -> dict:
+    recorder = Recorder()
+    fanout = Fanout()
+
+    async def body(client: httpx.AsyncClient, attach) -> dict:
+        users = await create_users(client, args.users, args.setup_concurrency)
+        await create_rooms(client, users, args.rooms, args.setup_concurrency)
+
+        receivers = users[: args.receivers]
+        await attach(receivers, fanout)
+        receivers_per_room = Counter(room_id for user in receivers for room_id in user.rooms)
+
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(
+                virtual_user(
+                    client,
+                    user,
+                    args.mix,
+                    deadline,
+                    args.think_ms / 1000,
+                    args.seed,
+                    recorder,
+                    fanout,
+                    receivers_per_room,
+                )
+                for user in users
+            )
+        )
+        elapsed = time.perf_counter() - started
+        # 남은 브로드캐스트 수신 대기
+        if len(fanout.lags) < fanout.expected:
+            try:
+                await asyncio.wait_for(fanout.delivered.wait(), args.drain)
+            except asyncio.TimeoutError:
+                pass
+        return {"elapsed": elapsed}
+
+    if args.url:
+        measured = await run_against_server(args, body)
+    else:
+        measured = await run_in_process(args, body)
+
+    elapsed = measured["elapsed"]
+    operations = {}
+    for op in OPERATIONS:
+        latencies = recorder.latencies[op]
+        if not latencies:
+            continue
+        statuses = recorder.statuses[op]
+        operations[op] = {
+            "count": len(latencies),
+            "errors": sum(n for code, n in statuses.items() if not code.startswith(("2", "3"))),
+            "statuses": dict(sorted(statuses.items())),
+            "rps": round(len(latencies) / elapsed, 1),
+            "latency_ms": latency_summary(latencies),
+        }
+    total = sum(len(values) for values in recorder.latencies.values())
+    return {
+        "config": {
+            "target": args.url or "in-process",
+            "users": args.users,
+            "rooms": args.rooms,
+            "receivers": args.receivers,
+            "duration": args.duration,
+            "mix": args.mix,
+            "think_ms": args.think_ms,
+            "seed": args.seed,
+        },
+        "git_rev": git_revision(),
+        "elapsed_s": round(elapsed, 2),
+        "requests": total,
+        "rps": round(total / elapsed, 1),
+        "operations": operations,
+        "fanout": {
+            "expected": fanout.expected,
+            "delivered": len(fanout.lags),
+            "missing": max(0, fanout.expected - len(fanout.lags)),
+            "lag_ms": latency_summary(fanout.lags),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="", help="서버 주소 (생략하면 같은 프로세스에서 실행)")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--rooms", type=int, default=100)
+    parser.add_argument("--receivers", type=int, default=20, help="WebSocket 수신 사용자 수")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument(
+        "--mix", type=parse_mix, default=parse_mix("send=2,history=5,rooms=2,sync=1")
+    )
+    parser.add_argument(
+        "--think-ms", type=float, default=0.0, help="요청 사이 평균 대기 (지수 분포)"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--drain", type=float, default=5.0, help="종료 후 수신 대기 초")
+    parser.add_argument("--setup-concurrency", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=4, help="같은 프로세스 모드의 bcrypt cost")
+    parser.add_argument(
+        "--rate-limit", action="store_true", help="같은 프로세스 모드에서 속도 제한 유지"
+    )
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+    args.receivers = min(args.receivers, args.users)
+
+    result = asyncio.run(run(args))
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        result["baseline"] = {
+            "path": args.baseline,
+            "git_rev": baseline.get("git_rev"),
+            "same_config": baseline.get("config") == result["config"],
+        }
+        result["regressions"] = compare(baseline, result, args.tolerance)
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,33 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
+from src.core.user_cache import UserSnapshot, user_cache
 from src.database import get_db
 from src.models.user import User
 
 security = HTTPBearer()
 
 
+async def load_user_snapshot(db: AsyncSession, user_id: str) -> UserSnapshot | None:
+    """사용자 스냅샷 조회 (캐시에 없을 때만 DB 조회)"""
+    snapshot = user_cache.get(user_id)
+    if snapshot is None:
+        user = await db.get(User, user_id)
+        if user is None:
+            return None
+        snapshot = UserSnapshot.from_user(user)
+        user_cache.set(user_id, snapshot)
+    return snapshot
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
-) -> User:
+) -> UserSnapshot:
+    """access 토큰의 사용자 스냅샷 (읽기 전용, 캐시 히트 시 DB 조회 없음)"""
     token = credentials.credentials
 
     try:
@@ -33,13 +46,19 @@ async def get_current_user(
             detail="Invalid or expired token",
         )
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    snapshot = await load_user_snapshot(db, user_id)
 
-    if user is None:
+    if snapshot is None or not snapshot.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
 
-    return user
+    # ver 클레임이 없는 이전 토큰은 버전 0으로 취급
+    if payload.get("ver", 0) != snapshot.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+        )
+
+    return snapshot
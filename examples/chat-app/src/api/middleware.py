@@ -0,0 +1,116 @@
+"""ASGI 미들웨어"""
+
+import math
+import time
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.instrumentation import record_request, track_request
+from src.core.metrics import HTTP_REQUEST_SECONDS
+from src.core.rate_limit import AdmissionControl, RateLimiter
+from src.core.security import decode_access_token
+
+# 속도/동시 요청 수 제한에서 제외하는 경로
+EXEMPT_PATHS = frozenset({"/health", "/metrics"})
+
+
+def client_identity(scope: Scope) -> str:
+    """속도 제한 키 (유효한 access 토큰이면 사용자, 아니면 클라이언트 IP)"""
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer":
+                claims = decode_access_token(token)
+                if claims is not None:
+                    return f"user:{claims[0]}"
+            break
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+class RateLimitMiddleware:
+    """HTTP 요청의 속도 제한(429)과 동시 요청 수 제한(503)
+
+    라우팅 전에 거절하므로 거절된 요청은 DB 세션이나 인증 의존성을 만들지 않는다.
+    WebSocket 연결은 오래 유지되므로 동시 요청 수에 포함하지 않는다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: RateLimiter,
+        admission: AdmissionControl | None = None,
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.admission = admission
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        if self.limiter.enabled:
+            _, retry_after = self.limiter.check(
+                scope["method"], scope["path"], client_identity(scope)
+            )
+            if retry_after:
+                response = JSONResponse(
+                    status_code=429,
+                    content={"detail": "Too many requests"},
+                    headers={"Retry-After": str(max(1, math.ceil(min(retry_after, 3600))))},
+                )
+                await response(scope, receive, send)
+                return
+
+        if self.admission is None:
+            await self.app(scope, receive, send)
+            return
+        if not await self.admission.acquire():
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "Server is busy, try again shortly"},
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.admission.release()
+
+
+class InstrumentationMiddleware:
+    """HTTP 요청의 라우트별 지연, 쿼리 수, DB 시간 기록
+
+    라우트 레이블은 경로가 아니라 매칭된 라우트 템플릿("/api/rooms/{room_id}")이라
+    레이블 수가 라우트 수로 제한된다. 매칭되지 않은 요청은 "unmatched"로 묶는다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        with track_request() as stats:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", "unmatched")
+                HTTP_REQUEST_SECONDS.observe(
+                    time.perf_counter() - started, scope["method"], route, str(status_code)
+                )
+                record_request(route, stats)
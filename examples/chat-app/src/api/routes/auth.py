@@ -6,7 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_current_user
 from src.core.config import settings
-from src.core.security import create_access_token, create_refresh_token, hash_password, verify_password
+from src.core.security import create_access_token, create_refresh_token, password_hasher
+from src.core.user_cache import UserSnapshot
 from src.database import get_db
 from src.models.user import User
 from src.schemas.auth import LoginRequest, RefreshRequest, TokenResponse, UserCreate, UserResponse
@@ -17,7 +18,7 @@ router = APIRouter(prefix="/api/auth", tags=["auth"])
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     # 비밀번호 해시화
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await password_hasher.hash(user_data.password)
 
     # 사용자 생성
     user = User(
@@ -46,14 +47,19 @@ async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.username == login_data.username))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(login_data.password, user.password_hash):
+    if not user or not await password_hasher.verify(login_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
         )
 
+    # cost 설정이 바뀌었으면 평문을 알고 있는 지금 재해시
+    if password_hasher.needs_rehash(user.password_hash):
+        user.password_hash = await password_hasher.hash(login_data.password)
+        await db.commit()
+
     # 토큰 생성
-    token_data = {"sub": user.id, "username": user.username}
+    token_data = {"sub": user.id, "username": user.username, "ver": user.token_version}
     access_token = create_access_token(token_data)
     refresh_token = create_refresh_token(token_data)
 
@@ -61,14 +67,16 @@ async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(current_user: UserSnapshot = Depends(get_current_user)):
     return current_user
 
 
 @router.post("/refresh")
 async def refresh_token(data: RefreshRequest, db: AsyncSession = Depends(get_db)):
     try:
-        payload = jwt.decode(data.refresh_token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt.decode(
+            data.refresh_token, settings.secret_key, algorithms=[settings.algorithm]
+        )
         user_id: str = payload.get("sub")
         token_type: str = payload.get("type")
 
@@ -86,13 +94,30 @@ async def refresh_token(data: RefreshRequest, db: AsyncSession = Depends(get_db)
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
-    if user is None:
+    if user is None or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
 
-    token_data = {"sub": user.id, "username": user.username}
+    if payload.get("ver", 0) != user.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token has been revoked",
+        )
+
+    token_data = {"sub": user.id, "username": user.username, "ver": user.token_version}
     new_access_token = create_access_token(token_data)
 
     return {"access_token": new_access_token, "token_type": "bearer"}
+
+
+@router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
+async def logout_all(
+    db: AsyncSession = Depends(get_db),
+    current_user: UserSnapshot = Depends(get_current_user),
+):
+    """모든 기기에서 로그아웃 (발급된 access/refresh 토큰 전부 무효화)"""
+    user = await db.get(User, current_user.id)
+    user.token_version += 1
+    await db.commit()
@@ -1,12 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_current_user
+from src.core.config import settings
+from src.core.membership_cache import membership_cache
+from src.core.user_cache import UserSnapshot
 from src.database import get_db
 from src.models.message import Message, MessageRead
 from src.models.room import ChatRoomMember
-from src.models.user import User
+from src.repositories.ingest import message_ingest
+from src.repositories.message import (
+    SEQ_RETRIES,
+    InvalidCursor,
+    encode_cursor,
+    latest_message_query,
+    mark_read_receipts_stmt,
+    message_page_query,
+    next_seq,
+    unread_count_query,
+)
 from src.schemas.message import MessageCreate, MessageResponse
 from src.websocket.manager import manager
 
@@ -14,33 +28,33 @@ router = APIRouter(prefix="/api/rooms", tags=["messages"])
 read_router = APIRouter(prefix="/api/messages", tags=["read-status"])
 
 
-async def check_room_membership(db: AsyncSession, room_id: str, user_id: str) -> bool:
-    """사용자가 채팅방 멤버인지 확인"""
-    result = await db.execute(
-        select(ChatRoomMember).where(
-            ChatRoomMember.room_id == room_id, ChatRoomMember.user_id == user_id
-        )
-    )
-    return result.scalar_one_or_none() is not None
+async def get_membership(db: AsyncSession, room_id: str, user_id: str) -> ChatRoomMember | None:
+    """채팅방 멤버 정보 조회"""
+    return await db.get(ChatRoomMember, (room_id, user_id))
 
 
-async def get_room_member_ids(db: AsyncSession, room_id: str) -> list[str]:
-    """채팅방 멤버 ID 목록 조회"""
-    result = await db.execute(
-        select(ChatRoomMember.user_id).where(ChatRoomMember.room_id == room_id)
-    )
-    return [r for r in result.scalars().all()]
+async def check_room_membership(db: AsyncSession, room_id: str, user_id: str) -> bool:
+    """사용자가 채팅방 멤버인지 확인 (멤버십 캐시)"""
+    return await membership_cache.is_member(db, room_id, user_id)
 
 
 @router.get("/{room_id}/messages", response_model=list[MessageResponse])
 async def get_messages(
     room_id: str,
-    limit: int = 50,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
     offset: int = 0,
+    before: str | None = None,
+    after: str | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
-    """채팅방 메시지 히스토리 조회"""
+    """채팅방 메시지 히스토리 조회
+
+    before/after 커서를 주면 (created_at, id) 키셋으로 조회하고, 결과는 항상
+    시간순이다. 응답 헤더의 X-Before-Cursor / X-After-Cursor로 이전/다음
+    페이지를 요청한다. offset은 커서가 없을 때만 사용한다 (하위 호환).
+    """
     # 채팅방 멤버 확인
     if not await check_room_membership(db, room_id, current_user.id):
         raise HTTPException(
@@ -48,14 +62,29 @@ async def get_messages(
             detail="You are not a member of this room",
         )
 
-    result = await db.execute(
-        select(Message)
-        .where(Message.room_id == room_id)
-        .order_by(Message.created_at.asc())
-        .offset(offset)
-        .limit(limit)
-    )
-    return result.scalars().all()
+    if before is not None and after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either before or after, not both",
+        )
+
+    try:
+        query = message_page_query(room_id, limit, before=before, after=after)
+    except InvalidCursor:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    if before is None and after is None and offset:
+        query = query.offset(offset)
+
+    result = await db.execute(query)
+    messages = list(result.scalars().all())
+    if before is not None:
+        messages.reverse()
+
+    if messages:
+        response.headers["X-Before-Cursor"] = encode_cursor(messages[0])
+        response.headers["X-After-Cursor"] = encode_cursor(messages[-1])
+    return messages
 
 
 @router.post(
@@ -64,9 +93,17 @@ async def get_messages(
 async def send_message(
     room_id: str,
     message_data: MessageCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
+    """메시지 전송
+
+    INSERT ... RETURNING 한 문장으로 저장하고 저장된 행을 그대로 응답한다.
+    채팅방 시퀀스 번호(seq)도 같은 문장 안에서 계산된다.
+    그룹 커밋이 켜져 있으면 수집 큐에 넣고 배치가 커밋될 때까지 기다린다.
+    WebSocket 브로드캐스트는 응답을 보낸 뒤 백그라운드 태스크로 실행한다.
+    """
     # 채팅방 멤버 확인
     if not await check_room_membership(db, room_id, current_user.id):
         raise HTTPException(
@@ -74,59 +111,74 @@ async def send_message(
             detail="You are not a member of this room",
         )
 
-    # 메시지 저장
-    message = Message(
-        room_id=room_id,
-        sender_id=current_user.id,
-        content=message_data.content,
-    )
-    db.add(message)
-    await db.commit()
-    await db.refresh(message)
-
-    # WebSocket으로 실시간 전송
-    member_ids = await get_room_member_ids(db, room_id)
-    await manager.broadcast_to_room(
-        member_ids,
-        {
-            "type": "message",
-            "room_id": room_id,
-            "message": MessageResponse.model_validate(message).model_dump(mode="json"),
-        },
+    if message_ingest.running:
+        # 멤버 확인용 읽기 트랜잭션을 먼저 끝내 배치 커밋과 겹치지 않게 함
+        await db.rollback()
+        row = await message_ingest.submit(room_id, current_user.id, message_data.content)
+        payload = MessageResponse.model_validate(row)
+    else:
+        # 메시지 저장 (id/created_at/seq가 같은 문장에서 채워져 돌아옴)
+        stmt = (
+            insert(Message)
+            .values(
+                room_id=room_id,
+                sender_id=current_user.id,
+                content=message_data.content,
+                seq=next_seq(room_id),
+            )
+            .returning(Message)
+        )
+        for attempt in range(SEQ_RETRIES):
+            try:
+                message = await db.scalar(stmt)
+                await db.commit()
+                break
+            except IntegrityError:
+                # 동시에 커밋된 메시지와 seq가 겹침 → 다음 번호로 재시도
+                await db.rollback()
+                if attempt == SEQ_RETRIES - 1:
+                    raise
+        payload = MessageResponse.model_validate(message)
+
+    # WebSocket으로 실시간 전송 (응답 후, 채팅방에 연결된 소켓만)
+    # datetime은 프레임 인코딩 때 직렬화하므로 여기서는 파이썬 모드로 덤프
+    background_tasks.add_task(
+        manager.broadcast_to_room,
+        room_id,
+        {"type": "message", "room_id": room_id, "message": payload.model_dump()},
     )
 
-    return message
+    return payload
 
 
 @read_router.post("/{message_id}/read")
 async def mark_as_read(
     message_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
-    """메시지 읽음 표시"""
+    """메시지 읽음 표시 (이 메시지까지 읽음 워터마크 전진)"""
     # 메시지 존재 확인
-    result = await db.execute(select(Message).where(Message.id == message_id))
-    message = result.scalar_one_or_none()
+    message = await db.get(Message, message_id)
     if not message:
         raise HTTPException(status_code=404, detail="Message not found")
 
     # 채팅방 멤버 확인
-    if not await check_room_membership(db, message.room_id, current_user.id):
+    member = await get_membership(db, message.room_id, current_user.id)
+    if member is None:
         raise HTTPException(status_code=403, detail="You are not a member of this room")
 
-    # 이미 읽음 표시 확인
-    existing = await db.execute(
-        select(MessageRead).where(
-            MessageRead.message_id == message_id, MessageRead.user_id == current_user.id
-        )
-    )
-    if existing.scalar_one_or_none():
-        return {"read": True, "message_id": message_id}
+    # 워터마크는 앞으로만 이동
+    if not member.has_read(message.created_at, message.id):
+        member.last_read_at = message.created_at
+        member.last_read_message_id = message.id
+
+    # 메시지별 읽음 기록 (선택 기능)
+    if settings.read_receipts:
+        existing = await db.get(MessageRead, (message_id, current_user.id))
+        if existing is None:
+            db.add(MessageRead(message_id=message_id, user_id=current_user.id))
 
-    # 읽음 표시 저장
-    read_status = MessageRead(message_id=message_id, user_id=current_user.id)
-    db.add(read_status)
     await db.commit()
 
     return {"read": True, "message_id": message_id}
@@ -136,28 +188,14 @@ async def mark_as_read(
 async def get_unread_count(
     room_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
     """안 읽은 메시지 수 조회"""
-    if not await check_room_membership(db, room_id, current_user.id):
+    member = await get_membership(db, room_id, current_user.id)
+    if member is None:
         raise HTTPException(status_code=403, detail="You are not a member of this room")
 
-    # 채팅방 내 전체 메시지 중 내가 보내지 않은 메시지
-    all_messages = select(Message.id).where(
-        Message.room_id == room_id, Message.sender_id != current_user.id
-    )
-
-    # 내가 읽은 메시지
-    read_messages = select(MessageRead.message_id).where(
-        MessageRead.user_id == current_user.id
-    )
-
-    # 안 읽은 메시지 수
-    result = await db.execute(
-        select(func.count()).select_from(
-            all_messages.except_(read_messages).subquery()
-        )
-    )
+    result = await db.execute(unread_count_query(member))
     unread_count = result.scalar() or 0
 
     return {"room_id": room_id, "unread_count": unread_count}
@@ -167,29 +205,27 @@ async def get_unread_count(
 async def mark_all_as_read(
     room_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
-    """채팅방 전체 메시지 읽음 처리"""
-    if not await check_room_membership(db, room_id, current_user.id):
+    """채팅방 전체 메시지 읽음 처리 (워터마크를 최신 메시지로 이동)"""
+    member = await get_membership(db, room_id, current_user.id)
+    if member is None:
         raise HTTPException(status_code=403, detail="You are not a member of this room")
 
-    # 내가 보내지 않은 안 읽은 메시지 조회
-    result = await db.execute(
-        select(Message.id).where(
-            Message.room_id == room_id,
-            Message.sender_id != current_user.id,
-            ~Message.id.in_(
-                select(MessageRead.message_id).where(MessageRead.user_id == current_user.id)
-            ),
-        )
-    )
-    unread_message_ids = result.scalars().all()
+    latest = (await db.execute(latest_message_query(room_id))).one_or_none()
+    if latest is None or member.has_read(latest.created_at, latest.id):
+        return {"room_id": room_id, "marked_count": 0}
 
-    # 읽음 표시 일괄 저장
-    for msg_id in unread_message_ids:
-        read_status = MessageRead(message_id=msg_id, user_id=current_user.id)
-        db.add(read_status)
+    marked_count = (await db.execute(unread_count_query(member))).scalar() or 0
+
+    # 메시지별 읽음 기록 (선택 기능): INSERT ... SELECT 한 문장
+    if settings.read_receipts:
+        await db.execute(
+            mark_read_receipts_stmt(db.bind.dialect.name, member, (latest.created_at, latest.id))
+        )
 
+    member.last_read_at = latest.created_at
+    member.last_read_message_id = latest.id
     await db.commit()
 
-    return {"room_id": room_id, "marked_count": len(unread_message_ids)}
+    return {"room_id": room_id, "marked_count": marked_count}
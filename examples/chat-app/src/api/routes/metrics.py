@@ -0,0 +1,107 @@
+"""계측 API 라우터 (Prometheus 지표, 샘플링 프로파일러)"""
+
+import ipaddress
+from typing import Iterable
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import PlainTextResponse
+
+from src.core.config import settings
+from src.core.metrics import Family, registry
+from src.core.profiler import ProfilerBusy, profile
+from src.core.rate_limit import rate_limiter
+from src.websocket.manager import manager
+
+router = APIRouter(tags=["metrics"])
+
+
+def runtime_families(request: Request) -> Iterable[Family]:
+    """조회 시점에 읽는 연결/속도 제한/온라인 상태 값"""
+    yield "ws_connections", "gauge", "Open WebSocket connections", [
+        ("", {}, manager.get_connection_count())
+    ]
+    depth = sum(
+        outbox.queue_depth
+        for connections in manager.active_connections.values()
+        for outbox in connections.values()
+    )
+    yield "ws_send_queue_depth", "gauge", "Frames waiting in WebSocket outboxes", [("", {}, depth)]
+
+    limiter = rate_limiter.metrics()
+    yield "rate_limit_allowed_total", "counter", "Requests within rate limits", [
+        ("", {}, limiter["allowed"])
+    ]
+    yield "rate_limit_limited_total", "counter", "Requests rejected with 429", [
+        ("", {"budget": name}, n) for name, n in limiter["limited"].items()
+    ]
+
+    admission = getattr(request.app.state, "admission", None)
+    if admission is not None:
+        yield "admission_in_flight", "gauge", "HTTP requests being processed", [
+            ("", {}, admission.in_flight)
+        ]
+        yield "admission_waiting", "gauge", "HTTP requests waiting for a slot", [
+            ("", {}, admission.waiting)
+        ]
+        yield "admission_shed_total", "counter", "Requests rejected with 503", [
+            ("", {}, admission.shed)
+        ]
+
+    if manager.presence is not None:
+        stats = manager.presence.stats
+        yield "presence_expired_total", "counter", "Connections closed by heartbeat TTL", [
+            ("", {}, stats.expired)
+        ]
+        yield "presence_pushes_total", "counter", "Presence frames pushed to rooms", [
+            ("", {}, stats.pushes)
+        ]
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus 텍스트 형식 지표"""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(
+        registry.render(runtime_families(request)),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+def is_local_request(request: Request) -> bool:
+    """루프백 주소에서 직접 들어온 요청인지 확인
+
+    같은 호스트의 리버스 프록시를 거친 요청도 루프백으로 보이므로 프록시
+    전달 헤더가 있으면 로컬 요청으로 보지 않는다.
+    """
+    if request.client is None:
+        return False
+    if "x-forwarded-for" in request.headers or "forwarded" in request.headers:
+        return False
+    try:
+        return ipaddress.ip_address(request.client.host).is_loopback
+    except ValueError:
+        return False
+
+
+@router.get("/debug/profile", include_in_schema=False)
+async def debug_profile(
+    request: Request,
+    seconds: float = Query(5.0, gt=0, le=60),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+):
+    """이벤트 루프 스레드를 seconds초 동안 샘플링한 collapsed 스택 (로컬 요청만)"""
+    if not settings.profiler_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if not is_local_request(request):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Profiler is only available from localhost",
+        )
+    try:
+        profiler = await profile(seconds, interval_ms / 1000)
+    except ProfilerBusy:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="A profile is already running"
+        )
+    return PlainTextResponse(profiler.collapsed())
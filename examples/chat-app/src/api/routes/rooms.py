@@ -1,12 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.api.deps import get_current_user
+from src.core.user_cache import UserSnapshot
 from src.database import get_db
 from src.models.room import ChatRoom, ChatRoomMember
 from src.models.user import User
-from src.schemas.room import RoomCreate, RoomMemberResponse, RoomResponse
+from src.schemas.room import RoomCreate, RoomResponse
+from src.websocket.manager import manager
 
 router = APIRouter(prefix="/api/rooms", tags=["rooms"])
 
@@ -14,33 +18,20 @@ router = APIRouter(prefix="/api/rooms", tags=["rooms"])
 async def find_existing_room(
     db: AsyncSession, user1_id: str, user2_id: str
 ) -> ChatRoom | None:
-    """두 사용자 간 기존 채팅방 찾기"""
-    # user1이 속한 채팅방 중 user2도 속한 채팅방 찾기
-    subquery = (
-        select(ChatRoomMember.room_id)
-        .where(ChatRoomMember.user_id == user1_id)
-        .subquery()
-    )
+    """두 사용자 간 기존 채팅방 찾기 (참여자 쌍 키의 유니크 인덱스 조회)"""
     result = await db.execute(
-        select(ChatRoomMember.room_id)
-        .where(
-            ChatRoomMember.user_id == user2_id,
-            ChatRoomMember.room_id.in_(select(subquery.c.room_id)),
-        )
+        select(ChatRoom)
+        .where(ChatRoom.direct_key == ChatRoom.make_direct_key(user1_id, user2_id))
+        .options(selectinload(ChatRoom.members))
     )
-    room_id = result.scalar_one_or_none()
-
-    if room_id:
-        result = await db.execute(select(ChatRoom).where(ChatRoom.id == room_id))
-        return result.scalar_one_or_none()
-    return None
+    return result.scalar_one_or_none()
 
 
 @router.post("", response_model=RoomResponse, status_code=status.HTTP_201_CREATED)
 async def create_room(
     room_data: RoomCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
     # 자기 자신과 채팅방 생성 불가
     if room_data.other_user_id == current_user.id:
@@ -49,80 +40,55 @@ async def create_room(
             detail="Cannot create room with yourself",
         )
 
+    # 기존 채팅방 확인
+    existing_room = await find_existing_room(db, current_user.id, room_data.other_user_id)
+    if existing_room:
+        return existing_room
+
     # 상대방 사용자 존재 확인
-    result = await db.execute(select(User).where(User.id == room_data.other_user_id))
-    other_user = result.scalar_one_or_none()
-    if not other_user:
+    if await db.get(User, room_data.other_user_id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    # 기존 채팅방 확인
-    existing_room = await find_existing_room(db, current_user.id, room_data.other_user_id)
-    if existing_room:
-        # 기존 채팅방의 멤버 조회
-        result = await db.execute(
-            select(ChatRoomMember).where(ChatRoomMember.room_id == existing_room.id)
-        )
-        members = result.scalars().all()
-        return RoomResponse(
-            id=existing_room.id,
-            created_at=existing_room.created_at,
-            members=[RoomMemberResponse.model_validate(m) for m in members],
-        )
-
-    # 새 채팅방 생성
-    room = ChatRoom()
-    db.add(room)
-    await db.flush()
-
-    # 멤버 추가
-    member1 = ChatRoomMember(room_id=room.id, user_id=current_user.id)
-    member2 = ChatRoomMember(room_id=room.id, user_id=room_data.other_user_id)
-    db.add_all([member1, member2])
-    await db.commit()
-
-    return RoomResponse(
-        id=room.id,
-        created_at=room.created_at,
+    # 새 채팅방 생성 (멤버 포함)
+    room = ChatRoom(
+        direct_key=ChatRoom.make_direct_key(current_user.id, room_data.other_user_id),
         members=[
-            RoomMemberResponse.model_validate(member1),
-            RoomMemberResponse.model_validate(member2),
+            ChatRoomMember(user_id=current_user.id),
+            ChatRoomMember(user_id=room_data.other_user_id),
         ],
     )
+    db.add(room)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 동시에 같은 쌍의 채팅방이 만들어진 경우
+        await db.rollback()
+        existing_room = await find_existing_room(db, current_user.id, room_data.other_user_id)
+        if existing_room is None:
+            raise
+        return existing_room
+
+    # 연결 중인 멤버의 소켓을 새 채팅방에 구독
+    manager.join_room(current_user.id, room.id)
+    manager.join_room(room_data.other_user_id, room.id)
+
+    return room
 
 
 @router.get("", response_model=list[RoomResponse])
 async def list_rooms(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
-    # 현재 사용자가 속한 채팅방 ID 조회
+    # 내가 속한 채팅방 + 멤버를 채팅방 수와 무관하게 두 번의 쿼리로 조회
     result = await db.execute(
-        select(ChatRoomMember.room_id).where(ChatRoomMember.user_id == current_user.id)
+        select(ChatRoom)
+        .join(ChatRoomMember, ChatRoomMember.room_id == ChatRoom.id)
+        .where(ChatRoomMember.user_id == current_user.id)
+        .options(selectinload(ChatRoom.members))
+        .order_by(ChatRoom.created_at)
     )
-    room_ids = [r for r in result.scalars().all()]
-
-    if not room_ids:
-        return []
-
-    # 채팅방 정보 및 멤버 조회
-    rooms_result = await db.execute(select(ChatRoom).where(ChatRoom.id.in_(room_ids)))
-    rooms = rooms_result.scalars().all()
-
-    response = []
-    for room in rooms:
-        members_result = await db.execute(
-            select(ChatRoomMember).where(ChatRoomMember.room_id == room.id)
-        )
-        members = members_result.scalars().all()
-        response.append(
-            RoomResponse(
-                id=room.id,
-                created_at=room.created_at,
-                members=[RoomMemberResponse.model_validate(m) for m in members],
-            )
-        )
-
-    return response
+    return result.scalars().all()
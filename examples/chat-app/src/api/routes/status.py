@@ -1,13 +1,17 @@
-"""온라인 상태 API 라우터"""
+"""온라인 상태 API 라우터
+
+상태 변경은 WebSocket presence 프레임으로 푸시되므로 이 API는 초기 상태 조회용이며,
+DB 대신 사용자/멤버십 캐시를 읽는다.
+"""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.deps import get_current_user
+from src.api.deps import get_current_user, load_user_snapshot
+from src.core.membership_cache import membership_cache
+from src.core.user_cache import UserSnapshot
 from src.database import get_db
-from src.models.room import ChatRoomMember
-from src.models.user import User
+from src.websocket.manager import manager
 from src.websocket.status import status_manager
 
 router = APIRouter(prefix="/api", tags=["status"])
@@ -17,18 +21,19 @@ router = APIRouter(prefix="/api", tags=["status"])
 async def get_user_status(
     user_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
     """사용자 온라인 상태 조회"""
-    # 사용자 존재 확인
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await load_user_snapshot(db, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
+    # 아직 저장되지 않은 last_seen_at이 있으면 그 값이 최신
+    last_seen_at = manager.presence.last_seen(user_id) if manager.presence else None
     return {
         "user_id": user_id,
         "is_online": status_manager.is_online(user_id),
+        "last_seen_at": last_seen_at or user.last_seen_at,
     }
 
 
@@ -36,21 +41,15 @@ async def get_user_status(
 async def get_room_members_status(
     room_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
     """채팅방 멤버 온라인 상태 조회"""
-    # 채팅방 멤버 확인
-    result = await db.execute(
-        select(ChatRoomMember).where(ChatRoomMember.room_id == room_id)
-    )
-    members = result.scalars().all()
-
+    members = await membership_cache.room_members(db, room_id)
     if not members:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found")
 
     # 현재 사용자가 멤버인지 확인
-    member_ids = [m.user_id for m in members]
-    if current_user.id not in member_ids:
+    if current_user.id not in members:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this room",
@@ -60,6 +59,19 @@ async def get_room_members_status(
         "room_id": room_id,
         "members": [
             {"user_id": uid, "is_online": status_manager.is_online(uid)}
-            for uid in member_ids
+            for uid in sorted(members)
         ],
     }
+
+
+@router.get("/connections/metrics")
+async def get_connection_metrics(current_user: UserSnapshot = Depends(get_current_user)):
+    """WebSocket 송신 큐 지표 조회
+
+    접속 중인 사용자가 드러나지 않도록 연결별 값이 아닌 합계만 반환한다.
+    """
+    return {
+        "connection_count": manager.get_connection_count(),
+        "outbox": manager.get_aggregate_metrics(),
+        "presence": manager.presence.metrics() if manager.presence else None,
+    }
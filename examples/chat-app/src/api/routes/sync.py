@@ -0,0 +1,128 @@
+"""재연결 동기화 API 라우터"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.deps import get_current_user
+from src.core.user_cache import UserSnapshot
+from src.database import get_db
+from src.repositories.message import InvalidCursor
+from src.repositories.sync import (
+    SyncCursor,
+    decode_sync_cursor,
+    encode_sync_cursor,
+    messages_since_queries,
+    room_heads_query,
+    room_peers_query,
+    unread_counts_query,
+)
+from src.schemas.sync import SyncRequest, SyncResponse
+from src.websocket.status import status_manager
+
+router = APIRouter(prefix="/api", tags=["sync"])
+
+
+async def sync_since(
+    db: AsyncSession, current_user: UserSnapshot, since: str | None, limit: int
+) -> dict:
+    """since 커서 이후의 동기화 응답 생성"""
+    try:
+        cursor = decode_sync_cursor(since) if since is not None else None
+    except InvalidCursor:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    heads: dict[str, int] = dict((await db.execute(room_heads_query(current_user.id))).all())
+    messages = []
+    has_more = False
+
+    if cursor is None:
+        positions = dict(heads)
+        changed = list(heads)
+    else:
+        positions = {room_id: cursor.rooms.get(room_id, 0) for room_id in heads}
+        behind = {room_id: seq for room_id, seq in positions.items() if heads[room_id] > seq}
+        changed = list(behind)
+        if behind:
+            # 채팅방별로 limit + 1개를 읽어 남은 메시지가 있는지 판단
+            per_room: dict[str, int] = {}
+            for query in messages_since_queries(behind, limit + 1):
+                result = await db.execute(query)
+                for message in result.scalars():
+                    per_room[message.room_id] = per_room.get(message.room_id, 0) + 1
+                    if per_room[message.room_id] > limit:
+                        has_more = True
+                        continue
+                    messages.append(message)
+                    positions[message.room_id] = message.seq
+
+    unread_counts = {}
+    if changed:
+        result = await db.execute(unread_counts_query(current_user.id, changed))
+        unread_counts = dict(result.all())
+
+    presence_epoch, presence_version = status_manager.epoch, status_manager.version
+    changes = (
+        status_manager.changes_since(cursor.presence_epoch, cursor.presence_version)
+        if cursor is not None
+        else None
+    )
+    presence_reset = changes is None
+    presence = []
+    if presence_reset or changes:
+        peers = set((await db.execute(room_peers_query(current_user.id))).scalars())
+        if presence_reset:
+            changes = {user_id: status_manager.is_online(user_id) for user_id in sorted(peers)}
+        presence = [
+            {"user_id": user_id, "is_online": online}
+            for user_id, online in changes.items()
+            if user_id in peers
+        ]
+
+    return {
+        "cursor": encode_sync_cursor(
+            SyncCursor(
+                rooms=positions,
+                presence_epoch=presence_epoch,
+                presence_version=presence_version,
+            )
+        ),
+        "messages": messages,
+        "unread_counts": unread_counts,
+        "presence": presence,
+        "presence_reset": presence_reset,
+        "has_more": has_more,
+    }
+
+
+@router.post("/sync", response_model=SyncResponse)
+async def sync(
+    request: SyncRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserSnapshot = Depends(get_current_user),
+):
+    """재연결 후 놓친 변경 사항 조회
+
+    since 커서 이후 사용자의 모든 채팅방에 새로 온 메시지(채팅방별 최대
+    limit개, 채팅방/seq 순), 새 메시지가 있는 채팅방의 안 읽은 수, 같은
+    채팅방 사용자의 온라인 상태 변경을 한 번에 반환한다. since가 없으면
+    메시지 없이 현재 위치와 모든 채팅방의 안 읽은 수, 전체 온라인 상태를
+    반환한다. 응답의 cursor를 다음 동기화에 사용한다.
+
+    커서는 채팅방 수에 비례해 커지므로 요청 본문으로 받는다 (uvicorn/h11의
+    요청 헤더 한도 16KB, nginx의 요청 줄 한도 8KB).
+    """
+    return await sync_since(db, current_user, request.since, request.limit)
+
+
+@router.get("/sync", response_model=SyncResponse)
+async def sync_query(
+    since: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserSnapshot = Depends(get_current_user),
+):
+    """재연결 후 놓친 변경 사항 조회 (쿼리 문자열 커서, 하위 호환)
+
+    채팅방이 많으면 커서가 요청 줄 한도를 넘을 수 있으므로 POST를 사용한다.
+    """
+    return await sync_since(db, current_user, since, limit)
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_current_user
+from src.core.user_cache import UserSnapshot
 from src.database import get_db
 from src.models.user import User
+from src.repositories.message import InvalidCursor
+from src.repositories.user import encode_user_cursor, user_page_query, user_search_stages
 from src.schemas.auth import UserResponse
 
 router = APIRouter(prefix="/api/users", tags=["users"])
@@ -12,20 +14,47 @@ router = APIRouter(prefix="/api/users", tags=["users"])
 
 @router.get("", response_model=list[UserResponse])
 async def list_users(
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    after: str | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
-    result = await db.execute(select(User).where(User.is_active == True))
-    return result.scalars().all()
+    """활성 사용자 목록 (username 순, 다음 페이지는 X-After-Cursor)"""
+    try:
+        query = user_page_query(limit, after=after)
+    except InvalidCursor:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    users = (await db.execute(query)).scalars().all()
+    if len(users) == limit:
+        response.headers["X-After-Cursor"] = encode_user_cursor(users[-1].username)
+    return users
 
 
 @router.get("/search", response_model=list[UserResponse])
 async def search_users(
-    q: str,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=50),
+    limit: int = Query(20, ge=1, le=100),
+    after: str | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(User).where(User.is_active == True, User.username.contains(q))
-    )
-    return result.scalars().all()
+    """사용자 검색 (정확 일치 → 접두어 → 부분 일치 순, 다음 페이지는 X-After-Cursor)"""
+    users: list[User] = []
+    last_key = None
+    try:
+        for rank, query in user_search_stages(db.bind.dialect.name, q, after=after):
+            rows = (await db.execute(query.limit(limit - len(users)))).all()
+            users.extend(user for user, _ in rows)
+            if rows:
+                last_key = (rank, rows[-1][1])
+            if len(users) == limit:
+                break
+    except InvalidCursor:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    if len(users) == limit:
+        response.headers["X-After-Cursor"] = encode_user_cursor(*last_key)
+    return users
@@ -0,0 +1,47 @@
+"""WebSocket 라우터"""
+
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.deps import load_user_snapshot
+from src.core.membership_cache import membership_cache
+from src.core.security import decode_access_token
+from src.database import get_db
+from src.websocket.manager import manager
+
+router = APIRouter(tags=["websocket"])
+
+
+@router.websocket("/ws")
+async def websocket_endpoint(
+    websocket: WebSocket,
+    token: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """실시간 메시지 수신용 WebSocket (?token=<access token>)
+
+    한 사용자가 여러 탭/기기로 동시에 연결할 수 있으며, 마지막 연결이
+    끊기면 오프라인으로 바뀐다. 클라이언트가 보내는 프레임(ping 등)은
+    하트비트로 쓰이며, presence_ttl_seconds 동안 프레임이 없으면 연결을 닫는다.
+    """
+    claims = decode_access_token(token)
+    user = await load_user_snapshot(db, claims[0]) if claims else None
+    if user is None or not user.is_active or user.token_version != claims[1]:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    user_id = user.id
+
+    room_ids = list(await membership_cache.user_rooms(db, user_id))
+    # 연결이 유지되는 동안 DB 연결을 잡고 있지 않도록 반환
+    await db.close()
+
+    await websocket.accept()
+    manager.connect(user_id, websocket, room_ids)
+    try:
+        while True:
+            await websocket.receive_text()
+            manager.heartbeat(user_id, websocket)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        manager.disconnect(user_id, websocket)
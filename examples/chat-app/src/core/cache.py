@@ -0,0 +1,123 @@
+"""프로세스 내 TTL + LRU 캐시와 ORM 쓰기 기반 무효화"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """만료 시간이 있는 LRU 캐시
+
+    maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 버리고, ttl초가
+    지난 항목은 조회 시점에 버린다. 이벤트 루프 안에서만 쓰므로 락은 없다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: K) -> V | None:
+        """항목 조회 (없거나 만료되면 None)"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """항목 저장 (용량을 넘으면 LRU 항목 제거)"""
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        self._data[key] = (self._clock() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """항목 제거"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 비우기"""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def invalidate_on_write(
+    model: type,
+    events: tuple[str, ...],
+    key: Callable[[Any], K],
+    invalidate: Callable[[K], None],
+    clear: Callable[[], None] | None = None,
+) -> None:
+    """model의 ORM 쓰기에 캐시 무효화 리스너 등록
+
+    events(after_update 등)로 flush되는 객체마다 key(target)을 즉시 무효화하고,
+    flush와 commit 사이에 다른 요청이 이전 값을 다시 캐시할 수 있으므로 commit
+    후에 한 번 더 무효화한다. 롤백되면 대기 목록을 버린다. clear를 주면 세션으로
+    실행한 update(model)/delete(model) 문처럼 대상을 알 수 없는 쓰기에서 캐시
+    전체를 비운다.
+    """
+    # session.info 안의 이 등록 전용 키
+    stale_key = object()
+    clear_key = object()
+
+    def on_flush(mapper, connection, target) -> None:
+        cache_key = key(target)
+        invalidate(cache_key)
+        session = Session.object_session(target)
+        if session is not None:
+            session.info.setdefault(stale_key, set()).add(cache_key)
+
+    for name in events:
+        event.listen(model, name, on_flush)
+
+    def on_commit(session: Session) -> None:
+        if session.info.pop(clear_key, False) and clear is not None:
+            clear()
+        for cache_key in session.info.pop(stale_key, ()):
+            invalidate(cache_key)
+
+    def on_rollback(session: Session, previous_transaction) -> None:
+        session.info.pop(stale_key, None)
+        session.info.pop(clear_key, None)
+
+    event.listen(Session, "after_commit", on_commit)
+    event.listen(Session, "after_soft_rollback", on_rollback)
+
+    if clear is None:
+        return
+
+    def on_statement(orm_execute_state: ORMExecuteState) -> None:
+        if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and mapper.class_ is model:
+            clear()
+            orm_execute_state.session.info[clear_key] = True
+
+    event.listen(Session, "do_orm_execute", on_statement)
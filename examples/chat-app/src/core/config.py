@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,6 +12,26 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./chat.db"
+    # 읽기 전용 연결 URL (비우면 database_url, PostgreSQL이면 복제본 지정 가능)
+    database_read_url: str = ""
+    database_echo: bool = False
+    # default: 드라이버 기본값, production: SQLite PRAGMA + 읽기/쓰기 연결 분리 + 서버 DB 풀 설정
+    # (production의 SQLite 쓰기 연결은 하나뿐이므로 필요할 때 명시적으로 켠다)
+    database_profile: Literal["production", "default"] = "default"
+
+    # SQLite (production 프로필)
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size_kib: int = 64 * 1024
+    sqlite_read_pool_size: int = 8
+
+    # 서버 DB 커넥션 풀 (production 프로필)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
 
     # JWT
     secret_key: str = "your-secret-key-change-in-production"
@@ -17,5 +39,66 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
 
+    # 비밀번호 해시 (cost를 바꾸면 다음 로그인 때 재해시)
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 4
+    password_hash_queue_size: int = 64
+
+    # 인증된 사용자 캐시 (TTL 0이면 비활성화)
+    user_cache_size: int = 10_000
+    user_cache_ttl_seconds: float = 30.0
+
+    # 채팅방 멤버십 캐시 (TTL 0이면 비활성화)
+    membership_cache_size: int = 10_000
+    membership_cache_ttl_seconds: float = 60.0
+
+    # 메시지 그룹 커밋 (요청마다 커밋하는 대신 배치 단위로 커밋)
+    message_group_commit: bool = False
+    group_commit_batch_size: int = 256
+    group_commit_max_delay_ms: float = 2.0
+    group_commit_queue_size: int = 10_000
+
+    # 메시지별 읽음 기록 (기본은 멤버별 읽음 워터마크만 사용)
+    read_receipts: bool = False
+
+    # 요청 속도 제한 (사용자/IP별 토큰 버킷: 초당 충전 수, 최대 버스트)
+    rate_limit_enabled: bool = True
+    rate_limit_per_second: float = 50.0
+    rate_limit_burst: float = 100.0
+    rate_limit_routes: dict[str, tuple[float, float]] = {
+        "send_message": (10.0, 30.0),
+        "login": (1.0, 20.0),
+        "register": (0.2, 20.0),
+    }
+    rate_limit_max_keys: int = 100_000
+
+    # 동시 요청 수 제한 (0이면 제한 없음, 초과분은 대기 후 503)
+    # DB를 쓰지 않거나 읽기만 하는 요청도 포함하므로 커넥션 풀 크기보다 넉넉하게 잡는다
+    max_concurrent_requests: int = 256
+    admission_queue_size: int = 256
+    admission_timeout_ms: float = 1000.0
+
+    # 계측 (/metrics, 한 요청에서 같은 SQL이 이 횟수 이상이면 N+1로 기록)
+    metrics_enabled: bool = True
+    n_plus_one_threshold: int = 5
+    # GET /debug/profile?seconds= 샘플링 프로파일러 (운영에서는 필요할 때만 켬, 루프백 요청만 허용)
+    profiler_enabled: bool = False
+
+    # WebSocket
+    ws_send_queue_size: int = 100
+    ws_overflow_policy: Literal["drop_oldest", "disconnect", "coalesce"] = "drop_oldest"
+
+    # 온라인 상태 (ttl 동안 프레임이 없는 연결은 종료, 변경 푸시는 채팅방별로 병합)
+    presence_ttl_seconds: float = 60.0
+    presence_tick_seconds: float = 1.0
+    presence_push_window_ms: float = 250.0
+    last_seen_flush_seconds: float = 30.0
+
+    # 워커 간 백플레인 (local: Unix 소켓 경로, redis: redis:// URL)
+    backplane: Literal["memory", "local", "redis"] = "memory"
+    backplane_url: str = ""
+    backplane_batch_size: int = 100
+    backplane_flush_interval_ms: float = 1.0
+
 
 settings = Settings()
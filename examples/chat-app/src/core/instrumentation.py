@@ -0,0 +1,102 @@
+"""요청별 SQL 계측
+
+엔진에 before/after_cursor_execute 이벤트를 걸어 문장마다 실행 시간을 재고,
+현재 요청(contextvar)의 쿼리 수와 DB 시간에 더한다. SQLAlchemy asyncio는
+동기 이벤트를 요청 태스크의 컨텍스트를 물려받은 greenlet에서 실행하므로
+요청 밖(백그라운드 태스크 등)의 쿼리는 전역 히스토그램에만 기록된다.
+
+한 요청에서 같은 SQL 문이 n_plus_one_threshold번 이상 실행되면 N+1 패턴으로
+보고 카운터를 올리고 경고 로그를 남긴다.
+"""
+
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+from src.core.metrics import (
+    DB_QUERY_SECONDS,
+    HTTP_N_PLUS_ONE,
+    HTTP_REQUEST_DB_SECONDS,
+    HTTP_REQUEST_QUERIES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestStats:
+    """요청 하나의 SQL 실행 기록"""
+
+    queries: int = 0
+    db_seconds: float = 0.0
+    # SQL 문 → 실행 횟수
+    statements: Counter = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """threshold번 이상 실행된 SQL 문"""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> RequestStats | None:
+    """현재 요청의 SQL 실행 기록 (요청 밖이면 None)"""
+    return _current.get()
+
+
+@contextmanager
+def track_request() -> Iterator[RequestStats]:
+    """블록 안에서 실행된 SQL을 RequestStats로 수집"""
+    stats = RequestStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def record_request(route: str, stats: RequestStats) -> None:
+    """요청의 쿼리 수/DB 시간 기록과 N+1 판정"""
+    HTTP_REQUEST_QUERIES.observe(stats.queries, route)
+    HTTP_REQUEST_DB_SECONDS.observe(stats.db_seconds, route)
+    repeated = stats.repeated(settings.n_plus_one_threshold)
+    if repeated:
+        HTTP_N_PLUS_ONE.inc(route)
+        sql, count = repeated[0]
+        logger.warning("possible N+1 in %s: %d executions of %s", route, count, sql[:200])
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._instrument_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_instrument_start", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    DB_QUERY_SECONDS.observe(elapsed, statement.split(None, 1)[0].upper())
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        stats.statements[statement] += 1
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """엔진의 SQL 실행 계측 (여러 번 호출해도 한 번만 등록)"""
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,72 @@
+"""채팅방 멤버십 캐시
+
+채팅방 → 멤버, 사용자 → 채팅방 집합을 캐시해 메시지 조회/전송마다
+chat_room_members를 조회하지 않게 한다. ChatRoomMember 추가/삭제를 ORM으로
+flush/commit하면 자동으로 무효화되고, 다른 워커는 백플레인의 membership
+이벤트(ConnectionManager)로 무효화한다. 그 밖의 경로로 바뀐 멤버십은
+membership_cache_ttl_seconds 안에 반영된다.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import TTLCache, invalidate_on_write
+from src.core.config import settings
+from src.models.room import ChatRoomMember
+
+
+class MembershipCache:
+    """room → members, user → rooms 캐시"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._room_members: TTLCache[str, frozenset[str]] = TTLCache(maxsize, ttl)
+        self._user_rooms: TTLCache[str, frozenset[str]] = TTLCache(maxsize, ttl)
+
+    async def room_members(self, db: AsyncSession, room_id: str) -> frozenset[str]:
+        """채팅방 멤버 ID 집합"""
+        members = self._room_members.get(room_id)
+        if members is None:
+            result = await db.execute(
+                select(ChatRoomMember.user_id).where(ChatRoomMember.room_id == room_id)
+            )
+            members = frozenset(result.scalars().all())
+            self._room_members.set(room_id, members)
+        return members
+
+    async def user_rooms(self, db: AsyncSession, user_id: str) -> frozenset[str]:
+        """사용자가 속한 채팅방 ID 집합"""
+        rooms = self._user_rooms.get(user_id)
+        if rooms is None:
+            result = await db.execute(
+                select(ChatRoomMember.room_id).where(ChatRoomMember.user_id == user_id)
+            )
+            rooms = frozenset(result.scalars().all())
+            self._user_rooms.set(user_id, rooms)
+        return rooms
+
+    async def is_member(self, db: AsyncSession, room_id: str, user_id: str) -> bool:
+        """사용자가 채팅방 멤버인지 확인"""
+        return user_id in await self.room_members(db, room_id)
+
+    def invalidate(self, room_id: str, user_id: str) -> None:
+        """멤버십 변경 시 해당 채팅방과 사용자 항목 제거"""
+        self._room_members.invalidate(room_id)
+        self._user_rooms.invalidate(user_id)
+
+    def clear(self) -> None:
+        self._room_members.clear()
+        self._user_rooms.clear()
+
+
+membership_cache = MembershipCache(
+    maxsize=settings.membership_cache_size,
+    ttl=settings.membership_cache_ttl_seconds,
+)
+
+
+invalidate_on_write(
+    ChatRoomMember,
+    ("after_insert", "after_delete"),
+    key=lambda member: (member.room_id, member.user_id),
+    invalidate=lambda pair: membership_cache.invalidate(*pair),
+)
@@ -0,0 +1,172 @@
+"""프로세스 내 지표와 Prometheus 텍스트 형식 출력
+
+카운터와 히스토그램은 레이블 값 튜플마다 값을 메모리에 누적한다. 히스토그램은
+버킷별 개수만 저장하고(관측당 이진 탐색 한 번), 누적 합은 출력할 때 계산한다.
+연결 수처럼 그때그때 읽는 값은 출력할 때 render(extra=...)로 넘긴다.
+"""
+
+import math
+from bisect import bisect_left
+from typing import Iterable
+
+# 초 단위 지연 버킷 (0.5ms ~ 10s)
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+# 요청당 쿼리 수 버킷
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# (이름, 타입, 설명, [(이름 접미사, 레이블, 값)])
+Sample = tuple[str, dict[str, str], float]
+Family = tuple[str, str, str, list[Sample]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0)
+
+    def collect(self) -> Iterable[Family]:
+        samples = [("", dict(zip(self.labels, key)), v) for key, v in self._values.items()]
+        yield self.name, "counter", self.help, samples
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+class Histogram:
+    """버킷 히스토그램 (_bucket, _sum, _count)"""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 값 → [버킷별 개수 (+Inf 포함), 합계]
+        self._values: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        entry = self._values.get(label_values)
+        if entry is None:
+            entry = self._values[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+
+    def count(self, *label_values: str) -> int:
+        entry = self._values.get(label_values)
+        return sum(entry[0]) if entry else 0
+
+    def collect(self) -> Iterable[Family]:
+        samples = []
+        for key, (counts, total) in self._values.items():
+            labels = dict(zip(self.labels, key))
+            cumulative = 0
+            for bound, n in zip((*self.buckets, math.inf), counts):
+                cumulative += n
+                le = _format_value(float(bound))
+                samples.append(("_bucket", {**labels, "le": le}, cumulative))
+            samples.append(("_sum", labels, total))
+            samples.append(("_count", labels, cumulative))
+        yield self.name, "histogram", self.help, samples
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+class MetricsRegistry:
+    """지표 모음"""
+
+    def __init__(self):
+        self._metrics: list[Counter | Histogram] = []
+
+    def counter(self, name: str, help: str, labels: tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, help, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, help, labels, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def clear(self) -> None:
+        """누적 값 초기화"""
+        for metric in self._metrics:
+            metric.clear()
+
+    def render(self, extra: Iterable[Family] = ()) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4), extra는 함께 출력할 값"""
+        lines: list[str] = []
+        families = [family for metric in self._metrics for family in metric.collect()]
+        families += extra
+        for name, kind, help, samples in families:
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route", "status")
+)
+HTTP_REQUEST_QUERIES = registry.histogram(
+    "http_request_db_queries", "SQL statements per HTTP request", ("route",), COUNT_BUCKETS
+)
+HTTP_REQUEST_DB_SECONDS = registry.histogram(
+    "http_request_db_seconds", "Time spent in SQL per HTTP request", ("route",)
+)
+HTTP_N_PLUS_ONE = registry.counter(
+    "http_request_n_plus_one_total",
+    "Requests that repeated one SQL statement n_plus_one_threshold times or more",
+    ("route",),
+)
+DB_QUERY_SECONDS = registry.histogram(
+    "db_query_duration_seconds", "SQL statement latency", ("operation",)
+)
+WS_SEND_SECONDS = registry.histogram(
+    "ws_send_duration_seconds", "Time to write one WebSocket frame"
+)
+WS_QUEUE_SECONDS = registry.histogram(
+    "ws_send_queue_latency_seconds", "Time from enqueue to WebSocket frame written"
+)
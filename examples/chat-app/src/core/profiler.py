@@ -0,0 +1,74 @@
+"""샘플링 프로파일러
+
+별도 스레드가 interval마다 대상 스레드(이벤트 루프)의 현재 스택을 읽어
+호출 경로별로 센다. 계측 코드를 넣지 않으므로 켜 둔 동안의 오버헤드는
+샘플링 스레드의 스택 읽기뿐이다. 결과는 flamegraph.pl, speedscope 등이
+읽는 collapsed 형식("바깥;...;안쪽 횟수")이다.
+"""
+
+import asyncio
+import sys
+import threading
+from collections import Counter
+
+
+class SamplingProfiler:
+    """스레드 하나의 스택 샘플 수집"""
+
+    def __init__(self, interval: float = 0.005, thread_id: int | None = None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """collapsed 스택 형식 (샘플 수 내림차순)"""
+        return "".join(f"{stack} {n}\n" for stack, n in self.samples.most_common())
+
+
+class ProfilerBusy(Exception):
+    """이미 프로파일링 중"""
+
+
+_active: SamplingProfiler | None = None
+
+
+async def profile(seconds: float, interval: float = 0.005) -> SamplingProfiler:
+    """현재 이벤트 루프 스레드를 seconds초 동안 샘플링 (동시에 하나만)"""
+    global _active
+    if _active is not None:
+        raise ProfilerBusy()
+    profiler = _active = SamplingProfiler(interval)
+    profiler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.stop()
+        _active = None
+    return profiler
@@ -0,0 +1,212 @@
+"""요청 속도 제한과 동시 요청 수 제한
+
+- TokenBuckets: 키(사용자/IP)마다 (토큰 수, 마지막 갱신 시각)만 저장하고, 요청이
+  올 때 지난 시간만큼 토큰을 채우는 지연 충전 토큰 버킷. 요청당 O(1)이며
+  타이머가 필요 없다.
+- RateLimiter: 라우트별 예산(send_message, login, register)과 나머지 요청의
+  기본 예산을 묶는다.
+- AdmissionControl: 처리 중인 요청 수를 제한하고, 초과분은 짧게 대기시킨 뒤
+  자리가 나지 않으면 거절해 DB 커넥션 풀 대기(pool_timeout)까지 가지 않게 한다.
+"""
+
+import asyncio
+import math
+import re
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Hashable
+
+from src.core.config import settings
+
+# 라우트 예산 이름 → (메서드, 경로 패턴)
+ROUTE_PATTERNS: dict[str, tuple[str, re.Pattern]] = {
+    "send_message": ("POST", re.compile(r"^/api/rooms/[^/]+/messages$")),
+    "login": ("POST", re.compile(r"^/api/auth/login$")),
+    "register": ("POST", re.compile(r"^/api/auth/register$")),
+}
+
+
+class TokenBuckets:
+    """키별 토큰 버킷 (초당 rate개 충전, 최대 burst개)
+
+    maxsize를 넘으면 가장 오래 쓰지 않은 키부터 버린다. 오래 쓰지 않은 버킷은
+    어차피 가득 차 있으므로 다시 만들어도 결과가 같다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        maxsize: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.maxsize = maxsize
+        self._clock = clock
+        # key → [남은 토큰, 마지막 갱신 시각]
+        self._buckets: OrderedDict[Hashable, list[float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def take(self, key: Hashable, cost: float = 1.0) -> float:
+        """토큰 사용 (허용이면 0, 거절이면 다시 시도할 수 있을 때까지의 초)"""
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [self.burst, now]
+            if len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        if bucket[0] >= cost:
+            bucket[0] -= cost
+            return 0.0
+        if self.rate <= 0:
+            return math.inf
+        return (cost - bucket[0]) / self.rate
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
+def route_budget(method: str, path: str) -> str | None:
+    """요청에 해당하는 라우트 예산 이름 (없으면 None)"""
+    for name, (route_method, pattern) in ROUTE_PATTERNS.items():
+        if method == route_method and pattern.match(path):
+            return name
+    return None
+
+
+@dataclass
+class RateLimitStats:
+    """속도 제한 지표"""
+
+    allowed: int = 0
+    # 예산 이름 → 거절 수
+    limited: dict[str, int] = field(default_factory=dict)
+
+
+class RateLimiter:
+    """라우트별/기본 예산에 따른 사용자/IP 단위 속도 제한
+
+    한 요청은 라우트 예산이 있으면 그 버킷만, 없으면 기본 버킷만 사용한다.
+    """
+
+    def __init__(
+        self,
+        default: tuple[float, float],
+        routes: dict[str, tuple[float, float]],
+        maxsize: int = 100_000,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.enabled = enabled
+        self.default = TokenBuckets(*default, maxsize=maxsize, clock=clock)
+        self.routes = {
+            name: TokenBuckets(rate, burst, maxsize=maxsize, clock=clock)
+            for name, (rate, burst) in routes.items()
+        }
+        self.stats = RateLimitStats()
+
+    def check(self, method: str, path: str, identity: str) -> tuple[str, float]:
+        """(예산 이름, 거절이면 재시도까지의 초 / 허용이면 0)"""
+        name = route_budget(method, path)
+        buckets = self.routes.get(name) if name else None
+        if buckets is None:
+            name, buckets = "default", self.default
+        retry_after = buckets.take(identity) if self.enabled else 0.0
+        if retry_after:
+            self.stats.limited[name] = self.stats.limited.get(name, 0) + 1
+        else:
+            self.stats.allowed += 1
+        return name, retry_after
+
+    def clear(self) -> None:
+        """모든 버킷과 지표 초기화"""
+        self.default.clear()
+        for buckets in self.routes.values():
+            buckets.clear()
+        self.stats = RateLimitStats()
+
+    def metrics(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "allowed": self.stats.allowed,
+            "limited": dict(self.stats.limited),
+            "tracked_keys": len(self.default) + sum(map(len, self.routes.values())),
+        }
+
+
+class AdmissionControl:
+    """동시에 처리하는 요청 수 제한
+
+    limit개가 처리 중이면 최대 max_waiting개까지 timeout초 동안 순서대로
+    기다리게 하고, 대기열이 가득 찼거나 시간이 지나면 거절한다.
+    """
+
+    def __init__(self, limit: int, max_waiting: int, timeout: float):
+        self.limit = limit
+        self.max_waiting = max_waiting
+        self.timeout = timeout
+        self.in_flight = 0
+        self.shed = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """처리 자리 확보 (거절되면 False)"""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return True
+        if len(self._waiters) >= self.max_waiting or self.timeout <= 0:
+            self.shed += 1
+            return False
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # release()가 자리를 넘겨주면 in_flight는 그대로 유지된다
+            await asyncio.wait_for(waiter, self.timeout)
+            return True
+        except asyncio.TimeoutError:
+            self.shed += 1
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def release(self) -> None:
+        """처리 완료 (대기 중인 요청이 있으면 자리를 넘김)"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def metrics(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "shed": self.shed,
+        }
+
+
+rate_limiter = RateLimiter(
+    default=(settings.rate_limit_per_second, settings.rate_limit_burst),
+    routes=settings.rate_limit_routes,
+    maxsize=settings.rate_limit_max_keys,
+    enabled=settings.rate_limit_enabled,
+)
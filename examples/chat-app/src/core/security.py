@@ -1,7 +1,9 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 import bcrypt
-from jose import jwt
+from jose import JWTError, jwt
 
 from src.core.config import settings
 
@@ -10,8 +12,73 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+def hash_password(password: str, rounds: int | None = None) -> str:
+    salt = bcrypt.gensalt(rounds or settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode(), salt).decode()
+
+
+class PasswordHasherBusy(Exception):
+    """대기 중인 해시 작업이 한도를 넘음"""
+
+
+class PasswordHasher:
+    """bcrypt를 이벤트 루프 밖의 스레드 풀에서 실행하는 비동기 해셔
+
+    bcrypt는 해시 계산 중 GIL을 놓으므로 스레드만으로 코어 수만큼 병렬 처리된다.
+    실행 중 + 대기 중 작업이 workers + max_queue를 넘으면 PasswordHasherBusy를
+    던져, 로그인 폭주가 끝없는 대기열 대신 빠른 503으로 끝나게 한다.
+    """
+
+    def __init__(self, rounds: int, workers: int, max_queue: int):
+        self.rounds = rounds
+        self.workers = workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.rejected = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _run(self, fn, *args):
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusy()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="bcrypt"
+            )
+        self.in_flight += 1
+        future = asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future) -> None:
+        self.in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        """현재 cost로 해시"""
+        return await self._run(hash_password, password, self.rounds)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """비밀번호 확인"""
+        return await self._run(verify_password, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """해시의 cost가 현재 설정과 다른지 ($2b$<cost>$...)"""
+        try:
+            return int(hashed_password.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    rounds=settings.bcrypt_rounds,
+    workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_queue_size,
+)
 
 
 def create_access_token(data: dict) -> str:
@@ -26,3 +93,14 @@ def create_refresh_token(data: dict) -> str:
     expire = datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expire_days)
     to_encode.update({"exp": expire, "type": "refresh"})
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+
+
+def decode_access_token(token: str) -> tuple[str, int] | None:
+    """access 토큰에서 (사용자 ID, 토큰 버전) 추출 (유효하지 않으면 None)"""
+    try:
+        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    except JWTError:
+        return None
+    if payload.get("type") != "access" or payload.get("sub") is None:
+        return None
+    return payload["sub"], payload.get("ver", 0)
@@ -0,0 +1,44 @@
+"""JSON 직렬화
+
+orjson이 설치되어 있으면(`pip install -e ".[fast]"`) orjson으로, 없으면 표준
+json으로 인코딩한다. 두 경우 모두 결과는 UTF-8 bytes이고 datetime은 ISO 8601
+문자열(pydantic JSON 모드와 같은 형식)로 직렬화한다.
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """객체를 압축된 JSON bytes로 인코딩"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """JSON bytes/문자열 디코딩"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """dumps()로 렌더링하는 JSON 응답"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
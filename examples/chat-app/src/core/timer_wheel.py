@@ -0,0 +1,65 @@
+"""해시 타이머 휠"""
+
+import math
+import time
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class TimerWheel(Generic[K]):
+    """tick 단위 만료 타이머 모음
+
+    키마다 마감 틱을 하나만 기억하고, 슬롯(마감 틱 % slots)에 키를 넣는다.
+    예약/갱신/취소는 O(1)이며, 갱신 전 슬롯에 남은 항목은 그 슬롯을 지날 때
+    마감 틱을 비교해 버린다. slots보다 먼 마감은 바퀴를 돌 때까지 슬롯에 남는다.
+    """
+
+    def __init__(self, tick: float, slots: int, clock: Callable[[], float] = time.monotonic):
+        self.tick = tick
+        self._clock = clock
+        self._slots: list[set[K]] = [set() for _ in range(max(1, slots))]
+        self._deadlines: dict[K, int] = {}
+        self._current = self._now()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._deadlines
+
+    def _now(self) -> int:
+        return int(self._clock() / self.tick)
+
+    def schedule(self, key: K, delay: float) -> None:
+        """delay초 뒤 만료 예약 (이미 있으면 마감 갱신)"""
+        deadline = self._now() + max(1, math.ceil(delay / self.tick))
+        self._deadlines[key] = deadline
+        self._slots[deadline % len(self._slots)].add(key)
+
+    def cancel(self, key: K) -> None:
+        """예약 취소"""
+        self._deadlines.pop(key, None)
+
+    def advance(self) -> list[K]:
+        """현재 시각까지 지난 슬롯을 처리하고 만료된 키 반환"""
+        now = self._now()
+        expired: list[K] = []
+        size = len(self._slots)
+        # 오래 멈췄다면 슬롯을 한 바퀴만 돌면 충분
+        for tick in range(self._current + 1, self._current + 1 + min(now - self._current, size)):
+            index = tick % size
+            slot = self._slots[index]
+            keep: set[K] = set()
+            for key in slot:
+                deadline = self._deadlines.get(key)
+                if deadline is None or deadline % size != index:
+                    continue  # 취소되었거나 다른 슬롯으로 갱신됨
+                if deadline <= now:
+                    del self._deadlines[key]
+                    expired.append(key)
+                else:
+                    keep.add(key)
+            self._slots[index] = keep
+        self._current = max(self._current, now)
+        return expired
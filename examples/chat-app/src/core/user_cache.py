@@ -0,0 +1,60 @@
+"""인증된 사용자 스냅샷 캐시
+
+get_current_user가 매 요청마다 users를 조회하지 않도록 사용자 컬럼 값을
+캐시한다. ORM으로 User를 수정하면 flush/commit 시점에 자동으로 무효화되고,
+세션으로 실행한 update(User)/delete(User) 문은 대상을 알 수 없으므로 캐시
+전체를 비운다. 엔진에서 직접 실행하는 Core 문(presence의 last_seen_at 저장)은
+실행한 쪽에서 invalidate를 호출한다. 다른 워커의 캐시는 user_cache_ttl_seconds
+안에 만료된다. 즉시 폐기가 필요한 경우에는 token_version을 올린다
+(토큰의 "ver" 클레임과 비교).
+
+password_hash는 캐시하지 않는다. 로그인/비밀번호 검증은 항상 DB에서
+최신 해시를 읽는다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.core.cache import TTLCache, invalidate_on_write
+from src.core.config import settings
+from src.models.user import User
+
+
+@dataclass(frozen=True, slots=True)
+class UserSnapshot:
+    """캐시에 저장하는 User 컬럼 값 (읽기 전용, password_hash 제외)"""
+
+    id: str
+    username: str
+    email: str
+    is_active: bool
+    token_version: int
+    created_at: datetime
+    last_seen_at: datetime | None
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            is_active=user.is_active,
+            token_version=user.token_version,
+            created_at=user.created_at,
+            last_seen_at=user.last_seen_at,
+        )
+
+
+user_cache: TTLCache[str, UserSnapshot] = TTLCache(
+    maxsize=settings.user_cache_size,
+    ttl=settings.user_cache_ttl_seconds,
+)
+
+
+invalidate_on_write(
+    User,
+    ("after_update", "after_delete"),
+    key=lambda user: user.id,
+    invalidate=user_cache.invalidate,
+    clear=user_cache.clear,
+)
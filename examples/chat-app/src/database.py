@@ -1,11 +1,142 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+"""DB 엔진과 세션
+
+database_profile=production이면 SQLite 파일 DB에 WAL/synchronous/mmap/
+busy_timeout PRAGMA를 연결마다 적용하고, 쓰기 연결 하나와 읽기 전용 연결
+풀을 나눈다. 세션은 읽기 문장을 읽기 엔진으로, flush와 INSERT/UPDATE/
+DELETE를 쓰기 엔진으로 보낸다. 서버 DB(PostgreSQL 등)에는 풀 크기 설정을
+적용하고, database_read_url이 있으면 읽기를 그쪽(복제본)으로 보낸다.
+기본 프로필(default)은 엔진 하나를 드라이버 기본 설정으로 만든다.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from src.core.config import settings
 
-engine = create_async_engine(settings.database_url, echo=settings.debug)
 
-async_session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+def is_sqlite_file(url: str) -> bool:
+    """파일 기반 SQLite URL인지 (메모리 DB는 연결마다 별개라 분리 불가)"""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (None, "", ":memory:")
+
+
+def sqlite_pragmas(readonly: bool = False) -> list[str]:
+    """production 프로필의 연결별 PRAGMA"""
+    pragmas = [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size}",
+        f"PRAGMA cache_size=-{settings.sqlite_cache_size_kib}",
+        "PRAGMA foreign_keys=ON",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if readonly:
+        pragmas.append("PRAGMA query_only=ON")
+    return pragmas
+
+
+def apply_sqlite_pragmas(engine: AsyncEngine, readonly: bool = False) -> None:
+    """새 연결마다 PRAGMA를 실행하는 connect 이벤트 등록"""
+    pragmas = sqlite_pragmas(readonly)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def pool_options(url: str) -> dict:
+    """서버 DB 커넥션 풀 설정 (SQLite는 드라이버 기본 풀 사용)"""
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+
+
+def create_engines(
+    url: str,
+    read_url: str = "",
+    profile: str = "default",
+    echo: bool = False,
+) -> tuple[AsyncEngine, AsyncEngine]:
+    """(쓰기 엔진, 읽기 엔진) 생성 (분리하지 않으면 같은 엔진)"""
+    if profile != "production":
+        engine = create_async_engine(url, echo=echo)
+        return engine, engine
+
+    if is_sqlite_file(url):
+        # SQLite는 쓰기 트랜잭션이 하나뿐이므로 쓰기 연결도 하나로 직렬화
+        write_engine = create_async_engine(url, echo=echo, pool_size=1, max_overflow=0)
+        read_engine = create_async_engine(
+            read_url or url,
+            echo=echo,
+            pool_size=settings.sqlite_read_pool_size,
+            max_overflow=0,
+        )
+        apply_sqlite_pragmas(write_engine)
+        apply_sqlite_pragmas(read_engine, readonly=True)
+        return write_engine, read_engine
+
+    write_engine = create_async_engine(url, echo=echo, **pool_options(url))
+    if not read_url:
+        return write_engine, write_engine
+    return write_engine, create_async_engine(read_url, echo=echo, **pool_options(read_url))
+
+
+class RoutingSession(Session):
+    """읽기는 읽기 엔진, 쓰기는 쓰기 엔진으로 보내는 세션
+
+    트랜잭션 안에서 한 번 쓰기 연결을 쓰면 이후 문장도 쓰기 연결을 사용해
+    자기가 쓴 값을 읽을 수 있게 한다. 읽기 엔진은 info["read_bind"]로 받는다.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        read_bind = self.info.get("read_bind")
+        if read_bind is None or self.info.get("wrote"):
+            return super().get_bind(mapper, clause=clause, **kw)
+        if self._flushing or not getattr(clause, "is_select", False):
+            self.info["wrote"] = True
+            return super().get_bind(mapper, clause=clause, **kw)
+        return read_bind
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _reset_routing(session: Session, transaction) -> None:
+    if transaction.parent is None:
+        session.info.pop("wrote", None)
+
+
+def create_session_factory(write_engine: AsyncEngine, read_engine: AsyncEngine) -> sessionmaker:
+    """읽기/쓰기 엔진이 다르면 RoutingSession을 쓰는 세션 팩토리"""
+    if read_engine is write_engine:
+        return sessionmaker(write_engine, class_=AsyncSession, expire_on_commit=False)
+    return sessionmaker(
+        write_engine,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
+        info={"read_bind": read_engine.sync_engine},
+    )
+
+
+engine, read_engine = create_engines(
+    settings.database_url,
+    settings.database_read_url,
+    profile=settings.database_profile,
+    echo=settings.database_echo,
+)
+
+async_session_factory = create_session_factory(engine, read_engine)
 
 
 async def get_db() -> AsyncSession:
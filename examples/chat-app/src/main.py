@@ -1,15 +1,30 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.datastructures import Default
+from fastapi.responses import JSONResponse
 
+from src.api.middleware import InstrumentationMiddleware, RateLimitMiddleware
 from src.api.routes.auth import router as auth_router
-from src.api.routes.messages import read_router, router as messages_router
+from src.api.routes.messages import read_router
+from src.api.routes.messages import router as messages_router
+from src.api.routes.metrics import router as metrics_router
 from src.api.routes.rooms import router as rooms_router
 from src.api.routes.status import router as status_router
+from src.api.routes.sync import router as sync_router
 from src.api.routes.users import router as users_router
+from src.api.routes.websocket import router as websocket_router
 from src.core.config import settings
-from src.database import engine
+from src.core.instrumentation import instrument_engine
+from src.core.rate_limit import AdmissionControl, rate_limiter
+from src.core.security import PasswordHasherBusy, password_hasher
+from src.core.serialization import FastJSONResponse
+from src.database import engine, read_engine
+from src.migrations import upgrade_all
 from src.models.base import Base
+from src.repositories.ingest import message_ingest
+from src.websocket.backplane import create_backplane
+from src.websocket.manager import manager
 
 
 @asynccontextmanager
@@ -17,12 +32,66 @@ async def lifespan(app: FastAPI):
     # Startup: 테이블 생성
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(upgrade_all)
+    await manager.attach_backplane(
+        create_backplane(
+            settings.backplane,
+            settings.backplane_url,
+            batch_size=settings.backplane_batch_size,
+            flush_interval=settings.backplane_flush_interval_ms / 1000,
+        )
+    )
+    if settings.message_group_commit:
+        await message_ingest.start(engine)
+    await manager.start_presence(engine)
     yield
     # Shutdown
+    await message_ingest.stop()
+    await manager.stop_presence()
+    await manager.detach_backplane()
+    password_hasher.shutdown()
     await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
 
 
-app = FastAPI(title=settings.app_name, debug=settings.debug, lifespan=lifespan)
+# response_model이 있는 라우트는 FastAPI가 pydantic으로 바로 JSON bytes를 만들고,
+# dict를 반환하는 라우트는 FastJSONResponse(orjson)로 렌더링한다. Default()로 감싸야
+# FastAPI가 기본 응답 클래스로 취급해 pydantic 직렬화 경로를 유지한다.
+app = FastAPI(
+    title=settings.app_name,
+    debug=settings.debug,
+    lifespan=lifespan,
+    default_response_class=Default(FastJSONResponse),
+)
+
+# 과부하 시 요청이 쌓여 모든 요청이 느려지기 전에 대기/거절
+admission = (
+    AdmissionControl(
+        settings.max_concurrent_requests,
+        max_waiting=settings.admission_queue_size,
+        timeout=settings.admission_timeout_ms / 1000,
+    )
+    if settings.max_concurrent_requests
+    else None
+)
+app.state.admission = admission
+# 나중에 추가한 미들웨어가 바깥쪽: 속도 제한 → 계측 → 라우팅
+app.add_middleware(InstrumentationMiddleware)
+app.add_middleware(RateLimitMiddleware, limiter=rate_limiter, admission=admission)
+
+instrument_engine(engine)
+instrument_engine(read_engine)
+
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Too many authentication requests, try again shortly"},
+        headers={"Retry-After": "1"},
+    )
+
 
 app.include_router(auth_router)
 app.include_router(users_router)
@@ -30,6 +99,9 @@ app.include_router(rooms_router)
 app.include_router(messages_router)
 app.include_router(read_router)
 app.include_router(status_router)
+app.include_router(sync_router)
+app.include_router(websocket_router)
+app.include_router(metrics_router)
 
 
 @app.get("/health")
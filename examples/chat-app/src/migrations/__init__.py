@@ -0,0 +1,31 @@
+"""기존 DB 스키마 마이그레이션
+
+create_all은 없는 테이블만 만들기 때문에, 기존 테이블의 컬럼/인덱스
+추가와 백필은 여기서 처리한다. 각 마이그레이션은 적용 여부를 스스로 확인하므로
+시작할 때마다 실행해도 된다.
+"""
+
+from sqlalchemy.engine import Connection
+
+from src.migrations import (
+    direct_room_key,
+    message_history_index,
+    message_seq,
+    read_watermark,
+    user_search_index,
+    user_token_version,
+)
+
+MIGRATIONS = [
+    ("message_history_index", message_history_index.upgrade),
+    ("read_watermark", read_watermark.upgrade),
+    ("direct_room_key", direct_room_key.upgrade),
+    ("user_token_version", user_token_version.upgrade),
+    ("user_search_index", user_search_index.upgrade),
+    ("message_seq", message_seq.upgrade),
+]
+
+
+def upgrade_all(conn: Connection) -> list[str]:
+    """모든 마이그레이션 적용 (이번에 적용된 이름 목록 반환)"""
+    return [name for name, upgrade in MIGRATIONS if upgrade(conn)]
@@ -0,0 +1,65 @@
+"""1:1 채팅방 참여자 쌍 키 마이그레이션
+
+기존 DB의 chat_rooms에 direct_key 컬럼과 유니크 인덱스를 추가하고,
+멤버가 정확히 두 명인 채팅방에 키를 채운다. 같은 쌍의 채팅방이 여러 개
+있으면 가장 먼저 만들어진 채팅방만 키를 갖는다. 이미 적용된 DB에서는
+아무것도 하지 않는다.
+
+실행:
+    python -m src.migrations.direct_room_key
+"""
+
+import asyncio
+
+from sqlalchemy import String, inspect, select, update
+from sqlalchemy.engine import Connection
+
+from src.models.room import ChatRoom, ChatRoomMember
+
+
+def upgrade(conn: Connection) -> bool:
+    """direct_key 컬럼 추가 및 백필 (적용했으면 True)"""
+    columns = {c["name"] for c in inspect(conn).get_columns("chat_rooms")}
+    if "direct_key" in columns:
+        return False
+
+    conn.exec_driver_sql(
+        f"ALTER TABLE chat_rooms ADD COLUMN direct_key {String(73).compile(dialect=conn.dialect)}"
+    )
+
+    rows = conn.execute(
+        select(ChatRoomMember.room_id, ChatRoomMember.user_id)
+        .join(ChatRoom, ChatRoom.id == ChatRoomMember.room_id)
+        .order_by(ChatRoom.created_at, ChatRoom.id)
+    ).all()
+    members: dict[str, list[str]] = {}
+    for room_id, user_id in rows:
+        members.setdefault(room_id, []).append(user_id)
+
+    seen: set[str] = set()
+    for room_id, user_ids in members.items():
+        if len(user_ids) != 2:
+            continue
+        key = ChatRoom.make_direct_key(*user_ids)
+        if key in seen:
+            continue
+        seen.add(key)
+        conn.execute(update(ChatRoom).where(ChatRoom.id == room_id).values(direct_key=key))
+
+    conn.exec_driver_sql(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_chat_rooms_direct_key ON chat_rooms (direct_key)"
+    )
+    return True
+
+
+async def main() -> None:
+    from src.database import engine
+
+    async with engine.begin() as conn:
+        applied = await conn.run_sync(upgrade)
+    await engine.dispose()
+    print("direct room key: " + ("migrated" if applied else "already up to date"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
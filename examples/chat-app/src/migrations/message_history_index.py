@@ -0,0 +1,41 @@
+"""메시지 히스토리 키셋 인덱스 마이그레이션
+
+create_all은 기존 테이블에 인덱스를 추가하지 않으므로, 키셋
+페이지네이션이 사용하는 messages(room_id, created_at, id) 인덱스를
+기존 DB에 만든다. 인덱스가 없으면 커서 조회가 정렬로 떨어진다. 이미
+적용된 DB에서는 아무것도 하지 않는다.
+
+실행:
+    python -m src.migrations.message_history_index
+"""
+
+import asyncio
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
+
+def upgrade(conn: Connection) -> bool:
+    """(room_id, created_at, id) 인덱스 생성 (적용했으면 True)"""
+    indexes = {i["name"] for i in inspect(conn).get_indexes("messages")}
+    if "ix_messages_room_created_id" in indexes:
+        return False
+
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_messages_room_created_id "
+        "ON messages (room_id, created_at, id)"
+    )
+    return True
+
+
+async def main() -> None:
+    from src.database import engine
+
+    async with engine.begin() as conn:
+        applied = await conn.run_sync(upgrade)
+    await engine.dispose()
+    print("message history index: " + ("migrated" if applied else "already up to date"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
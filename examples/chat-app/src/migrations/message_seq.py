@@ -0,0 +1,60 @@
+"""메시지 시퀀스 마이그레이션
+
+기존 DB의 messages에 채팅방별 seq 컬럼을 추가하고, 채팅방마다
+(created_at, id) 순서로 1부터 번호를 매긴 뒤 (room_id, seq) 유니크
+인덱스를 만든다. 동기화 API가 사용자의 채팅방을 찾는
+chat_room_members(user_id, room_id) 인덱스도 함께 만든다. 이미 적용된
+DB에서는 아무것도 하지 않는다.
+
+실행:
+    python -m src.migrations.message_seq
+"""
+
+import asyncio
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
+BACKFILL = """
+UPDATE messages SET seq = ranked.n
+FROM (
+    SELECT id, ROW_NUMBER() OVER (PARTITION BY room_id ORDER BY created_at, id) AS n
+    FROM messages
+) AS ranked
+WHERE ranked.id = messages.id
+"""
+
+
+def upgrade(conn: Connection) -> bool:
+    """seq 컬럼 추가, 백필, 인덱스 생성 (적용했으면 True)"""
+    inspector = inspect(conn)
+    applied = False
+
+    columns = {c["name"] for c in inspector.get_columns("messages")}
+    if "seq" not in columns:
+        conn.exec_driver_sql("ALTER TABLE messages ADD COLUMN seq INTEGER NOT NULL DEFAULT 0")
+        conn.exec_driver_sql(BACKFILL)
+        conn.exec_driver_sql("CREATE UNIQUE INDEX ix_messages_room_seq ON messages (room_id, seq)")
+        applied = True
+
+    member_indexes = {i["name"] for i in inspector.get_indexes("chat_room_members")}
+    if "ix_chat_room_members_user" not in member_indexes:
+        conn.exec_driver_sql(
+            "CREATE INDEX ix_chat_room_members_user ON chat_room_members (user_id, room_id)"
+        )
+        applied = True
+
+    return applied
+
+
+async def main() -> None:
+    from src.database import engine
+
+    async with engine.begin() as conn:
+        applied = await conn.run_sync(upgrade)
+    await engine.dispose()
+    print("message seq: " + ("migrated" if applied else "already up to date"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""읽음 워터마크 마이그레이션
+
+기존 DB의 chat_room_members에 last_read_at / last_read_message_id 컬럼을
+추가하고, message_reads에서 멤버별로 가장 최근에 읽은 메시지를 워터마크로
+채운다. 이미 적용된 DB에서는 아무것도 하지 않는다. message_reads는
+read_receipts 설정용으로 그대로 남긴다.
+
+실행:
+    python -m src.migrations.read_watermark
+"""
+
+import asyncio
+
+from sqlalchemy import DateTime, String, inspect, select, update
+from sqlalchemy.engine import Connection
+
+from src.models.message import Message, MessageRead
+from src.models.room import ChatRoomMember
+
+
+def upgrade(conn: Connection) -> bool:
+    """워터마크 컬럼 추가 및 백필 (적용했으면 True)"""
+    columns = {c["name"] for c in inspect(conn).get_columns("chat_room_members")}
+    if "last_read_at" in columns:
+        return False
+
+    dialect = conn.dialect
+    conn.exec_driver_sql(
+        "ALTER TABLE chat_room_members ADD COLUMN last_read_at "
+        f"{DateTime().compile(dialect=dialect)}"
+    )
+    conn.exec_driver_sql(
+        "ALTER TABLE chat_room_members ADD COLUMN last_read_message_id "
+        f"{String(36).compile(dialect=dialect)}"
+    )
+
+    members = ChatRoomMember.__table__
+    # 멤버가 읽은 메시지 중 (created_at, id)가 가장 큰 메시지
+    last_read = (
+        select(Message.id)
+        .join(MessageRead, MessageRead.message_id == Message.id)
+        .where(
+            MessageRead.user_id == members.c.user_id,
+            Message.room_id == members.c.room_id,
+        )
+        .order_by(Message.created_at.desc(), Message.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    conn.execute(update(members).values(last_read_message_id=last_read))
+    conn.execute(
+        update(members)
+        .where(members.c.last_read_message_id.is_not(None))
+        .values(
+            last_read_at=select(Message.created_at)
+            .where(Message.id == members.c.last_read_message_id)
+            .scalar_subquery()
+        )
+    )
+    return True
+
+
+async def main() -> None:
+    from src.database import engine
+
+    async with engine.begin() as conn:
+        applied = await conn.run_sync(upgrade)
+    await engine.dispose()
+    print("read watermark: " + ("migrated" if applied else "already up to date"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""사용자 검색 인덱스 마이그레이션
+
+공통: 정확/접두어 검색용 (lower(username), username) 인덱스를 만든다.
+SQLite: username과 users.id를 저장하는 FTS5 trigram 테이블(users_fts)과
+users 변경을 따라가는 트리거를 만들고 기존 사용자를 색인한다. users.rowid를
+키로 쓰던 이전 버전의 users_fts는 다시 만든다.
+PostgreSQL: pg_trgm 확장과 username GIN 트라이그램 인덱스를 만든다.
+이미 적용된 DB에서는 아무것도 하지 않는다.
+
+실행:
+    python -m src.migrations.user_search_index
+"""
+
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from src.repositories.user import SQLITE_TRIGRAM
+
+# users의 기본 키는 문자열이라 rowid가 암시적이고 VACUUM 때 바뀔 수 있으므로,
+# 외부 콘텐츠 테이블 대신 username과 users.id(UNINDEXED)를 직접 저장한다.
+# 삭제/변경 트리거는 이전 username의 trigram MATCH로 대상 행을 좁힌 뒤 user_id로
+# 고른다 (trigram은 3자 미만을 찾지 못하므로 짧은 이름은 user_id로 스캔).
+SQLITE_STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE users_fts USING fts5(
+        username, user_id UNINDEXED, tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER users_fts_insert AFTER INSERT ON users BEGIN
+        INSERT INTO users_fts(username, user_id) VALUES (new.username, new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER users_fts_delete AFTER DELETE ON users BEGIN
+        DELETE FROM users_fts WHERE rowid IN (
+            SELECT rowid FROM users_fts
+            WHERE users_fts MATCH '"' || replace(old.username, '"', '""') || '"'
+                AND user_id = old.id
+        );
+        DELETE FROM users_fts WHERE length(old.username) < 3 AND user_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER users_fts_update AFTER UPDATE OF id, username ON users BEGIN
+        DELETE FROM users_fts WHERE rowid IN (
+            SELECT rowid FROM users_fts
+            WHERE users_fts MATCH '"' || replace(old.username, '"', '""') || '"'
+                AND user_id = old.id
+        );
+        DELETE FROM users_fts WHERE length(old.username) < 3 AND user_id = old.id;
+        INSERT INTO users_fts(username, user_id) VALUES (new.username, new.id);
+    END
+    """,
+    "INSERT INTO users_fts(username, user_id) SELECT username, id FROM users",
+]
+
+# users.rowid를 키로 쓰던 이전 외부 콘텐츠 테이블과 트리거
+SQLITE_LEGACY_DROP = [
+    "DROP TRIGGER IF EXISTS users_fts_insert",
+    "DROP TRIGGER IF EXISTS users_fts_delete",
+    "DROP TRIGGER IF EXISTS users_fts_update",
+    "DROP TABLE IF EXISTS users_fts",
+]
+
+
+def _sqlite_fts_sql(conn: Connection) -> str | None:
+    """users_fts 생성 SQL (없으면 None)"""
+    sql = "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'users_fts'"
+    return conn.exec_driver_sql(sql).scalar()
+
+
+def _has_index(conn: Connection, name: str) -> bool:
+    """인덱스 존재 여부 (표현식 인덱스는 inspect로 조회되지 않음)"""
+    if conn.dialect.name == "sqlite":
+        sql = "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = :name"
+    else:
+        sql = "SELECT 1 FROM pg_indexes WHERE indexname = :name"
+    return conn.execute(text(sql), {"name": name}).first() is not None
+
+
+def upgrade(conn: Connection) -> bool:
+    """검색 인덱스 생성 (적용했으면 True)"""
+    dialect = conn.dialect.name
+    if dialect not in ("sqlite", "postgresql"):
+        return False
+    applied = False
+
+    if not _has_index(conn, "ix_users_username_lower"):
+        conn.exec_driver_sql(
+            "CREATE INDEX ix_users_username_lower ON users (lower(username), username)"
+        )
+        applied = True
+
+    if dialect == "sqlite":
+        if SQLITE_TRIGRAM:
+            fts_sql = _sqlite_fts_sql(conn)
+            if fts_sql is None or "user_id" not in fts_sql:
+                for statement in SQLITE_LEGACY_DROP + SQLITE_STATEMENTS:
+                    conn.exec_driver_sql(statement)
+                applied = True
+
+    elif not _has_index(conn, "ix_users_username_trgm"):
+        conn.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        conn.exec_driver_sql(
+            "CREATE INDEX ix_users_username_trgm ON users USING gin (username gin_trgm_ops)"
+        )
+        applied = True
+
+    return applied
+
+
+async def main() -> None:
+    from src.database import engine
+
+    async with engine.begin() as conn:
+        applied = await conn.run_sync(upgrade)
+    await engine.dispose()
+    print("user search index: " + ("migrated" if applied else "already up to date"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
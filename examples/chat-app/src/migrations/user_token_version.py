@@ -0,0 +1,38 @@
+"""사용자 토큰 버전 마이그레이션
+
+기존 DB의 users에 token_version 컬럼(기본 0)을 추가한다. 이미 적용된
+DB에서는 아무것도 하지 않는다.
+
+실행:
+    python -m src.migrations.user_token_version
+"""
+
+import asyncio
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
+
+def upgrade(conn: Connection) -> bool:
+    """token_version 컬럼 추가 (적용했으면 True)"""
+    columns = {c["name"] for c in inspect(conn).get_columns("users")}
+    if "token_version" in columns:
+        return False
+
+    conn.exec_driver_sql(
+        "ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0"
+    )
+    return True
+
+
+async def main() -> None:
+    from src.database import engine
+
+    async with engine.begin() as conn:
+        applied = await conn.run_sync(upgrade)
+    await engine.dispose()
+    print("user token version: " + ("migrated" if applied else "already up to date"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,5 +1,12 @@
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
     pass
+
+
+def utcnow() -> datetime:
+    """마이크로초 단위 UTC 현재 시각 (DB의 CURRENT_TIMESTAMP는 초 단위)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -1,14 +1,20 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import ForeignKey, String, Text, func
+from sqlalchemy import ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from src.models.base import Base
+from src.models.base import Base, utcnow
 
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        # 키셋 페이지네이션: WHERE room_id = ? AND (created_at, id) < (?, ?)
+        Index("ix_messages_room_created_id", "room_id", "created_at", "id"),
+        # 채팅방별 시퀀스: 동기화(WHERE room_id = ? AND seq > ?)와 다음 번호 계산(MAX)
+        Index("ix_messages_room_seq", "room_id", "seq", unique=True),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid4())
@@ -20,7 +26,9 @@ class Message(Base):
         String(36), ForeignKey("users.id", ondelete="SET NULL")
     )
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(default=utcnow)
+    # 채팅방 안에서 1부터 단조 증가하는 번호 (repositories.message.next_seq로 채움)
+    seq: Mapped[int] = mapped_column(nullable=False)
 
 
 class MessageRead(Base):
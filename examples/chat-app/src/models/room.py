@@ -1,8 +1,8 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import ForeignKey, String, func
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, Index, String, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
 
@@ -14,10 +14,26 @@ class ChatRoom(Base):
         String(36), primary_key=True, default=lambda: str(uuid4())
     )
     created_at: Mapped[datetime] = mapped_column(default=func.now())
+    # 1:1 채팅방의 정규화된 참여자 쌍 ("작은ID:큰ID"), 같은 쌍의 중복 생성 방지
+    direct_key: Mapped[str | None] = mapped_column(String(73), unique=True, default=None)
+
+    # 비동기 세션에서 지연 로딩을 막기 위해 명시적으로 로드해야 함 (selectinload)
+    members: Mapped[list["ChatRoomMember"]] = relationship(
+        lazy="raise", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+    @staticmethod
+    def make_direct_key(user1_id: str, user2_id: str) -> str:
+        """두 사용자 ID로 순서와 무관한 1:1 채팅방 키 생성"""
+        return ":".join(sorted((user1_id, user2_id)))
 
 
 class ChatRoomMember(Base):
     __tablename__ = "chat_room_members"
+    __table_args__ = (
+        # 사용자 → 채팅방 조회 (멤버십 캐시, 동기화)
+        Index("ix_chat_room_members_user", "user_id", "room_id"),
+    )
 
     room_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("chat_rooms.id", ondelete="CASCADE"), primary_key=True
@@ -26,3 +42,12 @@ class ChatRoomMember(Base):
         String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
     )
     joined_at: Mapped[datetime] = mapped_column(default=func.now())
+    # 읽음 워터마크: (last_read_at, last_read_message_id) 이하의 메시지는 읽음
+    last_read_at: Mapped[datetime | None] = mapped_column(default=None)
+    last_read_message_id: Mapped[str | None] = mapped_column(String(36), default=None)
+
+    def has_read(self, created_at: datetime, message_id: str) -> bool:
+        """워터마크 기준 읽음 여부"""
+        if self.last_read_at is None:
+            return False
+        return (created_at, message_id) <= (self.last_read_at, self.last_read_message_id)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import String, func
+from sqlalchemy import Index, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -18,5 +18,11 @@ class User(Base):
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(default=True)
+    # 토큰의 "ver" 클레임과 비교, 올리면 발급된 모든 토큰이 무효화됨
+    token_version: Mapped[int] = mapped_column(default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(default=func.now())
     last_seen_at: Mapped[datetime | None] = mapped_column(default=None)
+
+
+# 대소문자 무시 정확/접두어 검색: lower(username) 범위 스캔 + 정렬
+Index("ix_users_username_lower", func.lower(User.username), User.username)
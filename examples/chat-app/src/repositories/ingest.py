@@ -0,0 +1,206 @@
+"""메시지 write-behind 수집 큐 (그룹 커밋)
+
+요청마다 트랜잭션을 커밋하면 SQLite는 메시지마다 fsync를 한 번씩 한다.
+MessageIngestQueue는 메시지를 asyncio 큐에 모았다가 batch_size개가 차거나
+max_delay가 지나면 한 트랜잭션으로 INSERT/COMMIT한다. submit()은 해당
+배치가 커밋된 뒤에 반환하므로, 응답을 받은 메시지는 항상 DB에 있다.
+채팅방 시퀀스 번호(seq)는 행마다 INSERT 안에서 계산하고 커밋 전에 읽어 온다.
+한 행 때문에 배치가 실패하면 행마다 다시 커밋해 그 행의 요청만 실패시킨다.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from uuid import uuid4
+
+from sqlalchemy import bindparam, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+from src.models.base import utcnow
+from src.models.message import Message
+from src.repositories.message import SEQ_RETRIES, next_seq
+
+# executemany 행마다 다음 seq를 계산하는 INSERT
+INSERT_MESSAGE = insert(Message).values(seq=next_seq(bindparam("seq_room_id")))
+
+
+@dataclass
+class IngestStats:
+    """그룹 커밋 지표"""
+
+    batches: int = 0
+    messages: int = 0
+    failed: int = 0
+    fallbacks: int = 0  # 행 단위 커밋으로 다시 처리한 배치 수
+    max_batch: int = 0
+    total_flush_ms: float = 0.0
+
+
+class MessageIngestQueue:
+    """메시지 그룹 커밋 큐와 writer 태스크"""
+
+    def __init__(self, batch_size: int = 256, max_delay: float = 0.002, maxsize: int = 10_000):
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.maxsize = maxsize
+        self.stats = IngestStats()
+        self._engine: AsyncEngine | None = None
+        self._queue: asyncio.Queue[tuple[dict, asyncio.Future]] | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self, engine: AsyncEngine) -> None:
+        """writer 태스크 시작"""
+        if self._task is not None:
+            return
+        self._engine = engine
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """대기 중인 메시지를 모두 커밋한 뒤 writer 태스크 종료"""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        await self._queue.join()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def submit(self, room_id: str, sender_id: str | None, content: str) -> dict:
+        """메시지를 큐에 넣고 커밋될 때까지 대기 (저장된 행 반환)
+
+        큐가 가득 차면 자리가 날 때까지 대기한다 (배압).
+        """
+        if self._task is None:
+            raise RuntimeError("Ingest queue is not running")
+        row = {
+            "id": str(uuid4()),
+            "room_id": room_id,
+            "sender_id": sender_id,
+            "content": content,
+            "created_at": utcnow(),
+        }
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((row, future))
+        await future
+        return row
+
+    async def _collect(self) -> list[tuple[dict, asyncio.Future]]:
+        """첫 항목을 기다린 뒤 batch_size 또는 max_delay까지 모음"""
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_delay
+        while len(batch) < self.batch_size:
+            if self._queue.empty():
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _insert(self, rows: list[dict]) -> None:
+        """행들을 한 트랜잭션으로 INSERT/COMMIT하고 각 행에 seq를 채움"""
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                INSERT_MESSAGE, [{**row, "seq_room_id": row["room_id"]} for row in rows]
+            )
+            result = await conn.execute(
+                select(Message.id, Message.seq).where(Message.id.in_([row["id"] for row in rows]))
+            )
+            seqs = dict(result.all())
+        for row in rows:
+            row["seq"] = seqs[row["id"]]
+
+    async def _insert_one(self, row: dict) -> Exception | None:
+        """한 행만 커밋 (seq가 동시 삽입과 겹치면 다시 시도, 실패하면 예외 반환)"""
+        for attempt in range(SEQ_RETRIES):
+            try:
+                await self._insert([row])
+                return None
+            except IntegrityError as e:
+                if attempt == SEQ_RETRIES - 1:
+                    return e
+            except Exception as e:
+                return e
+        return None
+
+    async def _flush(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        """배치를 커밋하고 요청마다 결과 전달
+
+        배치 커밋이 실패하면 (삭제된 채팅방, seq 충돌 등) 행마다 따로 커밋해
+        실패한 행의 요청에만 오류를 전달한다.
+        """
+        start = time.perf_counter()
+        results: list[Exception | None]
+        if len(batch) == 1:
+            results = [await self._insert_one(batch[0][0])]
+        else:
+            try:
+                await self._insert([row for row, _ in batch])
+                results = [None] * len(batch)
+            except Exception:
+                self.stats.fallbacks += 1
+                results = [await self._insert_one(row) for row, _ in batch]
+
+        committed = 0
+        for (_, future), error in zip(batch, results):
+            if error is None:
+                committed += 1
+                if not future.done():
+                    future.set_result(None)
+            else:
+                self.stats.failed += 1
+                if not future.done():
+                    future.set_exception(error)
+
+        if committed:
+            self.stats.batches += 1
+            self.stats.messages += committed
+            self.stats.max_batch = max(self.stats.max_batch, committed)
+            self.stats.total_flush_ms += (time.perf_counter() - start) * 1000
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def metrics(self) -> dict:
+        """그룹 커밋 지표"""
+        stats = self.stats
+        return {
+            "running": self.running,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "batches": stats.batches,
+            "messages": stats.messages,
+            "failed": stats.failed,
+            "fallbacks": stats.fallbacks,
+            "max_batch": stats.max_batch,
+            "avg_batch": round(stats.messages / stats.batches, 1) if stats.batches else 0.0,
+            "avg_flush_ms": (
+                round(stats.total_flush_ms / stats.batches, 3) if stats.batches else 0.0
+            ),
+        }
+
+
+# 전역 수집 큐 (MESSAGE_GROUP_COMMIT=true일 때 lifespan에서 시작)
+message_ingest = MessageIngestQueue(
+    batch_size=settings.group_commit_batch_size,
+    max_delay=settings.group_commit_max_delay_ms / 1000,
+    maxsize=settings.group_commit_queue_size,
+)
@@ -0,0 +1,137 @@
+"""메시지 조회 쿼리 모듈"""
+
+import base64
+from datetime import datetime
+
+from sqlalchemy import Insert, ScalarSelect, Select, func, literal, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+
+from src.models.message import Message, MessageRead
+from src.models.room import ChatRoomMember
+
+
+class InvalidCursor(ValueError):
+    """잘못된 페이지 커서"""
+
+
+def encode_cursor(message: Message) -> str:
+    """메시지 위치를 불투명 커서로 인코딩"""
+    raw = f"{message.created_at.isoformat()}|{message.id}"
+    return base64.urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """커서를 (created_at, id)로 디코딩"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, message_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), message_id
+    except ValueError as e:
+        raise InvalidCursor(cursor) from e
+
+
+# 동시 삽입과 seq가 겹쳤을 때 다시 시도하는 횟수 (PostgreSQL)
+SEQ_RETRIES = 3
+
+
+def next_seq(room_id) -> ScalarSelect:
+    """채팅방의 다음 시퀀스 번호 서브쿼리 (INSERT 값으로 사용)
+
+    (room_id, seq) 유니크 인덱스의 최댓값 + 1이므로 INSERT 한 문장 안에서
+    계산된다. SQLite는 쓰기가 직렬화되어 번호가 겹치지 않고, PostgreSQL에서
+    동시 삽입이 같은 번호를 얻으면 유니크 인덱스가 나중 것을 거부한다.
+    room_id에는 값이나 bindparam(executemany용)을 줄 수 있다.
+    """
+    return (
+        select(func.coalesce(func.max(Message.seq), 0) + 1)
+        .where(Message.room_id == room_id)
+        .scalar_subquery()
+    )
+
+
+def message_page_query(
+    room_id: str,
+    limit: int,
+    before: str | None = None,
+    after: str | None = None,
+) -> Select:
+    """(created_at, id) 키셋 페이지 쿼리
+
+    before: 커서보다 오래된 메시지 중 가장 최근 limit개 (내림차순으로 조회)
+    after: 커서보다 새 메시지 중 가장 오래된 limit개 (오름차순으로 조회)
+    messages(room_id, created_at, id) 인덱스 범위 스캔이므로 페이지 깊이와
+    무관하게 일정한 비용이 든다. 호출자는 before 결과를 뒤집어 시간순으로 만든다.
+    """
+    key = tuple_(Message.created_at, Message.id)
+    query = select(Message).where(Message.room_id == room_id)
+
+    if before is not None:
+        return (
+            query.where(key < tuple_(*decode_cursor(before)))
+            .order_by(Message.created_at.desc(), Message.id.desc())
+            .limit(limit)
+        )
+
+    if after is not None:
+        query = query.where(key > tuple_(*decode_cursor(after)))
+    return query.order_by(Message.created_at.asc(), Message.id.asc()).limit(limit)
+
+
+def unread_count_query(member: ChatRoomMember) -> Select:
+    """읽음 워터마크 이후, 내가 보내지 않은 메시지 수 쿼리
+
+    messages(room_id, created_at, id) 인덱스의 범위 카운트 하나로 계산한다.
+    """
+    query = select(func.count()).where(
+        Message.room_id == member.room_id, Message.sender_id != member.user_id
+    )
+    if member.last_read_at is not None:
+        query = query.where(
+            tuple_(Message.created_at, Message.id)
+            > tuple_(member.last_read_at, member.last_read_message_id)
+        )
+    return query
+
+
+def latest_message_query(room_id: str) -> Select:
+    """채팅방의 가장 최근 메시지 (created_at, id) 쿼리"""
+    return (
+        select(Message.created_at, Message.id)
+        .where(Message.room_id == room_id)
+        .order_by(Message.created_at.desc(), Message.id.desc())
+        .limit(1)
+    )
+
+
+def mark_read_receipts_stmt(
+    dialect_name: str,
+    member: ChatRoomMember,
+    up_to: tuple[datetime, str],
+) -> Insert:
+    """워터마크 이후 ~ up_to 메시지의 읽음 기록 일괄 저장 문
+
+    INSERT INTO message_reads ... SELECT ... ON CONFLICT DO NOTHING 한 문장으로
+    DB 안에서 처리하므로 메시지 ID를 애플리케이션으로 가져오지 않는다.
+    SQLite와 PostgreSQL을 지원한다.
+    """
+    if dialect_name == "postgresql":
+        insert = postgresql.insert
+    elif dialect_name == "sqlite":
+        insert = sqlite.insert
+    else:
+        raise ValueError(f"Unsupported dialect: {dialect_name}")
+
+    key = tuple_(Message.created_at, Message.id)
+    unread = select(Message.id, literal(member.user_id), func.now()).where(
+        Message.room_id == member.room_id,
+        Message.sender_id != member.user_id,
+        key <= tuple_(*up_to),
+    )
+    if member.last_read_at is not None:
+        unread = unread.where(key > tuple_(member.last_read_at, member.last_read_message_id))
+
+    return (
+        insert(MessageRead)
+        .from_select(["message_id", "user_id", "read_at"], unread)
+        .on_conflict_do_nothing(index_elements=["message_id", "user_id"])
+    )
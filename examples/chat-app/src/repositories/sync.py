@@ -0,0 +1,145 @@
+"""재연결 동기화 쿼리와 커서
+
+커서는 채팅방별로 마지막으로 받은 seq와 온라인 상태 변경 버전을 담는다.
+동기화는 사용자의 채팅방별 최신 seq를 한 번에 조회하고, 커서보다 앞선
+채팅방만 메시지와 안 읽은 수를 조회하므로 변경이 없는 재연결은 쿼리
+한 번으로 끝난다.
+"""
+
+import base64
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator
+
+from sqlalchemy import Select, func, select, tuple_, union_all
+from sqlalchemy.orm import aliased
+
+from src.core.serialization import dumps, loads
+from src.models.message import Message
+from src.models.room import ChatRoomMember
+from src.repositories.message import InvalidCursor
+
+# 한 쿼리에 묶는 채팅방 수 (SQLite 복합 SELECT 항 수 상한 500 미만)
+SYNC_ROOMS_PER_QUERY = 250
+
+
+@dataclass
+class SyncCursor:
+    """동기화 위치"""
+
+    # room_id → 받은 마지막 seq (없는 채팅방은 0)
+    rooms: dict[str, int] = field(default_factory=dict)
+    presence_epoch: str = ""
+    presence_version: int = 0
+
+
+def encode_sync_cursor(cursor: SyncCursor) -> str:
+    """동기화 위치를 불투명 커서로 인코딩"""
+    raw = dumps(
+        {
+            "r": {room_id: seq for room_id, seq in cursor.rooms.items() if seq},
+            "e": cursor.presence_epoch,
+            "p": cursor.presence_version,
+        }
+    )
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_sync_cursor(cursor: str) -> SyncCursor:
+    """커서를 동기화 위치로 디코딩"""
+    try:
+        data = loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return SyncCursor(
+            rooms={str(room_id): int(seq) for room_id, seq in data["r"].items()},
+            presence_epoch=str(data["e"]),
+            presence_version=int(data["p"]),
+        )
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        raise InvalidCursor(cursor) from e
+
+
+def room_heads_query(user_id: str) -> Select:
+    """사용자가 속한 채팅방과 각 채팅방의 최신 seq 쿼리
+
+    채팅방마다 (room_id, seq) 인덱스의 MAX 한 번이므로 메시지 수와 무관하다.
+    """
+    head = (
+        select(func.max(Message.seq))
+        .where(Message.room_id == ChatRoomMember.room_id)
+        .correlate(ChatRoomMember)
+        .scalar_subquery()
+    )
+    return select(ChatRoomMember.room_id, func.coalesce(head, 0)).where(
+        ChatRoomMember.user_id == user_id
+    )
+
+
+def messages_since_query(positions: dict[str, int], limit: int) -> Select:
+    """채팅방별 seq 이후 메시지를 최대 limit개씩 조회 (채팅방, seq 순)
+
+    채팅방마다 (room_id, seq) 인덱스 범위 스캔을 UNION ALL로 묶어 한 번에
+    실행한다. 호출자는 limit + 1을 넘겨 채팅방별 남은 메시지 여부를 판단한다.
+    """
+    parts = [
+        select(
+            select(Message.id)
+            .where(Message.room_id == room_id, Message.seq > seq)
+            .order_by(Message.seq)
+            .limit(limit)
+            .subquery()
+        )
+        for room_id, seq in positions.items()
+    ]
+    ids = parts[0] if len(parts) == 1 else union_all(*parts)
+    return (
+        select(Message)
+        .where(Message.id.in_(ids))
+        .order_by(Message.room_id, Message.seq)
+    )
+
+
+def messages_since_queries(positions: dict[str, int], limit: int) -> Iterator[Select]:
+    """messages_since_query를 SYNC_ROOMS_PER_QUERY개 채팅방씩 나눠 생성
+
+    채팅방 ID 순으로 나누므로 결과를 차례로 이어 붙여도 (채팅방, seq) 순이다.
+    """
+    rooms = sorted(positions.items())
+    for start in range(0, len(rooms), SYNC_ROOMS_PER_QUERY):
+        yield messages_since_query(dict(rooms[start : start + SYNC_ROOMS_PER_QUERY]), limit)
+
+
+def unread_counts_query(user_id: str, room_ids: list[str]) -> Select:
+    """채팅방별 안 읽은 메시지 수 쿼리 (워터마크 이후, 내가 보내지 않은 메시지)
+
+    멤버 행마다 상관 서브쿼리로 세므로 채팅방마다 messages(room_id,
+    created_at, id) 인덱스의 워터마크 이후 범위만 읽는다.
+    """
+    unread = (
+        select(func.count())
+        .where(
+            Message.room_id == ChatRoomMember.room_id,
+            Message.sender_id != user_id,
+            tuple_(Message.created_at, Message.id)
+            > tuple_(
+                func.coalesce(ChatRoomMember.last_read_at, datetime.min),
+                func.coalesce(ChatRoomMember.last_read_message_id, ""),
+            ),
+        )
+        .correlate(ChatRoomMember)
+        .scalar_subquery()
+    )
+    return select(ChatRoomMember.room_id, unread).where(
+        ChatRoomMember.user_id == user_id, ChatRoomMember.room_id.in_(room_ids)
+    )
+
+
+def room_peers_query(user_id: str) -> Select:
+    """사용자와 채팅방을 하나 이상 같이 쓰는 다른 사용자 ID 쿼리"""
+    me = aliased(ChatRoomMember)
+    other = aliased(ChatRoomMember)
+    return (
+        select(other.user_id)
+        .join(me, me.room_id == other.room_id)
+        .where(me.user_id == user_id, other.user_id != user_id)
+        .distinct()
+    )
@@ -0,0 +1,134 @@
+"""사용자 조회/검색 쿼리 모듈
+
+검색 결과는 정확 일치(0) → 접두어 일치(1) → 부분 일치(2) 등급 순이며,
+각 등급은 정렬 순서를 그대로 제공하는 인덱스를 따라 읽으므로 일치하는
+사용자가 수백만 명이어도 LIMIT만큼만 읽고 멈춘다.
+- 정확/접두어: (lower(username), username) 인덱스 범위 스캔
+- 부분 일치 (3자 이상):
+  SQLite는 FTS5 trigram 테이블 users_fts를 rowid 순으로 읽어 user_id로 users와 잇고,
+  PostgreSQL은 pg_trgm GIN 인덱스를 타는 ILIKE를 사용한다
+  (src.migrations.user_search_index)
+
+커서는 (등급, 등급 내 정렬 키)이다.
+"""
+
+import base64
+import sqlite3
+from typing import Iterator
+
+from sqlalchemy import ColumnElement, Select, func, literal, literal_column, select, table, tuple_
+
+from src.models.user import User
+from src.repositories.message import InvalidCursor
+
+# FTS5 trigram 토크나이저는 SQLite 3.34부터 지원
+SQLITE_TRIGRAM = sqlite3.sqlite_version_info >= (3, 34, 0)
+MIN_TRIGRAM_LENGTH = 3
+
+RANK_EXACT, RANK_PREFIX, RANK_SUBSTRING = 0, 1, 2
+
+users_fts = table("users_fts")
+fts_rowid = literal_column("users_fts.rowid")
+fts_user_id = literal_column("users_fts.user_id")
+
+
+def encode_user_cursor(*key: object) -> str:
+    """정렬 키를 불투명 커서로 인코딩"""
+    raw = "|".join(str(part) for part in key)
+    return base64.urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+
+def decode_user_cursor(cursor: str, parts: int) -> list[str]:
+    """커서를 정렬 키 문자열 목록으로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.b64decode(padded, altchars=b"-_", validate=True).decode()
+    except ValueError as e:
+        raise InvalidCursor(cursor) from e
+    key = raw.split("|", parts - 1)
+    if len(key) != parts:
+        raise InvalidCursor(cursor)
+    return key
+
+
+def user_page_query(limit: int, after: str | None = None) -> Select:
+    """활성 사용자 목록 (username 키셋 페이지)"""
+    query = select(User).where(User.is_active.is_(True))
+    if after is not None:
+        (username,) = decode_user_cursor(after, 1)
+        query = query.where(User.username > username)
+    return query.order_by(User.username).limit(limit)
+
+
+def _by_lower_username(query: Select, after: str | None) -> Select:
+    """(lower(username), username) 순서와 키셋 조건 적용"""
+    key = tuple_(func.lower(User.username), User.username)
+    if after is not None:
+        query = query.where(key > tuple_(func.lower(literal(after)), literal(after)))
+    return query.add_columns(User.username).order_by(func.lower(User.username), User.username)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def user_search_stages(
+    dialect_name: str, q: str, after: str | None = None
+) -> Iterator[tuple[int, Select]]:
+    """등급별 검색 쿼리를 순서대로 생성
+
+    각 쿼리는 (User, 정렬 키) 행을 반환한다. 호출자는 limit이 찰 때까지
+    남은 개수만큼 LIMIT을 붙여 차례로 실행하고, 마지막 행의 (등급, 키)를
+    다음 페이지 커서로 쓴다.
+    """
+    after_rank, after_key = RANK_EXACT, None
+    if after is not None:
+        rank, key = decode_user_cursor(after, 2)
+        if rank not in ("0", "1", "2"):
+            raise InvalidCursor(after)
+        after_rank, after_key = int(rank), key
+
+    lowered = func.lower(literal(q))
+    username = func.lower(User.username)
+    active = select(User).where(User.is_active.is_(True))
+
+    def resume(rank: int) -> str | None:
+        return after_key if rank == after_rank else None
+
+    if after_rank <= RANK_EXACT:
+        yield RANK_EXACT, _by_lower_username(active.where(username == lowered), resume(RANK_EXACT))
+
+    if after_rank <= RANK_PREFIX:
+        prefix = active.where(username > lowered, username < lowered.concat("\U0010ffff"))
+        yield RANK_PREFIX, _by_lower_username(prefix, resume(RANK_PREFIX))
+
+    if len(q) < MIN_TRIGRAM_LENGTH:
+        return
+
+    not_prefix: ColumnElement[bool] = func.substr(username, 1, func.length(lowered)) != lowered
+    resume_key = resume(RANK_SUBSTRING)
+
+    if dialect_name == "sqlite" and SQLITE_TRIGRAM:
+        phrase = '"' + q.replace('"', '""') + '"'
+        query = (
+            select(User, fts_rowid)
+            .join(users_fts, User.id == fts_user_id)
+            .where(
+                literal_column("users_fts").op("MATCH")(literal(phrase)),
+                User.is_active.is_(True),
+                not_prefix,
+            )
+            .order_by(fts_rowid)
+        )
+        if resume_key is not None:
+            if not resume_key.isdigit():
+                raise InvalidCursor(after)
+            query = query.where(fts_rowid > int(resume_key))
+        yield RANK_SUBSTRING, query
+        return
+
+    if dialect_name == "postgresql":
+        match = User.username.ilike(f"%{_escape_like(q)}%", escape="\\")
+    else:
+        match = User.username.contains(q, autoescape=True)
+    yield RANK_SUBSTRING, _by_lower_username(active.where(match, not_prefix), resume_key)
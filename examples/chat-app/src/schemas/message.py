@@ -15,3 +15,4 @@ class MessageResponse(BaseModel):
     sender_id: str | None
     content: str
     created_at: datetime
+    seq: int
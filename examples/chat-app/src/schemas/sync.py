@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+
+from src.schemas.message import MessageResponse
+
+
+class SyncRequest(BaseModel):
+    # 이전 응답의 cursor (없으면 현재 위치부터)
+    since: str | None = None
+    limit: int = Field(100, ge=1, le=500)
+
+
+class PresenceChange(BaseModel):
+    user_id: str
+    is_online: bool
+
+
+class SyncResponse(BaseModel):
+    cursor: str
+    messages: list[MessageResponse] = []
+    unread_counts: dict[str, int] = {}
+    presence: list[PresenceChange] = []
+    # True면 presence는 변경분이 아니라 전체 상태
+    presence_reset: bool = False
+    # True면 cursor로 다시 요청해 나머지 메시지를 받음
+    has_more: bool = False
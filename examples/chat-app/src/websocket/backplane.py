@@ -0,0 +1,390 @@
+"""워커 간 브로드캐스트 백플레인 모듈
+
+uvicorn을 여러 워커로 실행하면 각 워커는 자기 프로세스의 WebSocket만
+알고 있다. 백플레인은 채팅방 브로드캐스트, 멤버십 변경, 온라인 상태
+변경을 다른 워커로 전달한다.
+
+- InProcessBackplane: 같은 프로세스 안의 인스턴스끼리 전달 (단일 워커, 테스트)
+- LocalSocketBackplane: 같은 호스트의 워커끼리 Unix 소켓 허브로 전달
+- RedisBackplane: Redis(또는 RESP 호환 서버) PUBLISH/SUBSCRIBE로 전달
+
+publish()는 대기하지 않고 (kind, key) 단위로 버퍼에 쌓으며, flush 주기마다
+같은 채팅방의 메시지를 프레임 하나로 묶어 보낸다.
+"""
+
+import asyncio
+import contextlib
+import fcntl
+import os
+import struct
+from typing import Callable
+from urllib.parse import urlparse
+from uuid import uuid4
+
+from src.core.serialization import dumps, loads
+
+# (origin, kind, key, items) → None
+BatchHandler = Callable[[str, str, str, list[dict]], None]
+
+_LENGTH = struct.Struct(">I")
+
+
+class Backplane:
+    """백플레인 기본 클래스 (버퍼링과 배치 전송 담당)"""
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 0.001):
+        self.worker_id = uuid4().hex
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.frames_sent = 0
+        self.frames_received = 0
+        self._handler: BatchHandler | None = None
+        self._pending: dict[tuple[str, str], list[dict]] = {}
+        self._pending_count = 0
+        self._flush_task: asyncio.Task | None = None
+        self._background: set[asyncio.Task] = set()
+
+    async def start(self, handler: BatchHandler) -> None:
+        """수신 핸들러 등록 후 전달 시작"""
+        self._handler = handler
+
+    async def stop(self) -> None:
+        """남은 버퍼를 보내고 종료"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        self._handler = None
+
+    def publish(self, kind: str, key: str, item: dict) -> None:
+        """다른 워커로 보낼 항목 추가 (대기하지 않음)"""
+        self._pending.setdefault((kind, key), []).append(item)
+        self._pending_count += 1
+        if self._pending_count >= self.batch_size:
+            task = asyncio.get_running_loop().create_task(self.flush())
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+        elif self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """버퍼에 쌓인 항목을 (kind, key)별 프레임으로 전송"""
+        if not self._pending:
+            return
+        pending, self._pending, self._pending_count = self._pending, {}, 0
+        frames = [
+            {"origin": self.worker_id, "kind": kind, "key": key, "items": items}
+            for (kind, key), items in pending.items()
+        ]
+        self.frames_sent += len(frames)
+        await self._send(frames)
+
+    async def _send(self, frames: list[dict]) -> None:
+        raise NotImplementedError
+
+    def _dispatch(self, frame: dict) -> None:
+        """수신 프레임을 핸들러로 전달 (자기 워커가 보낸 프레임은 무시)"""
+        if frame.get("origin") == self.worker_id or self._handler is None:
+            return
+        self.frames_received += 1
+        self._handler(frame["origin"], frame["kind"], frame["key"], frame["items"])
+
+    @staticmethod
+    def encode(frame: dict) -> bytes:
+        return dumps(frame)
+
+    @staticmethod
+    def decode(data: bytes) -> dict:
+        return loads(data)
+
+
+class InProcessBackplane(Backplane):
+    """같은 프로세스 안의 백플레인끼리 전달"""
+
+    def __init__(self, peers: set["InProcessBackplane"] | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.peers = peers if peers is not None else set()
+
+    async def start(self, handler: BatchHandler) -> None:
+        await super().start(handler)
+        self.peers.add(self)
+
+    async def stop(self) -> None:
+        await super().stop()
+        self.peers.discard(self)
+
+    async def _send(self, frames: list[dict]) -> None:
+        for peer in list(self.peers):
+            if peer is not self:
+                for frame in frames:
+                    peer._dispatch(frame)
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+    (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+    return await reader.readexactly(length)
+
+
+def _pack_frame(data: bytes) -> bytes:
+    return _LENGTH.pack(len(data)) + data
+
+
+class LocalSocketBackplane(Backplane):
+    """Unix 소켓 허브를 통해 같은 호스트의 워커끼리 전달
+
+    가장 먼저 `{path}.lock`을 잡은 워커가 허브를 열고, 모든 워커(자신 포함)는
+    클라이언트로 접속한다. 허브 워커가 종료되면 잠금이 풀리고 다른 워커가
+    재접속 중에 허브를 이어받는다 (그 사이의 프레임은 유실될 수 있음).
+    """
+
+    def __init__(self, path: str, retry_interval: float = 0.2, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.retry_interval = retry_interval
+        self._writer: asyncio.StreamWriter | None = None
+        self._connected = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._lock_fd: int | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._hub_writers: set[asyncio.StreamWriter] = set()
+
+    async def start(self, handler: BatchHandler) -> None:
+        await super().start(handler)
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._connected.wait(), timeout=5)
+
+    async def stop(self) -> None:
+        await super().stop()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        if self._writer is not None:
+            self._writer.close()
+        await self._stop_hub()
+
+    async def _run(self) -> None:
+        """허브 접속 및 수신 루프 (끊기면 재접속)"""
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+            except (FileNotFoundError, ConnectionRefusedError):
+                if not await self._try_host():
+                    await asyncio.sleep(self.retry_interval)
+                continue
+
+            self._writer = writer
+            self._connected.set()
+            try:
+                while True:
+                    self._dispatch(self.decode(await _read_frame(reader)))
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            finally:
+                self._connected.clear()
+                self._writer = None
+                writer.close()
+
+    async def _try_host(self) -> bool:
+        """허브 잠금을 잡으면 허브 서버 시작"""
+        if self._server is not None:
+            return False
+        fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        # 잠금을 잡았으므로 남아 있는 소켓 파일은 종료된 허브의 것
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+        self._lock_fd = fd
+        self._server = await asyncio.start_unix_server(self._serve_client, self.path)
+        return True
+
+    async def _serve_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """허브: 받은 프레임을 다른 모든 클라이언트로 중계"""
+        self._hub_writers.add(writer)
+        try:
+            while True:
+                packed = _pack_frame(await _read_frame(reader))
+                for other in list(self._hub_writers):
+                    if other is not writer:
+                        other.write(packed)
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            # 종료 시 취소된 중계 태스크도 정상 종료로 처리
+            pass
+        finally:
+            self._hub_writers.discard(writer)
+            writer.close()
+
+    async def _stop_hub(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in list(self._hub_writers):
+            writer.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+        self._server = None
+
+    async def _send(self, frames: list[dict]) -> None:
+        writer = self._writer
+        if writer is None:
+            return  # 허브 재접속 중
+        writer.write(b"".join(_pack_frame(self.encode(frame)) for frame in frames))
+        with contextlib.suppress(ConnectionError):
+            await writer.drain()
+
+
+def encode_command(*args: str | bytes) -> bytes:
+    """RESP 배열 명령 인코딩"""
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = arg.encode() if isinstance(arg, str) else arg
+        parts.append(f"${len(data)}\r\n".encode() + data + b"\r\n")
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader):
+    """RESP 응답 하나 읽기"""
+    line = await reader.readuntil(b"\r\n")
+    prefix, body = line[:1], line[1:-2]
+    if prefix == b"+":
+        return body.decode()
+    if prefix == b"-":
+        raise ConnectionError(body.decode())
+    if prefix == b":":
+        return int(body)
+    if prefix == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if prefix == b"*":
+        count = int(body)
+        if count < 0:
+            return None
+        return [await read_reply(reader) for _ in range(count)]
+    raise ConnectionError(f"Unexpected RESP reply: {line!r}")
+
+
+class RedisBackplane(Backplane):
+    """Redis PUBLISH/SUBSCRIBE로 전달 (RESP를 직접 사용, 추가 의존성 없음)
+
+    한 flush의 프레임은 파이프라인으로 한 번에 PUBLISH한다.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        channel: str = "chat:backplane",
+        retry_interval: float = 0.5,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.channel = channel
+        self.retry_interval = retry_interval
+        self._pub: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None = None
+        self._pub_lock = asyncio.Lock()
+        self._subscribed = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def _open(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        if self.password:
+            writer.write(encode_command("AUTH", self.password))
+            await read_reply(reader)
+        return reader, writer
+
+    async def start(self, handler: BatchHandler) -> None:
+        await super().start(handler)
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._subscribed.wait(), timeout=5)
+
+    async def stop(self) -> None:
+        await super().stop()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        if self._pub is not None:
+            self._pub[1].close()
+            self._pub = None
+
+    async def _run(self) -> None:
+        """구독 연결 및 수신 루프 (끊기면 재접속)"""
+        while True:
+            try:
+                reader, writer = await self._open()
+            except OSError:
+                await asyncio.sleep(self.retry_interval)
+                continue
+
+            try:
+                writer.write(encode_command("SUBSCRIBE", self.channel))
+                await read_reply(reader)  # ["subscribe", channel, count]
+                self._subscribed.set()
+                while True:
+                    reply = await read_reply(reader)
+                    if isinstance(reply, list) and reply[0] == b"message":
+                        self._dispatch(self.decode(reply[2]))
+            except (asyncio.IncompleteReadError, ConnectionError):
+                await asyncio.sleep(self.retry_interval)
+            finally:
+                self._subscribed.clear()
+                writer.close()
+
+    async def _send(self, frames: list[dict]) -> None:
+        async with self._pub_lock:
+            try:
+                if self._pub is None:
+                    self._pub = await self._open()
+                reader, writer = self._pub
+                writer.write(
+                    b"".join(
+                        encode_command("PUBLISH", self.channel, self.encode(frame))
+                        for frame in frames
+                    )
+                )
+                for _ in frames:
+                    await read_reply(reader)
+            except (OSError, asyncio.IncompleteReadError):
+                # 다음 flush에서 재접속 (이번 프레임은 유실)
+                if self._pub is not None:
+                    self._pub[1].close()
+                self._pub = None
+
+
+def create_backplane(
+    kind: str, url: str = "", batch_size: int = 100, flush_interval: float = 0.001
+) -> Backplane:
+    """설정값으로 백플레인 생성"""
+    options = {"batch_size": batch_size, "flush_interval": flush_interval}
+    if kind == "memory":
+        return InProcessBackplane(**options)
+    if kind == "local":
+        return LocalSocketBackplane(url or "/tmp/chat-backplane.sock", **options)
+    if kind == "redis":
+        return RedisBackplane(url or "redis://localhost:6379/0", **options)
+    raise ValueError(f"Unknown backplane: {kind}")
@@ -1,40 +1,289 @@
-from fastapi import WebSocket
+import asyncio
+
+from fastapi import WebSocket, status
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+from src.core.membership_cache import membership_cache
+from src.websocket.backplane import Backplane
+from src.websocket.outbox import ConnectionOutbox, Frame
+from src.websocket.presence import PresenceTracker
+from src.websocket.status import OnlineStatusManager, status_manager
 
 
 class ConnectionManager:
-    """WebSocket 연결 관리자"""
+    """WebSocket 연결 관리자
+
+    사용자마다 여러 연결(탭, 기기)을 허용하며, 연결마다 제한된 크기의
+    송신 큐(ConnectionOutbox)를 두고 연결별 writer 태스크가 전송한다.
+    채팅방 → 연결 역색인을 유지하므로 브로드캐스트는 DB의 멤버 목록이
+    아니라 현재 연결된 소켓만 순회한다. 추가/제거는 모두 O(1)
+    (사용자가 속한 채팅방 수에 비례)이다.
+
+    백플레인이 연결되어 있으면 브로드캐스트, 채팅방 구독 변경, 온라인
+    상태 변경을 다른 워커에도 전달한다. 로컬 소켓에는 즉시 전달하고,
+    다른 워커는 자기 소켓에만 전달한다.
+
+    PresenceTracker가 있으면 하트비트가 끊긴 연결을 닫고, 온라인 여부
+    변경을 사용자가 속한 채팅방에 presence 프레임으로 푸시한다.
+    """
+
+    def __init__(
+        self,
+        queue_size: int | None = None,
+        overflow_policy: str | None = None,
+        status: OnlineStatusManager | None = None,
+        presence: PresenceTracker | None = None,
+    ):
+        # user_id → {websocket: outbox}
+        self.active_connections: dict[str, dict[WebSocket, ConnectionOutbox]] = {}
+        # room_id → {websocket: outbox}
+        self.room_connections: dict[str, dict[WebSocket, ConnectionOutbox]] = {}
+        # 연결된 사용자가 구독 중인 채팅방
+        self._user_rooms: dict[str, set[str]] = {}
+        self._socket_users: dict[WebSocket, str] = {}
+        self.queue_size = queue_size or settings.ws_send_queue_size
+        self.overflow_policy = overflow_policy or settings.ws_overflow_policy
+        self.status = status
+        self.presence = presence
+        self.backplane: Backplane | None = None
+
+    def connect(self, user_id: str, websocket: WebSocket, room_ids: list[str] | None = None):
+        """사용자 연결 추가 (같은 사용자의 기존 연결은 유지)"""
+        if websocket in self._socket_users:
+            return
+
+        outbox = ConnectionOutbox(
+            websocket,
+            maxsize=self.queue_size,
+            overflow_policy=self.overflow_policy,
+            on_close=lambda _: self._remove(websocket),
+        )
+        self._socket_users[websocket] = user_id
+        self.active_connections.setdefault(user_id, {})[websocket] = outbox
 
-    def __init__(self):
-        self.active_connections: dict[str, WebSocket] = {}
+        rooms = self._user_rooms.setdefault(user_id, set())
+        rooms.update(room_ids or ())
+        for room_id in rooms:
+            self.room_connections.setdefault(room_id, {})[websocket] = outbox
 
-    def connect(self, user_id: str, websocket: WebSocket):
-        """사용자 연결 추가"""
-        self.active_connections[user_id] = websocket
+        if self.presence is not None:
+            self.presence.touch(websocket, user_id)
+        if self.status is not None:
+            was_online = self.status.is_online(user_id)
+            if self.status.add_connection(user_id):
+                self._publish("presence", user_id, {"online": True})
+            self._presence_changed(user_id, was_online, rooms)
 
-    def disconnect(self, user_id: str):
-        """사용자 연결 해제"""
-        if user_id in self.active_connections:
+    def heartbeat(self, user_id: str, websocket: WebSocket):
+        """연결에서 프레임을 받았을 때 호출 (하트비트 마감 갱신)"""
+        if self.presence is not None and websocket in self._socket_users:
+            self.presence.touch(websocket, user_id)
+
+    def disconnect(self, user_id: str, websocket: WebSocket | None = None):
+        """연결 해제 (websocket을 생략하면 사용자의 모든 연결)"""
+        connections = self.active_connections.get(user_id, {})
+        sockets = [websocket] if websocket is not None else list(connections)
+        for ws in sockets:
+            outbox = connections.get(ws)
+            if outbox is not None:
+                outbox.close()  # on_close → _remove
+
+    def _remove(self, websocket: WebSocket):
+        """연결을 모든 색인에서 제거"""
+        user_id = self._socket_users.pop(websocket, None)
+        if user_id is None:
+            return
+
+        if self.presence is not None:
+            self.presence.forget(websocket, user_id)
+        connections = self.active_connections[user_id]
+        del connections[websocket]
+        rooms = self._user_rooms.get(user_id, set())
+        for room_id in rooms:
+            self._discard_room_socket(room_id, websocket)
+
+        if not connections:
             del self.active_connections[user_id]
+            self._user_rooms.pop(user_id, None)
+
+        if self.status is not None:
+            was_online = self.status.is_online(user_id)
+            if self.status.remove_connection(user_id):
+                self._publish("presence", user_id, {"online": False})
+            self._presence_changed(user_id, was_online, rooms)
+
+    def _presence_changed(self, user_id: str, was_online: bool, rooms: set[str]):
+        """온라인 여부가 바뀌었으면 채팅방 푸시 대기열에 추가"""
+        online = self.status.is_online(user_id)
+        if self.presence is not None and online != was_online:
+            self.presence.changed(user_id, online, rooms)
+
+    def _expire(self, websocket: WebSocket):
+        """하트비트 마감이 지난 연결 종료"""
+        user_id = self._socket_users.get(websocket)
+        if user_id is None:
+            return
+        self.disconnect(user_id, websocket)
+        asyncio.get_running_loop().create_task(self._close_expired(websocket))
+
+    @staticmethod
+    async def _close_expired(websocket: WebSocket):
+        try:
+            await websocket.close(code=status.WS_1001_GOING_AWAY)
+        except Exception:
+            pass  # 이미 끊긴 소켓
+
+    def _discard_room_socket(self, room_id: str, websocket: WebSocket):
+        room = self.room_connections.get(room_id)
+        if room is not None:
+            room.pop(websocket, None)
+            if not room:
+                del self.room_connections[room_id]
+
+    def join_room(self, user_id: str, room_id: str):
+        """연결된 사용자의 모든 연결을 채팅방에 구독"""
+        self._join_local(user_id, room_id)
+        self._publish("membership", room_id, {"user_id": user_id, "joined": True})
+
+    def leave_room(self, user_id: str, room_id: str):
+        """사용자의 모든 연결을 채팅방 구독에서 제거"""
+        self._leave_local(user_id, room_id)
+        self._publish("membership", room_id, {"user_id": user_id, "joined": False})
+
+    def _join_local(self, user_id: str, room_id: str):
+        connections = self.active_connections.get(user_id)
+        if not connections:
+            return
+        self._user_rooms[user_id].add(room_id)
+        self.room_connections.setdefault(room_id, {}).update(connections)
+
+    def _leave_local(self, user_id: str, room_id: str):
+        rooms = self._user_rooms.get(user_id)
+        if not rooms or room_id not in rooms:
+            return
+        rooms.discard(room_id)
+        for websocket in self.active_connections.get(user_id, {}):
+            self._discard_room_socket(room_id, websocket)
 
     def is_connected(self, user_id: str) -> bool:
         """사용자 연결 상태 확인"""
         return user_id in self.active_connections
 
     async def send_personal_message(self, user_id: str, message: dict):
-        """특정 사용자에게 메시지 전송"""
-        if user_id in self.active_connections:
-            await self.active_connections[user_id].send_json(message)
+        """특정 사용자의 모든 연결에 메시지 전송 (송신 큐에 추가)"""
+        frame = Frame(message)
+        for outbox in list(self.active_connections.get(user_id, {}).values()):
+            outbox.put(frame)
+
+    async def broadcast_to_room(self, room_id: str, message: dict):
+        """채팅방에 연결된 소켓들에게 메시지 브로드캐스트 (연결별 송신 큐에 추가)"""
+        self._deliver_to_room(room_id, message)
+        self._publish("room", room_id, message)
+
+    def _deliver_to_room(self, room_id: str, message: dict):
+        # 모든 연결이 같은 프레임을 공유하므로 인코딩은 브로드캐스트당 한 번
+        frame = Frame(message)
+        for outbox in list(self.room_connections.get(room_id, {}).values()):
+            outbox.put(frame)
+
+    async def attach_backplane(self, backplane: Backplane):
+        """백플레인 연결 (다른 워커의 이벤트 수신 시작)"""
+        self.backplane = backplane
+        await backplane.start(self._on_backplane)
+        # 이미 연결된 사용자의 온라인 상태 알림
+        for user_id in self.active_connections:
+            self._publish("presence", user_id, {"online": True})
 
-    async def broadcast_to_room(self, member_ids: list[str], message: dict):
-        """채팅방 멤버들에게 메시지 브로드캐스트"""
-        for user_id in member_ids:
-            if user_id in self.active_connections:
-                await self.active_connections[user_id].send_json(message)
+    async def start_presence(self, engine: AsyncEngine | None = None):
+        """하트비트 만료와 온라인 상태 푸시 시작"""
+        if self.presence is None:
+            return
+        await self.presence.start(self._expire, self.broadcast_to_room, engine)
+        for websocket, user_id in self._socket_users.items():
+            self.presence.touch(websocket, user_id)
+
+    async def stop_presence(self):
+        """하트비트 만료 중지 (대기 중인 푸시와 last_seen_at은 내보냄)"""
+        if self.presence is not None:
+            await self.presence.stop()
+
+    async def detach_backplane(self):
+        """백플레인 연결 해제"""
+        backplane, self.backplane = self.backplane, None
+        if backplane is not None:
+            await backplane.stop()
+
+    def _publish(self, kind: str, key: str, item: dict):
+        if self.backplane is not None:
+            self.backplane.publish(kind, key, item)
+
+    def _on_backplane(self, origin: str, kind: str, key: str, items: list[dict]):
+        """다른 워커에서 온 이벤트 배치 처리"""
+        if kind == "room":
+            for message in items:
+                self._deliver_to_room(key, message)
+        elif kind == "membership":
+            for item in items:
+                # 다른 워커에서 바뀐 멤버십은 이 워커의 캐시에서도 제거
+                membership_cache.invalidate(key, item["user_id"])
+                if item["joined"]:
+                    self._join_local(item["user_id"], key)
+                else:
+                    self._leave_local(item["user_id"], key)
+        elif kind == "presence" and self.status is not None:
+            for item in items:
+                self.status.set_remote(origin, key, item["online"])
+
+    async def flush(self):
+        """모든 송신 큐가 비워질 때까지 대기"""
+        outboxes = [
+            outbox
+            for connections in list(self.active_connections.values())
+            for outbox in connections.values()
+        ]
+        await asyncio.gather(*(outbox.join() for outbox in outboxes))
 
     def get_connection_count(self) -> int:
-        """현재 연결 수 반환"""
-        return len(self.active_connections)
+        """현재 연결(소켓) 수 반환"""
+        return len(self._socket_users)
+
+    def get_metrics(self) -> dict[str, list[dict]]:
+        """사용자별 연결의 큐 깊이와 전송 지연 지표 반환"""
+        return {
+            user_id: [outbox.metrics() for outbox in connections.values()]
+            for user_id, connections in self.active_connections.items()
+        }
+
+    def get_aggregate_metrics(self) -> dict:
+        """전체 연결의 큐/전송 지표 합계 (사용자 식별자 없음)"""
+        outboxes = [
+            outbox
+            for connections in self.active_connections.values()
+            for outbox in connections.values()
+        ]
+        sent = sum(o.stats.sent for o in outboxes)
+        total_latency_ms = sum(o.stats.total_latency_ms for o in outboxes)
+        return {
+            "queue_depth": sum(o.queue_depth for o in outboxes),
+            "max_queue_depth": max((o.stats.max_queue_depth for o in outboxes), default=0),
+            "sent": sent,
+            "dropped": sum(o.stats.dropped for o in outboxes),
+            "coalesced": sum(o.stats.coalesced for o in outboxes),
+            "avg_send_latency_ms": round(total_latency_ms / sent, 3) if sent else 0.0,
+            "max_send_latency_ms": round(
+                max((o.stats.max_latency_ms for o in outboxes), default=0.0), 3
+            ),
+        }
 
 
 # 전역 연결 관리자 인스턴스
-manager = ConnectionManager()
+manager = ConnectionManager(
+    status=status_manager,
+    presence=PresenceTracker(
+        ttl=settings.presence_ttl_seconds,
+        tick=settings.presence_tick_seconds,
+        push_window=settings.presence_push_window_ms / 1000,
+        last_seen_interval=settings.last_seen_flush_seconds,
+    ),
+)
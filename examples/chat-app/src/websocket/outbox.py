@@ -0,0 +1,204 @@
+"""연결별 송신 큐 모듈"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+from fastapi import WebSocket, status
+
+from src.core.metrics import WS_QUEUE_SECONDS, WS_SEND_SECONDS
+from src.core.serialization import dumps
+
+# 큐가 가득 찼을 때의 처리 방식
+OVERFLOW_POLICIES = ("drop_oldest", "disconnect", "coalesce")
+
+
+@dataclass
+class OutboxStats:
+    """송신 큐 지표"""
+
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    max_queue_depth: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+
+class Frame:
+    """한 번만 인코딩해 여러 연결에 보내는 텍스트 프레임
+
+    브로드캐스트는 Frame 하나를 모든 송신 큐에 넣고, 첫 writer가 인코딩한
+    텍스트를 나머지 연결이 그대로 보낸다.
+    """
+
+    __slots__ = ("message", "_text")
+
+    def __init__(self, message: dict):
+        self.message = message
+        self._text: str | None = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = dumps(self.message).decode()
+        return self._text
+
+
+def coalesce_key(message: dict) -> tuple | None:
+    """병합 키 반환 (같은 키의 대기 메시지는 최신 것으로 교체)
+
+    채팅 메시지와 여러 사용자의 변경을 담은 presence 프레임은 병합하지 않고,
+    상태/타이핑 같은 최신 값만 의미 있는 이벤트만 (type, room_id, user_id)
+    단위로 병합한다.
+    """
+    if message.get("type") in ("message", "presence"):
+        return None
+    return (message.get("type"), message.get("room_id"), message.get("user_id"))
+
+
+class ConnectionOutbox:
+    """WebSocket 연결 하나의 송신 큐와 writer 태스크
+
+    put()은 대기하지 않고 큐에 넣기만 하며, 실제 전송은 연결마다 하나씩
+    있는 writer 태스크가 순서대로 수행한다. 느린 클라이언트는 자기 큐만
+    채우고 다른 연결의 전송을 막지 않는다.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        maxsize: int = 100,
+        overflow_policy: str = "drop_oldest",
+        on_close: Callable[["ConnectionOutbox"], None] | None = None,
+    ):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        self.websocket = websocket
+        self.maxsize = maxsize
+        self.overflow_policy = overflow_policy
+        self.stats = OutboxStats()
+        self.closed = False
+        self._on_close = on_close
+        self._queue: deque[tuple[float, Frame]] = deque()
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._evicted = False
+        self._task: asyncio.Task | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """대기 중인 메시지 수"""
+        return len(self._queue)
+
+    def put(self, message: dict | Frame) -> bool:
+        """메시지를 송신 큐에 추가 (큐가 가득 차면 정책에 따라 처리)"""
+        if self.closed:
+            return False
+        frame = message if isinstance(message, Frame) else Frame(message)
+
+        if len(self._queue) >= self.maxsize:
+            if self.overflow_policy == "disconnect":
+                self._evict()
+                return False
+            if self.overflow_policy == "coalesce" and self._coalesce(frame):
+                return True
+            self._queue.popleft()
+            self.stats.dropped += 1
+
+        self._queue.append((time.perf_counter(), frame))
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, len(self._queue))
+        self._idle.clear()
+        self._ready.set()
+        self._ensure_writer()
+        return True
+
+    def _coalesce(self, frame: Frame) -> bool:
+        """같은 병합 키의 대기 메시지를 교체"""
+        key = coalesce_key(frame.message)
+        if key is None:
+            return False
+        for i in range(len(self._queue) - 1, -1, -1):
+            enqueued_at, queued = self._queue[i]
+            if coalesce_key(queued.message) == key:
+                self._queue[i] = (enqueued_at, frame)
+                self.stats.coalesced += 1
+                return True
+        return False
+
+    def _evict(self) -> None:
+        """느린 소비자 연결 종료 (writer가 소켓을 닫고 종료)"""
+        self._evicted = True
+        self.close()
+
+    def _ensure_writer(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """writer 루프: 큐에서 꺼내 순서대로 전송"""
+        try:
+            while not self.closed:
+                if not self._queue:
+                    self._idle.set()
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+
+                enqueued_at, frame = self._queue.popleft()
+                send_started = time.perf_counter()
+                try:
+                    await self.websocket.send_text(frame.text)
+                except Exception:
+                    # 전송 실패 = 끊어진 연결
+                    self.close()
+                    break
+
+                sent_at = time.perf_counter()
+                WS_SEND_SECONDS.observe(sent_at - send_started)
+                WS_QUEUE_SECONDS.observe(sent_at - enqueued_at)
+                latency_ms = (sent_at - enqueued_at) * 1000
+                self.stats.sent += 1
+                self.stats.total_latency_ms += latency_ms
+                self.stats.max_latency_ms = max(self.stats.max_latency_ms, latency_ms)
+        finally:
+            self._idle.set()
+            if self._evicted:
+                try:
+                    await self.websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+                except Exception:
+                    pass
+
+    async def join(self) -> None:
+        """큐가 모두 전송될 때까지 대기"""
+        await self._idle.wait()
+
+    def close(self) -> None:
+        """송신 중단 (대기 중인 메시지는 버림)"""
+        if self.closed:
+            return
+        self.closed = True
+        self._queue.clear()
+        self._idle.set()
+        self._ready.set()
+        # 전송 중에 막혀 있는 writer도 중단 (evict면 finally에서 소켓을 닫음)
+        if self._task and not self._task.done() and self._task is not asyncio.current_task():
+            self._task.cancel()
+        if self._on_close:
+            self._on_close(self)
+
+    def metrics(self) -> dict:
+        """연결 지표 반환"""
+        sent = self.stats.sent
+        return {
+            "queue_depth": len(self._queue),
+            "max_queue_depth": self.stats.max_queue_depth,
+            "sent": sent,
+            "dropped": self.stats.dropped,
+            "coalesced": self.stats.coalesced,
+            "avg_send_latency_ms": round(self.stats.total_latency_ms / sent, 3) if sent else 0.0,
+            "max_send_latency_ms": round(self.stats.max_latency_ms, 3),
+        }
@@ -0,0 +1,208 @@
+"""연결 하트비트와 온라인 상태 푸시 모듈
+
+- 연결마다 하트비트 마감을 타이머 휠에 걸어 두고, ttl 동안 프레임이 없는
+  연결(비정상 종료된 클라이언트)을 끊는다.
+- 온라인/오프라인 변경은 채팅방별로 push_window 동안 모았다가 채팅방마다
+  presence 프레임 하나로 보낸다. 창 안에서 원래 상태로 돌아온 변경(재연결)은
+  보내지 않는다.
+- last_seen_at은 메모리에 모았다가 last_seen_interval마다 UPDATE 한 번
+  (executemany)으로 저장한다.
+"""
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, Hashable
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.timer_wheel import TimerWheel
+from src.core.user_cache import user_cache
+from src.models.base import utcnow
+from src.models.user import User
+
+# 사용자별 last_seen_at 일괄 갱신
+UPDATE_LAST_SEEN = (
+    update(User).where(User.id == bindparam("user_id")).values(last_seen_at=bindparam("seen"))
+)
+
+
+@dataclass
+class PresenceStats:
+    """온라인 상태 지표"""
+
+    expired: int = 0
+    pushes: int = 0
+    coalesced: int = 0
+    last_seen_writes: int = 0
+
+
+class PresenceTracker:
+    """하트비트 만료, 온라인 상태 푸시 병합, last_seen write-behind"""
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        tick: float = 1.0,
+        push_window: float = 0.25,
+        last_seen_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.tick = tick
+        self.push_window = push_window
+        self.last_seen_interval = last_seen_interval
+        self.stats = PresenceStats()
+        self._clock = clock
+        self._wheel: TimerWheel[Hashable] = TimerWheel(tick, math.ceil(ttl / tick) + 1, clock)
+        # room_id → user_id → [창 시작 시 상태, 최신 상태]
+        self._pending: dict[str, dict[str, list[bool]]] = {}
+        self._last_seen: dict[str, datetime] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._on_expire: Callable[[Hashable], None] | None = None
+        self._push: Callable[[str, dict], Awaitable[None]] | None = None
+        self._engine: AsyncEngine | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    @property
+    def tracked(self) -> int:
+        """하트비트를 기다리는 연결 수"""
+        return len(self._wheel)
+
+    async def start(
+        self,
+        on_expire: Callable[[Hashable], None],
+        push: Callable[[str, dict], Awaitable[None]],
+        engine: AsyncEngine | None = None,
+    ) -> None:
+        """만료 처리 태스크 시작 (engine이 없으면 last_seen_at은 저장하지 않음)"""
+        if self._task is not None:
+            return
+        self._on_expire = on_expire
+        self._push = push
+        self._engine = engine
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """태스크 종료 (대기 중인 푸시와 last_seen_at은 내보냄)"""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        await self.flush_presence()
+        await self.flush_last_seen()
+
+    def touch(self, connection: Hashable, user_id: str) -> None:
+        """연결의 하트비트 (마감 갱신, last_seen 기록)"""
+        if self._task is None:
+            return
+        self._wheel.schedule(connection, self.ttl)
+        self._last_seen[user_id] = utcnow()
+
+    def forget(self, connection: Hashable, user_id: str) -> None:
+        """끊긴 연결의 마감 취소"""
+        if self._task is None:
+            return
+        self._wheel.cancel(connection)
+        self._last_seen[user_id] = utcnow()
+
+    def last_seen(self, user_id: str) -> datetime | None:
+        """아직 저장되지 않은 last_seen_at"""
+        return self._last_seen.get(user_id)
+
+    def changed(self, user_id: str, online: bool, room_ids) -> None:
+        """사용자의 온라인 여부 변경을 채팅방별 푸시 대기열에 추가"""
+        if self._task is None:
+            return
+        for room_id in room_ids:
+            users = self._pending.setdefault(room_id, {})
+            state = users.get(user_id)
+            if state is None:
+                users[user_id] = [not online, online]
+            else:
+                state[1] = online
+                self.stats.coalesced += 1
+        if self._pending and self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.push_window, self._schedule_flush
+            )
+
+    def _schedule_flush(self) -> None:
+        self._flush_handle = None
+        asyncio.get_running_loop().create_task(self.flush_presence())
+
+    async def flush_presence(self) -> None:
+        """모인 변경을 채팅방마다 presence 프레임 하나로 전송"""
+        pending, self._pending = self._pending, {}
+        for room_id, users in pending.items():
+            changes = [
+                {"user_id": user_id, "is_online": latest}
+                for user_id, (initial, latest) in users.items()
+                if initial != latest
+            ]
+            if changes and self._push is not None:
+                self.stats.pushes += 1
+                frame = {"type": "presence", "room_id": room_id, "users": changes}
+                await self._push(room_id, frame)
+
+    async def flush_last_seen(self) -> None:
+        """모인 last_seen_at을 한 번에 저장 (실패하면 다음 저장 때 다시 시도)"""
+        if not self._last_seen or self._engine is None:
+            return
+        seen, self._last_seen = self._last_seen, {}
+        try:
+            async with self._engine.begin() as conn:
+                await conn.execute(
+                    UPDATE_LAST_SEEN,
+                    [{"user_id": user_id, "seen": at} for user_id, at in seen.items()],
+                )
+        except Exception:
+            # 저장하는 동안 들어온 더 최신 값은 유지
+            for user_id, at in seen.items():
+                self._last_seen.setdefault(user_id, at)
+            raise
+        # Core UPDATE는 ORM flush 이벤트를 거치지 않으므로 직접 무효화
+        for user_id in seen:
+            user_cache.invalidate(user_id)
+        self.stats.last_seen_writes += len(seen)
+
+    async def _run(self) -> None:
+        next_flush = self._clock() + self.last_seen_interval
+        while True:
+            await asyncio.sleep(self.tick)
+            for connection in self._wheel.advance():
+                self.stats.expired += 1
+                self._on_expire(connection)
+            if self._clock() >= next_flush:
+                next_flush = self._clock() + self.last_seen_interval
+                try:
+                    await self.flush_last_seen()
+                except Exception:
+                    # DB 오류로 만료 처리가 멈추지 않게 함 (배치는 다음 주기에 다시 저장)
+                    pass
+
+    def metrics(self) -> dict:
+        """온라인 상태 지표"""
+        return {
+            "running": self.running,
+            "tracked_connections": self.tracked,
+            "expired": self.stats.expired,
+            "pushes": self.stats.pushes,
+            "coalesced": self.stats.coalesced,
+            "pending_last_seen": len(self._last_seen),
+            "last_seen_writes": self.stats.last_seen_writes,
+        }
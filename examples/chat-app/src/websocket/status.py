@@ -1,31 +1,117 @@
 """온라인 상태 관리 모듈"""
 
+from collections import deque
+from uuid import uuid4
+
 
 class OnlineStatusManager:
-    """사용자 온라인 상태를 관리하는 클래스"""
+    """사용자 온라인 상태를 관리하는 클래스
+
+    WebSocket 연결 수를 사용자별로 세어, 첫 연결에서 온라인이 되고
+    마지막 연결이 끊기면 오프라인이 된다.
+
+    온라인 여부가 바뀔 때마다 버전을 올리고 최근 변경을 log_size개까지
+    기록해, 동기화 API가 (epoch, version) 이후의 변경만 돌려줄 수 있게 한다.
+    epoch은 프로세스마다 달라서 다른 워커나 재시작 전의 버전을 구분한다.
+    """
 
-    def __init__(self):
+    def __init__(self, log_size: int = 10_000):
         self._online_users: set[str] = set()
+        self._connection_counts: dict[str, int] = {}
+        # 다른 워커에 연결된 사용자 → 워커 ID (백플레인으로 전달받음)
+        self._remote_workers: dict[str, set[str]] = {}
+        self.epoch = uuid4().hex[:12]
+        self.version = 0
+        self._changes: deque[tuple[int, str, bool]] = deque(maxlen=log_size)
+
+    def _record(self, user_id: str, was_online: bool) -> None:
+        """온라인 여부가 바뀌었으면 변경 기록"""
+        online = self.is_online(user_id)
+        if online != was_online:
+            self.version += 1
+            self._changes.append((self.version, user_id, online))
+
+    def add_connection(self, user_id: str) -> bool:
+        """연결 추가 (오프라인 → 온라인으로 바뀌면 True)"""
+        was_online = self.is_online(user_id)
+        count = self._connection_counts.get(user_id, 0) + 1
+        self._connection_counts[user_id] = count
+        became_online = user_id not in self._online_users
+        self._online_users.add(user_id)
+        self._record(user_id, was_online)
+        return became_online
+
+    def remove_connection(self, user_id: str) -> bool:
+        """연결 제거 (마지막 연결이 끊겨 오프라인이 되면 True)"""
+        count = self._connection_counts.get(user_id, 0) - 1
+        if count > 0:
+            self._connection_counts[user_id] = count
+            return False
+        self._connection_counts.pop(user_id, None)
+        if user_id in self._online_users:
+            was_online = self.is_online(user_id)
+            self._online_users.discard(user_id)
+            self._record(user_id, was_online)
+            return True
+        return False
+
+    def get_connection_count(self, user_id: str) -> int:
+        """사용자의 활성 연결 수 반환"""
+        return self._connection_counts.get(user_id, 0)
 
     def set_online(self, user_id: str) -> None:
         """사용자를 온라인 상태로 설정"""
+        was_online = self.is_online(user_id)
         self._online_users.add(user_id)
+        self._record(user_id, was_online)
 
     def set_offline(self, user_id: str) -> None:
         """사용자를 오프라인 상태로 설정"""
+        was_online = self.is_online(user_id)
         self._online_users.discard(user_id)
+        self._connection_counts.pop(user_id, None)
+        self._record(user_id, was_online)
+
+    def set_remote(self, worker_id: str, user_id: str, online: bool) -> None:
+        """다른 워커의 온라인 상태 변경 반영"""
+        was_online = self.is_online(user_id)
+        if online:
+            self._remote_workers.setdefault(user_id, set()).add(worker_id)
+        else:
+            workers = self._remote_workers.get(user_id)
+            if workers is not None:
+                workers.discard(worker_id)
+                if not workers:
+                    del self._remote_workers[user_id]
+        self._record(user_id, was_online)
+
+    def changes_since(self, epoch: str, version: int) -> dict[str, bool] | None:
+        """(epoch, version) 이후 바뀐 사용자 → 현재 온라인 여부
+
+        다른 epoch이거나 기록이 이미 밀려난 버전이면 None (전체 상태 필요).
+        """
+        if epoch != self.epoch or version > self.version:
+            return None
+        if version < self.version and self._changes[0][0] > version + 1:
+            return None
+        changes: dict[str, bool] = {}
+        for changed_version, user_id, online in reversed(self._changes):
+            if changed_version <= version:
+                break
+            changes.setdefault(user_id, online)
+        return changes
 
     def is_online(self, user_id: str) -> bool:
         """사용자의 온라인 여부 확인"""
-        return user_id in self._online_users
+        return user_id in self._online_users or user_id in self._remote_workers
 
     def get_online_users(self) -> list[str]:
         """현재 온라인인 모든 사용자 목록 반환"""
-        return list(self._online_users)
+        return list(self._online_users | self._remote_workers.keys())
 
     def get_online_from_list(self, user_ids: list[str]) -> list[str]:
         """주어진 사용자 목록 중 온라인인 사용자만 반환"""
-        return [uid for uid in user_ids if uid in self._online_users]
+        return [uid for uid in user_ids if self.is_online(uid)]
 
 
 # 전역 인스턴스
@@ -3,18 +3,31 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
+from src.core.membership_cache import membership_cache
+from src.core.rate_limit import rate_limiter
+from src.core.user_cache import user_cache
 from src.database import get_db
 from src.main import app
+from src.migrations import upgrade_all
 from src.models.base import Base
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """테스트마다 속도 제한 버킷 초기화"""
+    rate_limiter.clear()
+    yield
+    rate_limiter.clear()
+
+
 @pytest.fixture
 async def async_engine():
     engine = create_async_engine(TEST_DATABASE_URL, echo=False)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(upgrade_all)
     yield engine
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
@@ -42,9 +55,42 @@ async def client(async_engine):
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    user_cache.clear()
+    membership_cache.clear()
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
     app.dependency_overrides.clear()
+    user_cache.clear()
+    membership_cache.clear()
+
+
+@pytest.fixture
+def count_queries(async_engine):
+    """실행된 SQL 문을 수집하는 컨텍스트 매니저
+
+    사용:
+        with count_queries() as statements:
+            await client.get("/api/rooms", headers=headers)
+        assert len(statements) <= 3
+    """
+    from contextlib import contextmanager
+
+    from sqlalchemy import event
+
+    @contextmanager
+    def counter():
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+    return counter
@@ -140,3 +140,83 @@ class TestPasswordHashing:
         assert hashed != password
         assert verify_password(password, hashed) is True
         assert verify_password("wrongpassword", hashed) is False
+
+
+class TestPasswordHasher:
+    """비동기 비밀번호 해셔 테스트"""
+
+    async def test_hash_and_verify_off_loop(self):
+        """스레드 풀에서 해시/검증"""
+        from src.core.security import PasswordHasher
+
+        hasher = PasswordHasher(rounds=4, workers=2, max_queue=2)
+        hashed = await hasher.hash("mysecretpassword")
+
+        assert hashed.startswith("$2b$04$")
+        assert await hasher.verify("mysecretpassword", hashed) is True
+        assert await hasher.verify("wrongpassword", hashed) is False
+        assert hasher.in_flight == 0
+        hasher.shutdown()
+
+    async def test_rejects_beyond_queue_depth(self):
+        """실행 + 대기 작업이 한도를 넘으면 거부"""
+        import asyncio
+
+        from src.core.security import PasswordHasher, PasswordHasherBusy
+
+        hasher = PasswordHasher(rounds=4, workers=1, max_queue=1)
+        results = await asyncio.gather(
+            *(hasher.hash(f"password{i}") for i in range(3)), return_exceptions=True
+        )
+
+        assert sum(isinstance(r, PasswordHasherBusy) for r in results) == 1
+        assert hasher.rejected == 1
+        hasher.shutdown()
+
+    async def test_login_returns_503_when_saturated(self, client: AsyncClient, monkeypatch):
+        """해셔가 포화 상태면 로그인은 503 + Retry-After"""
+        from src.core.security import password_hasher
+
+        await client.post(
+            "/api/auth/register",
+            json={"username": "busy", "email": "busy@example.com", "password": "password123"},
+        )
+        monkeypatch.setattr(password_hasher, "workers", 0)
+        monkeypatch.setattr(password_hasher, "max_queue", 0)
+
+        response = await client.post(
+            "/api/auth/login",
+            json={"username": "busy", "password": "password123"},
+        )
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+    async def test_login_rehashes_when_cost_changes(
+        self, client: AsyncClient, async_session, monkeypatch
+    ):
+        """cost가 바뀌면 로그인 시 새 cost로 재해시"""
+        from sqlalchemy import select
+
+        from src.core.security import password_hasher
+        from src.models.user import User
+
+        monkeypatch.setattr(password_hasher, "rounds", 4)
+        await client.post(
+            "/api/auth/register",
+            json={"username": "rehash", "email": "rehash@example.com", "password": "password123"},
+        )
+
+        monkeypatch.setattr(password_hasher, "rounds", 5)
+        response = await client.post(
+            "/api/auth/login", json={"username": "rehash", "password": "password123"}
+        )
+        assert response.status_code == 200
+
+        result = await async_session.execute(select(User).where(User.username == "rehash"))
+        assert result.scalar_one().password_hash.startswith("$2b$05$")
+
+        # 재해시된 비밀번호로 다시 로그인
+        response = await client.post(
+            "/api/auth/login", json={"username": "rehash", "password": "password123"}
+        )
+        assert response.status_code == 200
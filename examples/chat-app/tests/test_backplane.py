@@ -0,0 +1,221 @@
+"""워커 간 백플레인 테스트"""
+
+import asyncio
+import json
+import tempfile
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+async def wait_until(predicate, timeout: float = 2.0):
+    """조건이 참이 될 때까지 대기"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("timeout")
+        await asyncio.sleep(0.01)
+
+
+async def resp_server(port_holder: list):
+    """테스트용 RESP 호환 PUBLISH/SUBSCRIBE 서버"""
+    from src.websocket.backplane import read_reply
+
+    subscribers: dict[bytes, set[asyncio.StreamWriter]] = {}
+
+    def bulk(data: bytes) -> bytes:
+        return b"$%d\r\n%s\r\n" % (len(data), data)
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                command = await read_reply(reader)
+                name = command[0].upper()
+                if name == b"SUBSCRIBE":
+                    subscribers.setdefault(command[1], set()).add(writer)
+                    writer.write(b"*3\r\n" + bulk(b"subscribe") + bulk(command[1]) + b":1\r\n")
+                elif name == b"PUBLISH":
+                    targets = subscribers.get(command[1], set())
+                    for target in targets:
+                        target.write(
+                            b"*3\r\n" + bulk(b"message") + bulk(command[1]) + bulk(command[2])
+                        )
+                    writer.write(b":%d\r\n" % len(targets))
+                else:
+                    writer.write(b"+OK\r\n")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for writers in subscribers.values():
+                writers.discard(writer)
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port_holder.append(server.sockets[0].getsockname()[1])
+    return server
+
+
+class TestInProcessBackplane:
+    """같은 프로세스 백플레인 + ConnectionManager 테스트"""
+
+    async def create_workers(self):
+        from src.websocket.backplane import InProcessBackplane
+        from src.websocket.manager import ConnectionManager
+        from src.websocket.status import OnlineStatusManager
+
+        peers = set()
+        workers = []
+        for _ in range(2):
+            manager = ConnectionManager(status=OnlineStatusManager())
+            await manager.attach_backplane(InProcessBackplane(peers=peers))
+            workers.append(manager)
+        return workers
+
+    async def test_broadcast_reaches_other_worker(self):
+        """워커 A의 브로드캐스트가 워커 B의 소켓에 전달"""
+        worker_a, worker_b = await self.create_workers()
+        websocket = AsyncMock()
+        worker_b.connect("user1", websocket, ["room1"])
+
+        message = {"type": "message", "content": "Hello!"}
+        await worker_a.broadcast_to_room("room1", message)
+        await worker_a.backplane.flush()
+        await worker_b.flush()
+
+        websocket.send_text.assert_called_once()
+        assert json.loads(websocket.send_text.call_args.args[0]) == message
+
+    async def test_messages_batched_per_room(self):
+        """같은 틱의 메시지는 채팅방별로 한 프레임"""
+        worker_a, worker_b = await self.create_workers()
+        websocket = AsyncMock()
+        worker_b.connect("user1", websocket, ["room1"])
+
+        for n in range(50):
+            await worker_a.broadcast_to_room("room1", {"type": "message", "n": n})
+        await worker_a.backplane.flush()
+        await worker_b.flush()
+
+        assert worker_b.backplane.frames_received == 1
+        assert websocket.send_text.call_count == 50
+
+    async def test_presence_across_workers(self):
+        """다른 워커에 연결된 사용자도 온라인"""
+        worker_a, worker_b = await self.create_workers()
+        websocket = AsyncMock()
+
+        worker_b.connect("user1", websocket)
+        await worker_b.backplane.flush()
+        assert worker_a.status.is_online("user1") is True
+
+        worker_b.disconnect("user1", websocket)
+        await worker_b.backplane.flush()
+        assert worker_a.status.is_online("user1") is False
+
+    async def test_membership_across_workers(self):
+        """워커 A의 join_room이 워커 B의 채팅방 색인에 반영"""
+        worker_a, worker_b = await self.create_workers()
+        websocket = AsyncMock()
+        worker_b.connect("user1", websocket)
+
+        worker_a.join_room("user1", "room1")
+        await worker_a.backplane.flush()
+
+        assert websocket in worker_b.room_connections["room1"]
+
+
+class TestLocalSocketBackplane:
+    """Unix 소켓 허브 백플레인 테스트"""
+
+    async def test_frames_relayed_between_workers(self):
+        """허브를 통해 다른 워커로 프레임 전달"""
+        from src.websocket.backplane import LocalSocketBackplane
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/bp.sock"
+            received = []
+            worker_a = LocalSocketBackplane(path)
+            worker_b = LocalSocketBackplane(path)
+            await worker_a.start(lambda *args: None)
+            await worker_b.start(lambda *args: received.append(args))
+
+            worker_a.publish("room", "room1", {"n": 1})
+            worker_a.publish("room", "room1", {"n": 2})
+            await worker_a.flush()
+
+            await wait_until(lambda: received)
+            origin, kind, key, items = received[0]
+            assert (origin, kind, key) == (worker_a.worker_id, "room", "room1")
+            assert items == [{"n": 1}, {"n": 2}]
+
+            await worker_b.stop()
+            await worker_a.stop()
+
+    async def test_hub_failover(self):
+        """허브 워커가 종료되면 다른 워커가 허브를 이어받음"""
+        from src.websocket.backplane import LocalSocketBackplane
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/bp.sock"
+            received = []
+            hub = LocalSocketBackplane(path, retry_interval=0.01)
+            worker_b = LocalSocketBackplane(path, retry_interval=0.01)
+            worker_c = LocalSocketBackplane(path, retry_interval=0.01)
+            await hub.start(lambda *args: None)
+            await worker_b.start(lambda *args: None)
+            await worker_c.start(lambda *args: received.append(args))
+
+            await hub.stop()
+            await wait_until(lambda: worker_b._connected.is_set() and worker_c._connected.is_set())
+            await asyncio.sleep(0.05)
+
+            worker_b.publish("room", "room1", {"n": 1})
+            await worker_b.flush()
+            await wait_until(lambda: received)
+
+            await worker_c.stop()
+            await worker_b.stop()
+
+
+class TestRedisBackplane:
+    """RESP 호환 서버를 사용한 Redis 백플레인 테스트"""
+
+    async def test_publish_subscribe(self):
+        """PUBLISH/SUBSCRIBE로 다른 워커에 전달"""
+        from src.websocket.backplane import RedisBackplane
+
+        port = []
+        server = await resp_server(port)
+        url = f"redis://127.0.0.1:{port[0]}/0"
+
+        received = []
+        worker_a = RedisBackplane(url)
+        worker_b = RedisBackplane(url)
+        await worker_a.start(lambda *args: None)
+        await worker_b.start(lambda *args: received.append(args))
+
+        worker_a.publish("room", "room1", {"n": 1})
+        worker_a.publish("room", "room2", {"n": 2})
+        await worker_a.flush()
+
+        await wait_until(lambda: len(received) == 2)
+        assert {args[2] for args in received} == {"room1", "room2"}
+
+        await worker_b.stop()
+        await worker_a.stop()
+        server.close()
+
+    def test_encode_command(self):
+        """RESP 명령 인코딩"""
+        from src.websocket.backplane import encode_command
+
+        assert encode_command("PUBLISH", "ch", b"hi") == (
+            b"*3\r\n$7\r\nPUBLISH\r\n$2\r\nch\r\n$2\r\nhi\r\n"
+        )
+
+
+def test_create_backplane_unknown():
+    """알 수 없는 백플레인 종류"""
+    from src.websocket.backplane import create_backplane
+
+    with pytest.raises(ValueError):
+        create_backplane("carrier-pigeon")
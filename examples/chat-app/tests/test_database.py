@@ -0,0 +1,93 @@
+"""DB 프로필 테스트"""
+
+from sqlalchemy import event, select
+
+from src.database import RoutingSession, create_engines, create_session_factory, pool_options
+from src.models import Base, User
+
+
+class TestSQLiteProductionProfile:
+    """SQLite production 프로필 테스트"""
+
+    async def test_pragmas_applied(self, tmp_path):
+        """쓰기/읽기 연결에 WAL 등 PRAGMA 적용, 읽기 연결은 query_only"""
+        write_engine, read_engine = create_engines(
+            f"sqlite+aiosqlite:///{tmp_path / 'p.db'}", profile="production"
+        )
+        try:
+            assert write_engine is not read_engine
+            async with write_engine.connect() as conn:
+                assert (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar() == "wal"
+                assert (await conn.exec_driver_sql("PRAGMA synchronous")).scalar() == 1
+                assert (await conn.exec_driver_sql("PRAGMA busy_timeout")).scalar() == 5000
+                assert (await conn.exec_driver_sql("PRAGMA query_only")).scalar() == 0
+            async with read_engine.connect() as conn:
+                assert (await conn.exec_driver_sql("PRAGMA query_only")).scalar() == 1
+        finally:
+            await write_engine.dispose()
+            await read_engine.dispose()
+
+    async def test_session_routes_reads_and_writes(self, tmp_path):
+        """읽기는 읽기 엔진, 쓰기와 그 이후 문장은 쓰기 엔진"""
+        write_engine, read_engine = create_engines(
+            f"sqlite+aiosqlite:///{tmp_path / 'r.db'}", profile="production"
+        )
+        async with write_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        used: list[tuple[str, str]] = []
+        for name, engine in (("write", write_engine), ("read", read_engine)):
+            event.listen(
+                engine.sync_engine,
+                "before_cursor_execute",
+                lambda conn, cursor, statement, *args, name=name: used.append(
+                    (name, statement.split()[0])
+                ),
+            )
+
+        factory = create_session_factory(write_engine, read_engine)
+        try:
+            async with factory() as session:
+                assert isinstance(session.sync_session, RoutingSession)
+                await session.execute(select(User))
+                session.add(User(username="routed", email="routed@example.com", password_hash="x"))
+                await session.flush()
+                await session.execute(select(User))
+                await session.commit()
+                await session.execute(select(User))
+
+            assert used == [
+                ("read", "SELECT"),
+                ("write", "INSERT"),
+                ("write", "SELECT"),  # 같은 트랜잭션의 쓰기 이후 읽기
+                ("read", "SELECT"),  # 커밋 후 다시 읽기 엔진
+            ]
+        finally:
+            await write_engine.dispose()
+            await read_engine.dispose()
+
+    async def test_memory_and_default_profile_use_single_engine(self, tmp_path):
+        """메모리 DB와 default 프로필은 엔진 하나"""
+        engines = [
+            create_engines("sqlite+aiosqlite:///:memory:", profile="production"),
+            create_engines(f"sqlite+aiosqlite:///{tmp_path / 'd.db'}"),
+        ]
+        for write_engine, read_engine in engines:
+            assert write_engine is read_engine
+            await write_engine.dispose()
+
+
+def test_default_profile_is_opt_in():
+    """설정하지 않으면 default 프로필 (쓰기 연결 하나로 직렬화하지 않음)"""
+    from src.core.config import Settings
+
+    assert Settings(_env_file=None).database_profile == "default"
+
+
+def test_server_pool_options():
+    """서버 DB에는 풀 크기 설정, SQLite에는 없음"""
+    options = pool_options("postgresql+asyncpg://chat@localhost/chat")
+    assert options["pool_size"] == 10
+    assert options["max_overflow"] == 20
+    assert options["pool_pre_ping"] is True
+    assert pool_options("sqlite+aiosqlite:///./chat.db") == {}
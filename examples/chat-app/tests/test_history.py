@@ -109,3 +109,129 @@ class TestMessageHistory:
             headers={"Authorization": f"Bearer {token3}"},
         )
         assert response.status_code == 403
+
+
+class TestCursorPagination:
+    """키셋 커서 페이지네이션 테스트"""
+
+    async def create_room_with_messages(self, client: AsyncClient, prefix: str, count: int):
+        token1, _ = await create_user_and_login(client, f"{prefix}1", f"{prefix}1@example.com")
+        _, user2_id = await create_user_and_login(client, f"{prefix}2", f"{prefix}2@example.com")
+        headers = {"Authorization": f"Bearer {token1}"}
+        room_id = (
+            await client.post("/api/rooms", json={"other_user_id": user2_id}, headers=headers)
+        ).json()["id"]
+        for i in range(count):
+            await client.post(
+                f"/api/rooms/{room_id}/messages", json={"content": f"Message {i}"}, headers=headers
+            )
+        return room_id, headers
+
+    async def test_after_cursor_walks_forward(self, client: AsyncClient):
+        """after 커서로 오래된 것부터 순서대로 조회"""
+        room_id, headers = await self.create_room_with_messages(client, "fwd", 12)
+
+        contents = []
+        url = f"/api/rooms/{room_id}/messages?limit=5"
+        while True:
+            response = await client.get(url, headers=headers)
+            page = response.json()
+            if not page:
+                break
+            contents.extend(m["content"] for m in page)
+            cursor = response.headers["X-After-Cursor"]
+            url = f"/api/rooms/{room_id}/messages?limit=5&after={cursor}"
+
+        assert contents == [f"Message {i}" for i in range(12)]
+
+    async def test_before_cursor_walks_backward(self, client: AsyncClient):
+        """before 커서로 이전 페이지 조회 (페이지 내부는 시간순)"""
+        room_id, headers = await self.create_room_with_messages(client, "bwd", 12)
+
+        response = await client.get(
+            f"/api/rooms/{room_id}/messages?limit=5&offset=7", headers=headers
+        )
+        assert [m["content"] for m in response.json()][0] == "Message 7"
+
+        cursor = response.headers["X-Before-Cursor"]
+        response = await client.get(
+            f"/api/rooms/{room_id}/messages?limit=5&before={cursor}", headers=headers
+        )
+        assert [m["content"] for m in response.json()] == [f"Message {i}" for i in range(2, 7)]
+
+    async def test_equal_timestamps_are_stable(self, client: AsyncClient, async_session):
+        """같은 created_at이어도 id로 순서가 고정되어 중복/누락 없음"""
+        from datetime import datetime
+
+        from src.models.message import Message
+
+        room_id, headers = await self.create_room_with_messages(client, "tie", 0)
+        same_time = datetime(2025, 1, 1, 12, 0, 0)
+        async_session.add_all(
+            [
+                Message(room_id=room_id, content=f"Tie {i}", created_at=same_time, seq=i + 1)
+                for i in range(7)
+            ]
+        )
+        await async_session.commit()
+
+        seen = []
+        url = f"/api/rooms/{room_id}/messages?limit=2"
+        while True:
+            response = await client.get(url, headers=headers)
+            page = response.json()
+            if not page:
+                break
+            seen.extend(m["id"] for m in page)
+            cursor = response.headers["X-After-Cursor"]
+            url = f"/api/rooms/{room_id}/messages?limit=2&after={cursor}"
+
+        assert len(seen) == 7
+        assert len(set(seen)) == 7
+        assert seen == sorted(seen)
+
+    async def test_invalid_cursor(self, client: AsyncClient):
+        """잘못된 커서 또는 before/after 동시 사용은 400"""
+        room_id, headers = await self.create_room_with_messages(client, "badcur", 1)
+
+        response = await client.get(
+            f"/api/rooms/{room_id}/messages?before=not-a-cursor", headers=headers
+        )
+        assert response.status_code == 400
+
+        response = await client.get(
+            f"/api/rooms/{room_id}/messages?before=a&after=b", headers=headers
+        )
+        assert response.status_code == 400
+
+    def test_migration_adds_keyset_index(self, tmp_path):
+        """기존 DB에 (room_id, created_at, id) 인덱스를 추가하고 커서 조회가 사용"""
+        from sqlalchemy import create_engine, inspect
+
+        from src.migrations.message_history_index import upgrade
+        from src.models import Base
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            # 키셋 인덱스 도입 이전 스키마 재현
+            conn.exec_driver_sql("DROP INDEX ix_messages_room_created_id")
+
+        with engine.begin() as conn:
+            assert upgrade(conn) is True
+        with engine.begin() as conn:
+            assert upgrade(conn) is False
+            plan = " ".join(
+                row[-1]
+                for row in conn.exec_driver_sql(
+                    "EXPLAIN QUERY PLAN SELECT id FROM messages WHERE room_id = 'r' "
+                    "AND (created_at, id) < ('2025-01-01', 'x') "
+                    "ORDER BY created_at DESC, id DESC LIMIT 50"
+                )
+            )
+
+        indexes = {i["name"] for i in inspect(engine).get_indexes("messages")}
+        assert "ix_messages_room_created_id" in indexes
+        assert "ix_messages_room_created_id" in plan
+        assert "TEMP B-TREE" not in plan
+        engine.dispose()
@@ -0,0 +1,213 @@
+"""메시지 그룹 커밋 테스트"""
+
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.message import Message
+from src.models.room import ChatRoom
+from src.repositories.ingest import MessageIngestQueue, message_ingest
+
+
+async def create_user_and_login(client: AsyncClient, username: str, email: str):
+    """테스트 유틸: 사용자 생성 및 로그인"""
+    reg_response = await client.post(
+        "/api/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    user_id = reg_response.json()["id"]
+
+    login_response = await client.post(
+        "/api/auth/login",
+        json={"username": username, "password": "password123"},
+    )
+    return login_response.json()["access_token"], user_id
+
+
+class TestMessageIngestQueue:
+    """수집 큐 테스트"""
+
+    async def test_concurrent_submits_share_commits(
+        self, async_engine, async_session: AsyncSession
+    ):
+        """동시에 들어온 메시지는 적은 수의 배치로 커밋됨"""
+        room = ChatRoom()
+        async_session.add(room)
+        await async_session.commit()
+
+        queue = MessageIngestQueue(batch_size=64, max_delay=0.005)
+        await queue.start(async_engine)
+        rows = await asyncio.gather(
+            *(queue.submit(room.id, None, f"message {n}") for n in range(200))
+        )
+        await queue.stop()
+
+        assert len({row["id"] for row in rows}) == 200
+        # 배치 안에서도 채팅방 seq가 겹치지 않고 1부터 이어짐
+        assert sorted(row["seq"] for row in rows) == list(range(1, 201))
+        assert queue.stats.messages == 200
+        assert queue.stats.batches < 200
+        assert queue.stats.max_batch <= 64
+
+        count = await async_session.scalar(
+            select(func.count()).select_from(Message).where(Message.room_id == room.id)
+        )
+        assert count == 200
+
+    async def test_single_submit_flushes_after_max_delay(self, async_engine, async_session):
+        """배치가 차지 않아도 max_delay 안에 커밋"""
+        room = ChatRoom()
+        async_session.add(room)
+        await async_session.commit()
+
+        queue = MessageIngestQueue(batch_size=1000, max_delay=0.01)
+        await queue.start(async_engine)
+        row = await asyncio.wait_for(queue.submit(room.id, None, "alone"), timeout=1)
+        await queue.stop()
+
+        saved = await async_session.get(Message, row["id"])
+        assert saved.content == "alone"
+
+    async def test_failed_batch_raises_to_submitters(self, async_engine):
+        """커밋 실패는 배치의 모든 요청에 전달"""
+        queue = MessageIngestQueue(batch_size=10, max_delay=0.005)
+        await queue.start(async_engine)
+
+        with pytest.raises(Exception):
+            await queue.submit("room", None, None)
+        assert queue.stats.failed == 1
+        await queue.stop()
+
+    async def test_bad_row_fails_only_its_submitter(self, async_engine, async_session):
+        """배치 안의 잘못된 행은 그 요청만 실패하고 나머지는 커밋됨"""
+        room = ChatRoom()
+        async_session.add(room)
+        await async_session.commit()
+
+        queue = MessageIngestQueue(batch_size=10, max_delay=0.05)
+        await queue.start(async_engine)
+        results = await asyncio.gather(
+            queue.submit(room.id, None, "first"),
+            queue.submit(room.id, None, None),  # NOT NULL 위반
+            queue.submit(room.id, None, "second"),
+            return_exceptions=True,
+        )
+        await queue.stop()
+
+        first, bad, second = results
+        assert isinstance(bad, Exception)
+        assert (first["seq"], second["seq"]) == (1, 2)
+        assert queue.stats.failed == 1
+        assert queue.stats.fallbacks == 1
+        assert queue.stats.messages == 2
+
+        contents = await async_session.scalars(
+            select(Message.content).where(Message.room_id == room.id).order_by(Message.seq)
+        )
+        assert contents.all() == ["first", "second"]
+
+    async def test_seq_conflict_is_retried(self, async_engine, async_session, monkeypatch):
+        """행 단위 커밋에서 seq 충돌(IntegrityError)은 다시 시도"""
+        from sqlalchemy.exc import IntegrityError
+
+        room = ChatRoom()
+        async_session.add(room)
+        await async_session.commit()
+
+        queue = MessageIngestQueue(batch_size=10, max_delay=0.005)
+        insert = queue._insert
+        conflicts = [IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed"))] * 2
+
+        async def flaky_insert(rows):
+            if conflicts:
+                raise conflicts.pop()
+            await insert(rows)
+
+        monkeypatch.setattr(queue, "_insert", flaky_insert)
+        await queue.start(async_engine)
+        row = await queue.submit(room.id, None, "retried")
+        await queue.stop()
+
+        assert row["seq"] == 1
+        assert queue.stats.failed == 0
+
+    async def test_submit_requires_running_queue(self):
+        """시작하지 않은 큐에는 넣을 수 없음"""
+        with pytest.raises(RuntimeError):
+            await MessageIngestQueue().submit("room", None, "x")
+
+
+class TestGroupCommitRoute:
+    """그룹 커밋 모드의 메시지 전송 테스트"""
+
+    @pytest.fixture
+    async def file_client(self, tmp_path):
+        """파일 DB를 쓰는 클라이언트 (연결마다 별도 트랜잭션)"""
+        from httpx import ASGITransport
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from sqlalchemy.orm import sessionmaker
+
+        from src.core.membership_cache import membership_cache
+        from src.core.user_cache import user_cache
+        from src.database import get_db
+        from src.main import app
+        from src.migrations import upgrade_all
+        from src.models.base import Base
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'chat.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(upgrade_all)
+        factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        async def override_get_db():
+            async with factory() as session:
+                yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+        user_cache.clear()
+        membership_cache.clear()
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            yield ac, engine, factory
+        app.dependency_overrides.clear()
+        user_cache.clear()
+        membership_cache.clear()
+        await engine.dispose()
+
+    async def test_send_message_acknowledged_after_commit(self, file_client):
+        """응답을 받은 메시지는 이미 커밋되어 있음"""
+        client, engine, factory = file_client
+        token1, user1_id = await create_user_and_login(client, "gc1", "gc1@example.com")
+        _, user2_id = await create_user_and_login(client, "gc2", "gc2@example.com")
+        headers = {"Authorization": f"Bearer {token1}"}
+        room_id = (
+            await client.post("/api/rooms", json={"other_user_id": user2_id}, headers=headers)
+        ).json()["id"]
+
+        await message_ingest.start(engine)
+        try:
+            responses = await asyncio.gather(
+                *(
+                    client.post(
+                        f"/api/rooms/{room_id}/messages",
+                        json={"content": f"batched {n}"},
+                        headers=headers,
+                    )
+                    for n in range(20)
+                )
+            )
+        finally:
+            await message_ingest.stop()
+
+        assert all(r.status_code == 201 for r in responses)
+        assert {r.json()["sender_id"] for r in responses} == {user1_id}
+        assert message_ingest.stats.batches < 20
+
+        async with factory() as session:
+            for response in responses:
+                saved = await session.get(Message, response.json()["id"])
+                assert saved is not None
+                assert saved.created_at.isoformat() == response.json()["created_at"]
@@ -0,0 +1,133 @@
+"""채팅방 멤버십 캐시 테스트"""
+
+from unittest.mock import AsyncMock
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.membership_cache import membership_cache
+from src.models.room import ChatRoom, ChatRoomMember
+from src.models.user import User
+
+
+async def create_user_and_login(client: AsyncClient, username: str, email: str):
+    """테스트 유틸: 사용자 생성 및 로그인"""
+    reg_response = await client.post(
+        "/api/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    user_id = reg_response.json()["id"]
+
+    login_response = await client.post(
+        "/api/auth/login",
+        json={"username": username, "password": "password123"},
+    )
+    return login_response.json()["access_token"], user_id
+
+
+async def create_room(client: AsyncClient, token: str, other_user_id: str) -> str:
+    response = await client.post(
+        "/api/rooms",
+        json={"other_user_id": other_user_id},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    return response.json()["id"]
+
+
+class TestMembershipCacheHotPath:
+    """메시지 경로 쿼리 수 테스트"""
+
+    async def test_send_message_is_single_insert(self, client: AsyncClient, count_queries):
+        """캐시가 채워진 뒤 메시지 전송은 INSERT 한 번"""
+        token1, _ = await create_user_and_login(client, "hot1", "hot1@example.com")
+        _, user2_id = await create_user_and_login(client, "hot2", "hot2@example.com")
+        room_id = await create_room(client, token1, user2_id)
+        headers = {"Authorization": f"Bearer {token1}"}
+
+        await client.post(
+            f"/api/rooms/{room_id}/messages", json={"content": "warm"}, headers=headers
+        )
+
+        with count_queries() as statements:
+            response = await client.post(
+                f"/api/rooms/{room_id}/messages", json={"content": "hot"}, headers=headers
+            )
+
+        assert response.status_code == 201
+        assert response.json()["content"] == "hot"
+        assert len(statements) == 1
+        assert statements[0].startswith("INSERT INTO messages")
+
+    async def test_get_messages_skips_membership_query(self, client: AsyncClient, count_queries):
+        """캐시가 채워진 뒤 히스토리 조회는 메시지 SELECT 한 번"""
+        token1, _ = await create_user_and_login(client, "hist1", "hist1@example.com")
+        _, user2_id = await create_user_and_login(client, "hist2", "hist2@example.com")
+        room_id = await create_room(client, token1, user2_id)
+        headers = {"Authorization": f"Bearer {token1}"}
+
+        await client.get(f"/api/rooms/{room_id}/messages", headers=headers)
+
+        with count_queries() as statements:
+            response = await client.get(f"/api/rooms/{room_id}/messages", headers=headers)
+
+        assert response.status_code == 200
+        assert len(statements) == 1
+        assert "chat_room_members" not in statements[0]
+
+    async def test_non_member_still_rejected(self, client: AsyncClient):
+        """캐시된 멤버 집합에 없는 사용자는 거부"""
+        token1, _ = await create_user_and_login(client, "cm1", "cm1@example.com")
+        _, user2_id = await create_user_and_login(client, "cm2", "cm2@example.com")
+        token3, _ = await create_user_and_login(client, "cm3", "cm3@example.com")
+        room_id = await create_room(client, token1, user2_id)
+
+        for token, expected in [(token1, 201), (token3, 403), (token3, 403)]:
+            response = await client.post(
+                f"/api/rooms/{room_id}/messages",
+                json={"content": "hi"},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            assert response.status_code == expected
+
+
+class TestMembershipCacheInvalidation:
+    """멤버십 캐시 무효화 테스트"""
+
+    async def test_member_insert_invalidates(self, async_session: AsyncSession):
+        """ChatRoomMember 추가 commit 시 채팅방/사용자 항목 무효화"""
+        membership_cache.clear()
+        user = User(username="joiner", email="joiner@example.com", password_hash="x")
+        room = ChatRoom()
+        async_session.add_all([user, room])
+        await async_session.commit()
+
+        assert await membership_cache.is_member(async_session, room.id, user.id) is False
+        assert await membership_cache.user_rooms(async_session, user.id) == frozenset()
+
+        async_session.add(ChatRoomMember(room_id=room.id, user_id=user.id))
+        await async_session.commit()
+
+        assert await membership_cache.is_member(async_session, room.id, user.id) is True
+        assert await membership_cache.user_rooms(async_session, user.id) == {room.id}
+        membership_cache.clear()
+
+    async def test_backplane_membership_event_invalidates(self):
+        """다른 워커의 join_room 이벤트로 캐시 무효화"""
+        from src.websocket.backplane import InProcessBackplane
+        from src.websocket.manager import ConnectionManager
+
+        peers = set()
+        worker_a, worker_b = ConnectionManager(), ConnectionManager()
+        await worker_a.attach_backplane(InProcessBackplane(peers=peers))
+        await worker_b.attach_backplane(InProcessBackplane(peers=peers))
+        worker_b.connect("user1", AsyncMock())
+
+        membership_cache._room_members.set("room1", frozenset())
+        membership_cache._user_rooms.set("user1", frozenset())
+
+        worker_a.join_room("user1", "room1")
+        await worker_a.backplane.flush()
+
+        assert "room1" not in membership_cache._room_members
+        assert "user1" not in membership_cache._user_rooms
+        membership_cache.clear()
@@ -122,3 +122,70 @@ class TestMessagePersistence:
         messages = result.scalars().all()
         assert len(messages) == 1
         assert messages[0].content == "Persistent message"
+
+
+class TestMessageWritePath:
+    """메시지 저장 경로 테스트"""
+
+    async def test_insert_returning_single_statement(
+        self, client: AsyncClient, async_session: AsyncSession, count_queries
+    ):
+        """저장은 INSERT ... RETURNING 한 문장이고 응답은 저장된 행과 같음"""
+        token1, user1_id = await create_user_and_login(client, "retuser1", "ret1@example.com")
+        _, user2_id = await create_user_and_login(client, "retuser2", "ret2@example.com")
+        headers = {"Authorization": f"Bearer {token1}"}
+
+        room_response = await client.post(
+            "/api/rooms", json={"other_user_id": user2_id}, headers=headers
+        )
+        room_id = room_response.json()["id"]
+        await client.post(
+            f"/api/rooms/{room_id}/messages", json={"content": "warm"}, headers=headers
+        )
+
+        with count_queries() as statements:
+            response = await client.post(
+                f"/api/rooms/{room_id}/messages", json={"content": "returned"}, headers=headers
+            )
+
+        assert response.status_code == 201
+        assert len(statements) == 1
+        assert "RETURNING" in statements[0]
+
+        data = response.json()
+        saved = await async_session.get(Message, data["id"])
+        assert saved.content == "returned"
+        assert saved.sender_id == user1_id
+        assert data["created_at"] == saved.created_at.isoformat()
+
+    async def test_broadcast_after_response(self, client: AsyncClient, monkeypatch):
+        """브로드캐스트는 백그라운드 태스크로 응답과 같은 내용을 전송"""
+        from unittest.mock import AsyncMock
+
+        from src.core.serialization import dumps, loads
+        from src.websocket.manager import manager
+
+        token1, _ = await create_user_and_login(client, "bguser1", "bg1@example.com")
+        _, user2_id = await create_user_and_login(client, "bguser2", "bg2@example.com")
+        headers = {"Authorization": f"Bearer {token1}"}
+        room_response = await client.post(
+            "/api/rooms", json={"other_user_id": user2_id}, headers=headers
+        )
+        room_id = room_response.json()["id"]
+
+        broadcast = AsyncMock()
+        monkeypatch.setattr(manager, "broadcast_to_room", broadcast)
+
+        response = await client.post(
+            f"/api/rooms/{room_id}/messages", json={"content": "later"}, headers=headers
+        )
+
+        broadcast.assert_awaited_once()
+        args = broadcast.await_args.args
+        assert args[0] == room_id
+        # 프레임으로 인코딩된 내용이 응답 본문과 같음
+        assert loads(dumps(args[1])) == {
+            "type": "message",
+            "room_id": room_id,
+            "message": response.json(),
+        }
@@ -0,0 +1,177 @@
+"""계측과 /metrics 테스트"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from httpx import AsyncClient
+
+
+async def create_user_and_login(client: AsyncClient, username: str, email: str):
+    """테스트 유틸: 사용자 생성 및 로그인"""
+    reg_response = await client.post(
+        "/api/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    user_id = reg_response.json()["id"]
+
+    login_response = await client.post(
+        "/api/auth/login",
+        json={"username": username, "password": "password123"},
+    )
+    return login_response.json()["access_token"], user_id
+
+
+class TestMetricsRegistry:
+    """Counter/Histogram 출력 형식 테스트"""
+
+    def test_prometheus_text_format(self):
+        """히스토그램 버킷은 누적, _sum/_count 포함"""
+        from src.core.metrics import MetricsRegistry
+
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1))
+        errors = registry.counter("errors_total", "Errors", ("route",))
+        latency.observe(0.05, "/a")
+        latency.observe(0.5, "/a")
+        latency.observe(5, "/a")
+        errors.inc("/a", amount=2)
+
+        text = registry.render()
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in text
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+        assert 'latency_seconds_sum{route="/a"} 5.55' in text
+        assert 'latency_seconds_count{route="/a"} 3' in text
+        assert 'errors_total{route="/a"} 2' in text
+
+
+class TestRequestInstrumentation:
+    """요청별 지연/쿼리 계측 테스트"""
+
+    async def test_route_latency_and_query_count(self, client: AsyncClient, async_engine):
+        """라우트 템플릿 레이블로 지연과 요청당 쿼리 수 기록"""
+        from src.core.instrumentation import instrument_engine
+        from src.core.metrics import HTTP_REQUEST_QUERIES, HTTP_REQUEST_SECONDS
+
+        instrument_engine(async_engine)
+        token1, _ = await create_user_and_login(client, "metric1", "metric1@example.com")
+        _, user2_id = await create_user_and_login(client, "metric2", "metric2@example.com")
+        headers = {"Authorization": f"Bearer {token1}"}
+        room_id = (
+            await client.post("/api/rooms", json={"other_user_id": user2_id}, headers=headers)
+        ).json()["id"]
+
+        route = "/api/rooms/{room_id}/messages"
+        before = HTTP_REQUEST_SECONDS.count("GET", route, "200")
+        queries_before = HTTP_REQUEST_QUERIES.count(route)
+        response = await client.get(f"/api/rooms/{room_id}/messages", headers=headers)
+        assert response.status_code == 200
+
+        assert HTTP_REQUEST_SECONDS.count("GET", route, "200") == before + 1
+        assert HTTP_REQUEST_QUERIES.count(route) == queries_before + 1
+
+    async def test_n_plus_one_flagged(self, async_engine):
+        """같은 SQL을 임계값 이상 반복한 요청은 N+1로 기록"""
+        from sqlalchemy import select
+
+        from src.core.config import settings
+        from src.core.instrumentation import instrument_engine, record_request, track_request
+        from src.core.metrics import HTTP_N_PLUS_ONE
+        from src.models.user import User
+
+        instrument_engine(async_engine)
+        before = HTTP_N_PLUS_ONE.value("/n-plus-one")
+        async with async_engine.connect() as conn:
+            with track_request() as stats:
+                for n in range(settings.n_plus_one_threshold):
+                    await conn.execute(select(User).where(User.id == f"user{n}"))
+        assert stats.queries == settings.n_plus_one_threshold
+        assert stats.db_seconds > 0
+
+        record_request("/n-plus-one", stats)
+        assert HTTP_N_PLUS_ONE.value("/n-plus-one") == before + 1
+
+        with track_request() as few:
+            async with async_engine.connect() as conn:
+                await conn.execute(select(User))
+        record_request("/n-plus-one", few)
+        assert HTTP_N_PLUS_ONE.value("/n-plus-one") == before + 1
+
+    async def test_ws_send_timing(self):
+        """WebSocket 프레임 전송 시간 기록"""
+        from src.core.metrics import WS_QUEUE_SECONDS, WS_SEND_SECONDS
+        from src.websocket.outbox import ConnectionOutbox
+
+        before = WS_SEND_SECONDS.count()
+        outbox = ConnectionOutbox(AsyncMock())
+        outbox.put({"type": "message", "content": "hi"})
+        outbox.put({"type": "message", "content": "there"})
+        await outbox.join()
+        outbox.close()
+
+        assert WS_SEND_SECONDS.count() == before + 2
+        assert WS_QUEUE_SECONDS.count() >= 2
+
+
+class TestMetricsEndpoint:
+    """/metrics, /debug/profile 테스트"""
+
+    async def test_metrics_endpoint(self, client: AsyncClient):
+        """Prometheus 텍스트 형식으로 요청 지표와 런타임 값 출력"""
+        await client.get("/health")
+        response = await client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert 'http_request_duration_seconds_count{method="GET",route="/health"' in text
+        assert "ws_connections " in text
+        assert "rate_limit_allowed_total " in text
+
+    async def test_metrics_disabled(self, client: AsyncClient, monkeypatch):
+        from src.core.config import settings
+
+        monkeypatch.setattr(settings, "metrics_enabled", False)
+        assert (await client.get("/metrics")).status_code == 404
+
+    async def test_profiler(self, client: AsyncClient, monkeypatch):
+        """켜져 있을 때만 collapsed 스택 반환, 동시에 하나만"""
+        from src.core.config import settings
+
+        assert (await client.get("/debug/profile", params={"seconds": 0.01})).status_code == 404
+
+        monkeypatch.setattr(settings, "profiler_enabled", True)
+        first = asyncio.create_task(
+            client.get("/debug/profile", params={"seconds": 0.2, "interval_ms": 1})
+        )
+        await asyncio.sleep(0.05)
+        busy = await client.get("/debug/profile", params={"seconds": 0.01})
+        response = await first
+
+        assert busy.status_code == 409
+        assert response.status_code == 200
+        stack, _, count = response.text.splitlines()[0].rpartition(" ")
+        assert int(count) > 0
+        assert ";" in stack
+
+    async def test_profiler_is_local_only(self, client: AsyncClient, monkeypatch):
+        """원격 주소나 프록시를 거친 요청은 켜져 있어도 403"""
+        from httpx import ASGITransport
+
+        from src.core.config import settings
+        from src.main import app
+
+        monkeypatch.setattr(settings, "profiler_enabled", True)
+        params = {"seconds": 0.01}
+
+        remote = ASGITransport(app=app, client=("203.0.113.5", 40000))
+        async with AsyncClient(transport=remote, base_url="http://test") as remote_client:
+            response = await remote_client.get("/debug/profile", params=params)
+        assert response.status_code == 403
+
+        proxied = await client.get(
+            "/debug/profile", params=params, headers={"X-Forwarded-For": "203.0.113.5"}
+        )
+        assert proxied.status_code == 403
+
+        assert (await client.get("/debug/profile", params=params)).status_code == 200
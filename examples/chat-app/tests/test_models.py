@@ -94,7 +94,7 @@ class TestMessageModel:
         await async_session.commit()
 
         # 메시지 생성
-        message = Message(room_id=room.id, sender_id=user.id, content="Hello, World!")
+        message = Message(room_id=room.id, sender_id=user.id, content="Hello, World!", seq=1)
         async_session.add(message)
         await async_session.commit()
 
@@ -111,7 +111,7 @@ class TestMessageModel:
 
         # 여러 메시지 생성
         messages = [
-            Message(room_id=room.id, sender_id=user.id, content=f"Message {i}")
+            Message(room_id=room.id, sender_id=user.id, content=f"Message {i}", seq=i + 1)
             for i in range(3)
         ]
         async_session.add_all(messages)
@@ -126,3 +126,40 @@ class TestOnlineStatusAPI:
         assert response.status_code == 200
         data = response.json()
         assert len(data["members"]) == 2
+
+    async def test_connection_metrics_hide_user_ids(self, client):
+        """연결 지표 API는 접속 중인 사용자를 노출하지 않음"""
+        from src.websocket.manager import manager
+
+        reg = await client.post(
+            "/api/auth/register",
+            json={
+                "username": "metricsuser",
+                "email": "metrics@example.com",
+                "password": "password123",
+            },
+        )
+        user_id = reg.json()["id"]
+        login = await client.post(
+            "/api/auth/login",
+            json={"username": "metricsuser", "password": "password123"},
+        )
+        token = login.json()["access_token"]
+
+        websocket = MagicMock()
+        manager.connect("online-user", websocket)
+        try:
+            response = await client.get(
+                "/api/connections/metrics",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+        finally:
+            manager.disconnect("online-user", websocket)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["connection_count"] >= 1
+        assert data["outbox"]["queue_depth"] == 0
+        assert "connections" not in data
+        assert "online-user" not in response.text
+        assert user_id not in response.text
@@ -0,0 +1,317 @@
+"""하트비트 만료와 온라인 상태 푸시 테스트"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from httpx import AsyncClient
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def create_user_and_login(client: AsyncClient, username: str, email: str):
+    """테스트 유틸: 사용자 생성 및 로그인"""
+    reg_response = await client.post(
+        "/api/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    user_id = reg_response.json()["id"]
+
+    login_response = await client.post(
+        "/api/auth/login",
+        json={"username": username, "password": "password123"},
+    )
+    return login_response.json()["access_token"], user_id
+
+
+class TestTimerWheel:
+    """TimerWheel 테스트"""
+
+    def test_expires_after_delay(self):
+        """마감이 지난 키만 만료"""
+        from src.core.timer_wheel import TimerWheel
+
+        clock = FakeClock()
+        wheel = TimerWheel(tick=1.0, slots=8, clock=clock)
+        wheel.schedule("a", 3)
+        wheel.schedule("b", 5)
+
+        clock.now += 2
+        assert wheel.advance() == []
+        clock.now += 1
+        assert wheel.advance() == ["a"]
+        assert "a" not in wheel and "b" in wheel
+        clock.now += 2
+        assert wheel.advance() == ["b"]
+        assert len(wheel) == 0
+
+    def test_reschedule_and_cancel(self):
+        """갱신한 키는 새 마감까지 유지, 취소한 키는 만료되지 않음"""
+        from src.core.timer_wheel import TimerWheel
+
+        clock = FakeClock()
+        wheel = TimerWheel(tick=1.0, slots=8, clock=clock)
+        wheel.schedule("a", 3)
+        wheel.schedule("b", 3)
+        clock.now += 2
+        wheel.schedule("a", 3)
+        wheel.cancel("b")
+
+        clock.now += 1
+        assert wheel.advance() == []
+        clock.now += 2
+        assert wheel.advance() == ["a"]
+
+    def test_delay_longer_than_wheel(self):
+        """슬롯 수보다 먼 마감은 바퀴를 돈 뒤 만료"""
+        from src.core.timer_wheel import TimerWheel
+
+        clock = FakeClock()
+        wheel = TimerWheel(tick=1.0, slots=4, clock=clock)
+        wheel.schedule("a", 10)
+        for _ in range(9):
+            clock.now += 1
+            assert wheel.advance() == []
+        clock.now += 1
+        assert wheel.advance() == ["a"]
+
+    def test_catches_up_after_stall(self):
+        """여러 틱을 건너뛰어도 지난 마감은 모두 만료"""
+        from src.core.timer_wheel import TimerWheel
+
+        clock = FakeClock()
+        wheel = TimerWheel(tick=1.0, slots=4, clock=clock)
+        for n in range(1, 4):
+            wheel.schedule(n, n)
+        clock.now += 100
+        assert sorted(wheel.advance()) == [1, 2, 3]
+
+
+class TestPresenceTracker:
+    """PresenceTracker 테스트"""
+
+    async def test_changes_coalesced_per_room(self):
+        """창 안의 변경은 채팅방마다 프레임 하나, 되돌아온 변경은 생략"""
+        from src.websocket.presence import PresenceTracker
+
+        push = AsyncMock()
+        tracker = PresenceTracker(push_window=0.01)
+        await tracker.start(MagicMock(), push)
+        try:
+            tracker.changed("u1", True, {"room1", "room2"})
+            tracker.changed("u2", True, {"room1"})
+            # u3의 재연결 (오프라인 → 온라인) 은 보내지 않음
+            tracker.changed("u3", False, {"room1"})
+            tracker.changed("u3", True, {"room1"})
+            await asyncio.sleep(0.05)
+        finally:
+            await tracker.stop()
+
+        frames = {call.args[0]: call.args[1] for call in push.call_args_list}
+        assert push.call_count == 2
+        assert frames["room1"]["users"] == [
+            {"user_id": "u1", "is_online": True},
+            {"user_id": "u2", "is_online": True},
+        ]
+        assert frames["room2"]["users"] == [{"user_id": "u1", "is_online": True}]
+        assert tracker.stats.coalesced == 1
+
+    async def test_expires_silent_connection(self):
+        """ttl 동안 하트비트가 없는 연결만 만료"""
+        from src.websocket.presence import PresenceTracker
+
+        clock = FakeClock()
+        expire = MagicMock()
+        tracker = PresenceTracker(ttl=3, tick=0.001, clock=clock)
+        await tracker.start(expire, AsyncMock())
+        try:
+            tracker.touch("silent", "u1")
+            tracker.touch("alive", "u2")
+            for _ in range(4):
+                clock.now += 1
+                tracker.touch("alive", "u2")
+                await asyncio.sleep(0.01)
+        finally:
+            await tracker.stop()
+
+        expire.assert_called_once_with("silent")
+        assert tracker.stats.expired == 1
+
+    async def test_last_seen_written_in_one_batch(self, async_engine, count_queries):
+        """last_seen_at은 사용자마다가 아니라 UPDATE 한 번으로 저장"""
+        from sqlalchemy import select
+
+        from src.models.user import User
+        from src.websocket.presence import PresenceTracker
+
+        async with async_engine.begin() as conn:
+            await conn.execute(
+                User.__table__.insert(),
+                [
+                    {
+                        "id": f"u{n}",
+                        "username": f"u{n}",
+                        "email": f"u{n}@example.com",
+                        "password_hash": "x",
+                    }
+                    for n in range(3)
+                ],
+            )
+
+        tracker = PresenceTracker()
+        await tracker.start(MagicMock(), AsyncMock(), async_engine)
+        for n in range(3):
+            tracker.touch(f"ws{n}", f"u{n}")
+            tracker.touch(f"ws{n}", f"u{n}")
+        assert tracker.last_seen("u0") is not None
+
+        with count_queries() as statements:
+            await tracker.stop()
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE users")
+
+        async with async_engine.connect() as conn:
+            seen = (await conn.execute(select(User.last_seen_at))).scalars().all()
+        assert all(at is not None for at in seen)
+        assert tracker.stats.last_seen_writes == 3
+
+    async def test_failed_last_seen_flush_is_requeued(self, async_engine, monkeypatch):
+        """DB 오류로 저장하지 못한 last_seen_at은 다음 저장 때 다시 시도"""
+        import pytest
+        from sqlalchemy import select, text
+        from sqlalchemy.exc import OperationalError
+
+        from src.models.user import User
+        from src.websocket import presence
+        from src.websocket.presence import PresenceTracker
+
+        async with async_engine.begin() as conn:
+            await conn.execute(
+                User.__table__.insert(),
+                {"id": "u0", "username": "u0", "email": "u0@example.com", "password_hash": "x"},
+            )
+
+        tracker = PresenceTracker()
+        await tracker.start(MagicMock(), AsyncMock(), async_engine)
+        tracker.touch("ws0", "u0")
+        pending = tracker.last_seen("u0")
+
+        broken = text("UPDATE missing_table SET last_seen_at = :seen WHERE id = :user_id")
+        monkeypatch.setattr(presence, "UPDATE_LAST_SEEN", broken)
+        with pytest.raises(OperationalError):
+            await tracker.flush_last_seen()
+        assert tracker.last_seen("u0") == pending
+        assert tracker.stats.last_seen_writes == 0
+
+        monkeypatch.undo()
+        await tracker.stop()
+
+        async with async_engine.connect() as conn:
+            seen = (await conn.execute(select(User.last_seen_at))).scalar_one()
+        assert seen is not None
+        assert tracker.stats.last_seen_writes == 1
+
+
+class TestManagerPresence:
+    """ConnectionManager와 PresenceTracker 연동 테스트"""
+
+    async def test_push_on_first_connect_and_last_disconnect(self):
+        """첫 연결/마지막 연결 해제만 채팅방에 푸시"""
+        from src.websocket.manager import ConnectionManager
+        from src.websocket.presence import PresenceTracker
+        from src.websocket.status import OnlineStatusManager
+
+        manager = ConnectionManager(
+            status=OnlineStatusManager(), presence=PresenceTracker(push_window=0.01)
+        )
+        listener = AsyncMock()
+        await manager.start_presence()
+        try:
+            manager.connect("listener", listener, ["room1"])
+            await asyncio.sleep(0.05)
+            listener.send_text.reset_mock()
+
+            tab1, tab2 = AsyncMock(), AsyncMock()
+            manager.connect("user1", tab1, ["room1"])
+            manager.connect("user1", tab2, ["room1"])
+            await asyncio.sleep(0.05)
+            manager.disconnect("user1", tab1)
+            await asyncio.sleep(0.05)
+            manager.disconnect("user1", tab2)
+            await asyncio.sleep(0.05)
+            await manager.flush()
+        finally:
+            await manager.stop_presence()
+
+        frames = [json.loads(call.args[0])["users"] for call in listener.send_text.call_args_list]
+        assert frames == [
+            [{"user_id": "user1", "is_online": True}],
+            [{"user_id": "user1", "is_online": False}],
+        ]
+
+    async def test_expired_connection_goes_offline(self):
+        """하트비트가 끊긴 연결은 닫히고 오프라인이 됨"""
+        from src.websocket.manager import ConnectionManager
+        from src.websocket.presence import PresenceTracker
+        from src.websocket.status import OnlineStatusManager
+
+        clock = FakeClock()
+        status = OnlineStatusManager()
+        manager = ConnectionManager(
+            status=status, presence=PresenceTracker(ttl=2, tick=0.001, clock=clock)
+        )
+        await manager.start_presence()
+        try:
+            crashed, alive = AsyncMock(), AsyncMock()
+            manager.connect("user1", crashed)
+            manager.connect("user2", alive)
+            for _ in range(3):
+                clock.now += 1
+                manager.heartbeat("user2", alive)
+                await asyncio.sleep(0.01)
+        finally:
+            await manager.stop_presence()
+
+        assert status.is_online("user1") is False
+        assert status.is_online("user2") is True
+        crashed.close.assert_awaited_once()
+        alive.close.assert_not_called()
+
+
+class TestStatusRoutes:
+    """온라인 상태 API 테스트"""
+
+    async def test_room_status_uses_membership_cache(self, client: AsyncClient, count_queries):
+        """두 번째 조회부터 채팅방 멤버는 캐시에서 읽음"""
+        token1, _ = await create_user_and_login(client, "pres1", "pres1@example.com")
+        _, user2_id = await create_user_and_login(client, "pres2", "pres2@example.com")
+        headers = {"Authorization": f"Bearer {token1}"}
+        room_id = (
+            await client.post("/api/rooms", json={"other_user_id": user2_id}, headers=headers)
+        ).json()["id"]
+
+        await client.get(f"/api/rooms/{room_id}/status", headers=headers)
+        with count_queries() as statements:
+            response = await client.get(f"/api/rooms/{room_id}/status", headers=headers)
+        assert response.status_code == 200
+        assert len(response.json()["members"]) == 2
+        assert statements == []
+
+    async def test_user_status_includes_last_seen(self, client: AsyncClient):
+        """사용자 상태에 last_seen_at 포함"""
+        token1, _ = await create_user_and_login(client, "pres3", "pres3@example.com")
+        _, user2_id = await create_user_and_login(client, "pres4", "pres4@example.com")
+
+        response = await client.get(
+            f"/api/users/{user2_id}/status", headers={"Authorization": f"Bearer {token1}"}
+        )
+        assert response.status_code == 200
+        assert response.json() == {"user_id": user2_id, "is_online": False, "last_seen_at": None}
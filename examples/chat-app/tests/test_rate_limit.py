@@ -0,0 +1,233 @@
+"""속도 제한과 동시 요청 수 제한 테스트"""
+
+import asyncio
+
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def create_user_and_login(client: AsyncClient, username: str, email: str):
+    """테스트 유틸: 사용자 생성 및 로그인"""
+    reg_response = await client.post(
+        "/api/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    user_id = reg_response.json()["id"]
+
+    login_response = await client.post(
+        "/api/auth/login",
+        json={"username": username, "password": "password123"},
+    )
+    return login_response.json()["access_token"], user_id
+
+
+class TestTokenBuckets:
+    """TokenBuckets 테스트"""
+
+    def test_burst_then_refill(self):
+        """버스트만큼 허용한 뒤 지난 시간만큼만 충전"""
+        from src.core.rate_limit import TokenBuckets
+
+        clock = FakeClock()
+        buckets = TokenBuckets(rate=2.0, burst=3, clock=clock)
+        assert [buckets.take("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert buckets.take("a") == 0.5
+
+        clock.now += 0.5
+        assert buckets.take("a") == 0.0
+        assert buckets.take("a") > 0
+
+        # 오래 쉬어도 burst 이상 쌓이지 않음
+        clock.now += 100
+        assert [buckets.take("a") for _ in range(4)][-1] > 0
+
+    def test_keys_are_independent_and_bounded(self):
+        """키마다 버킷이 따로 있고, maxsize를 넘으면 오래된 키부터 제거"""
+        from src.core.rate_limit import TokenBuckets
+
+        buckets = TokenBuckets(rate=1.0, burst=1, maxsize=2, clock=FakeClock())
+        assert buckets.take("a") == 0.0
+        assert buckets.take("b") == 0.0
+        assert buckets.take("a") > 0
+        buckets.take("c")
+        assert len(buckets) == 2
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    def test_route_budget_separate_from_default(self):
+        """라우트 예산을 다 써도 다른 요청은 기본 예산으로 허용"""
+        from src.core.rate_limit import RateLimiter
+
+        limiter = RateLimiter(
+            default=(1.0, 5), routes={"send_message": (1.0, 1)}, clock=FakeClock()
+        )
+        path = "/api/rooms/r1/messages"
+        assert limiter.check("POST", path, "user:u1") == ("send_message", 0.0)
+        assert limiter.check("POST", path, "user:u1")[1] > 0
+        assert limiter.check("POST", path, "user:u2")[1] == 0.0
+        assert limiter.check("GET", path, "user:u1") == ("default", 0.0)
+        assert limiter.metrics()["limited"] == {"send_message": 1}
+
+    def test_disabled(self):
+        """비활성화하면 항상 허용"""
+        from src.core.rate_limit import RateLimiter
+
+        limiter = RateLimiter(default=(0.0, 0), routes={}, enabled=False)
+        assert limiter.check("GET", "/api/rooms", "ip:1.2.3.4") == ("default", 0.0)
+
+
+class TestAdmissionControl:
+    """AdmissionControl 테스트"""
+
+    async def test_waiters_get_released_slots_in_order(self):
+        """자리가 나면 대기 중인 요청 순서대로 처리"""
+        from src.core.rate_limit import AdmissionControl
+
+        admission = AdmissionControl(limit=1, max_waiting=2, timeout=1.0)
+        assert await admission.acquire() is True
+        first = asyncio.create_task(admission.acquire())
+        second = asyncio.create_task(admission.acquire())
+        await asyncio.sleep(0)
+        assert admission.waiting == 2
+        # 대기열이 가득 차면 즉시 거절
+        assert await admission.acquire() is False
+
+        admission.release()
+        assert await first is True
+        assert not second.done()
+        admission.release()
+        assert await second is True
+        admission.release()
+        assert admission.metrics() == {"limit": 1, "in_flight": 0, "waiting": 0, "shed": 1}
+
+    async def test_timeout_sheds(self):
+        """timeout 동안 자리가 나지 않으면 거절"""
+        from src.core.rate_limit import AdmissionControl
+
+        admission = AdmissionControl(limit=1, max_waiting=10, timeout=0.01)
+        assert await admission.acquire() is True
+        assert await admission.acquire() is False
+        admission.release()
+        assert admission.in_flight == 0
+        assert admission.waiting == 0
+
+
+class TestRateLimitMiddleware:
+    """RateLimitMiddleware 테스트"""
+
+    async def test_login_limited_per_ip(self, client: AsyncClient, monkeypatch):
+        """로그인 예산을 넘으면 Retry-After와 함께 429"""
+        from src.core.rate_limit import TokenBuckets, rate_limiter
+
+        monkeypatch.setitem(rate_limiter.routes, "login", TokenBuckets(rate=0.5, burst=2))
+        body = {"username": "nobody", "password": "password123"}
+        statuses = [
+            (await client.post("/api/auth/login", json=body)).status_code for _ in range(2)
+        ]
+        assert statuses == [401, 401]
+
+        response = await client.post("/api/auth/login", json=body)
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+
+    async def test_send_message_limited_per_user(self, client: AsyncClient, monkeypatch):
+        """메시지 전송 예산은 사용자별"""
+        from src.core.rate_limit import TokenBuckets, rate_limiter
+
+        token1, _ = await create_user_and_login(client, "rl1", "rl1@example.com")
+        token2, user2_id = await create_user_and_login(client, "rl2", "rl2@example.com")
+        headers1 = {"Authorization": f"Bearer {token1}"}
+        headers2 = {"Authorization": f"Bearer {token2}"}
+        room_id = (
+            await client.post("/api/rooms", json={"other_user_id": user2_id}, headers=headers1)
+        ).json()["id"]
+
+        monkeypatch.setitem(rate_limiter.routes, "send_message", TokenBuckets(rate=0.1, burst=1))
+        url = f"/api/rooms/{room_id}/messages"
+        assert (await client.post(url, json={"content": "a"}, headers=headers1)).status_code == 201
+        assert (await client.post(url, json={"content": "b"}, headers=headers1)).status_code == 429
+        assert (await client.post(url, json={"content": "c"}, headers=headers2)).status_code == 201
+        # 다른 라우트는 기본 예산 사용
+        assert (await client.get(url, headers=headers1)).status_code == 200
+
+    async def test_admission_sheds_with_503(self):
+        """동시 요청 수를 넘으면 503, 제외 경로는 제한 없음"""
+        from src.api.middleware import RateLimitMiddleware
+        from src.core.rate_limit import AdmissionControl, RateLimiter
+
+        release = asyncio.Event()
+
+        async def slow(request):
+            await release.wait()
+            return PlainTextResponse("ok")
+
+        async def health(request):
+            return PlainTextResponse("ok")
+
+        app = Starlette(routes=[Route("/slow", slow), Route("/health", health)])
+        admission = AdmissionControl(limit=1, max_waiting=0, timeout=1.0)
+        limiter = RateLimiter(default=(100.0, 100), routes={})
+        wrapped = RateLimitMiddleware(app, limiter=limiter, admission=admission)
+
+        async with AsyncClient(transport=ASGITransport(app=wrapped), base_url="http://t") as ac:
+            pending = asyncio.create_task(ac.get("/slow"))
+            await asyncio.sleep(0.01)
+            shed = await ac.get("/slow")
+            assert shed.status_code == 503
+            assert shed.headers["Retry-After"] == "1"
+            assert (await ac.get("/health")).status_code == 200
+
+            release.set()
+            assert (await pending).status_code == 200
+        assert admission.in_flight == 0
+
+    async def test_default_admission_allows_concurrent_requests(self):
+        """기본 설정의 동시 요청 제한은 DB 풀 크기가 아니라 명시적인 값"""
+        from src.api.middleware import RateLimitMiddleware
+        from src.core.config import Settings, settings
+        from src.core.rate_limit import AdmissionControl, RateLimiter
+        from src.main import app as chat_app
+
+        defaults = Settings(_env_file=None)
+        assert defaults.max_concurrent_requests == 256
+        assert chat_app.state.admission.limit == settings.max_concurrent_requests
+
+        release = asyncio.Event()
+
+        async def slow(request):
+            await release.wait()
+            return PlainTextResponse("ok")
+
+        app = Starlette(routes=[Route("/slow", slow)])
+        admission = AdmissionControl(
+            defaults.max_concurrent_requests,
+            max_waiting=defaults.admission_queue_size,
+            timeout=defaults.admission_timeout_ms / 1000,
+        )
+        limiter = RateLimiter(default=(1000.0, 1000), routes={})
+        wrapped = RateLimitMiddleware(app, limiter=limiter, admission=admission)
+
+        async with AsyncClient(transport=ASGITransport(app=wrapped), base_url="http://t") as ac:
+            pending = [asyncio.create_task(ac.get("/slow")) for _ in range(32)]
+            await asyncio.sleep(0.05)
+            assert admission.in_flight == 32
+            assert admission.waiting == 0
+
+            release.set()
+            responses = await asyncio.gather(*pending)
+        assert [r.status_code for r in responses] == [200] * 32
+        assert admission.shed == 0
@@ -118,3 +118,265 @@ class TestMessageReadStatus:
             headers={"Authorization": f"Bearer {token2}"},
         )
         assert unread_response.json()["unread_count"] == 0
+
+
+async def create_room_with_messages(client: AsyncClient, prefix: str, count: int):
+    """user1이 count개 메시지를 보낸 채팅방 생성"""
+    token1, _ = await create_user_and_login(client, f"{prefix}1", f"{prefix}1@example.com")
+    token2, user2_id = await create_user_and_login(client, f"{prefix}2", f"{prefix}2@example.com")
+    room_id = (
+        await client.post(
+            "/api/rooms",
+            json={"other_user_id": user2_id},
+            headers={"Authorization": f"Bearer {token1}"},
+        )
+    ).json()["id"]
+    message_ids = []
+    for i in range(count):
+        response = await client.post(
+            f"/api/rooms/{room_id}/messages",
+            json={"content": f"Message {i}"},
+            headers={"Authorization": f"Bearer {token1}"},
+        )
+        message_ids.append(response.json()["id"])
+    return room_id, message_ids, token1, token2, user2_id
+
+
+async def unread_count(client: AsyncClient, room_id: str, token: str) -> int:
+    response = await client.get(
+        f"/api/rooms/{room_id}/unread", headers={"Authorization": f"Bearer {token}"}
+    )
+    return response.json()["unread_count"]
+
+
+class TestReadWatermark:
+    """멤버별 읽음 워터마크 테스트"""
+
+    async def test_mark_as_read_advances_watermark(self, client: AsyncClient):
+        """메시지를 읽으면 그 이전 메시지도 모두 읽음"""
+        room_id, message_ids, _, token2, _ = await create_room_with_messages(client, "wm", 3)
+
+        await client.post(
+            f"/api/messages/{message_ids[1]}/read", headers={"Authorization": f"Bearer {token2}"}
+        )
+        assert await unread_count(client, room_id, token2) == 1
+
+        # 이전 메시지를 읽어도 워터마크는 뒤로 가지 않음
+        await client.post(
+            f"/api/messages/{message_ids[0]}/read", headers={"Authorization": f"Bearer {token2}"}
+        )
+        assert await unread_count(client, room_id, token2) == 1
+
+    async def test_new_messages_after_read_all(self, client: AsyncClient):
+        """전체 읽음 이후 도착한 메시지만 안 읽음"""
+        room_id, _, token1, token2, _ = await create_room_with_messages(client, "wmnew", 4)
+
+        response = await client.post(
+            f"/api/rooms/{room_id}/read-all", headers={"Authorization": f"Bearer {token2}"}
+        )
+        assert response.json()["marked_count"] == 4
+
+        response = await client.post(
+            f"/api/rooms/{room_id}/read-all", headers={"Authorization": f"Bearer {token2}"}
+        )
+        assert response.json()["marked_count"] == 0
+
+        await client.post(
+            f"/api/rooms/{room_id}/messages",
+            json={"content": "later"},
+            headers={"Authorization": f"Bearer {token1}"},
+        )
+        assert await unread_count(client, room_id, token2) == 1
+
+    async def test_read_receipts_opt_in(
+        self, client: AsyncClient, async_session: AsyncSession, monkeypatch
+    ):
+        """read_receipts 설정 시에만 메시지별 읽음 기록 저장"""
+        from src.core.config import settings
+
+        room_id, message_ids, _, token2, user2_id = await create_room_with_messages(
+            client, "receipt", 3
+        )
+        await client.post(
+            f"/api/messages/{message_ids[0]}/read", headers={"Authorization": f"Bearer {token2}"}
+        )
+        result = await async_session.execute(
+            select(MessageRead).where(MessageRead.user_id == user2_id)
+        )
+        assert result.scalars().all() == []
+
+        monkeypatch.setattr(settings, "read_receipts", True)
+        await client.post(
+            f"/api/rooms/{room_id}/read-all", headers={"Authorization": f"Bearer {token2}"}
+        )
+        result = await async_session.execute(
+            select(MessageRead.message_id).where(MessageRead.user_id == user2_id)
+        )
+        # 워터마크 이후에 새로 읽은 메시지만 기록
+        assert set(result.scalars().all()) == set(message_ids[1:])
+
+
+class TestReadWatermarkMigration:
+    """message_reads → 워터마크 마이그레이션 테스트"""
+
+    def test_upgrade_backfills_latest_read_message(self, tmp_path):
+        """기존 읽음 기록에서 가장 최근 메시지를 워터마크로 설정"""
+        from datetime import datetime, timedelta
+
+        from sqlalchemy import create_engine, inspect
+
+        from src.migrations.read_watermark import upgrade
+        from src.models import Base
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        Base.metadata.create_all(engine)
+        base = datetime(2025, 1, 1)
+        with engine.begin() as conn:
+            # 워터마크 도입 이전 스키마 재현
+            conn.exec_driver_sql("ALTER TABLE chat_room_members DROP COLUMN last_read_at")
+            conn.exec_driver_sql("ALTER TABLE chat_room_members DROP COLUMN last_read_message_id")
+            conn.exec_driver_sql(
+                "INSERT INTO users (id, username, email, password_hash, is_active, created_at) "
+                "VALUES ('u1', 'a', 'a@x', 'h', 1, ?), ('u2', 'b', 'b@x', 'h', 1, ?)",
+                (base, base),
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO chat_rooms (id, created_at) VALUES ('r1', ?)", (base,)
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO chat_room_members (room_id, user_id, joined_at) "
+                "VALUES ('r1', 'u1', ?), ('r1', 'u2', ?)",
+                (base, base),
+            )
+            for i in range(3):
+                conn.exec_driver_sql(
+                    "INSERT INTO messages (id, room_id, sender_id, content, created_at, seq) "
+                    "VALUES (?, 'r1', 'u1', 'hi', ?, ?)",
+                    (f"m{i}", base + timedelta(seconds=i), i + 1),
+                )
+            conn.exec_driver_sql(
+                "INSERT INTO message_reads (message_id, user_id, read_at) "
+                "VALUES ('m0', 'u2', ?), ('m1', 'u2', ?)",
+                (base, base),
+            )
+
+        with engine.begin() as conn:
+            assert upgrade(conn) is True
+        with engine.begin() as conn:
+            assert upgrade(conn) is False
+            rows = dict(
+                conn.exec_driver_sql(
+                    "SELECT user_id, last_read_message_id FROM chat_room_members"
+                ).all()
+            )
+
+        assert rows == {"u1": None, "u2": "m1"}
+        columns = {c["name"] for c in inspect(engine).get_columns("chat_room_members")}
+        assert "last_read_at" in columns
+        engine.dispose()
+
+
+class TestBulkReadReceipts:
+    """대규모 채팅방 읽음 기록 일괄 저장 테스트"""
+
+    async def seed_messages(
+        self, async_session: AsyncSession, room_id: str, sender_id: str, count: int
+    ):
+        """메시지를 ORM 없이 대량 삽입하고 ID 목록 반환"""
+        from datetime import datetime, timedelta
+
+        from sqlalchemy import insert
+
+        from src.models.message import Message
+
+        base = datetime(2025, 1, 1)
+        rows = [
+            {
+                "id": f"{room_id[:8]}-{i:06d}",
+                "room_id": room_id,
+                "sender_id": sender_id,
+                "content": "bulk",
+                "created_at": base + timedelta(milliseconds=i),
+                "seq": i + 1,
+            }
+            for i in range(count)
+        ]
+        await async_session.execute(insert(Message), rows)
+        await async_session.commit()
+        return [row["id"] for row in rows]
+
+    async def test_large_room_single_insert_select(
+        self, client: AsyncClient, async_session: AsyncSession, count_queries, monkeypatch
+    ):
+        """5천 개 메시지 전체 읽음이 INSERT ... SELECT 한 문장으로 처리"""
+        from sqlalchemy import func
+
+        from src.core.config import settings
+        from src.models.room import ChatRoomMember
+
+        monkeypatch.setattr(settings, "read_receipts", True)
+        room_id, _, _, token2, user2_id = await create_room_with_messages(client, "bulk", 0)
+        members = await async_session.execute(
+            select(ChatRoomMember.user_id).where(ChatRoomMember.room_id == room_id)
+        )
+        sender_id = next(uid for uid in members.scalars() if uid != user2_id)
+        await self.seed_messages(async_session, room_id, sender_id, 5000)
+
+        with count_queries() as statements:
+            response = await client.post(
+                f"/api/rooms/{room_id}/read-all", headers={"Authorization": f"Bearer {token2}"}
+            )
+
+        assert response.json()["marked_count"] == 5000
+        inserts = [s for s in statements if s.startswith("INSERT INTO message_reads")]
+        assert len(inserts) == 1
+        assert "SELECT" in inserts[0] and "ON CONFLICT" in inserts[0]
+
+        count = await async_session.execute(
+            select(func.count()).select_from(MessageRead).where(MessageRead.user_id == user2_id)
+        )
+        assert count.scalar() == 5000
+        assert await unread_count(client, room_id, token2) == 0
+
+    async def test_existing_receipts_do_not_conflict(
+        self, client: AsyncClient, async_session: AsyncSession, monkeypatch
+    ):
+        """이미 있는 읽음 기록은 건너뜀 (ON CONFLICT DO NOTHING)"""
+        from sqlalchemy import func
+
+        from src.core.config import settings
+
+        monkeypatch.setattr(settings, "read_receipts", True)
+        room_id, message_ids, _, token2, user2_id = await create_room_with_messages(
+            client, "overlap", 3
+        )
+        # 워터마크 없이 읽음 기록만 있는 상태 (read_receipts 이전 데이터 등)
+        async_session.add(MessageRead(message_id=message_ids[2], user_id=user2_id))
+        await async_session.commit()
+
+        response = await client.post(
+            f"/api/rooms/{room_id}/read-all", headers={"Authorization": f"Bearer {token2}"}
+        )
+        assert response.status_code == 200
+
+        count = await async_session.execute(
+            select(func.count()).select_from(MessageRead).where(MessageRead.user_id == user2_id)
+        )
+        assert count.scalar() == 3
+
+    def test_postgres_statement(self):
+        """PostgreSQL 방언으로도 ON CONFLICT DO NOTHING 생성"""
+        from datetime import datetime
+
+        from sqlalchemy.dialects import postgresql
+
+        from src.models.room import ChatRoomMember
+        from src.repositories.message import mark_read_receipts_stmt
+
+        member = ChatRoomMember(room_id="r1", user_id="u1")
+        stmt = mark_read_receipts_stmt("postgresql", member, (datetime(2025, 1, 1), "m1"))
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("INSERT INTO message_reads")
+        assert "SELECT" in sql
+        assert "ON CONFLICT (message_id, user_id) DO NOTHING" in sql
@@ -106,3 +106,96 @@ class TestChatRoom:
             json={"other_user_id": "some-user-id"},
         )
         assert response.status_code == 401
+
+
+class TestRoomQueries:
+    """채팅방 쿼리 수 테스트"""
+
+    async def test_list_rooms_query_count_is_constant(self, client: AsyncClient, count_queries):
+        """채팅방 수가 늘어도 list_rooms 쿼리 수는 일정"""
+        token, _ = await create_user_and_login(client, "manyrooms", "manyrooms@example.com")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        async def create_rooms(start: int, count: int):
+            for i in range(start, start + count):
+                _, other_id = await create_user_and_login(
+                    client, f"peer{i}", f"peer{i}@example.com"
+                )
+                await client.post("/api/rooms", json={"other_user_id": other_id}, headers=headers)
+
+        await create_rooms(0, 2)
+        with count_queries() as few:
+            response = await client.get("/api/rooms", headers=headers)
+        assert len(response.json()) == 2
+
+        await create_rooms(2, 10)
+        with count_queries() as many:
+            response = await client.get("/api/rooms", headers=headers)
+        assert len(response.json()) == 12
+        assert all(len(room["members"]) == 2 for room in response.json())
+
+        # 인증 사용자 조회 1 + 채팅방 1 + 멤버 selectin 1
+        assert len(many) == len(few) <= 3
+
+    async def test_existing_room_lookup_by_pair_key(self, client: AsyncClient, count_queries):
+        """기존 1:1 채팅방은 참여자 쌍 키로 한 번에 조회 (순서 무관)"""
+        token1, user1_id = await create_user_and_login(client, "pair1", "pair1@example.com")
+        token2, user2_id = await create_user_and_login(client, "pair2", "pair2@example.com")
+
+        created = await client.post(
+            "/api/rooms",
+            json={"other_user_id": user2_id},
+            headers={"Authorization": f"Bearer {token1}"},
+        )
+        with count_queries() as statements:
+            existing = await client.post(
+                "/api/rooms",
+                json={"other_user_id": user1_id},
+                headers={"Authorization": f"Bearer {token2}"},
+            )
+
+        assert existing.json()["id"] == created.json()["id"]
+        room_queries = [s for s in statements if "FROM chat_rooms" in s]
+        assert len(room_queries) == 1
+        assert "direct_key" in room_queries[0]
+
+
+class TestDirectRoomKeyMigration:
+    """참여자 쌍 키 마이그레이션 테스트"""
+
+    def test_upgrade_backfills_direct_key(self, tmp_path):
+        """멤버 2명 채팅방에 키를 채우고 중복 쌍은 첫 채팅방만 유지"""
+        from datetime import datetime, timedelta
+
+        from sqlalchemy import create_engine
+
+        from src.migrations.direct_room_key import upgrade
+        from src.models import Base
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        Base.metadata.create_all(engine)
+        base = datetime(2025, 1, 1)
+        with engine.begin() as conn:
+            # direct_key 도입 이전 스키마 재현 (UNIQUE 컬럼은 DROP할 수 없어 테이블 재생성)
+            conn.exec_driver_sql("DROP TABLE chat_rooms")
+            conn.exec_driver_sql(
+                "CREATE TABLE chat_rooms (id VARCHAR(36) PRIMARY KEY, created_at DATETIME)"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO chat_rooms (id, created_at) VALUES ('r1', ?), ('r2', ?), ('r3', ?)",
+                (base, base + timedelta(seconds=1), base + timedelta(seconds=2)),
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO chat_room_members (room_id, user_id, joined_at) VALUES "
+                "('r1', 'b', ?), ('r1', 'a', ?), ('r2', 'a', ?), ('r2', 'b', ?), ('r3', 'a', ?)",
+                (base,) * 5,
+            )
+
+        with engine.begin() as conn:
+            assert upgrade(conn) is True
+        with engine.begin() as conn:
+            assert upgrade(conn) is False
+            keys = dict(conn.exec_driver_sql("SELECT id, direct_key FROM chat_rooms").all())
+
+        assert keys == {"r1": "a:b", "r2": None, "r3": None}
+        engine.dispose()
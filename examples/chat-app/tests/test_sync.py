@@ -0,0 +1,363 @@
+"""재연결 동기화 API 테스트"""
+
+import uuid
+
+import h11
+import httpx
+import pytest
+from httpx import AsyncClient
+
+
+async def create_user_and_login(client: AsyncClient, username: str, email: str):
+    """테스트 유틸: 사용자 생성 및 로그인"""
+    reg_response = await client.post(
+        "/api/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    user_id = reg_response.json()["id"]
+
+    login_response = await client.post(
+        "/api/auth/login",
+        json={"username": username, "password": "password123"},
+    )
+    return login_response.json()["access_token"], user_id
+
+
+async def create_room(client: AsyncClient, token: str, other_user_id: str) -> str:
+    response = await client.post(
+        "/api/rooms",
+        json={"other_user_id": other_user_id},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    return response.json()["id"]
+
+
+async def send(client: AsyncClient, token: str, room_id: str, content: str) -> dict:
+    response = await client.post(
+        f"/api/rooms/{room_id}/messages",
+        json={"content": content},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    return response.json()
+
+
+async def sync(client: AsyncClient, token: str, since: str | None = None, **params) -> dict:
+    response = await client.post(
+        "/api/sync", json={"since": since, **params}, headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def parses_within_header_limit(request: httpx.Request, segment: int = 1460) -> bool:
+    """uvicorn 기본 HTTP 파서(h11)가 요청을 받아들이는지 확인
+
+    h11은 요청 줄+헤더가 완성되기 전에 버퍼가 16KB를 넘으면 요청을 거부한다.
+    네트워크처럼 TCP 세그먼트 크기로 나눠 넣는다.
+    """
+    lines = [f"{request.method} {request.url.raw_path.decode()} HTTP/1.1"]
+    lines += [f"{name}: {value}" for name, value in request.headers.items()]
+    raw = ("\r\n".join(lines) + "\r\n\r\n").encode() + request.content
+    connection = h11.Connection(h11.SERVER)
+    try:
+        for start in range(0, len(raw), segment):
+            connection.receive_data(raw[start : start + segment])
+            event = connection.next_event()
+            if isinstance(event, h11.Request):
+                return True
+    except h11.RemoteProtocolError:
+        return False
+    return False
+
+
+@pytest.fixture(autouse=True)
+def fresh_status(monkeypatch):
+    """테스트마다 빈 온라인 상태 관리자 사용"""
+    from src.api.routes import sync as sync_module
+    from src.websocket.status import OnlineStatusManager
+
+    status = OnlineStatusManager()
+    monkeypatch.setattr(sync_module, "status_manager", status)
+    return status
+
+
+class TestMessageSeq:
+    """채팅방별 메시지 시퀀스 테스트"""
+
+    async def test_seq_increments_per_room(self, client: AsyncClient):
+        """seq는 채팅방마다 1부터 증가"""
+        token1, _ = await create_user_and_login(client, "sequser1", "seq1@example.com")
+        _, user2_id = await create_user_and_login(client, "sequser2", "seq2@example.com")
+        _, user3_id = await create_user_and_login(client, "sequser3", "seq3@example.com")
+        room_a = await create_room(client, token1, user2_id)
+        room_b = await create_room(client, token1, user3_id)
+
+        seqs_a = [(await send(client, token1, room_a, f"a{i}"))["seq"] for i in range(3)]
+        seqs_b = [(await send(client, token1, room_b, f"b{i}"))["seq"] for i in range(2)]
+
+        assert seqs_a == [1, 2, 3]
+        assert seqs_b == [1, 2]
+
+    def test_migration_backfills_seq(self, tmp_path):
+        """기존 메시지에 (created_at, id) 순서로 seq를 채움"""
+        from datetime import datetime, timedelta
+
+        from sqlalchemy import create_engine, inspect
+
+        from src.migrations.message_seq import upgrade
+        from src.models import Base
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        Base.metadata.create_all(engine)
+        base = datetime(2025, 1, 1)
+        with engine.begin() as conn:
+            # seq 도입 이전 스키마 재현
+            conn.exec_driver_sql("DROP INDEX ix_messages_room_seq")
+            conn.exec_driver_sql("DROP INDEX ix_chat_room_members_user")
+            conn.exec_driver_sql("ALTER TABLE messages DROP COLUMN seq")
+            conn.exec_driver_sql(
+                "INSERT INTO chat_rooms (id, created_at) VALUES ('r1', ?), ('r2', ?)", (base, base)
+            )
+            for room_id, message_id, offset in [
+                ("r1", "m-b", 1),
+                ("r1", "m-a", 1),
+                ("r2", "m-c", 0),
+                ("r1", "m-d", 0),
+            ]:
+                conn.exec_driver_sql(
+                    "INSERT INTO messages (id, room_id, content, created_at) VALUES (?, ?, 'x', ?)",
+                    (message_id, room_id, base + timedelta(seconds=offset)),
+                )
+
+        with engine.begin() as conn:
+            assert upgrade(conn) is True
+        with engine.begin() as conn:
+            assert upgrade(conn) is False
+            rows = dict(conn.exec_driver_sql("SELECT id, seq FROM messages").all())
+
+        assert rows == {"m-d": 1, "m-a": 2, "m-b": 3, "m-c": 1}
+        indexes = {i["name"] for i in inspect(engine).get_indexes("messages")}
+        assert "ix_messages_room_seq" in indexes
+        engine.dispose()
+
+
+class TestSync:
+    """GET /api/sync 테스트"""
+
+    async def test_initial_sync_returns_position(self, client: AsyncClient):
+        """since가 없으면 메시지 없이 현재 위치와 안 읽은 수를 반환"""
+        token1, _ = await create_user_and_login(client, "syncinit1", "syncinit1@example.com")
+        token2, user2_id = await create_user_and_login(client, "syncinit2", "syncinit2@example.com")
+        room_id = await create_room(client, token1, user2_id)
+        for i in range(3):
+            await send(client, token1, room_id, f"hello {i}")
+
+        data = await sync(client, token2)
+
+        assert data["messages"] == []
+        assert data["unread_counts"] == {room_id: 3}
+        assert data["presence_reset"] is True
+        assert data["has_more"] is False
+
+        # 바로 다시 동기화하면 변경 없음
+        again = await sync(client, token2, data["cursor"])
+        assert again["messages"] == []
+        assert again["unread_counts"] == {}
+
+    async def test_returns_missed_messages_across_rooms(self, client: AsyncClient):
+        """커서 이후 모든 채팅방의 새 메시지만 seq 순으로 반환"""
+        token1, user1_id = await create_user_and_login(client, "syncmiss1", "syncmiss1@example.com")
+        token2, user2_id = await create_user_and_login(client, "syncmiss2", "syncmiss2@example.com")
+        token3, user3_id = await create_user_and_login(client, "syncmiss3", "syncmiss3@example.com")
+        room_a = await create_room(client, token1, user2_id)
+        room_b = await create_room(client, token3, user1_id)
+        await send(client, token1, room_a, "before")
+
+        cursor = (await sync(client, token1))["cursor"]
+
+        await send(client, token2, room_a, "a1")
+        await send(client, token2, room_a, "a2")
+        await send(client, token3, room_b, "b1")
+        await send(client, token1, room_b, "mine")
+
+        data = await sync(client, token1, cursor)
+        by_room = {}
+        for message in data["messages"]:
+            by_room.setdefault(message["room_id"], []).append((message["seq"], message["content"]))
+
+        assert by_room == {room_a: [(2, "a1"), (3, "a2")], room_b: [(1, "b1"), (2, "mine")]}
+        # 안 읽은 수에는 내가 보낸 메시지가 포함되지 않음
+        assert data["unread_counts"] == {room_a: 2, room_b: 1}
+
+        after = await sync(client, token1, data["cursor"])
+        assert after["messages"] == []
+
+    async def test_has_more_pages_with_cursor(self, client: AsyncClient):
+        """채팅방별 limit을 넘으면 has_more이고 커서로 이어서 받음"""
+        token1, _ = await create_user_and_login(client, "syncpage1", "syncpage1@example.com")
+        token2, user2_id = await create_user_and_login(client, "syncpage2", "syncpage2@example.com")
+        room_id = await create_room(client, token1, user2_id)
+        cursor = (await sync(client, token2))["cursor"]
+        for i in range(5):
+            await send(client, token1, room_id, f"m{i}")
+
+        seen = []
+        while True:
+            data = await sync(client, token2, cursor, limit=2)
+            seen.extend(message["seq"] for message in data["messages"])
+            cursor = data["cursor"]
+            if not data["has_more"]:
+                break
+
+        assert seen == [1, 2, 3, 4, 5]
+
+    async def test_behind_in_more_rooms_than_compound_select_limit(
+        self, client: AsyncClient, async_session
+    ):
+        """SQLite 복합 SELECT 항 수 상한(500)보다 많은 채팅방이 밀려도 동기화됨"""
+        from src.models.message import Message
+        from src.models.room import ChatRoom, ChatRoomMember
+
+        token1, user1_id = await create_user_and_login(client, "syncwide1", "syncwide1@example.com")
+        _, user2_id = await create_user_and_login(client, "syncwide2", "syncwide2@example.com")
+        # 실제 ID와 같은 36자 (정렬 순서 유지)
+        room_ids = [f"wide-{n:04d}-{uuid.uuid4().hex[:26]}" for n in range(600)]
+        async_session.add_all(ChatRoom(id=room_id) for room_id in room_ids)
+        async_session.add_all(
+            ChatRoomMember(room_id=room_id, user_id=user_id)
+            for room_id in room_ids
+            for user_id in (user1_id, user2_id)
+        )
+        await async_session.commit()
+        cursor = (await sync(client, token1))["cursor"]
+
+        async_session.add_all(
+            Message(room_id=room_id, sender_id=user2_id, content=room_id, seq=1)
+            for room_id in room_ids
+        )
+        await async_session.commit()
+
+        data = await sync(client, token1, cursor)
+
+        assert [m["room_id"] for m in data["messages"]] == room_ids
+        assert len(data["unread_counts"]) == 600
+        assert data["has_more"] is False
+
+        # 600개 채팅방의 커서는 쿼리 문자열로는 요청 줄 한도를 넘고 본문으로는 전달됨
+        headers = {"Authorization": f"Bearer {token1}"}
+        get = client.build_request(
+            "GET", "/api/sync", params={"since": data["cursor"]}, headers=headers
+        )
+        post = client.build_request(
+            "POST", "/api/sync", json={"since": data["cursor"]}, headers=headers
+        )
+        assert len(get.url.raw_path) > 8 * 1024  # nginx 기본 요청 줄 한도
+        assert not parses_within_header_limit(get)
+        assert parses_within_header_limit(post)
+
+    async def test_idle_sync_is_single_query(self, client: AsyncClient, count_queries):
+        """변경이 없는 재동기화는 채팅방 위치 조회 한 번"""
+        token1, _ = await create_user_and_login(client, "syncidle1", "syncidle1@example.com")
+        _, user2_id = await create_user_and_login(client, "syncidle2", "syncidle2@example.com")
+        room_id = await create_room(client, token1, user2_id)
+        await send(client, token1, room_id, "hello")
+        cursor = (await sync(client, token1))["cursor"]
+
+        with count_queries() as statements:
+            data = await sync(client, token1, cursor)
+
+        assert data["messages"] == [] and data["presence"] == []
+        assert len(statements) == 1
+
+    async def test_presence_changes_since_cursor(self, client: AsyncClient, fresh_status):
+        """같은 채팅방 사용자의 온라인 상태 변경만 반환"""
+        token1, _ = await create_user_and_login(client, "syncpres1", "syncpres1@example.com")
+        _, user2_id = await create_user_and_login(client, "syncpres2", "syncpres2@example.com")
+        _, stranger_id = await create_user_and_login(client, "syncpres3", "syncpres3@example.com")
+        await create_room(client, token1, user2_id)
+
+        initial = await sync(client, token1)
+        assert initial["presence"] == [{"user_id": user2_id, "is_online": False}]
+
+        fresh_status.add_connection(user2_id)
+        fresh_status.add_connection(stranger_id)
+        data = await sync(client, token1, initial["cursor"])
+
+        assert data["presence_reset"] is False
+        assert data["presence"] == [{"user_id": user2_id, "is_online": True}]
+
+    async def test_presence_reset_for_other_epoch(self, client: AsyncClient, monkeypatch):
+        """다른 워커(재시작)의 커서면 전체 온라인 상태를 반환"""
+        from src.api.routes import sync as sync_module
+        from src.websocket.status import OnlineStatusManager
+
+        token1, _ = await create_user_and_login(client, "syncepoch1", "syncepoch1@example.com")
+        _, user2_id = await create_user_and_login(client, "syncepoch2", "syncepoch2@example.com")
+        await create_room(client, token1, user2_id)
+        cursor = (await sync(client, token1))["cursor"]
+
+        restarted = OnlineStatusManager()
+        restarted.add_connection(user2_id)
+        monkeypatch.setattr(sync_module, "status_manager", restarted)
+        data = await sync(client, token1, cursor)
+
+        assert data["presence_reset"] is True
+        assert data["presence"] == [{"user_id": user2_id, "is_online": True}]
+
+    async def test_invalid_cursor(self, client: AsyncClient):
+        """잘못된 커서는 400"""
+        token1, _ = await create_user_and_login(client, "syncbad1", "syncbad1@example.com")
+        headers = {"Authorization": f"Bearer {token1}"}
+
+        response = await client.post("/api/sync", json={"since": "not-a-cursor"}, headers=headers)
+        assert response.status_code == 400
+        response = await client.get(
+            "/api/sync", params={"since": "not-a-cursor"}, headers=headers
+        )
+        assert response.status_code == 400
+
+    async def test_query_string_cursor_still_supported(self, client: AsyncClient):
+        """GET ?since= 커서도 POST와 같은 결과"""
+        token1, _ = await create_user_and_login(client, "syncget1", "syncget1@example.com")
+        _, user2_id = await create_user_and_login(client, "syncget2", "syncget2@example.com")
+        room_id = await create_room(client, token1, user2_id)
+        cursor = (await sync(client, token1))["cursor"]
+        await send(client, token1, room_id, "hello")
+
+        response = await client.get(
+            "/api/sync",
+            params={"since": cursor, "limit": 10},
+            headers={"Authorization": f"Bearer {token1}"},
+        )
+        assert response.status_code == 200
+        assert response.json() == await sync(client, token1, cursor, limit=10)
+
+
+class TestPresenceLog:
+    """온라인 상태 변경 기록 테스트"""
+
+    def test_changes_since_latest_state(self):
+        """버전 이후 사용자별 마지막 상태만 반환"""
+        from src.websocket.status import OnlineStatusManager
+
+        status = OnlineStatusManager()
+        status.add_connection("u1")
+        version = status.version
+        status.add_connection("u2")
+        status.remove_connection("u1")
+        status.add_connection("u2")  # 이미 온라인 → 변경 아님
+
+        assert status.changes_since(status.epoch, version) == {"u2": True, "u1": False}
+        assert status.changes_since(status.epoch, status.version) == {}
+
+    def test_truncated_log_requires_reset(self):
+        """기록이 밀려난 버전이나 다른 epoch이면 None"""
+        from src.websocket.status import OnlineStatusManager
+
+        status = OnlineStatusManager(log_size=2)
+        for n in range(4):
+            status.add_connection(f"u{n}")
+
+        assert status.changes_since(status.epoch, 0) is None
+        assert status.changes_since(status.epoch, 2) == {"u2": True, "u3": True}
+        assert status.changes_since("other", 2) is None
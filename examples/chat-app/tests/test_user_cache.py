@@ -0,0 +1,200 @@
+"""인증 사용자 캐시 테스트"""
+
+import dataclasses
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+
+from src.core.cache import TTLCache
+from src.core.user_cache import user_cache
+from src.models.user import User
+
+
+async def create_user_and_login(client: AsyncClient, username: str, email: str):
+    """테스트 유틸: 사용자 생성 및 로그인 후 토큰 쌍과 사용자 ID 반환"""
+    reg_response = await client.post(
+        "/api/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    user_id = reg_response.json()["id"]
+
+    login_response = await client.post(
+        "/api/auth/login",
+        json={"username": username, "password": "password123"},
+    )
+    return login_response.json(), user_id
+
+
+class TestTTLCache:
+    """TTL + LRU 캐시 테스트"""
+
+    def test_expires_after_ttl(self):
+        """TTL이 지난 항목은 조회되지 않음"""
+        now = [0.0]
+        cache = TTLCache(maxsize=10, ttl=5, clock=lambda: now[0])
+        cache.set("a", 1)
+
+        now[0] = 4.9
+        assert cache.get("a") == 1
+        now[0] = 5.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """용량을 넘으면 가장 오래 사용하지 않은 항목 제거"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_zero_ttl_disables_cache(self):
+        """TTL 0이면 저장하지 않음"""
+        cache = TTLCache(maxsize=10, ttl=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+
+class TestCurrentUserCache:
+    """get_current_user 캐시 테스트"""
+
+    async def test_cached_user_skips_database(self, client: AsyncClient, count_queries):
+        """캐시된 사용자는 인증에 DB 조회가 없음"""
+        tokens, user_id = await create_user_and_login(client, "cacheuser", "cache@example.com")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+        response = await client.get("/api/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert user_id in user_cache
+
+        with count_queries() as statements:
+            response = await client.get("/api/auth/me", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["username"] == "cacheuser"
+        assert statements == []
+
+    async def test_snapshot_excludes_password_hash(self, client: AsyncClient):
+        """캐시된 스냅샷에는 password_hash가 없고 수정할 수 없음"""
+        tokens, user_id = await create_user_and_login(client, "nohash", "nohash@example.com")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        assert (await client.get("/api/auth/me", headers=headers)).status_code == 200
+
+        snapshot = user_cache.get(user_id)
+        assert snapshot is not None
+        assert not hasattr(snapshot, "password_hash")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.is_active = False  # type: ignore[misc]
+
+    async def test_password_change_takes_effect_immediately(
+        self, client: AsyncClient, async_session
+    ):
+        """비밀번호 변경 직후 이전 비밀번호로 로그인할 수 없음"""
+        from src.core.security import password_hasher
+
+        tokens, user_id = await create_user_and_login(client, "pwchange", "pwchange@example.com")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        assert (await client.get("/api/auth/me", headers=headers)).status_code == 200
+
+        user = (await async_session.execute(select(User).where(User.id == user_id))).scalar_one()
+        user.password_hash = await password_hasher.hash("newpassword123")
+        await async_session.commit()
+
+        old = await client.post(
+            "/api/auth/login", json={"username": "pwchange", "password": "password123"}
+        )
+        new = await client.post(
+            "/api/auth/login", json={"username": "pwchange", "password": "newpassword123"}
+        )
+        assert old.status_code == 401
+        assert new.status_code == 200
+
+    async def test_deactivation_invalidates_cache(
+        self, client: AsyncClient, async_session
+    ):
+        """ORM으로 비활성화하면 캐시가 무효화되어 바로 거부됨"""
+        tokens, user_id = await create_user_and_login(client, "deactivated", "deact@example.com")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        assert (await client.get("/api/auth/me", headers=headers)).status_code == 200
+
+        user = (await async_session.execute(select(User).where(User.id == user_id))).scalar_one()
+        user.is_active = False
+        await async_session.commit()
+
+        assert user_id not in user_cache
+        response = await client.get("/api/auth/me", headers=headers)
+        assert response.status_code == 401
+
+    async def test_session_bulk_update_invalidates_cache(
+        self, client: AsyncClient, async_session
+    ):
+        """세션으로 실행한 update(User) 문도 캐시를 무효화"""
+        tokens, user_id = await create_user_and_login(client, "bulkupd", "bulkupd@example.com")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        assert (await client.get("/api/auth/me", headers=headers)).status_code == 200
+        assert user_id in user_cache
+
+        await async_session.execute(
+            update(User).where(User.id == user_id).values(is_active=False)
+        )
+        await async_session.commit()
+
+        assert user_id not in user_cache
+        response = await client.get("/api/auth/me", headers=headers)
+        assert response.status_code == 401
+
+    async def test_last_seen_flush_invalidates_cache(self, client: AsyncClient, async_engine):
+        """presence의 Core UPDATE로 저장한 last_seen_at이 상태 조회에 반영"""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.websocket.presence import PresenceTracker
+
+        tokens, _ = await create_user_and_login(client, "seer", "seer@example.com")
+        _, user_id = await create_user_and_login(client, "seen", "seen@example.com")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        response = await client.get(f"/api/users/{user_id}/status", headers=headers)
+        assert response.json()["last_seen_at"] is None
+        assert user_id in user_cache
+
+        tracker = PresenceTracker()
+        await tracker.start(MagicMock(), AsyncMock(), async_engine)
+        tracker.touch("ws", user_id)
+        await tracker.stop()
+
+        assert user_id not in user_cache
+        response = await client.get(f"/api/users/{user_id}/status", headers=headers)
+        assert response.json()["last_seen_at"] is not None
+
+    async def test_logout_all_revokes_tokens(self, client: AsyncClient):
+        """logout-all 후 이전 access/refresh 토큰 모두 거부"""
+        tokens, _ = await create_user_and_login(client, "revoker", "revoker@example.com")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        assert (await client.get("/api/auth/me", headers=headers)).status_code == 200
+
+        response = await client.post("/api/auth/logout-all", headers=headers)
+        assert response.status_code == 204
+
+        response = await client.get("/api/auth/me", headers=headers)
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Token has been revoked"
+
+        response = await client.post(
+            "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert response.status_code == 401
+
+        # 새로 로그인하면 새 버전의 토큰 발급
+        new_tokens = (
+            await client.post(
+                "/api/auth/login", json={"username": "revoker", "password": "password123"}
+            )
+        ).json()
+        response = await client.get(
+            "/api/auth/me", headers={"Authorization": f"Bearer {new_tokens['access_token']}"}
+        )
+        assert response.status_code == 200
@@ -53,3 +53,246 @@ class TestUserList:
         """인증 없이 사용자 목록 조회 실패 테스트"""
         response = await client.get("/api/users")
         assert response.status_code == 401
+
+
+class TestUserPagination:
+    """사용자 목록 페이지네이션 테스트"""
+
+    async def test_list_users_cursor(self, client: AsyncClient):
+        """limit과 X-After-Cursor로 전체 목록 순회"""
+        token = await create_user_and_login(client, "page0", "page0@example.com")
+        for n in range(1, 5):
+            await create_user_and_login(client, f"page{n}", f"page{n}@example.com")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.get("/api/users?limit=2", headers=headers)
+        assert [u["username"] for u in response.json()] == ["page0", "page1"]
+
+        seen = []
+        url = "/api/users?limit=2"
+        while True:
+            response = await client.get(url, headers=headers)
+            seen.extend(u["username"] for u in response.json())
+            cursor = response.headers.get("X-After-Cursor")
+            if cursor is None:
+                break
+            url = f"/api/users?limit=2&after={cursor}"
+
+        assert seen == [f"page{n}" for n in range(5)]
+
+    async def test_list_users_invalid_cursor(self, client: AsyncClient):
+        """잘못된 커서는 400"""
+        token = await create_user_and_login(client, "badcursor", "badcursor@example.com")
+        response = await client.get(
+            "/api/users?after=!!!", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 400
+
+
+class TestUserSearchIndex:
+    """사용자 검색 인덱스 테스트"""
+
+    async def test_ranked_exact_prefix_substring(self, client: AsyncClient):
+        """정확 일치 → 접두어 → 부분 일치 순으로 정렬"""
+        token = await create_user_and_login(client, "xbob", "xbob@example.com")
+        await create_user_and_login(client, "bobby", "bobby@example.com")
+        await create_user_and_login(client, "bob", "bob@example.com")
+        await create_user_and_login(client, "alice", "alice@example.com")
+
+        response = await client.get(
+            "/api/users/search?q=BOB", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 200
+        assert [u["username"] for u in response.json()] == ["bob", "bobby", "xbob"]
+
+    async def test_search_cursor_pagination(self, client: AsyncClient):
+        """검색 결과를 커서로 나눠 받아도 순서가 유지됨"""
+        token = await create_user_and_login(client, "team", "team@example.com")
+        for name in ["teamlead", "teammate", "myteam", "ourteam"]:
+            await create_user_and_login(client, name, f"{name}@example.com")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        seen = []
+        url = "/api/users/search?q=team&limit=2"
+        while True:
+            response = await client.get(url, headers=headers)
+            seen.extend(u["username"] for u in response.json())
+            cursor = response.headers.get("X-After-Cursor")
+            if cursor is None:
+                break
+            url = f"/api/users/search?q=team&limit=2&after={cursor}"
+
+        assert seen == ["team", "teamlead", "teammate", "myteam", "ourteam"]
+
+    async def test_short_query_matches_prefix(self, client: AsyncClient):
+        """3자 미만 검색어는 접두어 일치"""
+        token = await create_user_and_login(client, "zoe", "zoe@example.com")
+        await create_user_and_login(client, "liz", "liz@example.com")
+
+        response = await client.get(
+            "/api/users/search?q=zo", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert [u["username"] for u in response.json()] == ["zoe"]
+
+    async def test_special_characters_are_literal(self, client: AsyncClient):
+        """따옴표/와일드카드 문자는 그대로 검색"""
+        token = await create_user_and_login(client, "per_cent", "percent@example.com")
+        await create_user_and_login(client, "perxcent", "perxcent@example.com")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.get("/api/users/search?q=r_c", headers=headers)
+        assert [u["username"] for u in response.json()] == ["per_cent"]
+
+        response = await client.get('/api/users/search?q="r"', headers=headers)
+        assert response.status_code == 200
+        assert response.json() == []
+
+    async def test_sqlite_search_reads_indexes_in_order(self, async_session):
+        """SQLite 검색 단계는 users 전체 스캔/정렬 없이 인덱스 순서대로 읽음"""
+        from sqlalchemy import text
+
+        from src.repositories.user import SQLITE_TRIGRAM, user_search_stages
+
+        if not SQLITE_TRIGRAM:
+            pytest.skip("SQLite FTS5 trigram 미지원")
+
+        plans = {}
+        for rank, query in user_search_stages("sqlite", "search"):
+            compiled = query.limit(20).compile(
+                async_session.bind, compile_kwargs={"literal_binds": True}
+            )
+            rows = (await async_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))).all()
+            plans[rank] = [row[-1] for row in rows]
+
+        assert plans[0][0].startswith("SEARCH users USING INDEX ix_users_username_lower")
+        assert plans[1] == [
+            "SEARCH users USING INDEX ix_users_username_lower (<expr>>? AND <expr><?)"
+        ]
+        assert plans[2][0].startswith("SCAN users_fts VIRTUAL TABLE INDEX")
+        assert plans[2][1:] == ["SEARCH users USING INDEX sqlite_autoindex_users_1 (id=?)"]
+
+    def test_sqlite_index_survives_rowid_changes(self, tmp_path):
+        """users.rowid가 바뀌어도(VACUUM) 검색 결과가 맞고, 변경/삭제가 반영됨"""
+        from sqlalchemy import create_engine, insert
+        from sqlalchemy.orm import Session
+
+        from src.migrations.user_search_index import upgrade
+        from src.models import Base, User
+        from src.repositories.user import SQLITE_TRIGRAM, user_search_stages
+
+        if not SQLITE_TRIGRAM:
+            pytest.skip("SQLite FTS5 trigram 미지원")
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            upgrade(conn)
+            conn.execute(
+                insert(User),
+                [
+                    {"id": f"id-{n}", "username": name, "email": f"{n}@x.com", "password_hash": "x"}
+                    for n, name in enumerate(["gone", "alpha", "xxalphaxx", "beta", "ab"])
+                ],
+            )
+            conn.exec_driver_sql("DELETE FROM users WHERE id = 'id-0'")
+            conn.exec_driver_sql("UPDATE users SET username = 'alphabet' WHERE id = 'id-3'")
+            conn.exec_driver_sql("UPDATE users SET username = 'xyz' WHERE id = 'id-4'")
+        with engine.connect() as conn:
+            conn.exec_driver_sql("VACUUM")
+            fts_rows = conn.exec_driver_sql("SELECT count(*) FROM users_fts").scalar()
+
+        def search(q: str) -> list[str]:
+            with Session(engine) as session:
+                return [
+                    user.id
+                    for _, query in user_search_stages("sqlite", q)
+                    for user, _ in session.execute(query)
+                ]
+
+        assert fts_rows == 4
+        assert search("lph") == ["id-1", "id-2", "id-3"]
+        assert search("gone") == []
+        assert search("beta") == []
+        assert search("xyz") == ["id-4"]
+        engine.dispose()
+
+    def test_migration_replaces_rowid_keyed_index(self):
+        """users.rowid를 키로 쓰던 이전 users_fts를 user_id 기반으로 다시 만듦"""
+        from sqlalchemy import create_engine
+
+        from src.migrations.user_search_index import upgrade
+        from src.models import Base
+        from src.repositories.user import SQLITE_TRIGRAM
+
+        if not SQLITE_TRIGRAM:
+            pytest.skip("SQLite FTS5 trigram 미지원")
+
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE VIRTUAL TABLE users_fts USING fts5("
+                "username, content='users', content_rowid='rowid', tokenize='trigram')"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO users (id, username, email, password_hash, is_active, created_at) "
+                "VALUES ('u1', 'legacy', 'l@x.com', 'x', 1, CURRENT_TIMESTAMP)"
+            )
+            assert upgrade(conn) is True
+            assert upgrade(conn) is False
+            rows = conn.exec_driver_sql("SELECT username, user_id FROM users_fts").all()
+
+        assert rows == [("legacy", "u1")]
+        engine.dispose()
+
+    async def test_migration_indexes_existing_users(self):
+        """인덱스 생성 전에 있던 사용자도 검색됨"""
+        from sqlalchemy import create_engine, insert, select
+        from sqlalchemy.orm import Session
+
+        from src.migrations.user_search_index import upgrade
+        from src.models import Base, User
+        from src.repositories.user import SQLITE_TRIGRAM, user_search_stages
+
+        if not SQLITE_TRIGRAM:
+            pytest.skip("SQLite FTS5 trigram 미지원")
+
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                insert(User),
+                [
+                    {
+                        "id": f"id-{n}",
+                        "username": name,
+                        "email": f"{name}@example.com",
+                        "password_hash": "x",
+                    }
+                    for n, name in enumerate(["legacy", "legacyfan", "other"])
+                ],
+            )
+            assert upgrade(conn) is True
+            assert upgrade(conn) is False
+
+        with Session(engine) as session:
+            found = [
+                user.username
+                for _, query in user_search_stages("sqlite", "egac")
+                for user, _ in session.execute(query)
+            ]
+            assert found == ["legacy", "legacyfan"]
+            assert session.scalar(select(User).where(User.username == "other")) is not None
+        engine.dispose()
+
+    def test_postgres_search_uses_trigram_operator(self):
+        """PostgreSQL에서는 pg_trgm 인덱스를 타는 ILIKE로 컴파일"""
+        from sqlalchemy.dialects import postgresql
+
+        from src.repositories.user import user_search_stages
+
+        *_, (rank, query) = user_search_stages("postgresql", "search")
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert rank == 2
+        assert "ILIKE" in sql
+        assert "users_fts" not in sql
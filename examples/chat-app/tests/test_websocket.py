@@ -1,9 +1,17 @@
 """WebSocket 연결 관리자 테스트"""
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 
+def sent_messages(websocket) -> list[dict]:
+    """가짜 WebSocket에 전송된 텍스트 프레임 디코딩"""
+    return [json.loads(call.args[0]) for call in websocket.send_text.call_args_list]
+
+
 class TestConnectionManager:
     """ConnectionManager 테스트"""
 
@@ -18,7 +26,7 @@ class TestConnectionManager:
         manager.connect(user_id, websocket)
 
         assert user_id in manager.active_connections
-        assert manager.active_connections[user_id] == websocket
+        assert websocket in manager.active_connections[user_id]
 
     def test_disconnect(self):
         """연결 해제 테스트"""
@@ -56,8 +64,9 @@ class TestConnectionManager:
 
         manager.connect(user_id, websocket)
         await manager.send_personal_message(user_id, message)
+        await manager.flush()
 
-        websocket.send_json.assert_called_once_with(message)
+        assert sent_messages(websocket) == [message]
 
     async def test_broadcast_to_room(self):
         """채팅방 브로드캐스트 테스트"""
@@ -68,18 +77,18 @@ class TestConnectionManager:
         ws2 = AsyncMock()
         ws3 = AsyncMock()
 
-        manager.connect("user1", ws1)
-        manager.connect("user2", ws2)
+        manager.connect("user1", ws1, ["room1"])
+        manager.connect("user2", ws2, ["room1"])
         manager.connect("user3", ws3)  # 채팅방에 없는 사용자
 
-        room_member_ids = ["user1", "user2"]
         message = {"type": "message", "content": "Hello room!"}
 
-        await manager.broadcast_to_room(room_member_ids, message)
+        await manager.broadcast_to_room("room1", message)
+        await manager.flush()
 
-        ws1.send_json.assert_called_once_with(message)
-        ws2.send_json.assert_called_once_with(message)
-        ws3.send_json.assert_not_called()
+        assert sent_messages(ws1) == [message]
+        assert sent_messages(ws2) == [message]
+        ws3.send_text.assert_not_called()
 
     def test_get_connection_count(self):
         """연결 수 확인 테스트"""
@@ -94,3 +103,370 @@ class TestConnectionManager:
 
         manager.disconnect("user1")
         assert manager.get_connection_count() == 1
+
+
+class TestBackpressure:
+    """연결별 송신 큐 테스트"""
+
+    async def test_slow_consumer_does_not_block_others(self):
+        """느린 클라이언트가 다른 멤버 전송을 막지 않음"""
+        from src.websocket.manager import ConnectionManager
+
+        manager = ConnectionManager()
+        gate = asyncio.Event()
+
+        async def send_text(text):
+            await gate.wait()
+
+        slow = AsyncMock()
+        slow.send_text.side_effect = send_text
+        fast = AsyncMock()
+
+        manager.connect("slow", slow, ["room1"])
+        manager.connect("fast", fast, ["room1"])
+
+        message = {"type": "message", "content": "Hello room!"}
+        await asyncio.wait_for(manager.broadcast_to_room("room1", message), 0.1)
+        await asyncio.wait_for(manager.active_connections["fast"][fast].join(), 0.1)
+
+        assert sent_messages(fast) == [message]
+        assert manager.get_metrics()["slow"][0]["sent"] == 0
+
+        gate.set()
+        await manager.flush()
+        assert manager.get_metrics()["slow"][0]["sent"] == 1
+
+    async def test_drop_oldest(self):
+        """큐가 가득 차면 가장 오래된 메시지 제거"""
+        from src.websocket.manager import ConnectionManager
+
+        manager = ConnectionManager(queue_size=2, overflow_policy="drop_oldest")
+        gate = asyncio.Event()
+        sent = []
+
+        async def send_text(text):
+            await gate.wait()
+            sent.append(json.loads(text)["n"])
+
+        websocket = AsyncMock()
+        websocket.send_text.side_effect = send_text
+        manager.connect("user1", websocket)
+
+        for n in range(5):
+            await manager.send_personal_message("user1", {"type": "message", "n": n})
+        await asyncio.sleep(0)
+        # 첫 메시지는 writer가 이미 꺼내 전송 중
+        for n in range(5, 8):
+            await manager.send_personal_message("user1", {"type": "message", "n": n})
+
+        gate.set()
+        await manager.flush()
+
+        assert sent[-2:] == [6, 7]
+        assert manager.get_metrics()["user1"][0]["dropped"] > 0
+
+    async def test_disconnect_slow_consumer(self):
+        """disconnect 정책: 큐가 넘치면 연결 종료"""
+        from src.websocket.manager import ConnectionManager
+
+        manager = ConnectionManager(queue_size=1, overflow_policy="disconnect")
+        gate = asyncio.Event()
+
+        async def send_text(text):
+            await gate.wait()
+
+        websocket = AsyncMock()
+        websocket.send_text.side_effect = send_text
+        manager.connect("user1", websocket)
+
+        for n in range(3):
+            await manager.send_personal_message("user1", {"type": "message", "n": n})
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert manager.is_connected("user1") is False
+        websocket.close.assert_called_once()
+
+    async def test_coalesce_status_events(self):
+        """coalesce 정책: 같은 상태 이벤트는 최신 값으로 교체"""
+        from src.websocket.outbox import ConnectionOutbox
+
+        websocket = AsyncMock()
+        outbox = ConnectionOutbox(websocket, maxsize=2, overflow_policy="coalesce")
+        outbox._ensure_writer = lambda: None  # 전송 없이 큐 상태만 확인
+
+        outbox.put({"type": "status", "user_id": "u1", "is_online": True})
+        outbox.put({"type": "message", "content": "hi"})
+        outbox.put({"type": "status", "user_id": "u1", "is_online": False})
+
+        assert outbox.queue_depth == 2
+        assert outbox._queue[0][1].message["is_online"] is False
+        assert outbox.stats.coalesced == 1
+
+    async def test_failed_send_removes_connection(self):
+        """전송 실패 시 연결 제거"""
+        from src.websocket.manager import ConnectionManager
+
+        manager = ConnectionManager()
+        websocket = AsyncMock()
+        websocket.send_text.side_effect = RuntimeError("closed")
+        manager.connect("user1", websocket)
+
+        await manager.send_personal_message("user1", {"type": "message"})
+        await asyncio.sleep(0)
+
+        assert manager.is_connected("user1") is False
+
+    async def test_metrics(self):
+        """큐 깊이와 전송 지연 지표"""
+        from src.websocket.manager import ConnectionManager
+
+        manager = ConnectionManager()
+        manager.connect("user1", AsyncMock())
+
+        for _ in range(3):
+            await manager.send_personal_message("user1", {"type": "message"})
+        await manager.flush()
+
+        metrics = manager.get_metrics()["user1"][0]
+        assert metrics["sent"] == 3
+        assert metrics["queue_depth"] == 0
+        assert metrics["max_queue_depth"] == 3
+        assert metrics["avg_send_latency_ms"] >= 0
+
+    async def test_aggregate_metrics(self):
+        """합계 지표에는 사용자 식별자가 없음"""
+        from src.websocket.manager import ConnectionManager
+
+        manager = ConnectionManager()
+        manager.connect("user1", AsyncMock())
+        manager.connect("user2", AsyncMock())
+
+        await manager.send_personal_message("user1", {"type": "message"})
+        await manager.send_personal_message("user2", {"type": "message"})
+        await manager.send_personal_message("user2", {"type": "message"})
+        await manager.flush()
+
+        metrics = manager.get_aggregate_metrics()
+        assert metrics["sent"] == 3
+        assert metrics["queue_depth"] == 0
+        assert metrics["max_queue_depth"] == 2
+        assert "user1" not in str(metrics) and "user2" not in str(metrics)
+
+
+class TestMultiDevice:
+    """사용자별 다중 연결 테스트"""
+
+    async def test_multiple_connections_per_user(self):
+        """두 번째 탭이 첫 번째 연결을 대체하지 않음"""
+        from src.websocket.manager import ConnectionManager
+
+        manager = ConnectionManager()
+        tab1 = AsyncMock()
+        tab2 = AsyncMock()
+        manager.connect("user1", tab1)
+        manager.connect("user1", tab2)
+
+        message = {"type": "message", "content": "Hello!"}
+        await manager.send_personal_message("user1", message)
+        await manager.flush()
+
+        assert sent_messages(tab1) == [message]
+        assert sent_messages(tab2) == [message]
+        assert manager.get_connection_count() == 2
+
+        manager.disconnect("user1", tab1)
+        assert manager.is_connected("user1") is True
+        manager.disconnect("user1", tab2)
+        assert manager.is_connected("user1") is False
+
+    async def test_room_index(self):
+        """채팅방 역색인은 연결된 소켓만 유지"""
+        from src.websocket.manager import ConnectionManager
+
+        manager = ConnectionManager()
+        phone = AsyncMock()
+        laptop = AsyncMock()
+        manager.connect("user1", phone, ["room1"])
+        manager.connect("user1", laptop)
+
+        assert set(manager.room_connections["room1"]) == {phone, laptop}
+
+        manager.join_room("user1", "room2")
+        assert set(manager.room_connections["room2"]) == {phone, laptop}
+
+        manager.leave_room("user1", "room1")
+        assert "room1" not in manager.room_connections
+
+        manager.disconnect("user1")
+        assert manager.room_connections == {}
+        assert manager.active_connections == {}
+
+    def test_join_room_ignores_offline_user(self):
+        """연결되지 않은 사용자는 채팅방 색인에 추가하지 않음"""
+        from src.websocket.manager import ConnectionManager
+
+        manager = ConnectionManager()
+        manager.join_room("user1", "room1")
+
+        assert manager.room_connections == {}
+
+    def test_online_status_follows_connections(self):
+        """마지막 연결이 끊길 때 오프라인"""
+        from src.websocket.manager import ConnectionManager
+        from src.websocket.status import OnlineStatusManager
+
+        status = OnlineStatusManager()
+        manager = ConnectionManager(status=status)
+        tab1 = MagicMock()
+        tab2 = MagicMock()
+
+        manager.connect("user1", tab1)
+        manager.connect("user1", tab2)
+        assert status.is_online("user1") is True
+        assert status.get_connection_count("user1") == 2
+
+        manager.disconnect("user1", tab1)
+        assert status.is_online("user1") is True
+
+        manager.disconnect("user1", tab2)
+        assert status.is_online("user1") is False
+
+
+@pytest.fixture
+def ws_client(tmp_path, monkeypatch):
+    """WebSocket 테스트용 동기 클라이언트 (파일 DB, 단일 이벤트 루프)"""
+    from fastapi.testclient import TestClient
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import NullPool
+
+    from src.database import get_db
+    from src.main import app
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'ws.db'}", poolclass=NullPool)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    monkeypatch.setattr("src.main.engine", engine)
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+def receive_message(websocket) -> dict:
+    """presence 푸시를 건너뛰고 다음 프레임 수신"""
+    while True:
+        frame = websocket.receive_json()
+        if frame.get("type") != "presence":
+            return frame
+
+
+def register_and_login(client, username: str) -> tuple[str, str]:
+    """사용자 생성 후 (user_id, access_token) 반환"""
+    response = client.post(
+        "/api/auth/register",
+        json={"username": username, "email": f"{username}@example.com", "password": "password123"},
+    )
+    user_id = response.json()["id"]
+    response = client.post(
+        "/api/auth/login", json={"username": username, "password": "password123"}
+    )
+    return user_id, response.json()["access_token"]
+
+
+class TestWebSocketEndpoint:
+    """WebSocket 엔드포인트 테스트"""
+
+    def test_message_reaches_every_device(self, ws_client):
+        """같은 사용자의 두 연결 모두 메시지 수신"""
+        from src.websocket.status import status_manager
+
+        user1_id, token1 = register_and_login(ws_client, "wsuser1")
+        user2_id, token2 = register_and_login(ws_client, "wsuser2")
+        room_id = ws_client.post(
+            "/api/rooms",
+            json={"other_user_id": user2_id},
+            headers={"Authorization": f"Bearer {token1}"},
+        ).json()["id"]
+
+        with ws_client.websocket_connect(f"/ws?token={token2}") as tab1:
+            with ws_client.websocket_connect(f"/ws?token={token2}") as tab2:
+                assert status_manager.get_connection_count(user2_id) == 2
+
+                ws_client.post(
+                    f"/api/rooms/{room_id}/messages",
+                    json={"content": "Hello!"},
+                    headers={"Authorization": f"Bearer {token1}"},
+                )
+                assert receive_message(tab1)["message"]["content"] == "Hello!"
+                assert receive_message(tab2)["message"]["content"] == "Hello!"
+
+            status = ws_client.get(
+                f"/api/users/{user2_id}/status", headers={"Authorization": f"Bearer {token1}"}
+            ).json()
+            assert status["is_online"] is True
+
+        status = ws_client.get(
+            f"/api/users/{user2_id}/status", headers={"Authorization": f"Bearer {token1}"}
+        ).json()
+        assert status["is_online"] is False
+
+    def test_invalid_token_rejected(self, ws_client):
+        """잘못된 토큰은 연결 거부"""
+        from starlette.websockets import WebSocketDisconnect
+
+        with pytest.raises(WebSocketDisconnect):
+            with ws_client.websocket_connect("/ws?token=invalid") as websocket:
+                websocket.receive_json()
+
+
+class TestPreEncodedFrame:
+    """브로드캐스트 프레임 인코딩 테스트"""
+
+    async def test_broadcast_encodes_once(self, monkeypatch):
+        """채팅방의 모든 소켓이 한 번 인코딩된 같은 텍스트를 받음"""
+        from src.websocket import outbox as outbox_module
+        from src.websocket.manager import ConnectionManager
+
+        calls = []
+        original = outbox_module.dumps
+
+        def counting_dumps(obj):
+            calls.append(obj)
+            return original(obj)
+
+        monkeypatch.setattr(outbox_module, "dumps", counting_dumps)
+
+        manager = ConnectionManager()
+        sockets = [AsyncMock() for _ in range(5)]
+        for n, websocket in enumerate(sockets):
+            manager.connect(f"user{n}", websocket, ["room1"])
+
+        await manager.broadcast_to_room("room1", {"type": "message", "content": "Hello!"})
+        await manager.flush()
+
+        assert len(calls) == 1
+        texts = [websocket.send_text.call_args.args[0] for websocket in sockets]
+        assert all(text is texts[0] for text in texts)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_datetime_encoding(self, monkeypatch, use_orjson):
+        """datetime은 ISO 8601 문자열로 인코딩 (orjson 유무와 무관)"""
+        from datetime import datetime
+
+        from src.core import serialization
+
+        if not use_orjson:
+            monkeypatch.setattr(serialization, "orjson", None)
+        elif serialization.orjson is None:
+            pytest.skip("orjson not installed")
+
+        created_at = datetime(2025, 1, 2, 3, 4, 5, 678901)
+        encoded = serialization.dumps({"created_at": created_at, "content": "안녕"})
+
+        assert json.loads(encoded) == {"created_at": created_at.isoformat(), "content": "안녕"}
@@ -7,6 +7,7 @@ from pathlib import Path
 
 import click
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
@@ -43,6 +44,24 @@ def cli():
     pass
 
 
+@cli.result_callback()
+def _after_command(result, **kwargs):
+    """명령 실행 후 auto_run 정책이면 백그라운드 정리 시작."""
+    ctx = click.get_current_context()
+    if ctx.invoked_subcommand == "clean":
+        return
+
+    forge_dir = Path.cwd() / ".forge"
+    if not forge_dir.exists():
+        return
+
+    from ideaforge.core.cleanup import CleanupExecutor
+
+    executor = CleanupExecutor(Path.cwd())
+    if executor.policy.enabled and executor.policy.auto_run:
+        executor.run_in_background()
+
+
 @cli.command()
 @click.argument("path", type=click.Path(), default=".")
 @click.option("--force", "-f", is_flag=True, help="Overwrite existing files")
@@ -284,11 +303,13 @@ def status():
     table.add_column("Progress", style="white")
 
     if prds:
+        from ideaforge.core.prd import PrdDocument
+
         for prd in prds:
-            # Parse PRD frontmatter (simplified)
-            content = prd.read_text()
+            # Frontmatter comes from the cached section index (read-only: never writes it)
+            doc = PrdDocument(prd, persist_index=False)
             prd_id = prd.stem
-            title = prd_id  # Simplified, would parse from content
+            title = doc.title
             status_emoji = "📝"
             progress = "0%"
             table.add_row(prd_id, title, status_emoji, progress)
@@ -472,6 +493,232 @@ def upgrade(force: bool, rollback: bool):
     console.print("  2. /forge:status로 상태 확인")
 
 
+@cli.command(name="index")
+@click.argument("prd_id", required=False)
+@click.option("--force", "-f", is_flag=True, help="변경 여부와 관계없이 다시 생성")
+def index_prds(prd_id: str | None, force: bool):
+    """PRD 헤딩/요구사항 오프셋 인덱스 생성.
+
+    .forge/prds/.index/{ID}.json에 섹션과 FR/NFR 정의의 바이트 범위를
+    기록합니다. PRD의 mtime이 바뀐 경우에만 다시 생성합니다.
+
+    Examples:
+        forge index             # 모든 PRD
+        forge index AUTH-001    # 특정 PRD
+    """
+    from ideaforge.core.prd import PrdIndex
+
+    prds_dir = Path.cwd() / ".forge" / "prds"
+    if not prds_dir.exists():
+        console.print("[yellow]⚠ No PRDs found[/yellow]")
+        return
+
+    prds = [prds_dir / f"{prd_id}.md"] if prd_id else sorted(prds_dir.glob("*.md"))
+    built = reused = 0
+
+    for prd in prds:
+        if not prd.exists():
+            console.print(f"[red]✗ PRD 없음: {prd.stem}[/red]")
+            continue
+
+        index_path = PrdIndex.index_path_for(prd)
+        existing = None if force else PrdIndex.load(index_path)
+        if existing is not None and existing.is_fresh(prd):
+            reused += 1
+            continue
+
+        PrdIndex.build(prd).save(index_path)
+        built += 1
+
+    console.print(f"[green]✓[/green] 인덱스 생성 {built}개, 재사용 {reused}개")
+
+
+@cli.command()
+@click.argument("prd_id")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["markdown", "json"]),
+    default="markdown",
+    help="출력 형식",
+)
+def resume(prd_id: str, output_format: str):
+    """체크포인트에서 작업 재개용 컨텍스트 번들 출력.
+
+    PRD 전체 대신 체크포인트 스냅샷과 현재 태스크가 참조하는
+    PRD 섹션만 읽어 작은 프롬프트 페이로드를 만듭니다.
+    섹션 위치는 .forge/prds/.index/의 헤딩 오프셋 인덱스를 사용합니다.
+
+    Examples:
+        forge resume AUTH-001
+        forge resume AUTH-001 --format json
+    """
+    import json
+
+    from ideaforge.core.resume import ResumeContextBuilder
+
+    cwd = Path.cwd()
+    if not (cwd / ".forge").exists():
+        console.print("[red]✗ IdeaForge 프로젝트가 아닙니다[/red]")
+        console.print("  실행: [bold]forge init .[/bold]")
+        sys.exit(1)
+
+    result = ResumeContextBuilder(cwd).build(prd_id)
+    if not result.success or result.context is None:
+        console.print(f"[red]✗ {result.message}[/red]")
+        sys.exit(1)
+
+    if output_format == "json":
+        click.echo(json.dumps(result.context.to_dict(), ensure_ascii=False, separators=(",", ":")))
+    else:
+        click.echo(result.context.to_markdown(), nl=False)
+
+
+@cli.command(name="export")
+@click.argument("archive", type=click.Path(dir_okay=False))
+@click.option("--prd", "prd_ids", multiple=True, help="내보낼 PRD ID (여러 번 지정 가능)")
+@click.option("--level", type=click.IntRange(0, 9), default=6, help="압축 레벨 (0-9)")
+def export_portfolio(archive: str, prd_ids: tuple[str, ...], level: int):
+    """PRD 포트폴리오를 하나의 아카이브 파일로 내보내기.
+
+    .forge/의 prds, tasks, progress, agents를 중복 제거 후
+    단일 압축 스트림과 manifest로 저장합니다.
+
+    Examples:
+        forge export portfolio.ifpk
+        forge export auth.ifpk --prd AUTH-001 --prd AUTH-002
+    """
+    from ideaforge.core.portfolio import PortfolioExporter
+
+    cwd = Path.cwd()
+    if not (cwd / ".forge").exists():
+        console.print("[red]✗ IdeaForge 프로젝트가 아닙니다[/red]")
+        console.print("  실행: [bold]forge init .[/bold]")
+        sys.exit(1)
+
+    result = PortfolioExporter(cwd).export(Path(archive), list(prd_ids) or None, level=level)
+    if not result.success or result.archive_path is None:
+        console.print(f"[red]✗ {result.message}[/red]")
+        sys.exit(1)
+
+    size = result.archive_path.stat().st_size
+    console.print(f"[green]✓[/green] {result.message}")
+    console.print(f"  [dim]고유 내용 {result.blob_count}개, 아카이브 크기 {size / 1024:.1f} KB[/dim]")
+
+
+@cli.command(name="import")
+@click.argument("archive", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--on-conflict",
+    type=click.Choice(["fail", "skip", "overwrite"]),
+    default="fail",
+    help="이미 존재하는 PRD ID 처리 방식",
+)
+@click.option("--dry-run", is_flag=True, help="기록 없이 충돌만 확인")
+def import_portfolio(archive: str, on_conflict: str, dry_run: bool):
+    """아카이브에서 PRD 포트폴리오 가져오기.
+
+    manifest로 PRD ID 충돌을 먼저 확인하고,
+    모든 파일의 해시를 검증한 뒤에만 .forge/에 반영합니다.
+
+    Examples:
+        forge import portfolio.ifpk
+        forge import portfolio.ifpk --on-conflict skip
+        forge import portfolio.ifpk --dry-run
+    """
+    from ideaforge.core.portfolio import PortfolioImporter
+
+    cwd = Path.cwd()
+    if not (cwd / ".forge").exists():
+        console.print("[red]✗ IdeaForge 프로젝트가 아닙니다[/red]")
+        console.print("  실행: [bold]forge init .[/bold]")
+        sys.exit(1)
+
+    result = PortfolioImporter(cwd).import_archive(
+        Path(archive), on_conflict=on_conflict, dry_run=dry_run
+    )
+    if not result.success:
+        console.print(f"[red]✗ {result.message}[/red]")
+        if result.conflicts:
+            console.print("  [dim]--on-conflict skip 또는 overwrite로 다시 실행하세요[/dim]")
+        sys.exit(1)
+
+    console.print(f"[green]✓[/green] {escape(result.message)}")
+    if result.skipped_ids:
+        console.print(f"  [dim]건너뛴 PRD: {len(result.skipped_ids)}개[/dim]")
+
+
+@cli.command()
+@click.option("--dry-run", is_flag=True, help="삭제/회전 없이 대상만 계산")
+def clean(dry_run: bool):
+    """보관 정책에 따라 로그와 임시 파일 정리.
+
+    config.json의 document_management.cleanup 설정 적용:
+      - retention_days    보관 기간이 지난 targets 파일 삭제
+      - max_log_size_mb   크기 상한을 넘은 활성 로그(*.log) 회전
+      - max_rotated_logs  로그당 유지할 회전 파일 수
+      - auto_run          true면 다른 명령 실행 후 백그라운드 정리
+
+    Examples:
+        forge clean             # 정리 실행
+        forge clean --dry-run   # 정리 대상 미리보기
+    """
+    from ideaforge.core.cleanup import CleanupExecutor
+
+    cwd = Path.cwd()
+    forge_dir = cwd / ".forge"
+
+    if not forge_dir.exists():
+        console.print("[red]✗ IdeaForge 프로젝트가 아닙니다[/red]")
+        console.print("  실행: [bold]forge init .[/bold]")
+        sys.exit(1)
+
+    executor = CleanupExecutor(cwd)
+    result = executor.run(dry_run=dry_run)
+
+    if not result.success:
+        console.print(f"[red]✗ {result.message}[/red]")
+        sys.exit(1)
+
+    console.print(f"[green]✓[/green] {escape(result.message)}")
+    if result.bytes_freed:
+        console.print(f"  [dim]확보된 공간: {result.bytes_freed / 1024:.1f} KB[/dim]")
+
+
+@cli.command()
+@click.option("--changed-only", is_flag=True, help="마지막 검증 이후 변경된 파일만 검증")
+def validate(changed_only: bool):
+    """.forge JSON 산출물 스키마 검증.
+
+    config.json, tasks/{ID}/tasks.json, progress/{ID}/checkpoint.json을
+    schemas/의 스키마로 검증하고, 나머지 JSON은 파싱 가능 여부를 확인합니다.
+    오류가 있으면 종료 코드 1을 반환합니다 (pre-commit 훅에서 사용 가능).
+
+    Examples:
+        forge validate                  # 전체 검증
+        forge validate --changed-only   # 변경된 파일만 검증
+    """
+    from ideaforge.core.validate import ArtifactValidator
+
+    cwd = Path.cwd()
+    forge_dir = cwd / ".forge"
+
+    if not forge_dir.exists():
+        console.print("[red]✗ IdeaForge 프로젝트가 아닙니다[/red]")
+        console.print("  실행: [bold]forge init .[/bold]")
+        sys.exit(1)
+
+    result = ArtifactValidator(cwd).validate(changed_only=changed_only)
+
+    if not result.success:
+        console.print(f"[red]✗ {escape(result.message)}[/red]")
+        for issue in result.issues:
+            console.print(f"  [dim]{escape(issue.path)}[/dim] {escape(issue.message)}")
+        sys.exit(1)
+
+    console.print(f"[green]✓[/green] {escape(result.message)}")
+
+
 def _handle_rollback(project_path: Path):
     """백업에서 롤백 처리."""
     from ideaforge.core.upgrade import BackupManager
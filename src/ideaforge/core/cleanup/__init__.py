@@ -0,0 +1,11 @@
+"""Cleanup system for IdeaForge projects.
+
+`document_management.cleanup` 정책 실행:
+  - 보관 기간(retention_days)이 지난 대상 파일 삭제
+  - 크기 상한(max_log_size_mb)을 넘은 활성 로그 회전
+"""
+
+from .executor import CleanupExecutor, CleanupResult
+from .policy import CleanupPolicy
+
+__all__ = ["CleanupPolicy", "CleanupExecutor", "CleanupResult"]
@@ -0,0 +1,265 @@
+"""Retention and log rotation executor for IdeaForge projects."""
+
+from __future__ import annotations
+
+import fnmatch
+import glob
+import os
+import re
+import shutil
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import NamedTuple
+
+from .policy import CleanupPolicy
+
+# 회전된 로그 파일명: build.log.1, build.log.2, ...
+_ROTATED_LOG = re.compile(r"^(?P<base>.+\.log)\.(?P<index>\d+)$")
+
+
+class CleanupResult(NamedTuple):
+    """정리 결과."""
+
+    success: bool
+    files_deleted: int
+    files_rotated: int
+    bytes_freed: int
+    message: str
+
+
+class _ScanEntry(NamedTuple):
+    """디렉토리 스캔 중 수집한 파일 정보."""
+
+    name: str
+    size: int
+    mtime: float
+
+
+class CleanupExecutor:
+    """`document_management.cleanup` 정책 실행기.
+
+    대상 glob 패턴을 디렉토리별로 묶어 디렉토리당 한 번만 스캔하고,
+    보관 기간이 지난 파일은 디렉토리 단위로 일괄 삭제합니다.
+    크기 상한을 넘은 활성 로그(*.log)는 copy-truncate 방식으로 회전하여
+    쓰기 중인 프로세스의 파일 핸들을 유지합니다.
+    """
+
+    def __init__(self, project_path: Path, policy: CleanupPolicy | None = None):
+        """초기화.
+
+        Args:
+            project_path: 프로젝트 루트 디렉토리 경로
+            policy: 정리 정책 (None이면 config.json에서 로드)
+        """
+        self.project_path = project_path
+        self.policy = policy or CleanupPolicy.from_config(project_path)
+
+    def _group_targets(self) -> dict[Path, list[str]]:
+        """대상 패턴을 디렉토리별 파일명 패턴으로 그룹화.
+
+        Returns:
+            디렉토리 경로 → 파일명 glob 패턴 목록
+        """
+        root = self.project_path.resolve()
+        groups: dict[Path, list[str]] = defaultdict(list)
+
+        for target in self.policy.targets:
+            parent, name_pattern = os.path.split(target)
+            if not name_pattern:
+                continue
+
+            if any(c in parent for c in "*?["):
+                directories = [Path(p) for p in glob.glob(str(root / parent)) if os.path.isdir(p)]
+            else:
+                directories = [root / parent]
+
+            for directory in directories:
+                directory = directory.resolve()
+                # 프로젝트 외부 경로는 정리하지 않음
+                if directory != root and root not in directory.parents:
+                    continue
+                groups[directory].append(name_pattern)
+
+        return groups
+
+    def _scan(self, directory: Path, patterns: list[str]) -> list[_ScanEntry]:
+        """디렉토리를 한 번 스캔하여 패턴에 맞는 일반 파일 수집."""
+        entries: list[_ScanEntry] = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not any(fnmatch.fnmatchcase(entry.name, p) for p in patterns):
+                        continue
+                    try:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append(_ScanEntry(entry.name, stat.st_size, stat.st_mtime))
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        return entries
+
+    def _plan_directory(
+        self, entries: list[_ScanEntry], cutoff: float
+    ) -> tuple[dict[str, int], dict[str, list[int]]]:
+        """삭제 대상과 회전 대상 결정.
+
+        Returns:
+            (삭제할 파일명 → 크기, 회전할 활성 로그명 → 남아있는 회전 인덱스 목록)
+        """
+        max_rotated = self.policy.max_rotated_logs
+        max_bytes = self.policy.max_log_size_bytes
+
+        to_delete: dict[str, int] = {}
+        rotated: dict[str, list[int]] = defaultdict(list)
+        oversized: list[str] = []
+
+        for entry in entries:
+            if entry.mtime < cutoff:
+                to_delete[entry.name] = entry.size
+                continue
+
+            match = _ROTATED_LOG.match(entry.name)
+            if match:
+                index = int(match.group("index"))
+                if index > max_rotated:
+                    to_delete[entry.name] = entry.size
+                else:
+                    rotated[match.group("base")].append(index)
+            elif entry.name.endswith(".log") and max_bytes > 0 and entry.size > max_bytes:
+                oversized.append(entry.name)
+
+        return to_delete, {name: sorted(rotated[name], reverse=True) for name in oversized}
+
+    def _unlink_batch(self, directory: Path, names: list[str]) -> list[str]:
+        """디렉토리 파일 핸들 하나로 여러 파일 일괄 삭제.
+
+        삭제하지 못한 파일(권한 없음, 이미 없음 등)은 건너뜁니다.
+
+        Returns:
+            실제로 삭제된 파일명 목록
+        """
+        if not names:
+            return []
+
+        deleted: list[str] = []
+        dir_fd: int | None = None
+        if os.unlink in os.supports_dir_fd:
+            try:
+                dir_fd = os.open(directory, os.O_RDONLY)
+            except OSError:
+                dir_fd = None
+
+        try:
+            for name in names:
+                try:
+                    if dir_fd is not None:
+                        os.unlink(name, dir_fd=dir_fd)
+                    else:
+                        os.unlink(directory / name)
+                    deleted.append(name)
+                except OSError:
+                    continue
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+        return deleted
+
+    def _rotate(self, directory: Path, name: str, indices: list[int]) -> None:
+        """활성 로그 회전 (copy-truncate).
+
+        Args:
+            directory: 로그 디렉토리
+            name: 활성 로그 파일명
+            indices: 현재 남아있는 회전 인덱스 (내림차순)
+        """
+        max_rotated = self.policy.max_rotated_logs
+        log_path = directory / name
+
+        if max_rotated > 0:
+            for index in indices:
+                src = directory / f"{name}.{index}"
+                if index + 1 > max_rotated:
+                    src.unlink(missing_ok=True)
+                else:
+                    os.replace(src, directory / f"{name}.{index + 1}")
+            shutil.copyfile(log_path, directory / f"{name}.1")
+
+        os.truncate(log_path, 0)
+
+    def run(self, dry_run: bool = False, now: float | None = None) -> CleanupResult:
+        """정리 정책 실행.
+
+        Args:
+            dry_run: True면 파일을 변경하지 않고 결과만 계산
+            now: 기준 시각 (테스트용, 기본값은 현재 시각)
+
+        Returns:
+            CleanupResult: 정리 결과
+        """
+        if not self.policy.enabled:
+            return CleanupResult(
+                success=True,
+                files_deleted=0,
+                files_rotated=0,
+                bytes_freed=0,
+                message="정리 비활성화됨",
+            )
+
+        cutoff = (now if now is not None else time.time()) - self.policy.retention_days * 86400
+        files_deleted = 0
+        files_rotated = 0
+        bytes_freed = 0
+
+        try:
+            for directory, patterns in self._group_targets().items():
+                to_delete, to_rotate = self._plan_directory(self._scan(directory, patterns), cutoff)
+
+                if dry_run:
+                    files_deleted += len(to_delete)
+                    bytes_freed += sum(to_delete.values())
+                    files_rotated += len(to_rotate)
+                    continue
+
+                deleted = self._unlink_batch(directory, list(to_delete))
+                files_deleted += len(deleted)
+                bytes_freed += sum(to_delete[name] for name in deleted)
+
+                for name, indices in to_rotate.items():
+                    self._rotate(directory, name, indices)
+                    files_rotated += 1
+
+            prefix = "[dry-run] " if dry_run else ""
+            return CleanupResult(
+                success=True,
+                files_deleted=files_deleted,
+                files_rotated=files_rotated,
+                bytes_freed=bytes_freed,
+                message=f"{prefix}정리 완료: 삭제 {files_deleted}개, 회전 {files_rotated}개",
+            )
+
+        except OSError as e:
+            return CleanupResult(
+                success=False,
+                files_deleted=files_deleted,
+                files_rotated=files_rotated,
+                bytes_freed=bytes_freed,
+                message=f"정리 실패: {e}",
+            )
+
+    def run_in_background(self) -> threading.Thread:
+        """백그라운드 스레드에서 정리 실행.
+
+        데몬 스레드가 아니므로 인터프리터 종료 전에 정리가 끝납니다.
+
+        Returns:
+            시작된 스레드
+        """
+        thread = threading.Thread(target=self.run, name="forge-cleanup", daemon=False)
+        thread.start()
+        return thread
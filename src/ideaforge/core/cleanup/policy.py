@@ -0,0 +1,59 @@
+"""Cleanup policy loading for IdeaForge projects."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+
+class CleanupPolicy(NamedTuple):
+    """`document_management.cleanup` 설정."""
+
+    enabled: bool = True
+    retention_days: int = 30  # 로그/임시 파일 보관 일수
+    targets: tuple[str, ...] = (".forge/logs/*", ".forge/reports/*.tmp")
+    max_log_size_mb: float = 10.0  # 활성 로그 회전 기준 크기
+    max_rotated_logs: int = 5  # 로그당 유지할 회전 파일 수
+    auto_run: bool = False  # 명령 실행 후 백그라운드 정리 여부
+
+    @classmethod
+    def from_config(cls, project_path: Path) -> CleanupPolicy:
+        """`.forge/config.json`에서 정리 정책 로드.
+
+        Args:
+            project_path: 프로젝트 루트 디렉토리 경로
+
+        Returns:
+            CleanupPolicy: 설정이 없거나 손상된 경우 기본값
+        """
+        config_path = project_path / ".forge" / "config.json"
+        if not config_path.exists():
+            return cls()
+
+        try:
+            config = json.loads(config_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return cls()
+
+        section = config.get("document_management", {}).get("cleanup", {})
+        if not isinstance(section, dict):
+            return cls()
+
+        defaults = cls()
+        try:
+            return cls(
+                enabled=bool(section.get("enabled", defaults.enabled)),
+                retention_days=max(1, int(section.get("retention_days", defaults.retention_days))),
+                targets=tuple(section.get("targets", defaults.targets)),
+                max_log_size_mb=float(section.get("max_log_size_mb", defaults.max_log_size_mb)),
+                max_rotated_logs=max(0, int(section.get("max_rotated_logs", defaults.max_rotated_logs))),
+                auto_run=bool(section.get("auto_run", defaults.auto_run)),
+            )
+        except (TypeError, ValueError):
+            return defaults
+
+    @property
+    def max_log_size_bytes(self) -> int:
+        """회전 기준 크기 (바이트)."""
+        return int(self.max_log_size_mb * 1024 * 1024)
@@ -0,0 +1,11 @@
+"""Portfolio import/export for IdeaForge projects.
+
+.forge/의 prds, tasks, progress, agents를 하나의 아카이브로 옮깁니다:
+  - Export: 중복 제거 + 단일 압축 스트림 + 컬럼형 manifest
+  - Import: manifest로 ID 충돌 확인 후 스트림을 풀면서 바로 기록
+"""
+
+from .exporter import ExportResult, PortfolioExporter
+from .importer import ImportResult, PortfolioImporter
+
+__all__ = ["PortfolioExporter", "ExportResult", "PortfolioImporter", "ImportResult"]
@@ -0,0 +1,157 @@
+"""Portfolio archive format for IdeaForge PRD import/export.
+
+Layout::
+
+    b"IFPK" + version(1 byte)
+    solid zlib stream      중복 제거된 blob들을 순서대로 이어 붙여 압축
+    manifest               zlib 압축된 컬럼형 JSON
+    trailer                manifest offset(u64) + manifest length(u64) + b"IFPK"
+
+blob 오프셋은 manifest의 크기 컬럼 누적합으로 계산하므로 압축 스트림을
+처음부터 순서대로 풀면서 바로 파일로 기록할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import IO, Any, Iterator, NamedTuple
+
+MAGIC = b"IFPK"
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 1
+_TRAILER = struct.Struct("<QQ4s")
+
+# 압축 해제 시 한 번에 읽을 크기
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class ArchiveManifest(NamedTuple):
+    """아카이브 manifest (컬럼형).
+
+    files_* 컬럼은 파일 단위, blob_* 컬럼은 압축 스트림 내 blob 순서와 같습니다.
+    """
+
+    prd_ids: list[str]
+    file_paths: list[str]  # .forge 기준 상대 경로 (POSIX)
+    file_blobs: list[int]  # 각 파일의 blob 인덱스
+    file_mtimes: list[float]
+    blob_hashes: list[str]  # sha256 hex
+    blob_sizes: list[int]  # 압축 해제 크기
+    created_at: str = ""
+    ideaforge_version: str = ""
+
+    def to_json(self) -> dict[str, Any]:
+        """직렬화용 딕셔너리 반환."""
+        return {
+            "format": "ideaforge-portfolio",
+            "version": FORMAT_VERSION,
+            "created_at": self.created_at,
+            "ideaforge_version": self.ideaforge_version,
+            "prd_ids": self.prd_ids,
+            "files": {
+                "path": self.file_paths,
+                "blob": self.file_blobs,
+                "mtime": self.file_mtimes,
+            },
+            "blobs": {
+                "sha256": self.blob_hashes,
+                "size": self.blob_sizes,
+            },
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> ArchiveManifest:
+        """딕셔너리에서 manifest 생성."""
+        files = data["files"]
+        blobs = data["blobs"]
+        return cls(
+            prd_ids=list(data["prd_ids"]),
+            file_paths=list(files["path"]),
+            file_blobs=list(files["blob"]),
+            file_mtimes=list(files["mtime"]),
+            blob_hashes=list(blobs["sha256"]),
+            blob_sizes=list(blobs["size"]),
+            created_at=data.get("created_at", ""),
+            ideaforge_version=data.get("ideaforge_version", ""),
+        )
+
+
+def write_header(f: IO[bytes]) -> None:
+    """아카이브 헤더 기록."""
+    f.write(MAGIC + bytes([FORMAT_VERSION]))
+
+
+def write_trailer(f: IO[bytes], manifest: ArchiveManifest) -> None:
+    """manifest와 trailer 기록 (압축 스트림 뒤에 호출)."""
+    payload = zlib.compress(
+        json.dumps(manifest.to_json(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    )
+    offset = f.tell()
+    f.write(payload)
+    f.write(_TRAILER.pack(offset, len(payload), MAGIC))
+
+
+def read_manifest(f: IO[bytes]) -> ArchiveManifest:
+    """아카이브 끝의 trailer를 읽어 manifest 로드.
+
+    Raises:
+        ValueError: 아카이브 형식이 올바르지 않은 경우
+    """
+    f.seek(0)
+    header = f.read(HEADER_SIZE)
+    if len(header) != HEADER_SIZE or header[:4] != MAGIC:
+        raise ValueError("IdeaForge 아카이브가 아닙니다")
+    if header[4] != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 아카이브 버전: {header[4]}")
+
+    f.seek(-_TRAILER.size, 2)
+    offset, length, magic = _TRAILER.unpack(f.read(_TRAILER.size))
+    if magic != MAGIC:
+        raise ValueError("아카이브 trailer가 손상되었습니다")
+
+    f.seek(offset)
+    try:
+        data = json.loads(zlib.decompress(f.read(length)).decode("utf-8"))
+        return ArchiveManifest.from_json(data)
+    except (zlib.error, json.JSONDecodeError, KeyError, TypeError) as e:
+        raise ValueError(f"manifest가 손상되었습니다: {e}") from e
+
+
+def iter_blobs(f: IO[bytes], manifest: ArchiveManifest) -> Iterator[tuple[int, bytes]]:
+    """압축 스트림을 순서대로 풀면서 (blob 인덱스, 내용) 생성.
+
+    Raises:
+        ValueError: 스트림이 manifest보다 짧거나 손상된 경우
+    """
+    f.seek(HEADER_SIZE)
+    decompressor = zlib.decompressobj()
+    buffer = bytearray()
+
+    for blob_index, size in enumerate(manifest.blob_sizes):
+        while len(buffer) < size:
+            if decompressor.eof:
+                raise ValueError("압축 스트림이 예상보다 짧습니다")
+            chunk = f.read(READ_CHUNK_SIZE)
+            try:
+                buffer += decompressor.decompress(chunk) if chunk else decompressor.flush()
+            except zlib.error as e:
+                raise ValueError(f"압축 스트림이 손상되었습니다: {e}") from e
+            if not chunk and len(buffer) < size:
+                raise ValueError("압축 스트림이 예상보다 짧습니다")
+        yield blob_index, bytes(buffer[:size])
+        del buffer[:size]
+
+
+def safe_relative_path(rel_path: str) -> Path:
+    """아카이브 내 경로를 검증하여 상대 경로로 변환.
+
+    Raises:
+        ValueError: 절대 경로이거나 상위 디렉토리를 참조하는 경우
+    """
+    path = Path(rel_path)
+    if path.is_absolute() or ".." in path.parts or not path.parts:
+        raise ValueError(f"허용되지 않는 경로: {rel_path}")
+    return path
@@ -0,0 +1,202 @@
+"""Portfolio export for IdeaForge projects."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple
+
+from ideaforge import __version__
+
+from .archive import ArchiveManifest, write_header, write_trailer
+
+
+class ExportResult(NamedTuple):
+    """내보내기 결과."""
+
+    success: bool
+    archive_path: Path | None
+    prd_count: int
+    file_count: int
+    blob_count: int  # 중복 제거 후 저장된 내용 수
+    message: str
+
+
+class PortfolioExporter:
+    """PRD 포트폴리오 내보내기.
+
+    `.forge/`의 prds, tasks, progress, agents를 하나의 아카이브 파일로
+    묶습니다. 같은 내용의 파일은 한 번만 저장하고, 전체를 하나의
+    압축 스트림으로 기록하여 작은 파일이 많아도 압축률을 유지합니다.
+    """
+
+    # 내보낼 .forge 하위 디렉토리 (prds는 {ID}.md, 나머지는 {ID}/ 디렉토리)
+    PORTFOLIO_DIRS = ("prds", "tasks", "progress", "agents")
+
+    # 내보내지 않을 파일명
+    SKIP_NAMES = frozenset({".gitkeep", ".DS_Store"})
+
+    def __init__(self, project_path: Path):
+        """초기화.
+
+        Args:
+            project_path: 프로젝트 루트 디렉토리 경로
+        """
+        self.project_path = project_path
+        self.forge_dir = project_path / ".forge"
+
+    @staticmethod
+    def _failure(message: str) -> ExportResult:
+        """실패 결과 생성."""
+        return ExportResult(
+            success=False,
+            archive_path=None,
+            prd_count=0,
+            file_count=0,
+            blob_count=0,
+            message=message,
+        )
+
+    def _walk(self, directory: Path, rel_prefix: str) -> list[tuple[str, Path]]:
+        """디렉토리 아래 파일을 scandir로 재귀 수집."""
+        files: list[tuple[str, Path]] = []
+        stack = [(directory, rel_prefix)]
+        while stack:
+            current, prefix = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                if entry.name in self.SKIP_NAMES:
+                    continue
+                rel = f"{prefix}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((Path(entry.path), rel))
+                elif entry.is_file(follow_symlinks=False):
+                    files.append((rel, Path(entry.path)))
+        return files
+
+    def collect(self, prd_ids: list[str] | None = None) -> dict[str, list[tuple[str, Path]]]:
+        """내보낼 파일 수집.
+
+        Args:
+            prd_ids: 내보낼 PRD ID 목록 (None이면 전체)
+
+        Returns:
+            PRD ID → (.forge 기준 상대 경로, 실제 경로) 목록
+        """
+        wanted = set(prd_ids) if prd_ids else None
+        collected: dict[str, list[tuple[str, Path]]] = {}
+
+        for dirname in self.PORTFOLIO_DIRS:
+            base = self.forge_dir / dirname
+            try:
+                with os.scandir(base) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue  # .gitkeep, .index 등
+                if dirname == "prds":
+                    if not (entry.name.endswith(".md") and entry.is_file(follow_symlinks=False)):
+                        continue
+                    prd_id = entry.name[: -len(".md")]
+                    files = [(f"prds/{entry.name}", Path(entry.path))]
+                else:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    prd_id = entry.name
+                    files = self._walk(Path(entry.path), f"{dirname}/{entry.name}")
+
+                if wanted is not None and prd_id not in wanted:
+                    continue
+                collected.setdefault(prd_id, []).extend(files)
+
+        return collected
+
+    def export(
+        self,
+        archive_path: Path,
+        prd_ids: list[str] | None = None,
+        level: int = 6,
+    ) -> ExportResult:
+        """아카이브 파일 생성.
+
+        Args:
+            archive_path: 생성할 아카이브 경로
+            prd_ids: 내보낼 PRD ID 목록 (None이면 전체)
+            level: zlib 압축 레벨 (0-9)
+
+        Returns:
+            ExportResult: 내보내기 결과
+        """
+        collected = self.collect(prd_ids)
+        if not collected:
+            return self._failure("내보낼 PRD 없음")
+
+        file_paths: list[str] = []
+        file_blobs: list[int] = []
+        file_mtimes: list[float] = []
+        blob_hashes: list[str] = []
+        blob_sizes: list[int] = []
+        blob_index: dict[str, int] = {}
+
+        tmp_path = archive_path.with_name(archive_path.name + ".tmp")
+        try:
+            archive_path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as out:
+                write_header(out)
+                compressor = zlib.compressobj(level)
+
+                for prd_id in sorted(collected):
+                    for rel_path, path in collected[prd_id]:
+                        data = path.read_bytes()
+                        digest = hashlib.sha256(data).hexdigest()
+
+                        index = blob_index.get(digest)
+                        if index is None:
+                            index = len(blob_hashes)
+                            blob_index[digest] = index
+                            blob_hashes.append(digest)
+                            blob_sizes.append(len(data))
+                            out.write(compressor.compress(data))
+
+                        file_paths.append(rel_path)
+                        file_blobs.append(index)
+                        file_mtimes.append(path.stat().st_mtime)
+
+                out.write(compressor.flush())
+
+                manifest = ArchiveManifest(
+                    prd_ids=sorted(collected),
+                    file_paths=file_paths,
+                    file_blobs=file_blobs,
+                    file_mtimes=file_mtimes,
+                    blob_hashes=blob_hashes,
+                    blob_sizes=blob_sizes,
+                    created_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    ideaforge_version=__version__,
+                )
+                write_trailer(out, manifest)
+
+            tmp_path.replace(archive_path)
+
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            return self._failure(f"내보내기 실패: {e}")
+
+        return ExportResult(
+            success=True,
+            archive_path=archive_path,
+            prd_count=len(collected),
+            file_count=len(file_paths),
+            blob_count=len(blob_hashes),
+            message=f"내보내기 완료: PRD {len(collected)}개, 파일 {len(file_paths)}개",
+        )
@@ -0,0 +1,282 @@
+"""Portfolio import for IdeaForge projects."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from typing import IO, NamedTuple
+
+from ideaforge.core.prd import PrdIndex
+
+from .archive import ArchiveManifest, iter_blobs, read_manifest, safe_relative_path
+from .exporter import PortfolioExporter
+
+
+class ImportResult(NamedTuple):
+    """가져오기 결과."""
+
+    success: bool
+    imported_ids: list[str]
+    skipped_ids: list[str]
+    conflicts: list[str]  # 대상 프로젝트에 이미 있는 PRD ID
+    files_written: int
+    message: str
+
+
+class PortfolioImporter:
+    """PRD 포트폴리오 가져오기.
+
+    manifest만 먼저 읽어 PRD ID 충돌을 확인한 뒤, 압축 스트림을
+    순서대로 풀면서 `.forge/` 안의 임시 디렉토리에 기록합니다. 모든 blob의
+    해시를 확인한 다음에만 PRD 단위로 `replace()`하여 반영하므로, 손상된
+    아카이브는 기존 PRD를 건드리지 않습니다.
+    """
+
+    # 충돌 처리 방식
+    CONFLICT_POLICIES = ("fail", "skip", "overwrite")
+
+    def __init__(self, project_path: Path):
+        """초기화.
+
+        Args:
+            project_path: 프로젝트 루트 디렉토리 경로
+        """
+        self.project_path = project_path
+        self.forge_dir = project_path / ".forge"
+
+    @staticmethod
+    def _prd_id_of(rel_path: Path) -> str:
+        """아카이브 내 경로에서 PRD ID 추출.
+
+        Raises:
+            ValueError: 포트폴리오 디렉토리 밖의 경로인 경우
+        """
+        parts = rel_path.parts
+        if len(parts) < 2 or parts[0] not in PortfolioExporter.PORTFOLIO_DIRS:
+            raise ValueError(f"허용되지 않는 경로: {rel_path}")
+        if parts[0] == "prds":
+            # prds/{ID}.md만 허용 (하위 디렉토리 불가)
+            if len(parts) != 2 or rel_path.suffix != ".md":
+                raise ValueError(f"허용되지 않는 경로: {rel_path}")
+            prd_id = rel_path.stem
+        else:
+            # {dir}/{ID}/... 파일만 허용 (디렉토리 자체 불가)
+            if len(parts) < 3:
+                raise ValueError(f"허용되지 않는 경로: {rel_path}")
+            prd_id = parts[1]
+        if not prd_id or prd_id.startswith("."):
+            raise ValueError(f"허용되지 않는 경로: {rel_path}")
+        return prd_id
+
+    @staticmethod
+    def _prd_units(base: Path, prd_id: str) -> list[Path]:
+        """PRD 하나를 이루는 경로 (prds/{ID}.md와 tasks/progress/agents의 {ID} 디렉토리)."""
+        return [
+            base / dirname / (f"{prd_id}.md" if dirname == "prds" else prd_id)
+            for dirname in PortfolioExporter.PORTFOLIO_DIRS
+        ]
+
+    def existing_ids(self) -> set[str]:
+        """대상 프로젝트에 이미 있는 PRD ID."""
+        ids: set[str] = set()
+        for dirname in PortfolioExporter.PORTFOLIO_DIRS:
+            try:
+                with os.scandir(self.forge_dir / dirname) as it:
+                    for entry in it:
+                        if entry.name.startswith("."):
+                            continue
+                        if dirname == "prds":
+                            if entry.name.endswith(".md"):
+                                ids.add(entry.name[: -len(".md")])
+                        elif entry.is_dir():
+                            ids.add(entry.name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        return ids
+
+    @staticmethod
+    def _failure(message: str, conflicts: list[str] | None = None) -> ImportResult:
+        """실패 결과 생성."""
+        return ImportResult(
+            success=False,
+            imported_ids=[],
+            skipped_ids=[],
+            conflicts=conflicts or [],
+            files_written=0,
+            message=message,
+        )
+
+    def read_manifest(self, archive_path: Path) -> ArchiveManifest:
+        """아카이브 manifest만 읽기.
+
+        Raises:
+            ValueError: 아카이브 형식이 올바르지 않은 경우
+        """
+        with archive_path.open("rb") as f:
+            return read_manifest(f)
+
+    @staticmethod
+    def _extract(
+        f: IO[bytes],
+        manifest: ArchiveManifest,
+        rel_paths: list[Path],
+        targets: dict[int, list[int]],
+        staging: Path,
+    ) -> int:
+        """압축 스트림을 풀어 해시를 확인하면서 임시 디렉토리에 기록.
+
+        Returns:
+            기록한 파일 수
+
+        Raises:
+            ValueError: blob 해시가 다르거나 스트림이 잘린 경우
+        """
+        files_written = 0
+        created_dirs: set[Path] = set()
+        last_blob = max(targets) if targets else -1
+
+        for blob_index, data in iter_blobs(f, manifest):
+            if blob_index > last_blob:
+                break
+            file_indices = targets.get(blob_index)
+            if not file_indices:
+                continue
+
+            if hashlib.sha256(data).hexdigest() != manifest.blob_hashes[blob_index]:
+                raise ValueError(f"blob 해시 불일치: #{blob_index}")
+
+            for file_index in file_indices:
+                dst = staging / rel_paths[file_index]
+                if dst.parent not in created_dirs:
+                    dst.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(dst.parent)
+                dst.write_bytes(data)
+                mtime = manifest.file_mtimes[file_index]
+                os.utime(dst, (mtime, mtime))
+                files_written += 1
+
+        return files_written
+
+    def _commit(self, staging: Path, prd_ids: list[str]) -> None:
+        """임시 디렉토리의 PRD를 `.forge/`로 교체.
+
+        덮어쓰는 PRD의 기존 파일/디렉토리는 먼저 옆으로 옮겨 두었다가
+        모두 교체된 뒤 지우고, 중간에 실패하면 되돌립니다.
+        """
+        moved: list[tuple[Path, Path | None]] = []  # (대상, 옮겨 둔 기존 경로)
+        try:
+            for prd_id in prd_ids:
+                for src, dst in zip(
+                    self._prd_units(staging, prd_id), self._prd_units(self.forge_dir, prd_id)
+                ):
+                    backup = None
+                    if dst.exists():
+                        backup = staging / ".old" / dst.relative_to(self.forge_dir)
+                        backup.parent.mkdir(parents=True, exist_ok=True)
+                        os.replace(dst, backup)
+                    moved.append((dst, backup))
+                    if src.exists():
+                        dst.parent.mkdir(parents=True, exist_ok=True)
+                        os.replace(src, dst)
+        except OSError:
+            for dst, backup in reversed(moved):
+                if dst.is_dir():
+                    shutil.rmtree(dst, ignore_errors=True)
+                else:
+                    dst.unlink(missing_ok=True)
+                if backup is not None:
+                    os.replace(backup, dst)
+            raise
+
+    def import_archive(
+        self,
+        archive_path: Path,
+        on_conflict: str = "fail",
+        dry_run: bool = False,
+    ) -> ImportResult:
+        """아카이브 가져오기.
+
+        Args:
+            archive_path: 아카이브 파일 경로
+            on_conflict: 충돌 처리 ("fail": 중단, "skip": 건너뛰기, "overwrite": 덮어쓰기)
+            dry_run: True면 충돌 확인만 수행
+
+        Returns:
+            ImportResult: 가져오기 결과
+        """
+        if on_conflict not in self.CONFLICT_POLICIES:
+            raise ValueError(f"알 수 없는 충돌 처리 방식: {on_conflict}")
+
+        if not archive_path.exists():
+            return self._failure(f"아카이브 없음: {archive_path}")
+
+        try:
+            with archive_path.open("rb") as f:
+                manifest = read_manifest(f)
+
+                # 1) 경로 검증과 충돌 확인 (기록 전)
+                rel_paths = [safe_relative_path(p) for p in manifest.file_paths]
+                file_ids = [self._prd_id_of(p) for p in rel_paths]
+                if set(file_ids) != set(manifest.prd_ids):
+                    raise ValueError("manifest의 PRD ID와 파일 경로가 일치하지 않음")
+                conflicts = sorted(set(file_ids) & self.existing_ids())
+
+                if conflicts and on_conflict == "fail":
+                    shown = ", ".join(conflicts[:10])
+                    more = f" 외 {len(conflicts) - 10}개" if len(conflicts) > 10 else ""
+                    return self._failure(f"이미 존재하는 PRD: {shown}{more}", conflicts=conflicts)
+
+                skipped = set(conflicts) if on_conflict == "skip" else set()
+                imported = [pid for pid in manifest.prd_ids if pid not in skipped]
+
+                if dry_run:
+                    return ImportResult(
+                        success=True,
+                        imported_ids=imported,
+                        skipped_ids=sorted(skipped),
+                        conflicts=conflicts,
+                        files_written=0,
+                        message=f"[dry-run] 가져올 PRD {len(imported)}개, 건너뛸 PRD {len(skipped)}개",
+                    )
+
+                # blob 인덱스 → 기록할 파일 목록
+                targets: dict[int, list[int]] = defaultdict(list)
+                for file_index, prd_id in enumerate(file_ids):
+                    if prd_id not in skipped:
+                        targets[manifest.file_blobs[file_index]].append(file_index)
+                expected = sum(len(indices) for indices in targets.values())
+
+                # 2) 압축 스트림을 순서대로 풀면서 임시 디렉토리에 기록
+                self.forge_dir.mkdir(parents=True, exist_ok=True)
+                staging = Path(tempfile.mkdtemp(prefix=".import-", dir=self.forge_dir))
+                try:
+                    files_written = self._extract(f, manifest, rel_paths, targets, staging)
+                    if files_written != expected:
+                        raise ValueError("아카이브에 일부 파일이 없습니다")
+
+                    # 3) 검증이 끝난 PRD만 반영
+                    self._commit(staging, imported)
+                finally:
+                    shutil.rmtree(staging, ignore_errors=True)
+
+        except (OSError, ValueError) as e:
+            return self._failure(f"가져오기 실패: {e}")
+
+        # 덮어쓴 PRD의 섹션 인덱스는 다시 생성되도록 제거
+        for prd_id in imported:
+            PrdIndex.index_path_for(self.forge_dir / "prds" / f"{prd_id}.md").unlink(
+                missing_ok=True
+            )
+
+        return ImportResult(
+            success=True,
+            imported_ids=imported,
+            skipped_ids=sorted(skipped),
+            conflicts=conflicts,
+            files_written=files_written,
+            message=f"가져오기 완료: PRD {len(imported)}개, 파일 {files_written}개",
+        )
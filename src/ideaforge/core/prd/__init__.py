@@ -0,0 +1,9 @@
+"""PRD document utilities for IdeaForge projects.
+
+PRD 헤딩/요구사항 오프셋 인덱스로 필요한 섹션만 읽을 수 있습니다.
+"""
+
+from .document import PrdDocument
+from .index import PrdIndex, PrdSection
+
+__all__ = ["PrdIndex", "PrdSection", "PrdDocument"]
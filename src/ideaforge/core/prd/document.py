@@ -0,0 +1,91 @@
+"""Lazy section access for IdeaForge PRD documents."""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+from .index import PrdIndex
+
+_REQUIREMENT_KEY = re.compile(r"^N?FR-\d+$", re.IGNORECASE)
+
+
+class PrdDocument:
+    """PRD 문서의 지연 로딩 래퍼.
+
+    헤딩 오프셋 인덱스를 통해 요청한 섹션/요구사항 범위만 읽습니다.
+
+    Examples:
+        doc = PrdDocument.open(forge_dir, "AUTH-001")
+        doc.section("FR-002")      # 요구사항 정의만
+        doc.section("기능 요구사항")  # 헤딩 섹션 전체
+    """
+
+    def __init__(self, path: Path, persist_index: bool = True):
+        """초기화.
+
+        Args:
+            path: PRD 마크다운 파일 경로
+            persist_index: False면 인덱스 파일을 만들거나 갱신하지 않음
+        """
+        self.path = path
+        self.persist_index = persist_index
+        self._index: PrdIndex | None = None
+
+    @classmethod
+    def open(cls, forge_dir: Path, prd_id: str) -> PrdDocument:
+        """`.forge/prds/{ID}.md` 문서 열기."""
+        return cls(forge_dir / "prds" / f"{prd_id}.md")
+
+    @property
+    def index(self) -> PrdIndex:
+        """최신 인덱스 (PRD가 바뀌었으면 재생성)."""
+        if self._index is None or not self._index.is_fresh(self.path):
+            self._index = PrdIndex.for_prd(self.path, persist=self.persist_index)
+        return self._index
+
+    @property
+    def prd_id(self) -> str:
+        """PRD ID."""
+        return self.index.prd_id
+
+    @property
+    def frontmatter(self) -> dict[str, str]:
+        """PRD frontmatter 키/값."""
+        return self.index.frontmatter
+
+    @property
+    def title(self) -> str:
+        """PRD 제목 (frontmatter title, 없으면 ID)."""
+        return self.frontmatter.get("title") or self.prd_id
+
+    def section_titles(self) -> list[str]:
+        """문서 순서대로 헤딩 제목 목록."""
+        return [s.title for s in self.index.sections]
+
+    def requirement_ids(self) -> list[str]:
+        """문서 순서대로 정의된 요구사항 ID 목록."""
+        reqs = self.index.requirements
+        return sorted(reqs, key=lambda req_id: reqs[req_id][0])
+
+    def section(self, key: str) -> str | None:
+        """요구사항 ID 또는 헤딩 제목으로 섹션 본문 읽기.
+
+        Args:
+            key: "FR-002" 같은 요구사항 ID, 헤딩 제목 또는 제목 일부
+
+        Returns:
+            해당 범위의 본문, 찾지 못하면 None
+        """
+        index = self.index
+
+        if _REQUIREMENT_KEY.match(key):
+            span = index.requirements.get(key.upper())
+            if span is not None:
+                return PrdIndex.read_range(self.path, *span)
+
+        exact = next((s for s in index.sections if s.title == key), None)
+        target = exact or index.find_heading(key)
+        if target is None:
+            return None
+        return PrdIndex.read_section(self.path, target)
@@ -0,0 +1,289 @@
+"""Heading offset index for IdeaForge PRD markdown files."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, NamedTuple
+
+_HEADING = re.compile(rb"^(#{1,6})[ \t]+(.+?)[ \t#]*$")
+_REQUIREMENT_ID = re.compile(rb"\b(N?FR-\d+)\b")
+_FENCE = re.compile(rb"^[ \t]*(```|~~~)")
+# 요구사항 정의 줄: "- [ ] FR-001: ...", "* NFR-002 ..." 또는 "### FR-003: ..."
+_REQUIREMENT_ITEM = re.compile(rb"^([ \t]*)[-*+][ \t]+(?:\[[ xX]\][ \t]+)?(N?FR-\d+)\b")
+_REQUIREMENT_HEADING = re.compile(r"^(N?FR-\d+)\b")
+
+
+class PrdSection(NamedTuple):
+    """PRD 헤딩 섹션의 바이트 범위."""
+
+    title: str
+    level: int
+    start: int  # 헤딩 줄 시작 오프셋
+    end: int  # 같은 레벨 이상의 다음 헤딩 시작 오프셋 (또는 파일 끝)
+    requirements: tuple[str, ...]  # 섹션 본문(하위 섹션 제외)의 FR/NFR ID
+
+
+class PrdIndex:
+    """PRD 헤딩 오프셋 인덱스.
+
+    PRD를 한 번 훑어 헤딩별 바이트 범위, 각 섹션에 속한 요구사항 ID,
+    요구사항 정의(목록 항목 또는 헤딩)의 바이트 범위를 기록합니다.
+    인덱스는 `.forge/prds/.index/{ID}.json`에 저장되며,
+    PRD의 mtime/크기가 바뀌면 다시 생성됩니다.
+    """
+
+    VERSION = 3
+    INDEX_DIRNAME = ".index"
+
+    def __init__(
+        self,
+        prd_id: str,
+        source_mtime_ns: int,
+        source_size: int,
+        frontmatter: dict[str, str],
+        sections: list[PrdSection],
+        requirements: dict[str, tuple[int, int]] | None = None,
+    ):
+        """초기화.
+
+        Args:
+            prd_id: PRD ID
+            source_mtime_ns: 인덱스 생성 시점의 PRD mtime (ns)
+            source_size: 인덱스 생성 시점의 PRD 크기 (bytes)
+            frontmatter: PRD frontmatter 키/값
+            sections: 헤딩 섹션 목록 (문서 순서)
+            requirements: 요구사항 ID → 정의 바이트 범위 (start, end)
+        """
+        self.prd_id = prd_id
+        self.source_mtime_ns = source_mtime_ns
+        self.source_size = source_size
+        self.frontmatter = frontmatter
+        self.sections = sections
+        self.requirements = requirements or {}
+
+    @staticmethod
+    def index_path_for(prd_path: Path) -> Path:
+        """PRD 파일에 대응하는 인덱스 파일 경로."""
+        return prd_path.parent / PrdIndex.INDEX_DIRNAME / f"{prd_path.stem}.json"
+
+    @classmethod
+    def build(cls, prd_path: Path) -> PrdIndex:
+        """PRD 파일을 한 번 스캔하여 인덱스 생성.
+
+        Args:
+            prd_path: PRD 마크다운 파일 경로
+
+        Returns:
+            PrdIndex: 생성된 인덱스
+        """
+        stat = prd_path.stat()
+        frontmatter: dict[str, str] = {}
+        # [title, level, start, requirements]
+        open_sections: list[list[Any]] = []
+        sections: list[PrdSection] = []
+        requirements: dict[str, tuple[int, int]] = {}
+        heading_requirements: dict[int, str] = {}  # 헤딩 시작 오프셋 → 요구사항 ID
+        # [req_id, indent, start, content_end]
+        open_item: list[Any] | None = None
+
+        def close_until(level: int, offset: int) -> None:
+            while open_sections and open_sections[-1][1] >= level:
+                title, lvl, start, reqs = open_sections.pop()
+                sections.append(PrdSection(title, lvl, start, offset, tuple(reqs)))
+
+        def close_item() -> None:
+            nonlocal open_item
+            if open_item is not None:
+                req_id, _, start, end = open_item
+                requirements.setdefault(req_id, (start, end))
+                open_item = None
+
+        with prd_path.open("rb") as f:
+            offset = 0
+            in_frontmatter = False
+            in_fence = False
+
+            for line_no, line in enumerate(f):
+                stripped = line.rstrip(b"\r\n")
+                line_end = offset + len(line)
+                indent = len(stripped) - len(stripped.lstrip(b" \t"))
+
+                if line_no == 0 and stripped == b"---":
+                    in_frontmatter = True
+                    offset = line_end
+                    continue
+                if in_frontmatter:
+                    if stripped == b"---":
+                        in_frontmatter = False
+                    else:
+                        key, sep, value = stripped.decode("utf-8", "replace").partition(":")
+                        if sep and key.strip():
+                            frontmatter[key.strip()] = value.strip().strip("\"'")
+                    offset = line_end
+                    continue
+
+                is_fence = _FENCE.match(stripped) is not None
+                heading = None if in_fence or is_fence else _HEADING.match(stripped)
+                item = None if in_fence or is_fence else _REQUIREMENT_ITEM.match(stripped)
+                if is_fence:
+                    in_fence = not in_fence
+
+                if heading is not None:
+                    close_item()
+                    level = len(heading.group(1))
+                    close_until(level, offset)
+                    title = heading.group(2).decode("utf-8", "replace")
+                    if match := _REQUIREMENT_HEADING.match(title):
+                        heading_requirements[offset] = match.group(1)
+                        if open_sections and match.group(1) not in open_sections[-1][3]:
+                            open_sections[-1][3].append(match.group(1))
+                    open_sections.append([title, level, offset, []])
+                    offset = line_end
+                    continue
+
+                if item is not None:
+                    close_item()
+                    open_item = [item.group(2).decode("ascii"), indent, offset, line_end]
+                elif open_item is not None and stripped.strip():
+                    # 더 깊이 들여쓴 줄은 항목의 연속, 같은 들여쓰기 이하면 항목 종료
+                    if indent > open_item[1]:
+                        open_item[3] = line_end
+                    else:
+                        close_item()
+
+                if open_sections and not in_fence and not is_fence:
+                    reqs = open_sections[-1][3]
+                    for req in _REQUIREMENT_ID.findall(stripped):
+                        req_id = req.decode("ascii")
+                        if req_id not in reqs:
+                            reqs.append(req_id)
+
+                offset = line_end
+
+        close_item()
+        close_until(0, offset)
+        sections.sort(key=lambda s: s.start)
+
+        # 헤딩 정의("### FR-001: ...")가 목록 항목 언급("- FR-001: ...")보다 우선
+        heading_spans: dict[str, tuple[int, int]] = {}
+        for section in sections:
+            req_id = heading_requirements.get(section.start)
+            if req_id is not None:
+                heading_spans.setdefault(req_id, (section.start, section.end))
+        requirements.update(heading_spans)
+
+        return cls(
+            prd_id=frontmatter.get("id") or prd_path.stem,
+            source_mtime_ns=stat.st_mtime_ns,
+            source_size=stat.st_size,
+            frontmatter=frontmatter,
+            sections=sections,
+            requirements=requirements,
+        )
+
+    @classmethod
+    def load(cls, index_path: Path) -> PrdIndex | None:
+        """저장된 인덱스 로드.
+
+        Returns:
+            PrdIndex, 파일이 없거나 형식이 다르면 None
+        """
+        if not index_path.exists():
+            return None
+
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+            if data.get("version") != cls.VERSION:
+                return None
+            return cls(
+                prd_id=data["prd_id"],
+                source_mtime_ns=data["source_mtime_ns"],
+                source_size=data["source_size"],
+                frontmatter=data.get("frontmatter", {}),
+                sections=[
+                    PrdSection(s[0], s[1], s[2], s[3], tuple(s[4])) for s in data["sections"]
+                ],
+                requirements={k: (v[0], v[1]) for k, v in data.get("requirements", {}).items()},
+            )
+        except (json.JSONDecodeError, KeyError, IndexError, TypeError, OSError):
+            return None
+
+    def save(self, index_path: Path) -> None:
+        """인덱스 저장 (섹션은 배열로 압축 저장)."""
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": self.VERSION,
+            "prd_id": self.prd_id,
+            "source_mtime_ns": self.source_mtime_ns,
+            "source_size": self.source_size,
+            "frontmatter": self.frontmatter,
+            "sections": [
+                [s.title, s.level, s.start, s.end, list(s.requirements)] for s in self.sections
+            ],
+            "requirements": {k: list(v) for k, v in self.requirements.items()},
+        }
+        tmp_path = index_path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+        )
+        tmp_path.replace(index_path)
+
+    def is_fresh(self, prd_path: Path) -> bool:
+        """PRD가 인덱스 생성 이후 변경되지 않았는지 확인."""
+        try:
+            stat = prd_path.stat()
+        except OSError:
+            return False
+        return stat.st_mtime_ns == self.source_mtime_ns and stat.st_size == self.source_size
+
+    @classmethod
+    def for_prd(cls, prd_path: Path, persist: bool = True) -> PrdIndex:
+        """저장된 인덱스를 재사용하고, 없거나 오래되었으면 다시 생성.
+
+        Args:
+            prd_path: PRD 마크다운 파일 경로
+            persist: False면 다시 생성한 인덱스를 저장하지 않음 (읽기 전용)
+
+        Returns:
+            PrdIndex: 최신 인덱스
+        """
+        index_path = cls.index_path_for(prd_path)
+        index = cls.load(index_path)
+        if index is not None and index.is_fresh(prd_path):
+            return index
+
+        index = cls.build(prd_path)
+        if persist:
+            try:
+                index.save(index_path)
+            except OSError:
+                pass
+        return index
+
+    def find_requirement(self, req_id: str) -> PrdSection | None:
+        """요구사항 ID가 속한 섹션 반환."""
+        for section in self.sections:
+            if req_id in section.requirements:
+                return section
+        return None
+
+    def find_heading(self, keyword: str) -> PrdSection | None:
+        """제목에 키워드가 포함된 첫 번째 섹션 반환."""
+        for section in self.sections:
+            if keyword in section.title:
+                return section
+        return None
+
+    @staticmethod
+    def read_range(prd_path: Path, start: int, end: int) -> str:
+        """PRD 파일에서 바이트 범위만 읽기."""
+        with prd_path.open("rb") as f:
+            f.seek(start)
+            return f.read(end - start).decode("utf-8", "replace")
+
+    @staticmethod
+    def read_section(prd_path: Path, section: PrdSection) -> str:
+        """PRD 파일에서 섹션 범위만 읽기."""
+        return PrdIndex.read_range(prd_path, section.start, section.end)
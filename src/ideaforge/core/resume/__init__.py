@@ -0,0 +1,9 @@
+"""Checkpoint-aware resume for IdeaForge projects.
+
+체크포인트 스냅샷과 현재 태스크가 참조하는 PRD 섹션만으로
+작업 재개용 컨텍스트 번들을 생성합니다.
+"""
+
+from .context import ResumeContext, ResumeContextBuilder, ResumeResult
+
+__all__ = ["ResumeContext", "ResumeContextBuilder", "ResumeResult"]
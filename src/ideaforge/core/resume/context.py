@@ -0,0 +1,203 @@
+"""Resume context bundle builder for IdeaForge projects."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ideaforge.core.prd import PrdDocument, PrdIndex
+
+_REQUIREMENT_ID = re.compile(r"\bN?FR-\d+\b")
+
+
+class ResumeContext(NamedTuple):
+    """작업 재개에 필요한 최소 컨텍스트."""
+
+    prd_id: str
+    title: str
+    checkpoint: dict[str, Any]  # 체크포인트 스냅샷 (요약)
+    current_task: dict[str, Any] | None  # tasks.json의 현재 태스크
+    sections: dict[str, str]  # 요구사항 ID 또는 섹션 제목 → 본문
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 직렬화용 딕셔너리 반환."""
+        return self._asdict()
+
+    def to_markdown(self) -> str:
+        """프롬프트에 넣을 마크다운 번들 반환."""
+        cp = self.checkpoint
+        lines = [f"# Resume: {self.prd_id} — {self.title}", ""]
+
+        current = cp.get("current_task") or "-"
+        phase = cp.get("current_phase")
+        lines.append(f"- status: {cp.get('status', 'in_progress')}")
+        lines.append(f"- current_task: {current}" + (f" ({phase})" if phase else ""))
+        pending = cp.get("pending_tasks", [])
+        lines.append(
+            f"- completed: {cp.get('completed_count', 0)} / pending: {len(pending)}"
+            + (f" ({', '.join(pending)})" if pending else "")
+        )
+        if cp.get("last_updated"):
+            lines.append(f"- last_updated: {cp['last_updated']}")
+
+        if self.current_task:
+            lines += [
+                "",
+                "## Current Task",
+                "",
+                "```json",
+                json.dumps(self.current_task, ensure_ascii=False),
+                "```",
+            ]
+
+        if self.sections:
+            lines += ["", "## PRD Sections", ""]
+            for text in self.sections.values():
+                lines.append(text.rstrip())
+                lines.append("")
+
+        return "\n".join(lines).rstrip() + "\n"
+
+
+class ResumeResult(NamedTuple):
+    """재개 컨텍스트 생성 결과."""
+
+    success: bool
+    context: ResumeContext | None
+    message: str
+
+
+class ResumeContextBuilder:
+    """체크포인트 기반 재개 컨텍스트 생성기.
+
+    PRD 전체, 에이전트 파일을 다시 읽는 대신 체크포인트 스냅샷과
+    현재 태스크가 참조하는 PRD 섹션만 헤딩 오프셋 인덱스로 읽어옵니다.
+    """
+
+    # 번들에 포함할 체크포인트 필드
+    CHECKPOINT_FIELDS = (
+        "status",
+        "current_task",
+        "current_phase",
+        "pending_tasks",
+        "last_updated",
+        "can_resume",
+        "test_summary",
+    )
+
+    # 참조 요구사항이 없을 때 포함할 섹션
+    FALLBACK_HEADING = "개요"
+
+    def __init__(self, project_path: Path):
+        """초기화.
+
+        Args:
+            project_path: 프로젝트 루트 디렉토리 경로
+        """
+        self.project_path = project_path
+        self.forge_dir = project_path / ".forge"
+
+    def _read_json(self, path: Path) -> dict[str, Any] | None:
+        """JSON 파일 읽기 (없거나 손상되면 None)."""
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def load_checkpoint(self, prd_id: str) -> dict[str, Any] | None:
+        """체크포인트 스냅샷 로드.
+
+        Returns:
+            요약된 체크포인트, 없으면 None
+        """
+        data = self._read_json(self.forge_dir / "progress" / prd_id / "checkpoint.json")
+        if data is None:
+            return None
+
+        snapshot = {k: data[k] for k in self.CHECKPOINT_FIELDS if k in data}
+        snapshot["completed_count"] = len(data.get("completed_tasks") or [])
+        return snapshot
+
+    def load_task(self, prd_id: str, task_id: str) -> dict[str, Any] | None:
+        """tasks.json에서 현재 태스크 항목만 추출."""
+        data = self._read_json(self.forge_dir / "tasks" / prd_id / "tasks.json")
+        if data is None:
+            return None
+
+        for task in data.get("tasks") or []:
+            if isinstance(task, dict) and task.get("id") == task_id:
+                return task
+        return None
+
+    @staticmethod
+    def referenced_requirements(task_id: str, task: dict[str, Any] | None) -> list[str]:
+        """태스크가 참조하는 요구사항 ID 목록 (순서 유지, 중복 제거)."""
+        refs: list[str] = []
+        candidates: list[str] = [task_id]
+        if task:
+            requirements = task.get("requirements") or []
+            if isinstance(requirements, list):
+                candidates.extend(str(r) for r in requirements)
+            candidates.append(str(task.get("title", "")))
+
+        for text in candidates:
+            for req_id in _REQUIREMENT_ID.findall(text):
+                if req_id not in refs:
+                    refs.append(req_id)
+        return refs
+
+    def build(self, prd_id: str) -> ResumeResult:
+        """재개 컨텍스트 생성.
+
+        Args:
+            prd_id: 재개할 PRD ID
+
+        Returns:
+            ResumeResult: 생성 결과
+        """
+        prd_path = self.forge_dir / "prds" / f"{prd_id}.md"
+        if not prd_path.exists():
+            return ResumeResult(False, None, f"PRD 없음: {prd_id}")
+
+        checkpoint = self.load_checkpoint(prd_id)
+        if checkpoint is None:
+            return ResumeResult(False, None, f"체크포인트 없음: {prd_id}")
+
+        if checkpoint.get("can_resume") is False:
+            return ResumeResult(False, None, f"재개할 수 없는 상태: {checkpoint.get('status')}")
+
+        try:
+            document = PrdDocument(prd_path)
+            index = document.index
+
+            task_id = checkpoint.get("current_task") or ""
+            task = self.load_task(prd_id, task_id) if task_id else None
+
+            # 요구사항은 언급된 섹션이 아니라 정의 범위(목록 항목/헤딩)에서 읽음
+            sections: dict[str, str] = {}
+            for req_id in self.referenced_requirements(task_id, task):
+                if req_id not in index.requirements:
+                    continue
+                text = document.section(req_id)
+                if text is not None and text not in sections.values():
+                    sections[req_id] = text
+            if not sections:
+                fallback = index.find_heading(self.FALLBACK_HEADING)
+                if fallback is not None:
+                    sections[fallback.title] = PrdIndex.read_section(prd_path, fallback)
+        except OSError as e:
+            return ResumeResult(False, None, f"PRD 읽기 실패: {e}")
+
+        context = ResumeContext(
+            prd_id=prd_id,
+            title=index.frontmatter.get("title", prd_id),
+            checkpoint=checkpoint,
+            current_task=task,
+            sections=sections,
+        )
+        return ResumeResult(True, context, "재개 컨텍스트 생성 완료")
@@ -0,0 +1,17 @@
+"""Schema validation for IdeaForge `.forge` artifacts.
+
+.forge/의 JSON 산출물을 스키마로 검증합니다:
+  - Compiler: 스키마를 검사 함수 트리로 한 번만 컴파일하고 캐시
+  - Validator: 모든 산출물을 한 번에 검증, mtime 기반 변경분 검증
+"""
+
+from .compiler import compile_schema, load_schema_validator
+from .validator import ArtifactValidator, ValidationIssue, ValidationResult
+
+__all__ = [
+    "ArtifactValidator",
+    "ValidationIssue",
+    "ValidationResult",
+    "compile_schema",
+    "load_schema_validator",
+]
@@ -0,0 +1,262 @@
+"""Minimal JSON Schema (draft-07 subset) compiler.
+
+IdeaForge 스키마에서 사용하는 키워드만 지원합니다:
+  type, enum, const, properties, required, additionalProperties,
+  items, minItems, maxItems, minLength, maxLength, pattern,
+  minimum, maximum, exclusiveMinimum, exclusiveMaximum,
+  anyOf, oneOf, allOf, $ref (문서 내부 참조)
+
+`format`, `default`, `description`, `examples`는 주석으로 취급합니다.
+스키마는 검사 함수 트리로 한 번만 컴파일되고, 이후 검증은 키워드
+해석 없이 함수 호출만 수행합니다.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+# (값, JSON 경로, 오류 목록) → None
+Check = Callable[[Any, str, list[str]], None]
+
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+}
+
+
+def _resolve_ref(root: dict[str, Any], ref: str) -> Any:
+    """문서 내부 `$ref` (예: `#/definitions/task`) 해석 (스키마 객체 또는 boolean 스키마)."""
+    if not ref.startswith("#"):
+        raise ValueError(f"외부 $ref는 지원하지 않습니다: {ref}")
+    node: Any = root
+    for part in ref.lstrip("#").strip("/").split("/"):
+        if part:
+            node = node[part.replace("~1", "/").replace("~0", "~")]
+    return node
+
+
+def _compile(schema: Any, root: dict[str, Any], refs: dict[str, Check]) -> Check:
+    """스키마 노드를 검사 함수로 컴파일."""
+    if schema is True or schema == {}:
+        return lambda value, path, errors: None
+    if schema is False:
+        return lambda value, path, errors: errors.append(f"{path}: 허용되지 않는 값")
+
+    checks: list[Check] = []
+
+    if "$ref" in schema:
+        ref = schema["$ref"]
+        if ref not in refs:
+            # 재귀 참조를 위해 자리 표시자를 먼저 등록
+            holder: list[Check] = []
+            refs[ref] = lambda value, path, errors: holder[0](value, path, errors)
+            holder.append(_compile(_resolve_ref(root, ref), root, refs))
+        checks.append(refs[ref])
+
+    if "type" in schema:
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        type_checks = [_TYPE_CHECKS[t] for t in types]
+        expected = " | ".join(types)
+
+        def check_type(value: Any, path: str, errors: list[str]) -> None:
+            if not any(c(value) for c in type_checks):
+                errors.append(f"{path}: {expected} 타입이어야 합니다")
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+
+        def check_enum(value: Any, path: str, errors: list[str]) -> None:
+            if value not in allowed:
+                errors.append(f"{path}: {allowed} 중 하나여야 합니다 (현재: {value!r})")
+
+        checks.append(check_enum)
+
+    if "const" in schema:
+        const = schema["const"]
+
+        def check_const(value: Any, path: str, errors: list[str]) -> None:
+            if value != const:
+                errors.append(f"{path}: {const!r}이어야 합니다")
+
+        checks.append(check_const)
+
+    checks.extend(_compile_string(schema))
+    checks.extend(_compile_number(schema))
+    checks.extend(_compile_object(schema, root, refs))
+    checks.extend(_compile_array(schema, root, refs))
+
+    for keyword in ("anyOf", "oneOf", "allOf"):
+        if keyword in schema:
+            checks.append(_compile_combinator(keyword, schema[keyword], root, refs))
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any, path: str, errors: list[str]) -> None:
+        for check in checks:
+            check(value, path, errors)
+
+    return check_all
+
+
+def _compile_string(schema: dict[str, Any]) -> list[Check]:
+    """문자열 키워드 컴파일."""
+    checks: list[Check] = []
+
+    if "pattern" in schema:
+        regex = re.compile(schema["pattern"])
+
+        def check_pattern(value: Any, path: str, errors: list[str]) -> None:
+            if isinstance(value, str) and not regex.search(value):
+                errors.append(f"{path}: 패턴 {regex.pattern} 불일치 (현재: {value!r})")
+
+        checks.append(check_pattern)
+
+    min_len = schema.get("minLength")
+    max_len = schema.get("maxLength")
+    if min_len is not None or max_len is not None:
+
+        def check_length(value: Any, path: str, errors: list[str]) -> None:
+            if not isinstance(value, str):
+                return
+            if min_len is not None and len(value) < min_len:
+                errors.append(f"{path}: 최소 {min_len}자 이상이어야 합니다")
+            if max_len is not None and len(value) > max_len:
+                errors.append(f"{path}: 최대 {max_len}자 이하여야 합니다")
+
+        checks.append(check_length)
+
+    return checks
+
+
+def _compile_number(schema: dict[str, Any]) -> list[Check]:
+    """숫자 범위 키워드 컴파일."""
+    bounds: list[tuple[Any, Callable[[Any, Any], bool], str]] = [
+        (schema.get("minimum"), lambda v, b: v >= b, "이상"),
+        (schema.get("maximum"), lambda v, b: v <= b, "이하"),
+        (schema.get("exclusiveMinimum"), lambda v, b: v > b, "초과"),
+        (schema.get("exclusiveMaximum"), lambda v, b: v < b, "미만"),
+    ]
+    bounds = [b for b in bounds if b[0] is not None]
+    if not bounds:
+        return []
+
+    def check_range(value: Any, path: str, errors: list[str]) -> None:
+        if not _TYPE_CHECKS["number"](value):
+            return
+        for bound, ok, label in bounds:
+            if not ok(value, bound):
+                errors.append(f"{path}: {bound} {label}여야 합니다 (현재: {value})")
+
+    return [check_range]
+
+
+def _compile_object(
+    schema: dict[str, Any], root: dict[str, Any], refs: dict[str, Check]
+) -> list[Check]:
+    """객체 키워드 컴파일."""
+    properties = {
+        name: _compile(sub, root, refs) for name, sub in schema.get("properties", {}).items()
+    }
+    required = list(schema.get("required", []))
+    additional = schema.get("additionalProperties", True)
+    additional_check = None if additional is True else _compile(additional, root, refs)
+
+    if not properties and not required and additional_check is None:
+        return []
+
+    def check_object(value: Any, path: str, errors: list[str]) -> None:
+        if not isinstance(value, dict):
+            return
+        for name in required:
+            if name not in value:
+                errors.append(f"{path}: 필수 필드 '{name}' 없음")
+        for name, item in value.items():
+            check = properties.get(name)
+            if check is not None:
+                check(item, f"{path}.{name}", errors)
+            elif additional_check is not None:
+                additional_check(item, f"{path}.{name}", errors)
+
+    return [check_object]
+
+
+def _compile_array(
+    schema: dict[str, Any], root: dict[str, Any], refs: dict[str, Check]
+) -> list[Check]:
+    """배열 키워드 컴파일."""
+    items = _compile(schema["items"], root, refs) if "items" in schema else None
+    min_items = schema.get("minItems")
+    max_items = schema.get("maxItems")
+
+    if items is None and min_items is None and max_items is None:
+        return []
+
+    def check_array(value: Any, path: str, errors: list[str]) -> None:
+        if not isinstance(value, list):
+            return
+        if min_items is not None and len(value) < min_items:
+            errors.append(f"{path}: 최소 {min_items}개 항목이 필요합니다")
+        if max_items is not None and len(value) > max_items:
+            errors.append(f"{path}: 최대 {max_items}개 항목까지 허용됩니다")
+        if items is not None:
+            for i, item in enumerate(value):
+                items(item, f"{path}[{i}]", errors)
+
+    return [check_array]
+
+
+def _compile_combinator(
+    keyword: str, subschemas: list[Any], root: dict[str, Any], refs: dict[str, Check]
+) -> Check:
+    """anyOf / oneOf / allOf 컴파일."""
+    compiled = [_compile(sub, root, refs) for sub in subschemas]
+
+    def check_combinator(value: Any, path: str, errors: list[str]) -> None:
+        results = []
+        for check in compiled:
+            sub_errors: list[str] = []
+            check(value, path, sub_errors)
+            results.append(sub_errors)
+        passed = sum(1 for r in results if not r)
+
+        if keyword == "allOf":
+            for sub_errors in results:
+                errors.extend(sub_errors)
+        elif keyword == "anyOf" and passed == 0:
+            errors.append(f"{path}: anyOf 조건을 만족하지 않습니다")
+        elif keyword == "oneOf" and passed != 1:
+            errors.append(f"{path}: oneOf 조건 중 정확히 하나를 만족해야 합니다 ({passed}개 일치)")
+
+    return check_combinator
+
+
+def compile_schema(schema: dict[str, Any]) -> Check:
+    """스키마 딕셔너리를 검사 함수로 컴파일."""
+    return _compile(schema, schema, {})
+
+
+@lru_cache(maxsize=None)
+def _load_compiled(path: str, mtime_ns: int) -> Check:
+    """(경로, mtime)별로 컴파일 결과를 캐시."""
+    schema = json.loads(Path(path).read_text(encoding="utf-8"))
+    return compile_schema(schema)
+
+
+def load_schema_validator(schema_path: Path) -> Check:
+    """스키마 파일을 컴파일된 검사 함수로 로드.
+
+    같은 프로세스에서는 파일이 바뀌지 않는 한 다시 컴파일하지 않습니다.
+    """
+    return _load_compiled(str(schema_path), schema_path.stat().st_mtime_ns)
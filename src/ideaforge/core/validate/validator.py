@@ -0,0 +1,203 @@
+"""Schema validation for `.forge` JSON artifacts."""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+from .compiler import Check, load_schema_validator
+
+
+class ValidationIssue(NamedTuple):
+    """검증 오류."""
+
+    path: str  # .forge 기준 상대 경로
+    message: str
+
+
+class ValidationResult(NamedTuple):
+    """검증 결과."""
+
+    success: bool
+    files_checked: int
+    files_skipped: int  # 마지막 검증 이후 변경되지 않아 건너뛴 파일 수
+    issues: list[ValidationIssue]
+    message: str
+
+
+class ArtifactValidator:
+    """`.forge` JSON 산출물 검증기.
+
+    config.json, tasks.json, checkpoint.json을 스키마로 검증하고,
+    tasks/ 및 progress/의 나머지 JSON은 파싱 가능 여부만 확인합니다.
+    통과한 파일의 mtime/크기를 `.forge/.validate-cache.json`에 기록하여
+    `changed_only` 모드에서는 변경된 파일만 다시 검증합니다.
+    """
+
+    # .forge 기준 경로 패턴 → 스키마 파일명
+    ARTIFACT_SCHEMAS = {
+        "config.json": "config.schema.json",
+        "tasks/*/tasks.json": "tasks.schema.json",
+        "progress/*/checkpoint.json": "checkpoint.schema.json",
+    }
+
+    # {ID}/ 아래 JSON을 수집할 디렉토리
+    SCAN_DIRS = ("tasks", "progress")
+
+    # 스키마 위치: 설치된 패키지 → 소스 체크아웃 순
+    SCHEMA_DIRS = [
+        Path(__file__).parent.parent.parent / "schemas",
+        Path(__file__).parent.parent.parent.parent.parent / "schemas",
+    ]
+
+    CACHE_FILENAME = ".validate-cache.json"
+    CACHE_VERSION = 1
+
+    def __init__(self, project_path: Path):
+        """초기화.
+
+        Args:
+            project_path: 프로젝트 루트 디렉토리 경로
+        """
+        self.project_path = project_path
+        self.forge_dir = project_path / ".forge"
+        self.cache_path = self.forge_dir / self.CACHE_FILENAME
+
+    def _schema_path(self, name: str) -> Path | None:
+        """스키마 파일 경로 탐색."""
+        for directory in self.SCHEMA_DIRS:
+            path = directory / name
+            if path.exists():
+                return path
+        return None
+
+    def _schema_fingerprint(self) -> str:
+        """스키마 파일 mtime 지문 (스키마가 바뀌면 캐시 무효화)."""
+        parts = []
+        for name in sorted(set(self.ARTIFACT_SCHEMAS.values())):
+            path = self._schema_path(name)
+            parts.append(f"{name}:{path.stat().st_mtime_ns if path else 0}")
+        return ";".join(parts)
+
+    def _collect(self) -> list[tuple[str, os.stat_result]]:
+        """검증 대상 JSON 파일을 scandir로 수집.
+
+        Returns:
+            (.forge 기준 상대 경로, stat) 목록
+        """
+        files: list[tuple[str, os.stat_result]] = []
+
+        config = self.forge_dir / "config.json"
+        try:
+            files.append(("config.json", config.stat()))
+        except FileNotFoundError:
+            pass
+
+        for dirname in self.SCAN_DIRS:
+            try:
+                with os.scandir(self.forge_dir / dirname) as it:
+                    prd_dirs = [e for e in it if e.is_dir() and not e.name.startswith(".")]
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+            for prd_dir in sorted(prd_dirs, key=lambda e: e.name):
+                with os.scandir(prd_dir.path) as it:
+                    for entry in sorted(it, key=lambda e: e.name):
+                        if entry.name.endswith(".json") and entry.is_file():
+                            rel = f"{dirname}/{prd_dir.name}/{entry.name}"
+                            files.append((rel, entry.stat()))
+
+        return files
+
+    def _load_cache(self, fingerprint: str) -> dict[str, list[int]]:
+        """검증 캐시 로드 (스키마 지문이 다르면 빈 캐시)."""
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return {}
+        if data.get("version") != self.CACHE_VERSION or data.get("schemas") != fingerprint:
+            return {}
+        files = data.get("files", {})
+        return files if isinstance(files, dict) else {}
+
+    def _save_cache(self, fingerprint: str, files: dict[str, list[int]]) -> None:
+        """검증 캐시 저장."""
+        data = {"version": self.CACHE_VERSION, "schemas": fingerprint, "files": files}
+        try:
+            self.cache_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        except OSError:
+            pass
+
+    def _validator_for(self, rel_path: str, compiled: dict[str, Check | None]) -> Check | None:
+        """경로에 맞는 컴파일된 스키마 반환 (없으면 None)."""
+        for pattern, schema_name in self.ARTIFACT_SCHEMAS.items():
+            if fnmatch.fnmatchcase(rel_path, pattern):
+                if schema_name not in compiled:
+                    schema_path = self._schema_path(schema_name)
+                    compiled[schema_name] = (
+                        load_schema_validator(schema_path) if schema_path else None
+                    )
+                return compiled[schema_name]
+        return None
+
+    def validate(self, changed_only: bool = False) -> ValidationResult:
+        """모든 `.forge` JSON 산출물을 한 번에 검증.
+
+        Args:
+            changed_only: True면 마지막 통과 이후 mtime/크기가 바뀐 파일만 검증
+
+        Returns:
+            ValidationResult: 검증 결과
+        """
+        fingerprint = self._schema_fingerprint()
+        cache = self._load_cache(fingerprint)
+        passed: dict[str, list[int]] = {}
+        compiled: dict[str, Check | None] = {}
+        issues: list[ValidationIssue] = []
+        checked = skipped = 0
+
+        for rel_path, stat in self._collect():
+            signature = [stat.st_mtime_ns, stat.st_size]
+            if changed_only and cache.get(rel_path) == signature:
+                passed[rel_path] = signature
+                skipped += 1
+                continue
+
+            checked += 1
+            try:
+                data = json.loads((self.forge_dir / rel_path).read_bytes())
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                issues.append(ValidationIssue(rel_path, f"JSON 파싱 실패: {e}"))
+                continue
+            except OSError as e:
+                issues.append(ValidationIssue(rel_path, f"읽기 실패: {e}"))
+                continue
+
+            check = self._validator_for(rel_path, compiled)
+            errors: list[str] = []
+            if check is not None:
+                check(data, "$", errors)
+
+            if errors:
+                issues.extend(ValidationIssue(rel_path, error) for error in errors)
+            else:
+                passed[rel_path] = signature
+
+        self._save_cache(fingerprint, passed)
+
+        invalid_files = len({issue.path for issue in issues})
+        if issues:
+            message = f"검증 실패: {invalid_files}개 파일, 오류 {len(issues)}개"
+        else:
+            message = f"검증 통과: {checked}개 파일 검사, {skipped}개 변경 없음"
+
+        return ValidationResult(
+            success=not issues,
+            files_checked=checked,
+            files_skipped=skipped,
+            issues=issues,
+            message=message,
+        )
@@ -72,6 +72,72 @@ function parsePrdFrontmatter(content) {
   return {};
 }
 
+/**
+ * Helper: Load PRD section index (written by `forge index` / `forge resume`)
+ * Returns null when the index is missing or the PRD changed since it was built.
+ */
+function loadPrdIndex(id) {
+  const prdFile = path.join(FORGE_DIR, 'prds', `${id}.md`);
+  const index = readJsonFile(path.join(FORGE_DIR, 'prds', '.index', `${id}.json`));
+  if (!index || index.version !== 2) {
+    return null;
+  }
+  try {
+    const stat = fs.statSync(prdFile, { bigint: true });
+    if (Number(stat.mtimeNs) !== index.source_mtime_ns || Number(stat.size) !== index.source_size) {
+      return null;
+    }
+  } catch (err) {
+    return null;
+  }
+  return index;
+}
+
+/**
+ * Helper: Read a byte range of a file
+ */
+function readByteRange(filePath, start, end) {
+  const fd = fs.openSync(filePath, 'r');
+  try {
+    const buffer = Buffer.alloc(end - start);
+    fs.readSync(fd, buffer, 0, end - start, start);
+    return buffer.toString('utf8');
+  } finally {
+    fs.closeSync(fd);
+  }
+}
+
+/**
+ * Helper: Find a section by scanning the whole PRD (fallback without index)
+ */
+function scanPrdSection(content, key) {
+  const lines = content.split('\n');
+  const requirement = /^N?FR-\d+$/i.test(key);
+
+  if (requirement) {
+    const itemPattern = new RegExp(`^\\s*[-*+]\\s+(\\[[ xX]\\]\\s+)?${key}\\b`, 'i');
+    const line = lines.find(l => itemPattern.test(l));
+    if (line) {
+      return line + '\n';
+    }
+  }
+
+  const start = lines.findIndex(l => /^#{1,6}\s/.test(l) && l.replace(/^#+\s+/, '').includes(key));
+  if (start === -1) {
+    return null;
+  }
+  const level = lines[start].match(/^#+/)[0].length;
+  let end = start + 1;
+  while (end < lines.length) {
+    const match = lines[end].match(/^(#{1,6})\s/);
+    if (match && match[1].length <= level) {
+      break;
+    }
+    end++;
+  }
+  return lines.slice(start, end).join('\n') + '\n';
+}
+
 /**
  * API: Get all PRDs
  */
@@ -149,6 +215,39 @@ app.get('/api/prds/:id', (req, res) => {
   });
 });
 
+/**
+ * API: Get a single PRD section by heading title or FR/NFR id
+ */
+app.get('/api/prds/:id/sections/:key', (req, res) => {
+  const { id, key } = req.params;
+  const prdFile = path.join(FORGE_DIR, 'prds', `${id}.md`);
+
+  if (!fs.existsSync(prdFile)) {
+    return res.status(404).json({ error: 'PRD not found' });
+  }
+
+  const index = loadPrdIndex(id);
+  if (index) {
+    const span = /^N?FR-\d+$/i.test(key) ? index.requirements[key.toUpperCase()] : null;
+    if (span) {
+      return res.json({ id, key, indexed: true, content: readByteRange(prdFile, span[0], span[1]) });
+    }
+
+    // sections: [title, level, start, end, requirements]
+    const section = index.sections.find(s => s[0] === key) || index.sections.find(s => s[0].includes(key));
+    if (section) {
+      return res.json({ id, key, indexed: true, content: readByteRange(prdFile, section[2], section[3]) });
+    }
+    return res.status(404).json({ error: 'Section not found' });
+  }
+
+  const content = scanPrdSection(readMarkdownFile(prdFile) || '', key);
+  if (content === null) {
+    return res.status(404).json({ error: 'Section not found' });
+  }
+  res.json({ id, key, indexed: false, content });
+});
+
 /**
  * API: Get tasks for PRD
  */
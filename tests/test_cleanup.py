@@ -0,0 +1,168 @@
+"""보관 정책/로그 회전 테스트"""
+
+import json
+import os
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from ideaforge.cli.main import cli
+from ideaforge.core.cleanup import CleanupExecutor, CleanupPolicy
+
+NOW = 2_000_000_000.0
+DAY = 86400
+
+
+def write(path: Path, content: str, age_days: float = 0) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    mtime = NOW - age_days * DAY
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def snapshot(root: Path) -> dict[str, tuple[bytes, float]]:
+    return {
+        str(p.relative_to(root)): (p.read_bytes(), p.stat().st_mtime)
+        for p in sorted(root.rglob("*"))
+        if p.is_file()
+    }
+
+
+def make_project(tmp_path: Path) -> Path:
+    logs = tmp_path / ".forge" / "logs"
+    write(logs / "old.txt", "x" * 100, age_days=40)
+    write(logs / "recent.txt", "y" * 10, age_days=1)
+    write(logs / "build.log", "z" * 2048)
+    write(logs / "build.log.1", "one")
+    write(logs / "build.log.2", "two")
+    write(tmp_path / ".forge" / "reports" / "draft.tmp", "t" * 50, age_days=31)
+    write(tmp_path / ".forge" / "reports" / "report.md", "keep", age_days=90)
+    return tmp_path
+
+
+POLICY = CleanupPolicy(retention_days=30, max_log_size_mb=1 / 1024, max_rotated_logs=2)
+
+
+def test_retention_deletes_only_expired_targets(tmp_path: Path):
+    """보관 기간이 지난 대상 파일만 삭제"""
+    project = make_project(tmp_path)
+
+    result = CleanupExecutor(project, POLICY).run(now=NOW)
+
+    assert result.success
+    assert result.files_deleted == 2
+    assert result.bytes_freed == 150
+    assert not (project / ".forge" / "logs" / "old.txt").exists()
+    assert not (project / ".forge" / "reports" / "draft.tmp").exists()
+    assert (project / ".forge" / "logs" / "recent.txt").exists()
+    # targets에 없는 파일은 오래돼도 유지
+    assert (project / ".forge" / "reports" / "report.md").exists()
+
+
+def test_rotation_shifts_and_truncates(tmp_path: Path):
+    """크기 상한을 넘은 로그는 .1로 복사 후 비우고, 상한을 넘는 회전 파일은 삭제"""
+    project = make_project(tmp_path)
+    logs = project / ".forge" / "logs"
+
+    result = CleanupExecutor(project, POLICY).run(now=NOW)
+
+    assert result.files_rotated == 1
+    assert (logs / "build.log").read_text() == ""
+    assert (logs / "build.log.1").read_text() == "z" * 2048
+    assert (logs / "build.log.2").read_text() == "one"
+    assert not (logs / "build.log.3").exists()
+
+
+def test_dry_run_touches_nothing(tmp_path: Path):
+    """dry-run은 결과만 계산하고 파일 내용/mtime을 바꾸지 않음"""
+    project = make_project(tmp_path)
+    before = snapshot(project)
+
+    result = CleanupExecutor(project, POLICY).run(dry_run=True, now=NOW)
+
+    assert result.success
+    assert (result.files_deleted, result.files_rotated, result.bytes_freed) == (2, 1, 150)
+    assert result.message.startswith("[dry-run]")
+    assert snapshot(project) == before
+
+
+def test_bytes_freed_counts_only_removed_files(tmp_path: Path, monkeypatch):
+    """삭제에 실패한 파일은 삭제 수/확보 공간에 포함하지 않음"""
+    project = make_project(tmp_path)
+    real_unlink = os.unlink
+
+    def unlink(path, *args, **kwargs):
+        if str(path).endswith("old.txt"):
+            raise PermissionError(path)
+        return real_unlink(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "unlink", unlink)
+
+    result = CleanupExecutor(project, POLICY).run(now=NOW)
+
+    assert result.success
+    assert result.files_deleted == 1
+    assert result.bytes_freed == 50
+    assert (project / ".forge" / "logs" / "old.txt").exists()
+
+
+def test_disabled_policy_does_nothing(tmp_path: Path):
+    project = make_project(tmp_path)
+    before = snapshot(project)
+
+    result = CleanupExecutor(project, POLICY._replace(enabled=False)).run(now=NOW)
+
+    assert result.files_deleted == 0
+    assert snapshot(project) == before
+
+
+def test_targets_outside_project_are_ignored(tmp_path: Path):
+    """프로젝트 밖을 가리키는 대상 패턴은 무시"""
+    project = tmp_path / "project"
+    outside = write(tmp_path / "outside" / "old.txt", "x", age_days=400)
+    (project / ".forge").mkdir(parents=True)
+
+    policy = CleanupPolicy(targets=("../outside/*",))
+    CleanupExecutor(project, policy).run(now=NOW)
+
+    assert outside.exists()
+
+
+def test_policy_from_config(tmp_path: Path):
+    config = tmp_path / ".forge" / "config.json"
+    config.parent.mkdir(parents=True)
+    config.write_text(
+        json.dumps(
+            {"document_management": {"cleanup": {"retention_days": 7, "auto_run": True}}}
+        ),
+        encoding="utf-8",
+    )
+
+    policy = CleanupPolicy.from_config(tmp_path)
+
+    assert policy.retention_days == 7
+    assert policy.auto_run is True
+    assert policy.targets == CleanupPolicy().targets
+
+
+def test_auto_run_hook_runs_only_when_enabled(tmp_path: Path, monkeypatch):
+    """auto_run이 켜진 경우에만 다른 명령 실행 후 백그라운드 정리 시작"""
+    started = []
+    monkeypatch.setattr(
+        CleanupExecutor, "run_in_background", lambda self: started.append(self.project_path)
+    )
+    monkeypatch.chdir(tmp_path)
+    config = tmp_path / ".forge" / "config.json"
+    config.parent.mkdir(parents=True)
+
+    config.write_text(json.dumps({}), encoding="utf-8")
+    assert CliRunner().invoke(cli, ["list"]).exit_code == 0
+    assert started == []
+
+    config.write_text(
+        json.dumps({"document_management": {"cleanup": {"auto_run": True}}}), encoding="utf-8"
+    )
+    assert CliRunner().invoke(cli, ["list"]).exit_code == 0
+    assert CliRunner().invoke(cli, ["clean", "--dry-run"]).exit_code == 0
+    assert len(started) == 1
@@ -0,0 +1,191 @@
+"""포트폴리오 가져오기 테스트"""
+
+import hashlib
+import zlib
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from ideaforge.cli.main import cli
+from ideaforge.core.portfolio import PortfolioExporter, PortfolioImporter
+from ideaforge.core.portfolio.archive import ArchiveManifest, write_header, write_trailer
+
+
+def make_prd(forge: Path, prd_id: str, body: str, task_files: dict[str, str]) -> None:
+    (forge / "prds").mkdir(parents=True, exist_ok=True)
+    (forge / "prds" / f"{prd_id}.md").write_text(body, encoding="utf-8")
+    tasks = forge / "tasks" / prd_id
+    tasks.mkdir(parents=True, exist_ok=True)
+    for name, content in task_files.items():
+        (tasks / name).write_text(content, encoding="utf-8")
+
+
+def write_archive(
+    path: Path, prd_ids: list[str], files: dict[str, bytes], payload: bytes | None = None
+) -> None:
+    """manifest를 직접 구성한 아카이브 생성 (payload로 실제 내용을 바꿀 수 있음)."""
+    with path.open("wb") as out:
+        write_header(out)
+        out.write(zlib.compress(b"".join(files.values()) if payload is None else payload))
+        write_trailer(
+            out,
+            ArchiveManifest(
+                prd_ids=prd_ids,
+                file_paths=list(files),
+                file_blobs=list(range(len(files))),
+                file_mtimes=[0.0] * len(files),
+                blob_hashes=[hashlib.sha256(data).hexdigest() for data in files.values()],
+                blob_sizes=[len(data) for data in files.values()],
+            ),
+        )
+
+
+def test_rejects_manifest_ids_that_differ_from_paths(tmp_path: Path):
+    """manifest ID와 파일 경로가 다르면 기존 PRD를 덮어쓰지 않음"""
+    forge = tmp_path / ".forge"
+    make_prd(forge, "AUTH-001", "# original\n", {})
+
+    archive = tmp_path / "evil.ifpk"
+    write_archive(archive, ["OTHER-001"], {"prds/AUTH-001.md": b"# replaced\n"})
+
+    result = PortfolioImporter(tmp_path).import_archive(archive, on_conflict="fail")
+
+    assert not result.success
+    assert (forge / "prds" / "AUTH-001.md").read_text(encoding="utf-8") == "# original\n"
+
+
+def test_overwrite_removes_stale_files(tmp_path: Path):
+    """overwrite는 기존 PRD 디렉토리의 남은 파일을 제거"""
+    source = tmp_path / "source"
+    make_prd(source / ".forge", "AUTH-001", "# new\n", {"tasks.json": "{}"})
+    archive = tmp_path / "portfolio.ifpk"
+    assert PortfolioExporter(source).export(archive).success
+
+    target = tmp_path / "target"
+    make_prd(target / ".forge", "AUTH-001", "# old\n", {"tasks.json": "[]", "stale.md": "x"})
+
+    result = PortfolioImporter(target).import_archive(archive, on_conflict="overwrite")
+
+    assert result.success
+    tasks = target / ".forge" / "tasks" / "AUTH-001"
+    assert sorted(p.name for p in tasks.iterdir()) == ["tasks.json"]
+    assert (tasks / "tasks.json").read_text(encoding="utf-8") == "{}"
+
+
+def test_cli_import_failure_exits_nonzero(tmp_path: Path, monkeypatch):
+    """가져오기 실패 시 종료 코드 1"""
+    make_prd(tmp_path / ".forge", "AUTH-001", "# original\n", {})
+    archive = tmp_path / "portfolio.ifpk"
+    write_archive(archive, ["AUTH-001"], {"prds/AUTH-001.md": b"# replaced\n"})
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(cli, ["import", str(archive)])
+
+    assert result.exit_code == 1
+
+
+def test_corrupt_archive_keeps_existing_prd(tmp_path: Path):
+    """해시가 맞지 않는 아카이브는 overwrite여도 기존 PRD를 지우지 않음"""
+    source = tmp_path / "source"
+    make_prd(source / ".forge", "AUTH-001", "# new\n", {"tasks.json": "{}"})
+    archive = tmp_path / "portfolio.ifpk"
+    assert PortfolioExporter(source).export(archive, level=0).success
+    data = bytearray(archive.read_bytes())
+    offset = data.index(b"# new")
+    data[offset + 2 : offset + 5] = b"BAD"
+    archive.write_bytes(bytes(data))
+
+    target = tmp_path / "target"
+    make_prd(target / ".forge", "AUTH-001", "# old\n", {"tasks.json": "[]"})
+    before = sorted(p.relative_to(target) for p in (target / ".forge").rglob("*"))
+
+    result = PortfolioImporter(target).import_archive(archive, on_conflict="overwrite")
+
+    assert not result.success
+    assert "손상" in result.message
+    forge = target / ".forge"
+    assert (forge / "prds" / "AUTH-001.md").read_text(encoding="utf-8") == "# old\n"
+    assert (forge / "tasks" / "AUTH-001" / "tasks.json").read_text(encoding="utf-8") == "[]"
+    assert sorted(p.relative_to(target) for p in forge.rglob("*")) == before
+
+
+def test_hash_mismatch_keeps_existing_prd(tmp_path: Path):
+    """blob 해시가 manifest와 다르면 아무것도 반영하지 않음"""
+    files = {"prds/AUTH-001.md": b"# new\n", "tasks/AUTH-001/tasks.json": b"{}"}
+    archive = tmp_path / "tampered.ifpk"
+    write_archive(archive, ["AUTH-001"], files, payload=b"# new\n[]")
+    make_prd(tmp_path / ".forge", "AUTH-001", "# old\n", {"tasks.json": "[]"})
+
+    result = PortfolioImporter(tmp_path).import_archive(archive, on_conflict="overwrite")
+
+    assert not result.success
+    assert "해시" in result.message
+    forge = tmp_path / ".forge"
+    assert (forge / "prds" / "AUTH-001.md").read_text(encoding="utf-8") == "# old\n"
+    assert (forge / "tasks" / "AUTH-001" / "tasks.json").read_text(encoding="utf-8") == "[]"
+
+
+def test_truncated_archive_keeps_existing_prd(tmp_path: Path):
+    """잘린 압축 스트림도 기존 PRD를 건드리지 않음"""
+    files = {"prds/AUTH-001.md": b"# new\n", "tasks/AUTH-001/tasks.json": b"{}"}
+    archive = tmp_path / "short.ifpk"
+    with archive.open("wb") as out:
+        write_header(out)
+        out.write(zlib.compress(b"# new\n"))  # 두 번째 blob 없음
+        write_trailer(
+            out,
+            ArchiveManifest(
+                prd_ids=["AUTH-001"],
+                file_paths=list(files),
+                file_blobs=[0, 1],
+                file_mtimes=[0.0, 0.0],
+                blob_hashes=[hashlib.sha256(data).hexdigest() for data in files.values()],
+                blob_sizes=[len(data) for data in files.values()],
+            ),
+        )
+    make_prd(tmp_path / ".forge", "AUTH-001", "# old\n", {"tasks.json": "[]"})
+
+    result = PortfolioImporter(tmp_path).import_archive(archive, on_conflict="overwrite")
+
+    assert not result.success
+    forge = tmp_path / ".forge"
+    assert (forge / "prds" / "AUTH-001.md").read_text(encoding="utf-8") == "# old\n"
+    assert (forge / "tasks" / "AUTH-001" / "tasks.json").read_text(encoding="utf-8") == "[]"
+    assert not list(forge.glob(".import-*"))
+
+
+def test_overwrite_replaces_all_prd_directories(tmp_path: Path):
+    """overwrite는 아카이브에 없는 기존 디렉토리까지 교체하고 다른 PRD는 유지"""
+    source = tmp_path / "source"
+    make_prd(source / ".forge", "AUTH-001", "# new\n", {"tasks.json": "{}"})
+    archive = tmp_path / "portfolio.ifpk"
+    assert PortfolioExporter(source).export(archive).success
+
+    target = tmp_path / "target"
+    forge = target / ".forge"
+    make_prd(forge, "AUTH-001", "# old\n", {"tasks.json": "[]"})
+    make_prd(forge, "PAY-001", "# pay\n", {"tasks.json": "[]"})
+    (forge / "agents" / "AUTH-001").mkdir(parents=True)
+    (forge / "agents" / "AUTH-001" / "agent.md").write_text("old agent", encoding="utf-8")
+
+    result = PortfolioImporter(target).import_archive(archive, on_conflict="overwrite")
+
+    assert result.success
+    assert result.imported_ids == ["AUTH-001"]
+    assert (forge / "prds" / "AUTH-001.md").read_text(encoding="utf-8") == "# new\n"
+    assert not (forge / "agents" / "AUTH-001").exists()
+    assert (forge / "prds" / "PAY-001.md").read_text(encoding="utf-8") == "# pay\n"
+    assert not list(forge.glob(".import-*"))
+
+
+def test_rejects_nested_member_paths(tmp_path: Path):
+    """prds/ 하위 디렉토리나 ID 디렉토리 없는 경로는 거부"""
+    for path in ["prds/nested/AUTH-001.md", "tasks/AUTH-001", "prds/.index.md"]:
+        archive = tmp_path / "nested.ifpk"
+        write_archive(archive, ["AUTH-001"], {path: b"x"})
+
+        result = PortfolioImporter(tmp_path).import_archive(archive)
+
+        assert not result.success, path
+        assert "허용되지 않는 경로" in result.message
+    assert not (tmp_path / ".forge" / "prds").exists()
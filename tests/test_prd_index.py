@@ -0,0 +1,150 @@
+"""PRD 헤딩/요구사항 인덱스 테스트"""
+
+import os
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from ideaforge.cli.main import cli
+from ideaforge.core.prd import PrdDocument, PrdIndex
+
+PRD = """---
+id: AUTH-001
+title: "인증"
+---
+# 인증
+
+## 1. 개요
+
+- FR-001: 로그인 (요약)
+- FR-002: 로그아웃 (요약)
+
+## 2. 기능 요구사항
+
+### FR-001: 로그인
+
+이메일과 비밀번호로 로그인한다.
+
+## 3. 비기능 요구사항
+
+- [ ] NFR-001: 응답 시간 200ms 이하
+  - p95 기준
+- NFR-002: 가용성 99.9%
+
+```
+### FR-999: 코드 블록 안의 헤딩은 무시
+```
+"""
+
+
+def write_prd(tmp_path: Path, text: str = PRD) -> Path:
+    path = tmp_path / ".forge" / "prds" / "AUTH-001.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_build_records_sections_and_frontmatter(tmp_path: Path):
+    index = PrdIndex.build(write_prd(tmp_path))
+
+    assert index.prd_id == "AUTH-001"
+    assert index.frontmatter["title"] == "인증"
+    assert [(s.title, s.level) for s in index.sections] == [
+        ("인증", 1),
+        ("1. 개요", 2),
+        ("2. 기능 요구사항", 2),
+        ("FR-001: 로그인", 3),
+        ("3. 비기능 요구사항", 2),
+    ]
+    overview = index.find_heading("개요")
+    assert overview is not None
+    assert overview.requirements == ("FR-001", "FR-002")
+
+
+def test_heading_definition_wins_over_overview_bullet(tmp_path: Path):
+    """개요의 목록 항목보다 ### FR-001 헤딩 정의가 우선"""
+    path = write_prd(tmp_path)
+    doc = PrdDocument(path)
+
+    text = doc.section("FR-001")
+    assert text is not None
+    assert text.startswith("### FR-001: 로그인")
+    assert "이메일과 비밀번호" in text
+    # 헤딩 정의가 없는 요구사항은 목록 항목 범위
+    assert doc.section("FR-002") == "- FR-002: 로그아웃 (요약)\n"
+
+
+def test_list_item_span_includes_indented_continuation(tmp_path: Path):
+    doc = PrdDocument(write_prd(tmp_path))
+
+    assert doc.section("nfr-001") == "- [ ] NFR-001: 응답 시간 200ms 이하\n  - p95 기준\n"
+    assert doc.section("NFR-002") == "- NFR-002: 가용성 99.9%\n"
+    assert doc.section("FR-999") is None
+    assert doc.requirement_ids() == ["FR-002", "FR-001", "NFR-001", "NFR-002"]
+
+
+def test_section_by_title(tmp_path: Path):
+    doc = PrdDocument(write_prd(tmp_path))
+
+    exact = doc.section("2. 기능 요구사항")
+    assert exact is not None
+    assert exact.startswith("## 2. 기능 요구사항")
+    assert "### FR-001" in exact
+    assert "## 3." not in exact
+    assert doc.section("비기능") is not None
+    assert doc.section("없는 섹션") is None
+    assert doc.title == "인증"
+
+
+def test_save_load_and_freshness(tmp_path: Path):
+    path = write_prd(tmp_path)
+    index_path = PrdIndex.index_path_for(path)
+
+    built = PrdIndex.for_prd(path)
+    assert index_path.exists()
+    loaded = PrdIndex.load(index_path)
+    assert loaded is not None
+    assert loaded.sections == built.sections
+    assert loaded.requirements == built.requirements
+    assert loaded.is_fresh(path)
+
+    path.write_text(PRD + "\n## 4. 추가\n", encoding="utf-8")
+    assert not loaded.is_fresh(path)
+    assert PrdIndex.for_prd(path).find_heading("4. 추가") is not None
+
+
+def test_read_only_document_does_not_write_index(tmp_path: Path):
+    path = write_prd(tmp_path)
+
+    assert PrdDocument(path, persist_index=False).section("FR-001") is not None
+    assert not PrdIndex.index_path_for(path).exists()
+
+
+def test_cli_index_builds_then_reuses(tmp_path: Path, monkeypatch):
+    path = write_prd(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["index"])
+    assert result.exit_code == 0
+    assert "생성 1개, 재사용 0개" in result.output
+    assert PrdIndex.index_path_for(path).exists()
+
+    result = runner.invoke(cli, ["index", "AUTH-001"])
+    assert "생성 0개, 재사용 1개" in result.output
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    result = runner.invoke(cli, ["index"])
+    assert "생성 1개, 재사용 0개" in result.output
+
+
+def test_cli_status_is_read_only(tmp_path: Path, monkeypatch):
+    path = write_prd(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(cli, ["status"])
+
+    assert result.exit_code == 0
+    assert "인증" in result.output
+    assert not PrdIndex.index_path_for(path).parent.exists()
@@ -0,0 +1,82 @@
+"""재개 컨텍스트 생성 테스트"""
+
+import json
+from pathlib import Path
+
+from ideaforge.core.resume.context import ResumeContextBuilder
+
+PRD = """---
+id: AUTH-001
+title: 인증
+---
+# 인증
+
+## 1. 개요
+
+로그인(FR-001)과 로그아웃(FR-002)을 제공한다.
+
+## 2. 기능 요구사항
+
+### FR-001: 로그인
+
+이메일과 비밀번호로 로그인한다. 세션은 FR-002에서 종료한다.
+
+### FR-002: 로그아웃
+
+세션을 종료한다.
+"""
+
+
+def make_project(tmp_path: Path, current_task: str, requirements: list[str]) -> Path:
+    forge = tmp_path / ".forge"
+    (forge / "prds").mkdir(parents=True)
+    (forge / "prds" / "AUTH-001.md").write_text(PRD, encoding="utf-8")
+
+    progress = forge / "progress" / "AUTH-001"
+    progress.mkdir(parents=True)
+    (progress / "checkpoint.json").write_text(
+        json.dumps({"status": "in_progress", "current_task": current_task, "can_resume": True}),
+        encoding="utf-8",
+    )
+
+    tasks = forge / "tasks" / "AUTH-001"
+    tasks.mkdir(parents=True)
+    (tasks / "tasks.json").write_text(
+        json.dumps({"tasks": [{"id": current_task, "requirements": requirements}]}),
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+def build_sections(tmp_path: Path, requirements: list[str]) -> dict[str, str]:
+    project = make_project(tmp_path, "T-001", requirements)
+    result = ResumeContextBuilder(project).build("AUTH-001")
+    assert result.success, result.message
+    assert result.context is not None
+    return result.context.sections
+
+
+def test_requirement_uses_definition_not_first_mention(tmp_path: Path):
+    """개요에서 먼저 언급돼도 요구사항 정의 섹션을 사용"""
+    sections = build_sections(tmp_path, ["FR-001"])
+
+    assert list(sections) == ["FR-001"]
+    assert sections["FR-001"].startswith("### FR-001: 로그인")
+    assert "1. 개요" not in sections["FR-001"]
+    assert "### FR-002" not in sections["FR-001"]
+
+
+def test_requirement_mentioned_in_other_definition(tmp_path: Path):
+    """다른 요구사항 본문에서 언급돼도 자기 정의만 포함"""
+    sections = build_sections(tmp_path, ["FR-002"])
+
+    assert list(sections) == ["FR-002"]
+    assert sections["FR-002"].startswith("### FR-002: 로그아웃")
+    assert "로그인" not in sections["FR-002"]
+
+
+def test_unknown_requirement_falls_back_to_overview(tmp_path: Path):
+    """정의되지 않은 요구사항만 참조하면 개요 섹션 사용"""
+    sections = build_sections(tmp_path, ["FR-009"])
+
+    assert list(sections) == ["1. 개요"]
@@ -0,0 +1,303 @@
+"""스키마 컴파일러 / 산출물 검증기 테스트"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from ideaforge.cli.main import cli
+from ideaforge.core.validate import ArtifactValidator, compile_schema, load_schema_validator
+
+
+def errors_of(schema: dict[str, Any], value: Any) -> list[str]:
+    errors: list[str] = []
+    compile_schema(schema)(value, "$", errors)
+    return errors
+
+
+# --- 컴파일러: 키워드 ---
+
+
+def test_type_integer_rejects_float_and_bool():
+    schema = {"type": "integer"}
+    assert errors_of(schema, 3) == []
+    assert errors_of(schema, 1.0) == ["$: integer 타입이어야 합니다"]
+    assert errors_of(schema, True) == ["$: integer 타입이어야 합니다"]
+
+
+def test_type_number_accepts_int_and_float():
+    schema = {"type": "number"}
+    assert errors_of(schema, 1) == []
+    assert errors_of(schema, 1.5) == []
+    assert errors_of(schema, "1") == ["$: number 타입이어야 합니다"]
+
+
+def test_type_list_allows_any_listed_type():
+    schema = {"type": ["string", "null"]}
+    assert errors_of(schema, None) == []
+    assert errors_of(schema, "a") == []
+    assert errors_of(schema, 1) == ["$: string | null 타입이어야 합니다"]
+
+
+def test_required_reports_each_missing_field():
+    schema = {"type": "object", "required": ["a", "b"]}
+    assert errors_of(schema, {"a": 1, "b": 2}) == []
+    assert errors_of(schema, {}) == ["$: 필수 필드 'a' 없음", "$: 필수 필드 'b' 없음"]
+
+
+def test_properties_report_nested_path():
+    schema = {"properties": {"user": {"properties": {"age": {"type": "integer"}}}}}
+    assert errors_of(schema, {"user": {"age": "x"}}) == ["$.user.age: integer 타입이어야 합니다"]
+
+
+def test_additional_properties_false_and_schema():
+    closed = {"properties": {"a": {}}, "additionalProperties": False}
+    assert errors_of(closed, {"a": 1}) == []
+    assert errors_of(closed, {"a": 1, "b": 2}) == ["$.b: 허용되지 않는 값"]
+
+    typed = {"additionalProperties": {"type": "string"}}
+    assert errors_of(typed, {"x": "ok"}) == []
+    assert errors_of(typed, {"x": 1}) == ["$.x: string 타입이어야 합니다"]
+
+
+def test_ref_resolves_definitions_and_recursion():
+    schema = {
+        "definitions": {
+            "node": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {"children": {"type": "array", "items": {"$ref": "#/definitions/node"}}},
+            }
+        },
+        "$ref": "#/definitions/node",
+    }
+    assert errors_of(schema, {"name": "root", "children": [{"name": "leaf"}]}) == []
+    assert errors_of(schema, {"name": "root", "children": [{"children": []}]}) == [
+        "$.children[0]: 필수 필드 'name' 없음"
+    ]
+
+
+def test_external_ref_is_rejected():
+    with pytest.raises(ValueError, match="외부 \\$ref"):
+        compile_schema({"$ref": "other.json#/a"})
+
+
+def test_enum_and_const():
+    assert errors_of({"enum": ["RED", None]}, None) == []
+    assert errors_of({"enum": ["RED", None]}, "BLUE") == [
+        "$: ['RED', None] 중 하나여야 합니다 (현재: 'BLUE')"
+    ]
+    assert errors_of({"const": 1}, 2) == ["$: 1이어야 합니다"]
+
+
+def test_pattern_and_length_apply_only_to_strings():
+    schema = {"pattern": "^FR-\\d+$", "minLength": 5, "maxLength": 6}
+    assert errors_of(schema, "FR-01") == []
+    assert errors_of(schema, "NFR-1") == ["$: 패턴 ^FR-\\d+$ 불일치 (현재: 'NFR-1')"]
+    assert errors_of(schema, "FR-") == ["$: 패턴 ^FR-\\d+$ 불일치 (현재: 'FR-')", "$: 최소 5자 이상이어야 합니다"]
+    assert errors_of(schema, "FR-1234") == ["$: 최대 6자 이하여야 합니다"]
+    assert errors_of(schema, 12) == []
+
+
+def test_numeric_bounds():
+    schema = {"minimum": 0, "exclusiveMaximum": 10}
+    assert errors_of(schema, 0) == []
+    assert errors_of(schema, -1) == ["$: 0 이상여야 합니다 (현재: -1)"]
+    assert errors_of(schema, 10) == ["$: 10 미만여야 합니다 (현재: 10)"]
+    assert errors_of(schema, "x") == []
+
+
+def test_array_items_and_length():
+    schema = {"items": {"type": "string"}, "minItems": 1, "maxItems": 2}
+    assert errors_of(schema, ["a"]) == []
+    assert errors_of(schema, []) == ["$: 최소 1개 항목이 필요합니다"]
+    assert errors_of(schema, ["a", 1, "c"]) == [
+        "$: 최대 2개 항목까지 허용됩니다",
+        "$[1]: string 타입이어야 합니다",
+    ]
+
+
+def test_combinators():
+    any_of = {"anyOf": [{"type": "string"}, {"type": "integer"}]}
+    assert errors_of(any_of, 1) == []
+    assert errors_of(any_of, None) == ["$: anyOf 조건을 만족하지 않습니다"]
+
+    one_of = {"oneOf": [{"type": "integer"}, {"type": "number"}]}
+    assert errors_of(one_of, 1.5) == []
+    assert errors_of(one_of, 1) == ["$: oneOf 조건 중 정확히 하나를 만족해야 합니다 (2개 일치)"]
+
+    all_of = {"allOf": [{"type": "string"}, {"minLength": 2}]}
+    assert errors_of(all_of, "ab") == []
+    assert errors_of(all_of, "a") == ["$: 최소 2자 이상이어야 합니다"]
+
+
+def test_annotation_keywords_are_ignored():
+    schema = {"type": "string", "format": "date-time", "description": "x", "examples": ["y"]}
+    assert errors_of(schema, "not-a-date") == []
+
+
+def test_load_schema_validator_recompiles_after_change(tmp_path: Path):
+    path = tmp_path / "s.json"
+    path.write_text(json.dumps({"type": "string"}))
+    first = load_schema_validator(path)
+    assert load_schema_validator(path) is first
+
+    path.write_text(json.dumps({"type": "integer"}))
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000_000))
+    second = load_schema_validator(path)
+    assert second is not first
+    errors: list[str] = []
+    second("x", "$", errors)
+    assert errors == ["$: integer 타입이어야 합니다"]
+
+
+# --- 검증기 ---
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch) -> Path:
+    """`forge init`으로 만든 프로젝트."""
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(cli, ["init", "."])
+    assert result.exit_code == 0, result.output
+    return tmp_path
+
+
+def write_json(path: Path, data: Any) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_bundled_schemas_accept_fresh_init_project(project: Path):
+    forge = project / ".forge"
+    write_json(
+        forge / "tasks" / "AUTH-001" / "tasks.json",
+        {
+            "prd_id": "AUTH-001",
+            "total_tasks": 1,
+            "tasks": [{"id": "T-001", "requirements": ["FR-001", "NFR-002"], "depends_on": []}],
+        },
+    )
+    write_json(
+        forge / "progress" / "AUTH-001" / "checkpoint.json",
+        {"prd_id": "AUTH-001", "current_phase": None, "completed_tasks": []},
+    )
+
+    result = ArtifactValidator(project).validate()
+
+    assert result.success, result.issues
+    assert result.files_checked == 3  # config.json + tasks.json + checkpoint.json
+    assert result.message == "검증 통과: 3개 파일 검사, 0개 변경 없음"
+
+
+def test_schema_errors_are_reported_per_file(project: Path):
+    forge = project / ".forge"
+    write_json(
+        forge / "tasks" / "AUTH-001" / "tasks.json",
+        {"total_tasks": 1.0, "tasks": [{"requirements": ["X-1"]}]},
+    )
+    write_json(forge / "progress" / "AUTH-001" / "checkpoint.json", {"current_phase": "BLUE"})
+
+    result = ArtifactValidator(project).validate()
+
+    assert not result.success
+    messages = {(issue.path, issue.message) for issue in result.issues}
+    assert ("tasks/AUTH-001/tasks.json", "$.total_tasks: integer 타입이어야 합니다") in messages
+    assert ("tasks/AUTH-001/tasks.json", "$.tasks[0]: 필수 필드 'id' 없음") in messages
+    assert (
+        "tasks/AUTH-001/tasks.json",
+        "$.tasks[0].requirements[0]: 패턴 ^N?FR-\\d+$ 불일치 (현재: 'X-1')",
+    ) in messages
+    assert ("progress/AUTH-001/checkpoint.json", "$: 필수 필드 'prd_id' 없음") in messages
+    assert result.message.startswith("검증 실패: 2개 파일")
+
+
+def test_unparseable_json_is_reported(project: Path):
+    broken = project / ".forge" / "progress" / "AUTH-001" / "notes.json"
+    broken.parent.mkdir(parents=True)
+    broken.write_text("{not json", encoding="utf-8")
+
+    result = ArtifactValidator(project).validate()
+
+    assert not result.success
+    assert len(result.issues) == 1
+    assert result.issues[0].path == "progress/AUTH-001/notes.json"
+    assert result.issues[0].message.startswith("JSON 파싱 실패")
+
+
+def test_changed_only_skips_unchanged_files(project: Path):
+    tasks = write_json(project / ".forge" / "tasks" / "AUTH-001" / "tasks.json", {"tasks": []})
+    validator = ArtifactValidator(project)
+
+    first = validator.validate(changed_only=True)
+    assert (first.files_checked, first.files_skipped) == (2, 0)
+
+    second = validator.validate(changed_only=True)
+    assert (second.files_checked, second.files_skipped) == (0, 2)
+    assert second.message == "검증 통과: 0개 파일 검사, 2개 변경 없음"
+
+    # 전체 검증은 캐시를 무시
+    full = validator.validate()
+    assert (full.files_checked, full.files_skipped) == (2, 0)
+    assert tasks.exists()
+
+
+def test_changed_only_revalidates_after_mtime_change(project: Path):
+    tasks = write_json(project / ".forge" / "tasks" / "AUTH-001" / "tasks.json", {"tasks": []})
+    validator = ArtifactValidator(project)
+    validator.validate(changed_only=True)
+
+    bump_mtime(tasks)
+    result = validator.validate(changed_only=True)
+
+    assert (result.files_checked, result.files_skipped) == (1, 1)
+
+
+def test_changed_only_catches_content_change(project: Path):
+    tasks = write_json(project / ".forge" / "tasks" / "AUTH-001" / "tasks.json", {"tasks": []})
+    validator = ArtifactValidator(project)
+    assert validator.validate(changed_only=True).success
+
+    write_json(tasks, {"tasks": [{"title": "no id"}]})
+    result = validator.validate(changed_only=True)
+
+    assert not result.success
+    assert result.files_checked == 1
+    assert result.issues[0].message == "$.tasks[0]: 필수 필드 'id' 없음"
+
+    # 실패한 파일은 캐시에 남지 않아 다음에도 다시 검사
+    again = validator.validate(changed_only=True)
+    assert not again.success
+    assert again.files_checked == 1
+
+
+def test_cache_is_discarded_when_schemas_change(project: Path, monkeypatch):
+    validator = ArtifactValidator(project)
+    validator.validate(changed_only=True)
+
+    monkeypatch.setattr(validator, "_schema_fingerprint", lambda: "changed")
+    result = validator.validate(changed_only=True)
+
+    assert result.files_skipped == 0
+    assert result.files_checked == 1
+
+
+def test_cli_validate_exit_codes(project: Path):
+    runner = CliRunner()
+    ok = runner.invoke(cli, ["validate"])
+    assert ok.exit_code == 0, ok.output
+    assert "검증 통과" in ok.output
+
+    write_json(project / ".forge" / "config.json", {"project_name": 1})
+    failed = runner.invoke(cli, ["validate", "--changed-only"])
+    assert failed.exit_code == 1
+    assert "필수 필드 'version' 없음" in failed.output